@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+pytest 공통 설정
+
+tools 패키지는 import 시 ONEDRIVE_PATH / SFAICENTER_PATH를 탐지하므로,
+테스트에서는 실제 데이터 경로 대신 임시 디렉토리를 가리키도록 고정합니다.
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('ONEDRIVE_PATH', tempfile.gettempdir())
+os.environ.setdefault('SFAICENTER_PATH', tempfile.gettempdir())
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
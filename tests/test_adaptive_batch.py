@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""AdaptiveBatchSizer 테스트 (가상 모델 시뮬레이션)"""
+
+import pytest
+
+from tools.evaluation.adaptive_batch import (
+    AdaptiveBatchSizer,
+    _SimulatedBatchModel,
+    is_context_length_error,
+    simulate_adaptive_batching,
+)
+
+
+@pytest.mark.parametrize('reliable_size', [12, 20, 35])
+def test_converges_near_reliable_size(reliable_size):
+    result = simulate_adaptive_batching(total_questions=2000, reliable_size=reliable_size,
+                                        context_limit=100, max_size=50)
+    assert result['context_errors'] == 0
+    assert abs(result['ceiling'] - reliable_size) <= 3
+    assert result['avg_completeness'] > 0.9
+
+
+def test_context_error_backoff():
+    model = _SimulatedBatchModel(reliable_size=20, context_limit=15)
+    with pytest.raises(ValueError) as exc:
+        model.answer([f'Q{i}' for i in range(16)])
+    assert is_context_length_error(exc.value)
+
+    result = simulate_adaptive_batching(total_questions=2000, reliable_size=20, context_limit=15,
+                                        initial_size=10, max_size=50)
+    assert result['context_errors'] >= 1
+    assert result['hard_limit'] <= 15
+    assert result['final_size'] <= 15
+    # 한계에 닿은 뒤에는 컨텍스트 오류 없이 한계 크기로 계속 호출
+    assert result['size_trace'][-5:-1] == [15] * 4
+
+
+def test_simulation_is_deterministic():
+    assert simulate_adaptive_batching(500, seed=7) == simulate_adaptive_batching(500, seed=7)
+
+
+def test_max_latency_stops_growth():
+    sizer = AdaptiveBatchSizer(initial_size=10, max_size=50, grow_step=5, max_latency=30.0)
+    assert sizer.record(10, 10, 10, elapsed=5.0)
+    assert sizer.size == 15
+    assert sizer.record(15, 15, 15, elapsed=45.0)
+    assert (sizer.size, sizer.ceiling) == (15, 15)
+    for _ in range(3):
+        sizer.record(15, 15, 15, elapsed=10.0)
+    assert sizer.size == 15
+
+
+def test_unreliable_batch_shrinks_below_failed_size():
+    sizer = AdaptiveBatchSizer(initial_size=40, max_size=50)
+    assert not sizer.record(40, 20, 40)
+    assert sizer.size == 20
+    assert sizer.ceiling == 39
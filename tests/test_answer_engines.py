@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""서술형 모델 답변 생성 엔진 테스트 (stub 엔진)"""
+
+import json
+import os
+
+import pytest
+
+from tools.transformed.essay import create_model_answers
+from tools.transformed.essay.answer_engines import (
+    AnswerEngine,
+    StubEngine,
+    _ENGINE_CACHE,
+    get_answer_engine,
+    release_answer_engines,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    release_answer_engines()
+    yield
+    release_answer_engines()
+
+
+def _questions(n):
+    return [{'file_id': f'SS{i:04d}', 'tag': f'q_{i:04d}',
+             'essay_question': f'질문 {i}', 'essay_keyword': f'키워드{i}, 개념{i}'} for i in range(n)]
+
+
+def _run(tmp_path, monkeypatch, questions, round_number='1', batch_size=4):
+    monkeypatch.setattr(create_model_answers, 'ONEDRIVE_PATH', str(tmp_path))
+    create_model_answers.process_essay_questions('vendor/model', round_number, '1st', questions,
+                                                 engine_mode='stub', batch_size=batch_size)
+    path = tmp_path / 'evaluation' / 'eval_data' / '9_multiple_to_essay' / 'answers' / '1st' / f'vendor_model_{round_number}.json'
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_answer_engine_is_abstract():
+    with pytest.raises(TypeError):
+        AnswerEngine('model')
+
+
+def test_stub_answers_keep_question_order(tmp_path, monkeypatch):
+    questions = _questions(10)
+    answers = _run(tmp_path, monkeypatch, questions)
+
+    assert [(a['file_id'], a['tag']) for a in answers] == [(q['file_id'], q['tag']) for q in questions]
+    for a, q in zip(answers, questions):
+        assert a['answer'] == f"[vendor/model] {q['essay_question']} 핵심 개념은 {q['essay_keyword']}이다."
+    engine = get_answer_engine('vendor/model', mode='stub')
+    assert engine.batches == [4, 4, 2]
+
+
+def test_engine_reused_across_rounds_and_released(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, _questions(3), round_number='1')
+    engine = get_answer_engine('vendor/model', mode='stub')
+    _run(tmp_path, monkeypatch, _questions(5), round_number='2')
+
+    assert isinstance(engine, StubEngine)
+    assert engine.calls == 3
+    assert get_answer_engine('vendor/model', mode='stub') is engine
+    assert len(_ENGINE_CACHE) == 1
+
+    release_answer_engines('api')
+    assert len(_ENGINE_CACHE) == 1
+    release_answer_engines('stub')
+    assert not _ENGINE_CACHE
+    assert get_answer_engine('vendor/model', mode='stub') is not engine
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""AnswerTypeRules 규칙 기반 answer_type 판정 테스트"""
+
+import pytest
+
+from tools.transformed.multiple.answer_type_rules import AnswerTypeRules, instruction_sentence
+
+
+OPTIONS = ['주식', '채권', '예금', '보험', '펀드']
+COMBO_OPTIONS = ['ㄱ, ㄴ', 'ㄱ, ㄷ', 'ㄴ, ㄷ', 'ㄴ, ㄹ', 'ㄱ, ㄴ, ㄷ']
+
+
+@pytest.mark.parametrize('question, options, expected', [
+    ('다음 중 금리에 대한 설명으로 옳은 것은?', OPTIONS, 'right'),
+    ('다음 중 채권에 대한 설명으로 적절한 것은?', OPTIONS, 'right'),
+    ('예금자보호제도에 대해 바르게 설명한 것은?', OPTIONS, 'right'),
+    ('다음 중 금리에 대한 설명으로 옳지 않은 것은?', OPTIONS, 'wrong'),
+    ('파생상품에 대한 설명으로 틀린 것은?', OPTIONS, 'wrong'),
+    ('다음 중 금융투자상품이 아닌 것은?', OPTIONS, 'wrong'),
+    ('다음 중 옳은 것을 모두 고른 것은?', OPTIONS, 'abcd'),
+    ('<보기>에서 설명하는 것만을 있는 대로 고른 것은?', OPTIONS, 'abcd'),
+    ('다음 <보기> 중 옳은 것은?\nㄱ. 주식\nㄴ. 채권\nㄷ. 예금', COMBO_OPTIONS, 'abcd'),
+    # 애매한 문제는 LLM으로
+    ('다음 중 용어와 정의가 옳게 짝지어진 것은?', OPTIONS, None),
+    ('다음 <보기> 중 옳은 것은?\nㄱ. 주식\nㄴ. 채권', OPTIONS, None),
+    ('다음 중 금융투자상품에 해당하는 것은 몇 개인가?', OPTIONS, None),
+    ('다음 중 금리에 대한 설명으로 옳은 것을 고르시오.', OPTIONS, None),
+    ('옳지 않은 설명이 포함된 문항 중 옳은 것은?', OPTIONS, None),
+    ('', OPTIONS, None),
+])
+def test_classify(question, options, expected):
+    assert AnswerTypeRules().classify({'question': question, 'options': options}) == expected
+
+
+def test_instruction_sentence_uses_last_question():
+    question = '자본시장법은 투자자 보호를 목적으로 한다. 다음 중 옳은 것은?\n(단, 현행법 기준)'
+    assert instruction_sentence(question) == '다음 중 옳은 것은?'
+
+
+def test_report_counts():
+    questions = [
+        {'question': '옳은 것은?', 'options': OPTIONS, 'answer_type': 'right'},
+        {'question': '옳지 않은 것은?', 'options': OPTIONS, 'answer_type': 'wrong'},
+        {'question': '옳지 않은 것은?', 'options': OPTIONS, 'answer_type': 'right', 'tag': 'q_3'},
+        {'question': '몇 개인가?', 'options': OPTIONS, 'answer_type': 'right'},
+        {'question': '옳게 짝지어진 것은?', 'options': OPTIONS, 'answer_type': 'right'},
+        {'question': '옳은 것은?', 'options': OPTIONS, 'answer_type': ''},
+    ]
+    report = AnswerTypeRules().report(questions, batch_size=2)
+
+    assert (report['total'], report['rule_labeled']) == (5, 3)
+    assert report['coverage'] == pytest.approx(3 / 5)
+    assert report['precision'] == pytest.approx(2 / 3)
+    assert report['per_label']['wrong'] == {'predicted': 2, 'correct': 1, 'precision': 0.5}
+    assert report['per_label']['abcd'] == {'predicted': 0, 'correct': 0, 'precision': None}
+    assert (report['llm_calls_before'], report['llm_calls_after'], report['calls_avoided']) == (3, 1, 2)
+    assert [(m['tag'], m['rule'], m['llm']) for m in report['mismatches']] == [('q_3', 'wrong', 'right')]
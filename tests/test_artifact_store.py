@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""JSONL 아티팩트 / 사이드카 인덱스 테스트"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from tools.core import artifact_store
+from tools.core.artifact_store import ArtifactReader, index_path, load_records, write_artifact
+
+
+def _records(prefix='a'):
+    return [{'file_id': 'SS0001', 'tag': f'{{q_000{i}}}', 'question_id': f'{prefix}{i}', 'question': prefix * 3}
+            for i in range(3)]
+
+
+def test_reader_reads_single_records(tmp_path):
+    path = str(tmp_path / 'exam.jsonl')
+    write_artifact(_records(), path)
+    reader = ArtifactReader(path)
+    assert len(reader) == 3
+    assert reader.get(('SS0001', '{q_0001}'))['question_id'] == 'a1'
+    assert [r['question_id'] for r in reader.get_many(['a2', 'a0', 'missing'])] == ['a2', 'a0']
+    assert load_records(path) == _records()
+
+
+def test_same_size_edit_rebuilds_index(tmp_path):
+    path = str(tmp_path / 'exam.jsonl')
+    write_artifact(_records('a'), path)
+    ArtifactReader(path)
+    before = os.stat(path)
+
+    # 같은 길이로 내용만 바꾼 수동 편집 (레코드 순서가 바뀌어 오프셋이 달라짐)
+    with open(path, 'rb') as f:
+        lines = f.readlines()
+    with open(path, 'wb') as f:
+        f.writelines(reversed(lines))
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000))
+    assert os.path.getsize(path) == before.st_size
+
+    reader = ArtifactReader(path)
+    assert reader.get('a0') == _records('a')[0]
+    with open(index_path(path), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    assert index['data_mtime_ns'] == os.stat(path).st_mtime_ns
+
+
+def test_old_index_format_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'exam.jsonl')
+    write_artifact(_records(), path)
+    with open(index_path(path), 'w', encoding='utf-8') as f:
+        json.dump({'format': 'jsonl-idx/1', 'records': 1, 'data_size': os.path.getsize(path),
+                   'rows': [['SS0001', '{q_0000}', 'a0', 5, 3]]}, f)
+    assert [r['question_id'] for r in ArtifactReader(path).get_many(['a0', 'a1', 'a2'])] == ['a0', 'a1', 'a2']
+
+
+def test_remove_source_refused_for_to_jsonl(tmp_path, monkeypatch):
+    source = tmp_path / 'exam.json'
+    source.write_text(json.dumps(_records()), encoding='utf-8')
+    monkeypatch.setattr(sys, 'argv', ['artifact_store', 'to-jsonl', str(source), '--remove_source'])
+    with pytest.raises(SystemExit):
+        artifact_store.main()
+    assert source.exists()
+    assert not (tmp_path / 'exam.jsonl').exists()
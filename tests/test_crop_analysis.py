@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""CropAnalyzer 매니페스트 증분 스캔 / BEFORE·AFTER 비교 테스트"""
+
+import os
+import shutil
+
+import pytest
+
+from tools.benchmarks.crop_analysis import (
+    _legacy_compare_rows,
+    _legacy_organize_crop_files,
+    as_excel_rows,
+    make_synthetic_crop_dir,
+)
+from tools.data_processing.crop_analysis import CropAnalyzer, CropManifest, ManifestScanner, diff_folder_stats
+
+
+def _dicts(stats_list):
+    return [s.to_dict() for s in stats_list]
+
+
+def _str_rows(rows):
+    return [{k: str(v) for k, v in row.items()} for row in rows]
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    crop_dir = tmp_path / 'crop'
+    make_synthetic_crop_dir(str(crop_dir), num_books=3, folders_per_book=4, files_per_folder=6)
+    monkeypatch.chdir(tmp_path)  # 매니페스트는 작업 디렉토리에 저장됨
+    return CropAnalyzer(str(crop_dir), workers=4)
+
+
+def _first_image(analyzer, stats_list):
+    changed = next(s for s in stats_list if s.image_files)
+    folder = next(root for root, _, files in os.walk(analyzer.crop_dir) if changed.image_files[0] in files)
+    return os.path.join(folder, changed.image_files[0])
+
+
+def test_manifest_scan_matches_full_walk(analyzer):
+    assert _dicts(analyzer.organize_crop_files()) == _dicts(_legacy_organize_crop_files(analyzer))
+    assert os.path.exists(analyzer.manifest_file)
+
+
+def test_incremental_rescan_rereads_only_changed_folder(analyzer):
+    before = analyzer.organize_crop_files()
+    os.remove(_first_image(analyzer, before))
+
+    previous = CropManifest.load(analyzer.manifest_file, root=str(analyzer.crop_dir))
+    scanner = ManifestScanner(str(analyzer.crop_dir), previous=previous, workers=4)
+    manifest = scanner.scan()
+    assert _dicts(analyzer.stats_from_manifest(manifest)) == _dicts(_legacy_organize_crop_files(analyzer))
+    assert (scanner.rescanned, scanner.reused) == (1, len(previous.folders) - 1)
+    assert scanner.changed
+
+
+def test_diff_matches_legacy_excel_comparison(analyzer):
+    before = analyzer.organize_crop_files()
+    os.remove(_first_image(analyzer, before))
+    removed = [root for root, dirs, _ in os.walk(analyzer.crop_dir) if not dirs][-1]
+    shutil.rmtree(removed)
+    after = analyzer.organize_crop_files()
+
+    legacy = _legacy_compare_rows(as_excel_rows(before), as_excel_rows(after))
+    assert {row['상태'] for row in legacy} == {'일부_파일_누락', 'AFTER에_없는_폴더'}
+    assert _str_rows(diff_folder_stats(before, after)) == _str_rows(legacy)
+
+
+def test_excel_fallback_rows_give_same_diff(analyzer):
+    before = analyzer.organize_crop_files()
+    os.remove(_first_image(analyzer, before))
+    after = analyzer.organize_crop_files()
+
+    before_rows, after_rows = as_excel_rows(before), as_excel_rows(after)
+    from_rows = diff_folder_stats([analyzer._stats_from_row(r) for r in before_rows],
+                                  [analyzer._stats_from_row(r) for r in after_rows])
+    assert len(from_rows) == 1
+    assert _str_rows(from_rows) == _str_rows(_legacy_compare_rows(before_rows, after_rows))
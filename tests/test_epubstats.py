@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""epubstats.collect_page_counts / count_pdf_pages 테스트 (ebook-convert 스텁 사용)"""
+
+import os
+import subprocess
+
+import pytest
+
+from tools.benchmarks.epubstats import make_stub_converter, stub_page_count
+from tools.data_processing.epubstats import (
+    PAGES_10PT_COLUMN,
+    PAGES_COLUMN,
+    PageCountCache,
+    collect_page_counts,
+    count_pdf_pages,
+)
+
+
+@pytest.fixture
+def converter(tmp_path):
+    return make_stub_converter(str(tmp_path / 'ebook-convert'), delay=0)
+
+
+def _write(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return str(path)
+
+
+def _make_pdf(converter, tmp_path, name, size):
+    src = _write(tmp_path / f'{name}.src', size)
+    dst = str(tmp_path / 'Lv1' / f'{name}.pdf')
+    subprocess.run([converter, src, dst], check=True)
+    os.remove(src)
+    return dst
+
+
+@pytest.fixture
+def target_dir(tmp_path, converter):
+    target = tmp_path / 'Lv1'
+    target.mkdir()
+    _write(target / 'EB0001.EPUB', 4500)
+    _write(target / 'EB0002.EPUB', 1200)
+    _make_pdf(converter, tmp_path, 'PD0001', 7000)
+    # EPUB과 ID가 겹치는 이름이어도 원본 디렉토리에 있는 PDF는 원본으로 집계되어야 함
+    _make_pdf(converter, tmp_path, 'EB0002-10p', 2500)
+    return str(target)
+
+
+def test_count_pdf_pages_reads_root_count(target_dir):
+    assert count_pdf_pages(os.path.join(target_dir, 'PD0001.pdf')) == stub_page_count(7000)
+
+
+def test_collect_counts_epubs_and_source_pdfs(converter, target_dir):
+    listing = sorted(os.listdir(target_dir))
+    counts = collect_page_counts(target_dir, workers=2, convert_path=converter, show_progress=False)
+
+    assert counts == {
+        'EB0001': {PAGES_COLUMN: stub_page_count(4500), PAGES_10PT_COLUMN: stub_page_count(4500, True)},
+        'EB0002': {PAGES_COLUMN: stub_page_count(1200), PAGES_10PT_COLUMN: stub_page_count(1200, True)},
+        'PD0001': {PAGES_COLUMN: stub_page_count(7000)},
+        'EB0002-10p': {PAGES_COLUMN: stub_page_count(2500)},
+    }
+    # 변환 결과는 원본 디렉토리에 쓰지 않음
+    assert sorted(os.listdir(target_dir)) == listing
+
+
+def test_convert_dir_keeps_converted_pdfs(tmp_path, converter, target_dir):
+    convert_dir = str(tmp_path / 'converted')
+    first = collect_page_counts(target_dir, convert_path=converter, show_progress=False, convert_dir=convert_dir)
+    assert sorted(os.listdir(convert_dir)) == ['EB0001-10p.pdf', 'EB0001.pdf', 'EB0002-10p.pdf', 'EB0002.pdf']
+    assert collect_page_counts(target_dir, convert_path=converter, show_progress=False,
+                               convert_dir=convert_dir) == first
+
+    with pytest.raises(ValueError):
+        collect_page_counts(target_dir, convert_path=converter, show_progress=False, convert_dir=target_dir)
+
+
+def test_cache_skips_conversion(tmp_path, converter, target_dir):
+    cache_file = str(tmp_path / 'cache.json')
+    cache = PageCountCache(cache_file)
+    first = collect_page_counts(target_dir, cache, convert_path=converter, show_progress=False)
+    cache.save()
+
+    # 캐시가 있으면 변환기를 호출하지 않음 (존재하지 않는 경로여도 결과 동일)
+    cache = PageCountCache(cache_file)
+    missing = str(tmp_path / 'no-such-converter')
+    assert collect_page_counts(target_dir, cache, convert_path=missing, show_progress=False) == first
+    assert cache.misses == 0
+
+
+def test_failed_conversion_is_left_out(tmp_path, target_dir):
+    failing = tmp_path / 'failing-convert'
+    failing.write_text('#!/bin/sh\nexit 1\n')
+    failing.chmod(0o755)
+    counts = collect_page_counts(target_dir, convert_path=str(failing), show_progress=False)
+    assert set(counts) == {'PD0001', 'EB0002-10p'}
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""ExamAssembler 테스트"""
+
+from tools.exam.exam_assembly import FILL_TIERS, ExamAssembler
+
+
+def _config(quotas, exams=4):
+    return {
+        f'exam_{e + 1}': {'domain_details': {'D': {'subdomains': {s: {'count': q} for s, q in quotas.items()}}}}
+        for e in range(exams)
+    }
+
+
+def _items(subdomain, n, kind=''):
+    question = '{tb_0001_0001} 표' if kind == 'table' else '문제'
+    return [{'file_id': subdomain, 'tag': f'q_{i:05d}', 'domain': 'D', 'subdomain': subdomain,
+             'question': question} for i in range(n)]
+
+
+def _filled(plan, subdomain='S1'):
+    return [sum(n for bucket, n in allocation.items() if bucket[1] == subdomain)
+            for allocation in plan.allocation.values()]
+
+
+def test_scarce_pool_spreads_shortfall_across_exams():
+    quota = 8294
+    plan = ExamAssembler(_config({'S1': quota})).solve(_items('S1', 27706))
+
+    filled = _filled(plan)
+    assert sum(filled) == 27706
+    assert plan.total_shortfall == 4 * quota - 27706
+    assert max(filled) - min(filled) <= -(-quota // FILL_TIERS)
+    assert sum(edge['capacity'] for edge in plan.min_cut) == plan.max_flow
+
+
+def test_sufficient_pool_fills_every_quota_without_substitution():
+    plan = ExamAssembler(_config({'S1': 30, 'S2': 20}), allow_substitution=True).solve(
+        _items('S1', 200) + _items('S2', 100))
+
+    assert plan.feasible
+    assert _filled(plan, 'S1') == [30] * 4 and _filled(plan, 'S2') == [20] * 4
+
+
+def test_substitution_only_covers_real_deficit():
+    plan = ExamAssembler(_config({'S1': 10, 'S2': 10}), allow_substitution=True).solve(
+        _items('S1', 60) + _items('S2', 20))
+
+    assert plan.total_shortfall == 0
+    assert sum(sum(s.values()) for s in plan.substitutions.values()) == 20
+    exams = ExamAssembler(_config({'S1': 10, 'S2': 10}), allow_substitution=True).assemble(plan)
+    keys = [(q['file_id'], q['tag']) for exam in exams.values() for q in exam]
+    assert len(keys) == len(set(keys)) == 80
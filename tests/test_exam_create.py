@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""ExamMaker._replace_tags (copy-on-write 태그 대치) 테스트"""
+
+import copy
+import logging
+import os
+
+from tools.benchmarks.exam_create import _legacy_replace_tags, make_synthetic_exam_build
+from tools.exam.exam_create import ExamMaker, has_tags
+
+
+def test_replace_tags_identical_to_legacy_deepcopy(tmp_path):
+    exam_data = make_synthetic_exam_build(str(tmp_path), questions=300, tagged_ratio=0.2)
+    snapshot = copy.deepcopy(exam_data)
+    workbook_base = os.path.join(str(tmp_path), 'evaluation', 'workbook_data')
+
+    expected = _legacy_replace_tags(exam_data, workbook_base)
+    result = ExamMaker(str(tmp_path), logging.getLogger('tests.exam_create'))._replace_tags(exam_data)
+
+    assert result == expected
+    assert exam_data == snapshot
+    assert not any(has_tags(item) for item in result)
+
+
+def test_untagged_questions_are_not_copied(tmp_path):
+    exam_data = make_synthetic_exam_build(str(tmp_path), questions=50, tagged_ratio=0.0)
+    result = ExamMaker(str(tmp_path), logging.getLogger('tests.exam_create'))._replace_tags(exam_data)
+    assert all(out is item for out, item in zip(result, exam_data))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""partition_pool / ExamSetGenerator 테스트 (합성 풀)"""
+
+import json
+import logging
+import os
+
+import pytest
+
+from tools.benchmarks.question_pool import make_synthetic_exams_config, make_synthetic_pool
+from tools.exam.exam_sets import ExamSetGenerator, partition_pool
+from tools.exam.question_pool import question_key
+
+
+@pytest.mark.parametrize('num_sets', [2, 5, 7])
+def test_partition_shares_differ_by_at_most_one(num_sets):
+    pool = make_synthetic_pool(6000, seed=3, domains=12, subdomains_per_domain=9)
+    shares = partition_pool(pool, num_sets, seed=42)
+
+    sizes = [len(share) for share in shares]
+    assert max(sizes) - min(sizes) <= 1
+    keys = [question_key(item) for share in shares for item in share]
+    assert len(keys) == len(set(keys)) == len({question_key(item) for item in pool})
+
+
+def test_partition_ignores_input_order():
+    # 중복 키는 처음 것만 쓰므로 키가 겹치지 않는 풀로 비교
+    pool = list({question_key(item): item for item in make_synthetic_pool(2000, seed=4)}.values())
+    as_keys = lambda shares: [[question_key(item) for item in share] for share in shares]
+    assert as_keys(partition_pool(pool, 5, seed=1)) == as_keys(partition_pool(pool[::-1], 5, seed=1))
+
+
+def _generate(onedrive_path, pool, **kwargs):
+    eval_data = os.path.join(onedrive_path, 'evaluation', 'eval_data')
+    os.makedirs(os.path.join(eval_data, '2_subdomain'), exist_ok=True)
+    exams = make_synthetic_exams_config(pool, exams=3, fill=0.04)
+    for info in exams.values():
+        info['domains'] = sorted(info['domain_details'])
+    with open(os.path.join(eval_data, 'exam_config.json'), 'w', encoding='utf-8') as f:
+        json.dump({'exams': exams}, f, ensure_ascii=False)
+    with open(os.path.join(eval_data, '2_subdomain', 'multiple-choice_DST.json'), 'w', encoding='utf-8') as f:
+        json.dump(pool, f, ensure_ascii=False)
+
+    result = ExamSetGenerator(onedrive_path, logging.getLogger('tests.exam_sets')).generate(
+        num_sets=5, seed=42, replace_tags=False, **kwargs)
+    assert result['success'], result
+    exam_dir = os.path.join(eval_data, '4_multiple_exam')
+    outputs = {}
+    for root, _, files in os.walk(exam_dir):
+        for name in files:
+            if name.endswith('.json') and name != 'exam_sets_manifest.json':
+                with open(os.path.join(root, name), 'rb') as f:
+                    outputs[os.path.relpath(os.path.join(root, name), exam_dir)] = f.read()
+    return outputs
+
+
+def test_sets_byte_identical_across_workers(tmp_path):
+    pool = make_synthetic_pool(4000, seed=5)
+    sequential = _generate(str(tmp_path / 'seq'), pool, workers=1)
+    parallel = _generate(str(tmp_path / 'par'), pool, workers=3)
+    only_third = _generate(str(tmp_path / 'one'), pool, workers=2, sets=[3])
+
+    assert len(sequential) == 5 * 4
+    assert parallel == sequential
+    assert only_third == {k: v for k, v in sequential.items() if k.startswith('3rd' + os.sep)}
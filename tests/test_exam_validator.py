@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""ExamRequirementTracker / ExamValidator.update_existing_exam 테스트"""
+
+import logging
+import random
+
+from tools.benchmarks.exam_validator import (
+    _legacy_check_exam_meets_requirements,
+    _legacy_update_existing_exam,
+    make_synthetic_existing_exams,
+)
+from tools.benchmarks.question_pool import make_synthetic_exams_config, make_synthetic_pool
+from tools.exam.exam_validator import ExamRequirementTracker, ExamValidator
+from tools.exam.question_pool import QuestionPool, question_key
+
+
+def _stats(config):
+    return {
+        exam_name: {
+            domain: {
+                'exam_questions': sum(sub['count'] for sub in domain_info['subdomains'].values()),
+                'exam_subdomain_distribution': {s: sub['count'] for s, sub in domain_info['subdomains'].items()},
+            }
+            for domain, domain_info in exam_info['domain_details'].items()
+        }
+        for exam_name, exam_info in config.items()
+    }
+
+
+def test_incremental_update_identical_to_legacy_rescan():
+    pool = make_synthetic_pool(5000, seed=2)
+    stats = _stats(make_synthetic_exams_config(pool, 3, fill=0.8 / 3))
+    existing = make_synthetic_existing_exams(pool, stats, sets=3, seed=1)
+    logger = logging.getLogger('tests.exam_validator')
+
+    random.seed(9)
+    used_old, old = set(), []
+    for exam_set in existing:
+        for exam_name, exam_data in exam_set.items():
+            before, _ = _legacy_check_exam_meets_requirements(exam_data, exam_name, stats)
+            updated = _legacy_update_existing_exam(exam_data, exam_name, stats, pool, used_old)
+            after, counts = _legacy_check_exam_meets_requirements(updated, exam_name, stats)
+            old.append((before, after, counts, [question_key(q) for q in updated]))
+
+    random.seed(9)
+    used_new, new = set(), []
+    question_pool = QuestionPool(pool)
+    for exam_set in existing:
+        for exam_name, exam_data in exam_set.items():
+            tracker = ExamRequirementTracker(exam_name, stats, exam_data)
+            before = tracker.meets_requirements
+            updated = ExamValidator.update_existing_exam(exam_data, exam_name, stats, pool, used_new, logger,
+                                                         pool=question_pool, tracker=tracker)
+            new.append((before, tracker.meets_requirements, tracker.actual_counts(),
+                        [question_key(q) for q in updated]))
+
+    assert new == old
+    assert used_new == used_old
+
+
+def test_tracker_follows_add_and_remove():
+    stats = {'exam': {'D': {'exam_questions': 2, 'exam_subdomain_distribution': {'S': 2}}}}
+    q1 = {'file_id': 'F', 'tag': '1', 'domain': 'D', 'subdomain': 'S'}
+    q2 = {'file_id': 'F', 'tag': '2', 'domain': 'D', 'subdomain': 'S'}
+    tracker = ExamRequirementTracker('exam', stats, [q1])
+    assert not tracker.meets_requirements
+    tracker.add(q2)
+    assert tracker.meets_requirements
+    tracker.remove(q1)
+    assert not tracker.meets_requirements
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""JSONCleaner 빈 페이지 정리 테스트 (합성 JSON)"""
+
+import json
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tools.data_processing import json_cleaner
+from tools.data_processing.json_cleaner import JSONCleaner
+
+
+def _pages(rng, n):
+    pages = []
+    for i in range(n):
+        kind = rng.random()
+        if kind < 0.3:
+            page = {'page': str(i), 'page_contents': '', 'add_info': []}
+        elif kind < 0.5:
+            page = {'page': str(i), 'page_contents': '', 'add_info': [{'type': rng.choice(['image', 'table'])}]}
+        else:
+            page = {'page': str(i), 'chapter': f'{i // 10}장', 'page_contents': f'본문 {i}',
+                    'add_info': [{'type': 'etc'}] if kind > 0.9 else []}
+        pages.append(page)
+    return pages
+
+
+def _make_tree(root: Path, files=12, seed=0):
+    rng = random.Random(seed)
+    for i in range(files):
+        path = root / f'Lv{i % 3 + 2}' / f'SS{i:04d}.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 원본은 결과와 다른 형식(indent=4)으로 써서 백업이 원본 바이트인지 구분
+        path.write_text(json.dumps({'file_id': f'SS{i:04d}', 'contents': _pages(rng, rng.randint(0, 40))},
+                                   ensure_ascii=False, indent=4), encoding='utf-8')
+    (root / 'Lv2' / 'broken.json').write_text('{"contents": [', encoding='utf-8')
+    return root
+
+
+def _snapshot(root: Path):
+    return {str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob('*')) if p.is_file()}
+
+
+def _summary(root: Path, result):
+    files = sorted(
+        (str(r.file_path.relative_to(root)), r.removed_count, r.original_count, r.success,
+         r.before_stats, r.after_stats)
+        for r in result.file_results
+    )
+    return (result.processed_files, result.total_removed, result.total_original,
+            result.total_before_stats, result.total_after_stats, files)
+
+
+def test_scan_pages_matches_calculate_page_stats():
+    pages = _pages(random.Random(1), 200)
+    filtered, before, after = JSONCleaner.scan_pages(pages)
+
+    assert filtered == [p for p in pages if not JSONCleaner.is_empty_page(p)]
+    assert before == JSONCleaner.calculate_page_stats(pages)
+    assert after == JSONCleaner.calculate_page_stats(filtered)
+
+
+def test_parallel_cleanup_identical_to_sequential(tmp_path):
+    seq_root = _make_tree(tmp_path / 'seq')
+    par_root = tmp_path / 'par'
+    shutil.copytree(seq_root, par_root)
+
+    seq = JSONCleaner().cleanup_directory(seq_root, workers=1)
+    par = JSONCleaner().cleanup_directory(par_root, workers=3)
+
+    assert _snapshot(par_root) == _snapshot(seq_root)
+    assert _summary(par_root, par) == _summary(seq_root, seq)
+    assert seq.total_removed > 0
+    assert not [r for r in seq.file_results if not r.success and r.file_path.name != 'broken.json']
+
+
+def test_backup_is_original_bytes(tmp_path):
+    root = _make_tree(tmp_path / 'data', files=3, seed=2)
+    path = next(p for p in sorted(root.rglob('SS*.json'))
+                if any(JSONCleaner.is_empty_page(page)
+                       for page in json.loads(p.read_text(encoding='utf-8'))['contents']))
+    original = path.read_bytes()
+
+    result = JSONCleaner().cleanup_file(path)
+
+    assert result.removed_count > 0
+    assert path.with_suffix('.json.bak').read_bytes() == original
+    assert path.read_bytes() != original
+    assert json.loads(path.read_text(encoding='utf-8'))['contents'] == JSONCleaner.scan_pages(
+        json.loads(original.decode('utf-8'))['contents'])[0]
+
+
+def test_atomic_write_leaves_no_tmp_on_error(tmp_path, monkeypatch):
+    path = tmp_path / 'SS0001.json'
+    path.write_text(json.dumps({'contents': [{'page_contents': '', 'add_info': []},
+                                             {'page_contents': '본문', 'add_info': []}]}), encoding='utf-8')
+    original = path.read_bytes()
+
+    def fail(f):
+        f.write('{"contents": [')
+        raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        JSONCleaner._atomic_write(path, fail)
+    assert path.read_bytes() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['SS0001.json']
+
+    def failing_dump(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(json_cleaner.json, 'dump', failing_dump)
+    result = JSONCleaner().cleanup_file(path, create_backup=False)
+    assert not result.success
+    assert path.read_bytes() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['SS0001.json']
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""KeywordMatcher 로컬 키워드 판정 테스트"""
+
+import pytest
+
+from tools.evaluation.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher()
+
+
+@pytest.mark.parametrize('keyword, answer', [
+    ('신용도', '신용 위험이 높다'),
+    ('집중도', '위험 집중이 문제'),
+    ('투자가', '투자를 하면'),
+])
+def test_suffix_stripped_match_is_not_settled(matcher, keyword, answer):
+    # 끝 글자가 명사의 일부일 수 있으므로 어간 일치만으로 hit 확정하지 않음
+    result = matcher.match(keyword, answer)
+    assert result.statuses == {keyword: 'ambiguous'}
+    assert not result.settled
+
+
+@pytest.mark.parametrize('keywords, answer, decision', [
+    ('신용도', '차주의 신용도가 하락하면 금리가 오른다', True),
+    ('신용 위험, 유동성', '신용위험과 유동성 모두 고려해야 한다', True),
+    ('환율, 금리', '환율이 상승하면 수입 물가가 오른다', False),
+    ('파생상품', '주식과 채권에 분산 투자한다', False),
+])
+def test_settled_cases(matcher, keywords, answer, decision):
+    assert matcher.match(keywords, answer).decision is decision
+
+
+def test_partial_multiword_keyword_is_ambiguous(matcher):
+    result = matcher.match('신용 위험', '신용은 중요하고 시장 위험도 있다')
+    assert result.statuses == {'신용 위험': 'ambiguous'}
+    assert result.decision is None
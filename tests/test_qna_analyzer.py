@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""QnAStatisticsAnalyzer 파일별 집계 캐시 / 병렬 map 테스트"""
+
+import os
+
+import pytest
+
+from tools.benchmarks.qna_analyzer import (
+    _legacy_analyze,
+    append_item,
+    as_plain,
+    make_synthetic_workbook_data,
+    render_report,
+)
+from tools.report.qna_analyzer import QnAStatisticsAnalyzer
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    base_path = str(tmp_path / 'workbook_data')
+    files = make_synthetic_workbook_data(base_path, num_files=12, items_per_file=30)
+    return base_path, files
+
+
+def _legacy(base_path):
+    return as_plain(_legacy_analyze(QnAStatisticsAnalyzer(base_path)))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_analyze_matches_legacy(workbook, workers):
+    base_path, files = workbook
+    analyzer = QnAStatisticsAnalyzer(base_path, workers=workers)
+    assert as_plain(analyzer.analyze()) == _legacy(base_path)
+    assert analyzer.cache_misses == len(files)
+    assert all(os.path.exists(analyzer.cache_path(f)) for f in files)
+
+
+def test_report_matches_legacy(tmp_path, workbook):
+    base_path, _ = workbook
+    stats = QnAStatisticsAnalyzer(base_path).analyze()
+    assert render_report(stats, str(tmp_path / 'new.md')) == \
+        render_report(_legacy_analyze(QnAStatisticsAnalyzer(base_path)), str(tmp_path / 'old.md'))
+
+
+def test_changed_file_is_recomputed(workbook):
+    base_path, files = workbook
+    QnAStatisticsAnalyzer(base_path).analyze()
+    append_item(files[3])
+
+    analyzer = QnAStatisticsAnalyzer(base_path)
+    stats = as_plain(analyzer.analyze())
+    assert (analyzer.cache_hits, analyzer.cache_misses) == (len(files) - 1, 1)
+    assert stats == _legacy(base_path)
+
+
+def test_domain_change_invalidates_cache(workbook, monkeypatch):
+    base_path, files = workbook
+    QnAStatisticsAnalyzer(base_path).analyze()
+    monkeypatch.setattr(QnAStatisticsAnalyzer, 'VALID_DOMAINS', QnAStatisticsAnalyzer.VALID_DOMAINS | {'기타'})
+
+    analyzer = QnAStatisticsAnalyzer(base_path)
+    stats = as_plain(analyzer.analyze())
+    assert analyzer.cache_misses == len(files)
+    assert stats == _legacy(base_path)
+
+
+def test_no_cache_writes_nothing(workbook):
+    base_path, files = workbook
+    analyzer = QnAStatisticsAnalyzer(base_path, use_cache=False)
+    assert as_plain(analyzer.analyze()) == _legacy(base_path)
+    assert not any(os.path.exists(analyzer.cache_path(f)) for f in files)
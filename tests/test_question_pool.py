@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""QuestionPool 테스트"""
+
+import logging
+import random
+
+from tools.benchmarks.question_pool import (
+    _legacy_create_exam_random,
+    make_synthetic_exams_config,
+    make_synthetic_pool,
+)
+from tools.exam.exam_create import ExamMaker
+from tools.exam.question_pool import QuestionPool, question_key
+
+
+def _keys(exam):
+    return [question_key(q) for q in exam]
+
+
+def test_random_exams_identical_to_legacy_refilter():
+    pool = make_synthetic_pool(6000, seed=1)
+    config = make_synthetic_exams_config(pool, exams=3)
+    maker = ExamMaker(onedrive_path='', logger=logging.getLogger('tests.question_pool'))
+    valid_data = [item for item in pool if maker._is_valid_question(item)]
+
+    random.seed(5)
+    used_old = set()
+    old = [_legacy_create_exam_random(info, valid_data, used_old) for info in config.values()]
+
+    random.seed(5)
+    used_new = set()
+    question_pool = QuestionPool(valid_data)
+    new = [maker._create_exam_random(name, info, valid_data, used_new, pool=question_pool)
+           for name, info in config.items()]
+
+    assert [_keys(e) for e in new] == [_keys(e) for e in old]
+    assert used_new == used_old
+
+
+def test_duplicate_keys_are_all_removed_when_used():
+    items = [
+        {'file_id': 'F', 'tag': 'q_0001', 'domain': 'D', 'subdomain': 'S', 'question': 'a'},
+        {'file_id': 'F', 'tag': 'q_0001', 'domain': 'D', 'subdomain': 'S', 'question': 'b'},
+        {'file_id': 'F', 'tag': 'q_0002', 'domain': 'D', 'subdomain': 'S', 'question': 'c'},
+    ]
+    question_pool = QuestionPool(items)
+    used = set()
+    question_pool.take(items[:1], used)
+
+    assert used == {('F', 'q_0001')}
+    assert [q['question'] for q in question_pool.available('D', 'S')] == ['c']
+    found = question_pool.first_unused('D', 'S', used)
+    assert found is not None and found[0] == ('F', 'q_0002')
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""sampling.allocate_sample / estimate_stratum_std 테스트"""
+
+import math
+
+from tools.evaluation.sampling import allocate_sample, estimate_stratum_std, stratum_weights
+
+
+def test_estimate_stratum_std_averages_models_with_floor():
+    std = estimate_stratum_std({
+        ('경제',): [0.5, 0.5],
+        ('경영',): [0.9, 0.7],
+        ('법률',): [1.0, 1.0],
+        ('기타',): [float('nan')],
+    })
+    assert std[('경제',)] == 0.5
+    assert math.isclose(std[('경영',)], (math.sqrt(0.09) + math.sqrt(0.21)) / 2)
+    assert std[('법률',)] == 0.05
+    assert ('기타',) not in std
+
+
+def test_neyman_differs_from_proportional_with_estimates():
+    sizes = {'a': 1000, 'b': 1000}
+    assert allocate_sample(sizes, 100, 'neyman') == allocate_sample(sizes, 100, 'proportional') == {'a': 50, 'b': 50}
+
+    alloc = allocate_sample(sizes, 100, 'neyman', stratum_std=estimate_stratum_std({'a': [0.5], 'b': [0.95]}))
+    assert sum(alloc.values()) == 100
+    assert alloc['a'] > 2 * alloc['b']
+
+
+def test_every_stratum_sampled_when_n_covers_strata():
+    sizes = {f's{i}': 1000 if i == 0 else 3 for i in range(20)}
+    alloc = allocate_sample(sizes, 20)
+    assert all(v >= 1 for v in alloc.values())
+    assert set(stratum_weights(sizes, alloc)) == set(sizes)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""AnswerCountSampler 테스트"""
+
+from tools.benchmarks.stratified_sampler import legacy_sample, make_synthetic_pool, question_id
+from tools.transformed.multiple.stratified_sampler import AnswerCountSampler
+
+
+def _ids(groups):
+    return {ac: [question_id(q) for q in qs] for ac, qs in groups.items()}
+
+
+def test_same_result_as_legacy_for_unique_ids():
+    pool = make_synthetic_pool(2000)
+    assert _ids(AnswerCountSampler(7).sample(pool)) == _ids(legacy_sample(pool, 7))
+
+
+def test_every_question_assigned_once_without_ids():
+    # file_id/tag가 없으면 ID가 모두 "_"로 같음 → 뽑힌 항목만 제거되어야 함
+    pool = [{'question': f'q{i}', 'options': ['a', 'b', 'c', 'd']} for i in range(9)]
+    result = AnswerCountSampler(42).sample(pool)
+
+    assert {ac: len(qs) for ac, qs in result.items()} == {2: 3, 3: 3, 4: 3, 5: 0}
+    assigned = [id(q) for qs in result.values() for q in qs]
+    assert sorted(assigned) == sorted(id(q) for q in pool)
+    assert {ac: len(qs) for ac, qs in legacy_sample(pool, 42).items()} == {2: 3, 3: 3, 4: 3, 5: 0}
+
+
+def test_duplicate_ids_keep_all_questions():
+    pool = [{'file_id': 'F', 'tag': 'dup', 'question': f'q{i}', 'options': ['a'] * 5} for i in range(10)]
+    result = AnswerCountSampler(1).sample(pool)
+
+    assert sum(len(qs) for qs in result.values()) == 10
+    assert {q['question'] for qs in result.values() for q in qs} == {f'q{i}' for i in range(10)}
+
+
+def test_repeated_call_reflects_new_content():
+    sampler = AnswerCountSampler(3)
+    first = [{'file_id': 'F', 'tag': str(i), 'question': 'old', 'options': ['a'] * 4} for i in range(6)]
+    second = [dict(q, question='new') for q in first]
+
+    sampler.sample(first)
+    result = sampler.sample(second)
+    assert all(q['question'] == 'new' for qs in result.values() for q in qs)
+
+
+def test_excludes_non_four_or_five_option_questions():
+    pool = make_synthetic_pool(500, seed=3)
+    valid = sum(1 for q in pool if len(q['options']) in (4, 5))
+    result = AnswerCountSampler(0, by_domain=True).sample(pool)
+    assert sum(len(qs) for qs in result.values()) == valid
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmarks 패키지 - 성능 비교용 스크립트
+
+운영 모듈에서 분리한 기존(legacy) 구현, 합성 데이터 생성기, 벤치마크를 모아 둡니다.
+모든 벤치마크는 합성 데이터나 임시 디렉토리에서만 실행되며 원본 데이터를 읽거나 쓰지 않습니다.
+
+- stratified_sampler: AnswerCountSampler vs 기존 O(n²) 정답 개수별 샘플링
+- question_pool: QuestionPool 버킷 인덱스 vs 기존 subdomain별 재필터링 (합성 풀 / exam_config 생성기 포함)
+- exam_create: 시험지 태그 대치 copy-on-write vs 기존 deepcopy
+- exam_validator: 증분 요구사항 카운터 + 인덱스 풀 vs 기존 재스캔 검사/보충
+- crop_analysis: 매니페스트 증분 스캔 + 집합 비교 vs 기존 os.walk 스캔 + Excel 행 비교 (합성 crop 디렉토리)
+- epubstats: EPUB 변환 순차 vs 병렬 vs 페이지 수 캐시 재사용 (ebook-convert 스텁, 스텁 생성기 포함)
+- qna_analyzer: 파일별 집계 캐시 + 병렬 map vs 기존 순차 QnA 통계 분석 (합성 workbook_data)
+- report_store: 평가 직후 Excel 저장 vs 결과 저장소 기록 (평가 종료 시점 지연)
+
+사용 예:
+    python -m tools.benchmarks.stratified_sampler --pool_size 50000 --legacy_max 5000
+"""
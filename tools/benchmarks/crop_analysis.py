@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+crop 디렉토리 스캔/비교 벤치마크 (매니페스트 증분 스캔 vs 기존 os.walk 전체 스캔)
+
+임시 디렉토리에 합성 crop 디렉토리(책/챕터 폴더 아래 tb_/img_/etc_ 파일)를 만들고, 폴더 1개에서 파일을 지운 뒤
+CropAnalyzer.organize_crop_files(매니페스트 증분 스캔) + diff_folder_stats(집합 비교)와
+기존 방식(os.walk 전체 스캔 + Excel 행 비교)의 시간과 결과를 비교합니다. 실제 crop 디렉토리는 건드리지 않습니다.
+
+    python -m tools.benchmarks.crop_analysis --books 50 --folders 40 --files 30
+"""
+
+import os
+import time
+import random
+import argparse
+import tempfile
+from typing import Any, Dict, List
+
+from tools.data_processing.crop_analysis import CropAnalyzer, FolderStats, diff_folder_stats
+
+
+def _legacy_organize_crop_files(analyzer: CropAnalyzer) -> List[FolderStats]:
+    """crop_dir의 폴더별로 파일들을 정리 (기존 os.walk 전체 스캔)"""
+    results = []
+    for root, dirs, files in os.walk(analyzer.crop_dir):
+        # 시스템 파일 제외
+        files = [f for f in files if not f.startswith('.')]
+        if not files:
+            continue
+        stats = FolderStats(folder_name=os.path.basename(root))
+        for file in files:
+            analyzer._classify_file(file, stats)
+        # 분류된 파일이 있는 경우만 결과에 추가
+        if stats.table_files or stats.image_files or stats.etc_files:
+            results.append(stats)
+    return results
+
+
+def _legacy_compare_rows(before_rows: List[Dict[str, Any]], after_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """BEFORE/AFTER Excel 행 비교 (기존 방식, 셀 문자열을 그대로 옮김)"""
+    parse = CropAnalyzer._parse_file_list
+    before_dict = {row['폴더명']: row for row in before_rows}
+    after_dict = {row['폴더명']: row for row in after_rows}
+    results = []
+    for folder_name, before_row in before_dict.items():
+        if folder_name not in after_dict:
+            # AFTER에 없는 폴더
+            results.append({
+                '폴더명': folder_name,
+                '상태': 'AFTER에_없는_폴더',
+                '테이블_파일_수': before_row['테이블_파일_수'],
+                '이미지_파일_수': before_row['이미지_파일_수'],
+                '기타_파일_수': before_row.get('기타_파일_수', '0'),
+                '없어진_테이블_파일': before_row['테이블_파일_목록'],
+                '없어진_이미지_파일': before_row['이미지_파일_목록'],
+                '없어진_기타_파일': before_row.get('기타_파일_목록', ''),
+                '없어진_페이지_수': before_row['파일이_있는_페이지_수'],
+                '없어진_페이지_목록': before_row['파일이_있는_페이지_목록']
+            })
+            continue
+        after_row = after_dict[folder_name]
+        before_table, after_table = parse(before_row['테이블_파일_목록']), parse(after_row['테이블_파일_목록'])
+        before_image, after_image = parse(before_row['이미지_파일_목록']), parse(after_row['이미지_파일_목록'])
+        before_etc, after_etc = parse(before_row.get('기타_파일_목록', '')), parse(after_row.get('기타_파일_목록', ''))
+        before_pages, after_pages = parse(before_row['파일이_있는_페이지_목록']), parse(after_row['파일이_있는_페이지_목록'])
+
+        missing_table = before_table - after_table
+        missing_image = before_image - after_image
+        missing_etc = before_etc - after_etc
+        missing_pages = before_pages - after_pages
+        if missing_table or missing_image or missing_etc or missing_pages:
+            results.append({
+                '폴더명': folder_name,
+                '상태': '일부_파일_누락',
+                '테이블_파일_수': before_row['테이블_파일_수'],
+                '이미지_파일_수': before_row['이미지_파일_수'],
+                '기타_파일_수': before_row.get('기타_파일_수', '0'),
+                '없어진_테이블_파일': ', '.join(sorted(missing_table)) if missing_table else '',
+                '없어진_이미지_파일': ', '.join(sorted(missing_image)) if missing_image else '',
+                '없어진_기타_파일': ', '.join(sorted(missing_etc)) if missing_etc else '',
+                '없어진_페이지_수': len(missing_pages),
+                '없어진_페이지_목록': ', '.join(sorted(missing_pages)) if missing_pages else '',
+                '최종_페이지_목록': ', '.join(sorted(after_pages))
+            })
+    return results
+
+
+def as_excel_rows(stats_list: List[FolderStats]) -> List[Dict[str, Any]]:
+    """폴더 통계 → pd.read_excel(dtype=str)로 다시 읽은 것과 같은 행 (빈 셀은 NaN)"""
+    return [{k: (str(v) if v != '' else float('nan')) for k, v in s.to_dict().items()} for s in stats_list]
+
+
+def make_synthetic_crop_dir(root: str, num_books: int = 50, folders_per_book: int = 40,
+                            files_per_folder: int = 30, seed: int = 42) -> None:
+    """합성 crop 디렉토리 생성 (임시 디렉토리 전용, 책/챕터 폴더 아래 빈 tb_/img_/etc_ 파일)"""
+    rng = random.Random(seed)
+    prefixes = ['tb_', 'img_', 'etc_', 'img_', 'img_']
+    for b in range(num_books):
+        for c in range(folders_per_book):
+            folder = os.path.join(root, f'book_{b:04d}', f'crop_{b:04d}_{c:03d}')
+            os.makedirs(folder, exist_ok=True)
+            for i in range(files_per_folder):
+                name = f'{rng.choice(prefixes)}{rng.randint(0, 400):04d}_{i:02d}.png'
+                open(os.path.join(folder, name), 'w').close()
+
+
+def benchmark_crop_analysis(num_books: int = 50, folders_per_book: int = 40, files_per_folder: int = 30,
+                            workers: int = 8) -> Dict[str, Any]:
+    """
+    기존 전체 스캔 + Excel 행 비교 vs 매니페스트 증분 스캔 + 집합 비교 (합성 데이터, 결과 동일성 포함)
+
+    Returns:
+        dict: 단계별 소요 시간(초)과 스캔/비교 결과 동일 여부
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='crop_bench_') as work_dir:
+        crop_dir = os.path.join(work_dir, 'crop')
+        make_synthetic_crop_dir(crop_dir, num_books, folders_per_book, files_per_folder)
+        os.chdir(work_dir)  # 매니페스트는 작업 디렉토리에 저장되므로 임시 디렉토리 사용
+        try:
+            analyzer = CropAnalyzer(crop_dir, workers=workers)
+            report: Dict[str, Any] = {}
+
+            start = time.perf_counter()
+            legacy_before = _legacy_organize_crop_files(analyzer)
+            report['legacy_walk_seconds'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cold_stats = analyzer.organize_crop_files()
+            report['manifest_cold_seconds'] = time.perf_counter() - start
+
+            # 폴더 1개에서 파일 삭제 후 증분 스캔 (합성 디렉토리 안의 파일만 지움)
+            changed = next(s for s in cold_stats if s.image_files)
+            changed_dir = next(root for root, _, files in os.walk(crop_dir) if changed.image_files[0] in files)
+            os.remove(os.path.join(changed_dir, changed.image_files[0]))
+
+            start = time.perf_counter()
+            warm_stats = analyzer.organize_crop_files()
+            report['manifest_warm_seconds'] = time.perf_counter() - start
+            legacy_after = _legacy_organize_crop_files(analyzer)
+
+            before_rows, after_rows = as_excel_rows(legacy_before), as_excel_rows(legacy_after)
+            start = time.perf_counter()
+            legacy_diff = _legacy_compare_rows(before_rows, after_rows)
+            report['legacy_diff_seconds'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            diff = diff_folder_stats(cold_stats, warm_stats)
+            report['manifest_diff_seconds'] = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+    def as_dicts(stats_list):
+        return [s.to_dict() for s in stats_list]
+
+    report['scan_identical'] = (as_dicts(cold_stats) == as_dicts(legacy_before)
+                                and as_dicts(warm_stats) == as_dicts(legacy_after))
+    report['diff_identical'] = ([{k: str(v) for k, v in row.items()} for row in diff]
+                                == [{k: str(v) for k, v in row.items()} for row in legacy_diff])
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='crop 디렉토리 스캔/비교 벤치마크 (매니페스트 vs os.walk)')
+    parser.add_argument('--books', type=int, default=50, help='책 폴더 수 (기본값: 50)')
+    parser.add_argument('--folders', type=int, default=40, help='책당 crop 폴더 수 (기본값: 40)')
+    parser.add_argument('--files', type=int, default=30, help='폴더당 파일 수 (기본값: 30)')
+    parser.add_argument('--workers', type=int, default=8, help='하위 폴더 병렬 스캔 스레드 수 (기본값: 8)')
+    args = parser.parse_args()
+
+    report = benchmark_crop_analysis(args.books, args.folders, args.files, args.workers)
+    for name in ('legacy_walk', 'manifest_cold', 'manifest_warm', 'legacy_diff', 'manifest_diff'):
+        print(f"{name:>15}: {report[name + '_seconds']:.3f}s")
+    print(f"{'speedup (scan)':>15}: {report['legacy_walk_seconds'] / max(report['manifest_warm_seconds'], 1e-9):.1f}x")
+    print(f"스캔 결과 동일: {report['scan_identical']}, 비교 결과 동일: {report['diff_identical']}")
+
+
+if __name__ == '__main__':
+    main()
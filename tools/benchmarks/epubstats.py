@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EPUB/PDF 페이지 수 수집 벤치마크 (순차 변환 vs 병렬 변환 vs 캐시 재사용)
+
+임시 디렉토리에 합성 EPUB/PDF와 ebook-convert 스텁(입력 크기에 비례한 페이지 수의 최소 PDF 생성)을 만들고,
+collect_page_counts를 1) 캐시 없이 순차  2) 캐시 없이 병렬  3) 캐시가 채워진 상태로 실행한 시간과 결과를 비교합니다.
+PyPDF2가 설치되어 있으면 count_pdf_pages(/Count만 읽음)와 PyPDF2 전체 파싱도 비교합니다.
+
+    python -m tools.benchmarks.epubstats --books 40 --workers 8
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+from typing import Any, Dict
+
+from tools.data_processing.epubstats import (
+    PageCountCache,
+    PyPDF2,
+    _pypdf2_count_pages,
+    collect_page_counts,
+    count_pdf_pages,
+)
+
+
+_STUB_CONVERTER = """#!{python}
+# ebook-convert 대체 스텁: 입력 크기에 비례한 페이지 수의 최소 PDF 생성 (xref 포함)
+import sys, time
+src, dst = sys.argv[1], sys.argv[2]
+pages = len(open(src, 'rb').read()) // 1000 + 1
+if '--base-font-size' in sys.argv:
+    pages = pages * 3 // 2
+time.sleep({delay})
+objs = ['<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [' + ' '.join(f'{{i + 3}} 0 R' for i in range(pages)) + f'] /Count {{pages}} >>']
+objs += ['<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>'] * pages
+out = bytearray(b'%PDF-1.4\\n')
+offsets = []
+for i, obj in enumerate(objs, 1):
+    offsets.append(len(out))
+    out += f'{{i}} 0 obj\\n{{obj}}\\nendobj\\n'.encode()
+xref = len(out)
+out += f'xref\\n0 {{len(objs) + 1}}\\n0000000000 65535 f \\n'.encode()
+out += ''.join(f'{{o:010d}} 00000 n \\n' for o in offsets).encode()
+out += f'trailer\\n<< /Size {{len(objs) + 1}} /Root 1 0 R >>\\nstartxref\\n{{xref}}\\n%%EOF\\n'.encode()
+open(dst, 'wb').write(bytes(out))
+"""
+
+
+def stub_page_count(size: int, use_10pt_font: bool = False) -> int:
+    """스텁 변환기가 size 바이트 입력에 대해 만드는 PDF 페이지 수"""
+    pages = size // 1000 + 1
+    return pages * 3 // 2 if use_10pt_font else pages
+
+
+def make_stub_converter(path: str, delay: float = 0.05) -> str:
+    """ebook-convert 스텁 스크립트 생성 (실행 권한 부여)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_STUB_CONVERTER.format(python=sys.executable, delay=delay))
+    os.chmod(path, 0o755)
+    return path
+
+
+def make_synthetic_books(target_dir: str, converter: str, num_books: int = 40, seed: int = 42) -> None:
+    """합성 원본 디렉토리 생성 (임시 디렉토리 전용, EPUB num_books개 + 스텁으로 만든 원본 PDF num_books개)"""
+    os.makedirs(target_dir, exist_ok=True)
+    rng = random.Random(seed)
+    for i in range(num_books):
+        src = os.path.join(target_dir, f'EB{i:04d}.EPUB')
+        with open(src, 'wb') as f:
+            f.write(bytes(rng.getrandbits(8) for _ in range(rng.randint(1000, 50000))))
+        subprocess.run([converter, src, os.path.join(target_dir, f'PD{i:04d}.pdf')], check=True)
+
+
+def benchmark_page_counts(num_books: int = 40, workers: int = 8, delay: float = 0.05) -> Dict[str, Any]:
+    """
+    스텁 변환기로 순차/병렬 변환과 캐시 재사용 시간 비교
+
+    Returns:
+        dict: 단계별 소요 시간(초), 결과 동일 여부, 캐시 재실행의 캐시 미스 수
+    """
+    with tempfile.TemporaryDirectory(prefix='epubstats_bench_') as work_dir:
+        converter = make_stub_converter(os.path.join(work_dir, 'ebook-convert'), delay=delay)
+        target_dir = os.path.join(work_dir, 'Lv1')
+        make_synthetic_books(target_dir, converter, num_books)
+        report: Dict[str, Any] = {'books': num_books}
+
+        start = time.perf_counter()
+        serial = collect_page_counts(target_dir, workers=1, convert_path=converter, show_progress=False)
+        report['serial_seconds'] = time.perf_counter() - start
+
+        cache = PageCountCache(os.path.join(work_dir, 'cache.json'))
+        start = time.perf_counter()
+        pooled = collect_page_counts(target_dir, cache, workers=workers, convert_path=converter, show_progress=False)
+        report['pooled_seconds'] = time.perf_counter() - start
+        cache.save()
+
+        cache = PageCountCache(os.path.join(work_dir, 'cache.json'))
+        start = time.perf_counter()
+        cached = collect_page_counts(target_dir, cache, workers=workers, convert_path=converter, show_progress=False)
+        report['cached_seconds'] = time.perf_counter() - start
+        report['cache_misses'] = cache.misses
+        report['identical'] = serial == pooled == cached and len(serial) == num_books * 2
+
+        # 경량 카운터 vs PyPDF2 (설치된 경우)
+        pdfs = [os.path.join(target_dir, f) for f in sorted(os.listdir(target_dir)) if f.endswith('.pdf')]
+        start = time.perf_counter()
+        light = [count_pdf_pages(p) for p in pdfs]
+        report['count_light_seconds'] = time.perf_counter() - start
+        if PyPDF2 is not None:
+            start = time.perf_counter()
+            parsed = [_pypdf2_count_pages(p) for p in pdfs]
+            report['count_pypdf2_seconds'] = time.perf_counter() - start
+            report['count_identical'] = light == parsed
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EPUB/PDF 페이지 수 수집 벤치마크 (스텁 변환기)')
+    parser.add_argument('--books', type=int, default=40, help='EPUB / 원본 PDF 각각의 수 (기본값: 40)')
+    parser.add_argument('--workers', type=int, default=8, help='EPUB 변환 병렬 수 (기본값: 8)')
+    parser.add_argument('--delay', type=float, default=0.05, help='스텁 변환 1회 지연 시간(초) (기본값: 0.05)')
+    args = parser.parse_args()
+
+    report = benchmark_page_counts(args.books, args.workers, args.delay)
+    for name in ('serial', 'pooled', 'cached', 'count_light', 'count_pypdf2'):
+        if f'{name}_seconds' in report:
+            print(f"{name:>13}: {report[name + '_seconds']:.3f}s")
+    print(f"결과 동일: {report['identical']}, 캐시 재실행 미스: {report['cache_misses']}개")
+    if 'count_identical' in report:
+        print(f"PyPDF2 페이지 수 동일: {report['count_identical']}")
+
+
+if __name__ == '__main__':
+    main()
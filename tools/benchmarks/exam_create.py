@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시험지 태그 대치 벤치마크 (copy-on-write vs deepcopy)
+
+임시 디렉토리에 합성 _extracted_qna.json과 시험지 문제를 만들어, ExamMaker._replace_tags(copy-on-write,
+workbook 색인 1회)와 기존 방식(문제마다 deepcopy, file_id마다 os.walk)의 시간/최대 메모리/결과를 비교합니다.
+
+    python -m tools.benchmarks.exam_create --questions 6250
+"""
+
+import os
+import copy
+import json
+import time
+import random
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from typing import Any, Dict, List
+
+from tools.exam.exam_create import ExamMaker, has_tags
+from tools.qna.extraction.tag_processor import TagProcessor
+
+
+def _legacy_replace_tags(exam_data: List[Dict], workbook_base: str) -> List[Dict]:
+    """기존 알고리즘 (문제마다 deepcopy + 필드별 정규식, file_id마다 os.walk, 태그 선형 탐색, 로그 생략)"""
+    cache = {}
+    result = []
+    for item in exam_data:
+        file_id = item.get('file_id', '')
+        tag_normalized = item.get('tag', '').strip('{}')
+        item_copy = copy.deepcopy(item)
+        has_tags(item_copy)
+        if file_id not in cache:
+            path = None
+            for root, dirs, files in os.walk(workbook_base):
+                for file in files:
+                    if file == f'{file_id}_extracted_qna.json':
+                        path = os.path.join(root, file)
+                        break
+                if path:
+                    break
+            if path:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cache[file_id] = json.load(f)
+        extracted_qna_item = None
+        for candidate in cache.get(file_id, []):
+            if candidate.get('qna_data', {}).get('tag', '').strip('{}') == tag_normalized:
+                extracted_qna_item = candidate
+                break
+        if extracted_qna_item and extracted_qna_item.get('additional_tag_data'):
+            item_copy = TagProcessor.replace_tags_in_qna_data(item_copy, extracted_qna_item['additional_tag_data'])
+            has_tags(item_copy)
+        result.append({k: v for k, v in item_copy.items() if k != 'additional_tag_data'})
+    return result
+
+
+def make_synthetic_exam_build(onedrive_path: str, questions: int = 6250, tagged_ratio: float = 0.08,
+                              per_file: int = 25, seed: int = 0) -> List[Dict]:
+    """
+    합성 시험지 빌드 입력 생성 (임시 디렉토리 전용)
+
+    onedrive_path/evaluation/workbook_data 아래에 file_id별 _extracted_qna.json을 만들고,
+    시험지 문제 리스트(태그 포함 문제 tagged_ratio 비율)를 반환합니다.
+    """
+    rng = random.Random(seed)
+    workbook_base = os.path.join(onedrive_path, 'evaluation', 'workbook_data')
+    exam_data = []
+    extracted: Dict[str, List[Dict]] = {}
+    for i in range(questions):
+        file_id = f'SS{i // per_file:05d}'
+        tag = f'{{q_{i // per_file:04d}_{i % per_file:04d}}}'
+        item = {
+            'file_id': file_id, 'tag': tag, 'domain': '경제', 'subdomain': '미시경제학',
+            'question': f'문제 {i}: 다음 중 옳지 않은 것은?',
+            'options': [f'{n} 선지 {i}-{k} ' + '설명 ' * 20 for k, n in enumerate('①②③④⑤')],
+            'answer': '③', 'explanation': '해설 ' * 80,
+        }
+        additional_tag_data = []
+        if rng.random() < tagged_ratio:
+            table_tag = f'{{tb_{i % 10000:04d}_0001}}'
+            item['question'] += f' {table_tag}'
+            additional_tag_data.append({'tag': table_tag, 'data': {'content': '| 항목 | 값 |\n|---|---|\n' * 10}})
+        extracted.setdefault(file_id, []).append({'qna_data': {'tag': tag}, 'additional_tag_data': additional_tag_data})
+        exam_data.append(item)
+    for n, (file_id, items) in enumerate(extracted.items()):
+        file_dir = os.path.join(workbook_base, f'Lv{n % 3 + 1}', f'book_{n % 40:02d}')
+        os.makedirs(file_dir, exist_ok=True)
+        with open(os.path.join(file_dir, f'{file_id}_extracted_qna.json'), 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=False)
+    return exam_data
+
+
+def benchmark_replace_tags(questions: int = 6250, tagged_ratio: float = 0.08) -> Dict[str, Any]:
+    """
+    copy-on-write 태그 대치 vs 기존 deepcopy 방식 벤치마크 (시간, tracemalloc 최대 메모리, 결과 동일성)
+
+    Args:
+        questions: 전체 시험지 문제 수 (기본 5세트 × 1250 = 6250)
+        tagged_ratio: 태그를 포함한 문제 비율
+
+    Returns:
+        dict: 방식별 소요 시간(초)과 최대 할당 메모리(MB), 결과 동일 여부
+    """
+    def measure(func):
+        tracemalloc.start()
+        start = time.perf_counter()
+        output = func()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return output, seconds, peak / 1024 / 1024
+
+    with tempfile.TemporaryDirectory() as onedrive_path:
+        exam_data = make_synthetic_exam_build(onedrive_path, questions, tagged_ratio)
+        workbook_base = os.path.join(onedrive_path, 'evaluation', 'workbook_data')
+        logger = logging.getLogger('tools.benchmarks.exam_create')
+        logger.setLevel(logging.ERROR)
+
+        old, legacy_seconds, legacy_peak = measure(lambda: _legacy_replace_tags(exam_data, workbook_base))
+        maker = ExamMaker(onedrive_path, logger)
+        new, cow_seconds, cow_peak = measure(lambda: maker._replace_tags(exam_data))
+
+    return {
+        'questions': questions,
+        'tagged': sum(1 for item in exam_data if has_tags(item)),
+        'legacy_seconds': legacy_seconds,
+        'legacy_peak_mb': legacy_peak,
+        'cow_seconds': cow_seconds,
+        'cow_peak_mb': cow_peak,
+        'identical': old == new,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시험지 태그 대치 벤치마크 (copy-on-write vs deepcopy)')
+    parser.add_argument('--questions', type=int, default=6250, help='전체 문제 수 (기본값: 6250)')
+    parser.add_argument('--tagged_ratio', type=float, default=0.08, help='태그 포함 문제 비율 (기본값: 0.08)')
+    args = parser.parse_args()
+
+    report = benchmark_replace_tags(args.questions, args.tagged_ratio)
+    print(f"문제 {report['questions']}개 (태그 포함 {report['tagged']}개)")
+    print(f"기존 deepcopy: {report['legacy_seconds']:.3f}s, 최대 {report['legacy_peak_mb']:.1f}MB")
+    print(f"copy-on-write: {report['cow_seconds']:.3f}s, 최대 {report['cow_peak_mb']:.1f}MB")
+    print(f"결과 동일: {report['identical']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시험지 요구사항 검사/보충 벤치마크
+
+ExamRequirementTracker(증분 카운터) + QuestionPool(인덱스 풀)과 기존 재스캔 방식으로
+sets × exams 시험지를 검사 → 보충 → 재검사하고, 소요 시간과 결과 동일 여부를 비교합니다.
+
+    python -m tools.benchmarks.exam_validator --pool_size 30000
+"""
+
+import time
+import random
+import logging
+import argparse
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
+
+from tools.benchmarks.question_pool import make_synthetic_pool, make_synthetic_exams_config
+from tools.exam.exam_validator import ExamRequirementTracker, ExamValidator
+from tools.exam.question_pool import QuestionPool, question_key
+
+
+def _legacy_check_exam_meets_requirements(exam_data: List[Dict], exam_name: str,
+                                          stats: Dict[str, Any]) -> Tuple[bool, Dict[str, Dict[str, int]]]:
+    """기존 알고리즘 (매번 전체 재집계)"""
+    if exam_name not in stats:
+        return False, {}
+    actual_counts = defaultdict(lambda: defaultdict(int))
+    for question in exam_data:
+        domain = question.get('domain', '')
+        subdomain = question.get('subdomain', '')
+        if domain and subdomain:
+            actual_counts[domain][subdomain] += 1
+    meets_requirements = True
+    for domain in stats[exam_name].keys():
+        if domain not in actual_counts:
+            meets_requirements = False
+            continue
+        for subdomain, needed_count in stats[exam_name][domain]['exam_subdomain_distribution'].items():
+            if actual_counts[domain][subdomain] != needed_count:
+                meets_requirements = False
+    return meets_requirements, {domain: dict(counts) for domain, counts in actual_counts.items()}
+
+
+def _legacy_update_existing_exam(existing_exam_data: List[Dict], exam_name: str, stats: Dict[str, Any],
+                                 all_data: List[Dict], used_questions: set) -> List[Dict]:
+    """기존 알고리즘 (domain마다 all_data 전체 재필터링, 로그 생략)"""
+    if exam_name not in stats:
+        return existing_exam_data
+    existing_by_subdomain = defaultdict(list)
+    existing_question_ids = set()
+    for question in existing_exam_data:
+        if question.get('domain', '') and question.get('subdomain', ''):
+            existing_by_subdomain[(question['domain'], question['subdomain'])].append(question)
+            existing_question_ids.add(question_key(question))
+    updated_exam_data = []
+    for domain in stats[exam_name].keys():
+        domain_data = [d for d in all_data if d.get('domain') == domain]
+        for subdomain, needed_count in stats[exam_name][domain]['exam_subdomain_distribution'].items():
+            existing_subdomain_questions = existing_by_subdomain.get((domain, subdomain), [])
+            existing_count = len(existing_subdomain_questions)
+            if existing_count <= needed_count:
+                updated_exam_data.extend(existing_subdomain_questions)
+                used_questions.update(question_key(q) for q in existing_subdomain_questions)
+                if existing_count == needed_count:
+                    continue
+                available = [
+                    d for d in domain_data
+                    if d.get('subdomain') == subdomain
+                    and question_key(d) not in existing_question_ids
+                    and question_key(d) not in used_questions
+                ]
+                random.shuffle(available)
+                needed_additional = needed_count - existing_count
+                if len(available) >= needed_additional:
+                    additional = random.sample(available, needed_additional)
+                else:
+                    additional = available
+                updated_exam_data.extend(additional)
+                used_questions.update(question_key(q) for q in additional)
+                existing_question_ids.update(question_key(q) for q in additional)
+            else:
+                random.shuffle(existing_subdomain_questions)
+                selected = existing_subdomain_questions[:needed_count]
+                updated_exam_data.extend(selected)
+                used_questions.update(question_key(q) for q in selected)
+    return updated_exam_data
+
+
+def make_synthetic_existing_exams(pool: List[Dict[str, Any]], stats: Dict[str, Any], sets: int = 5,
+                                  seed: int = 0) -> List[Dict[str, List[Dict]]]:
+    """합성 기존 시험지 (subdomain별로 요구량의 0~130%를 무작위로 채움, 일부 요구 외 문제 포함)"""
+    rng = random.Random(seed)
+    buckets: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for item in pool:
+        buckets[(item['domain'], item['subdomain'])].append(item)
+    exam_sets = []
+    for _ in range(sets):
+        exams = {}
+        for exam_name, exam_stats in stats.items():
+            exam_data = []
+            for domain, domain_stats in exam_stats.items():
+                for subdomain, needed in domain_stats['exam_subdomain_distribution'].items():
+                    candidates = buckets[(domain, subdomain)]
+                    k = min(len(candidates), int(needed * rng.uniform(0.0, 1.3)))
+                    exam_data.extend(rng.sample(candidates, k))
+            exam_data.append({'file_id': 'X', 'tag': 'extra', 'domain': 'X', 'subdomain': 'X'})
+            rng.shuffle(exam_data)
+            exams[exam_name] = exam_data
+        exam_sets.append(exams)
+    return exam_sets
+
+
+def benchmark_exam_validator(pool_size: int = 30000, sets: int = 5, exams: int = 4,
+                             seed: int = 42) -> Dict[str, Any]:
+    """
+    증분 카운터/인덱스 풀 vs 기존 재스캔 방식 벤치마크 (sets × exams 시험지 검사 → 보충 → 재검사)
+
+    Args:
+        pool_size: 합성 DST 풀 크기
+        sets: 세트 수
+        exams: 세트당 과목 수
+        seed: 보충 랜덤 시드
+
+    Returns:
+        dict: 방식별 소요 시간, 결과(시험지/사용 문제/충족 여부) 동일 여부
+    """
+    pool = make_synthetic_pool(pool_size)
+    config = make_synthetic_exams_config(pool, exams, fill=0.8 / sets)
+    stats = {
+        exam_name: {
+            domain: {
+                'exam_questions': sum(sub['count'] for sub in domain_info['subdomains'].values()),
+                'exam_subdomain_distribution': {s: sub['count'] for s, sub in domain_info['subdomains'].items()},
+            }
+            for domain, domain_info in exam_info['domain_details'].items()
+        }
+        for exam_name, exam_info in config.items()
+    }
+    existing = make_synthetic_existing_exams(pool, stats, sets)
+    logger = logging.getLogger('tools.benchmarks.exam_validator')
+    logger.setLevel(logging.ERROR)
+
+    random.seed(seed)
+    start = time.perf_counter()
+    used_old: Set[Tuple[str, str]] = set()
+    old_results = []
+    for exam_set in existing:
+        for exam_name, exam_data in exam_set.items():
+            before, _ = _legacy_check_exam_meets_requirements(exam_data, exam_name, stats)
+            updated = _legacy_update_existing_exam(exam_data, exam_name, stats, pool, used_old)
+            after, counts = _legacy_check_exam_meets_requirements(updated, exam_name, stats)
+            old_results.append((before, after, counts, [question_key(q) for q in updated]))
+    legacy_seconds = time.perf_counter() - start
+
+    random.seed(seed)
+    start = time.perf_counter()
+    used_new: Set[Tuple[str, str]] = set()
+    question_pool = QuestionPool(pool)
+    new_results = []
+    for exam_set in existing:
+        for exam_name, exam_data in exam_set.items():
+            tracker = ExamRequirementTracker(exam_name, stats, exam_data)
+            before = tracker.meets_requirements
+            updated = ExamValidator.update_existing_exam(exam_data, exam_name, stats, pool, used_new, logger,
+                                                         pool=question_pool, tracker=tracker)
+            new_results.append((before, tracker.meets_requirements, tracker.actual_counts(),
+                                [question_key(q) for q in updated]))
+    indexed_seconds = time.perf_counter() - start
+
+    return {
+        'pool_size': pool_size,
+        'exams_checked': len(new_results),
+        'legacy_seconds': legacy_seconds,
+        'indexed_seconds': indexed_seconds,
+        'identical': old_results == new_results and used_old == used_new,
+        'met_before': sum(1 for r in new_results if r[0]),
+        'met_after': sum(1 for r in new_results if r[1]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시험지 요구사항 검사/보충 벤치마크 (증분 카운터 + 인덱스 풀)')
+    parser.add_argument('--pool_size', type=int, default=30000, help='합성 풀 크기 (기본값: 30000)')
+    parser.add_argument('--sets', type=int, default=5, help='세트 수 (기본값: 5)')
+    parser.add_argument('--exams', type=int, default=4, help='세트당 과목 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    report = benchmark_exam_validator(args.pool_size, args.sets, args.exams, args.seed)
+    print(f"풀: {report['pool_size']}개, 시험지 {report['exams_checked']}개 검사/보충")
+    print(f"기존 재스캔: {report['legacy_seconds']:.3f}s / 증분 카운터 + 인덱스 풀: {report['indexed_seconds']:.3f}s")
+    print(f"요구사항 충족 (보충 전 → 후): {report['met_before']} → {report['met_after']}")
+    print(f"결과 동일: {report['identical']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+QnA 통계 분석 벤치마크 (파일별 집계 캐시 + 병렬 map vs 기존 순차 전체 파싱)
+
+임시 디렉토리에 합성 workbook_data(*_extracted_qna.json)를 만들고 리포트 생성까지의 시간을 비교합니다.
+1) 기존 방식  2) 캐시 없이 병렬 map(콜드)  3) 파일 1개만 바뀐 뒤 재실행(웜)
+캐시 파일({파일}.qnastats)과 파일 변경은 모두 임시 디렉토리 안에서만 일어나며, 실제 workbook_data는 읽지 않습니다.
+
+    python -m tools.benchmarks.qna_analyzer --files 300 --items 200 --workers 8
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from tools.core.utils import JSONHandler
+from tools.report.qna_analyzer import QnAStatisticsAnalyzer
+from tools.report.qna_report import QnAReportGenerator
+
+
+def _legacy_analyze(analyzer: QnAStatisticsAnalyzer) -> Dict[str, Any]:
+    """QnA 파일들을 순차로 모두 파싱하여 통계 생성 (기존 방식)"""
+    files = analyzer.find_extracted_qna_files()
+    stats = {
+        'total_files': 0,
+        'total_qna_items': 0,
+        'valid_domain_items': 0,
+        'invalid_domain_items': 0,
+        'qna_domain_stats': defaultdict(int),
+        'qna_type_stats': defaultdict(int),
+        'domain_type_combination': defaultdict(lambda: defaultdict(int)),
+        'file_stats': [],
+        'domain_type_details': defaultdict(lambda: defaultdict(list)),
+        'invalid_domain_details': defaultdict(list),
+        'ss_pattern_details': defaultdict(list)
+    }
+
+    for file_path in files:
+        try:
+            data = JSONHandler.load(file_path)
+        except Exception as e:
+            analyzer.logger.error(f"Error loading {file_path}: {e}")
+            continue
+        if data is None:
+            continue
+
+        stats['total_files'] += 1
+        file_id = os.path.basename(file_path).replace('_extracted_qna.json', '')
+        file_qna_count = 0
+        file_valid_domain_count = 0
+        file_invalid_domain_count = 0
+
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            stats['total_qna_items'] += 1
+            file_qna_count += 1
+
+            qna_domain = item.get('qna_domain', '')
+            qna_type = item.get('qna_type', 'Unknown')
+            question_text = item.get('qna_data', {}).get('description', {}).get('question', '')
+            if not qna_domain or qna_domain.strip() == '':
+                qna_domain = ''
+            short_question = question_text[:100] + '...' if len(question_text) > 100 else question_text
+
+            if analyzer.is_valid_domain(qna_domain):
+                stats['valid_domain_items'] += 1
+                file_valid_domain_count += 1
+                stats['qna_domain_stats'][qna_domain] += 1
+                stats['qna_type_stats'][qna_type] += 1
+                stats['domain_type_combination'][qna_domain][qna_type] += 1
+                stats['domain_type_details'][qna_domain][qna_type].append({
+                    'file_id': file_id,
+                    'title': item.get('title', ''),
+                    'chapter': item.get('chapter', ''),
+                    'page': item.get('page', ''),
+                    'qna_reason': item.get('qna_reason', ''),
+                    'question': short_question
+                })
+            else:
+                stats['invalid_domain_items'] += 1
+                file_invalid_domain_count += 1
+                ss_pattern = analyzer.extract_ss_pattern_from_question(question_text)
+                stats['invalid_domain_details'][qna_domain].append({
+                    'file_id': file_id,
+                    'title': item.get('title', ''),
+                    'chapter': item.get('chapter', ''),
+                    'page': item.get('page', ''),
+                    'qna_reason': item.get('qna_reason', ''),
+                    'question': short_question,
+                    'ss_pattern': ss_pattern,
+                    'original_domain': qna_domain,
+                    'qna_type': qna_type
+                })
+                if ss_pattern:
+                    stats['ss_pattern_details'][ss_pattern].append({
+                        'file_id': file_id,
+                        'domain': qna_domain,
+                        'type': qna_type,
+                        'question': short_question
+                    })
+
+        stats['file_stats'].append({
+            'file_id': file_id,
+            'file_path': file_path,
+            'qna_count': file_qna_count,
+            'valid_domain_count': file_valid_domain_count,
+            'invalid_domain_count': file_invalid_domain_count
+        })
+
+    return stats
+
+
+def as_plain(value: Any) -> Any:
+    """defaultdict 중첩 통계 → 일반 dict/list (비교용)"""
+    if isinstance(value, dict):
+        return {k: as_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [as_plain(v) for v in value]
+    return value
+
+
+def render_report(stats: Dict[str, Any], path: str) -> List[str]:
+    """마크다운 리포트 생성 후 줄 목록 반환 (실행마다 다른 생성일시 줄 제외)"""
+    QnAReportGenerator.save_report(stats, path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line for line in f if not line.startswith('**생성일시**')]
+
+
+def make_synthetic_workbook_data(base_path: str, num_files: int = 300, items_per_file: int = 200,
+                                 seed: int = 42) -> List[str]:
+    """합성 workbook_data 생성 (임시 디렉토리 전용, 유효/무효 도메인, SS 패턴 포함 문항)"""
+    rng = random.Random(seed)
+    domains = sorted(QnAStatisticsAnalyzer.VALID_DOMAINS) + ['', '기타', '법률']
+    types = ['multiple-choice', 'short-answer', 'essay', 'etc']
+    paths = []
+    for i in range(num_files):
+        folder = os.path.join(base_path, f'{i % 4 + 1}C', f'Lv{i % 3 + 2}', f'{i % 7}')
+        os.makedirs(folder, exist_ok=True)
+        items = []
+        for j in range(items_per_file):
+            question = f'SS{i:04d}_q_{j:04d}_{rng.randint(0, 9999):04d} ' if rng.random() < 0.2 else ''
+            question += '문제 본문 ' * rng.randint(1, 40)
+            items.append({
+                'title': f'도서 {i}',
+                'chapter': f'{rng.randint(1, 20)}장',
+                'page': str(rng.randint(1, 500)),
+                'qna_type': rng.choice(types),
+                'qna_domain': rng.choice(domains),
+                'qna_reason': '분류 근거',
+                'qna_data': {'description': {'question': question, 'answer': '정답'}}
+            })
+        path = os.path.join(folder, f'SS{i:04d}_extracted_qna.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=False, indent=4)
+        paths.append(path)
+    return paths
+
+
+def append_item(file_path: str) -> None:
+    """합성 파일 1개에 문항 1개 추가 (크기/mtime 변경)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data.append(dict(data[0], qna_domain='경제', qna_type='essay'))
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def benchmark_qna_analyzer(num_files: int = 300, items_per_file: int = 200, workers: int = 8) -> Dict[str, Any]:
+    """
+    기존 순차 분석 vs 파일별 집계 캐시 분석 (합성 데이터, 리포트 생성 포함)
+
+    Returns:
+        dict: 단계별 소요 시간(초), 웜 실행의 캐시 미스 수, 통계/리포트 동일 여부
+    """
+    with tempfile.TemporaryDirectory(prefix='qna_bench_') as work_dir:
+        base_path = os.path.join(work_dir, 'workbook_data')
+        files = make_synthetic_workbook_data(base_path, num_files, items_per_file)
+        report_file = os.path.join(work_dir, 'report.md')
+        report: Dict[str, Any] = {'files': len(files)}
+
+        start = time.perf_counter()
+        legacy_stats = _legacy_analyze(QnAStatisticsAnalyzer(base_path))
+        legacy_report = render_report(legacy_stats, report_file)
+        report['legacy_seconds'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cold_stats = QnAStatisticsAnalyzer(base_path, workers=workers).analyze()
+        cold_report = render_report(cold_stats, report_file)
+        report['cold_seconds'] = time.perf_counter() - start
+
+        append_item(files[len(files) // 2])
+
+        analyzer = QnAStatisticsAnalyzer(base_path, workers=workers)
+        start = time.perf_counter()
+        warm_stats = analyzer.analyze()
+        warm_report = render_report(warm_stats, report_file)
+        report['warm_seconds'] = time.perf_counter() - start
+        report['warm_cache_misses'] = analyzer.cache_misses
+
+        start = time.perf_counter()
+        legacy_after = _legacy_analyze(QnAStatisticsAnalyzer(base_path))
+        legacy_after_report = render_report(legacy_after, report_file)
+        report['legacy_after_change_seconds'] = time.perf_counter() - start
+
+        report['identical'] = (as_plain(cold_stats) == as_plain(legacy_stats)
+                               and as_plain(warm_stats) == as_plain(legacy_after)
+                               and cold_report == legacy_report and warm_report == legacy_after_report)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='QnA 통계 분석 벤치마크 (파일별 집계 캐시 vs 기존 순차 분석)')
+    parser.add_argument('--files', type=int, default=300, help='합성 파일 수 (기본값: 300)')
+    parser.add_argument('--items', type=int, default=200, help='파일당 문항 수 (기본값: 200)')
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                        help='캐시에 없는 파일을 집계할 프로세스 수 (기본값: CPU 수, 최대 8)')
+    args = parser.parse_args()
+
+    report = benchmark_qna_analyzer(args.files, args.items, args.workers)
+    print(f"파일 {report['files']}개")
+    for name in ('legacy', 'cold', 'warm', 'legacy_after_change'):
+        print(f"{name:>20}: {report[name + '_seconds']:.3f}s")
+    print(f"{'speedup (warm)':>20}: {report['legacy_after_change_seconds'] / max(report['warm_seconds'], 1e-9):.1f}x")
+    print(f"웜 실행 캐시 미스: {report['warm_cache_misses']}개, 통계/리포트 동일: {report['identical']}")
+
+
+if __name__ == '__main__':
+    main()
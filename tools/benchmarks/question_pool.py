@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+(domain, subdomain) 버킷 인덱스 문제 풀 벤치마크
+
+QuestionPool 버킷 조회와 기존 subdomain별 valid_data 재필터링 방식으로 같은 seed의 시험지를 만들어
+소요 시간과 결과 동일 여부를 비교합니다. (현재 DST 풀의 약 10배 규모 합성 데이터)
+
+    python -m tools.benchmarks.question_pool --pool_size 150000
+"""
+
+import time
+import random
+import logging
+import argparse
+from typing import Any, Dict, List, Set
+
+from tools.exam.question_pool import BucketKey, QuestionKey, QuestionPool, question_key
+
+
+def make_synthetic_pool(size: int, seed: int = 0, domains: int = 8,
+                        subdomains_per_domain: int = 6) -> List[Dict[str, Any]]:
+    """합성 DST 풀 (표/계산 문제 일부, 중복 키 일부 포함)"""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(size):
+        d = rng.randrange(domains)
+        pool.append({
+            'file_id': f'F{i // 300:05d}',
+            'tag': f'q_{i % 300:04d}' if rng.random() > 0.001 else 'q_0000',
+            'domain': f'D{d}',
+            'subdomain': f'D{d}_S{rng.randrange(subdomains_per_domain)}',
+            'question': '{tb_0001_0001} 표를 보고 답하시오.' if rng.random() < 0.03 else f'문제 {i}',
+            'is_calculation': 'True' if rng.random() < 0.05 else 'False',
+        })
+    return pool
+
+
+def make_synthetic_exams_config(pool: List[Dict[str, Any]], exams: int = 4, fill: float = 0.2) -> Dict[str, Any]:
+    """합성 풀에 맞춘 exam_config (과목마다 subdomain별 공급량의 fill 비율을 요구)"""
+    supply: Dict[BucketKey, int] = {}
+    for item in pool:
+        ds_key = (item['domain'], item['subdomain'])
+        supply[ds_key] = supply.get(ds_key, 0) + 1
+    config = {}
+    for e in range(exams):
+        domain_details: Dict[str, Any] = {}
+        for (domain, subdomain), n in sorted(supply.items()):
+            domain_details.setdefault(domain, {'subdomains': {}})['subdomains'][subdomain] = {
+                'count': int(n * fill)
+            }
+        config[f'exam_{e + 1}'] = {'domain_details': domain_details}
+    return config
+
+
+def _legacy_create_exam_random(exam_info: Dict[str, Any], valid_data: List[Dict[str, Any]],
+                               used_questions: Set[QuestionKey]) -> List[Dict[str, Any]]:
+    """기존 알고리즘 (subdomain마다 valid_data 전체 재필터링)"""
+    exam_data = []
+    for domain_name, domain_info in exam_info.get('domain_details', {}).items():
+        for subdomain_name, subdomain_info in domain_info.get('subdomains', {}).items():
+            needed_count = subdomain_info.get('count', 0)
+            available = [
+                item for item in valid_data
+                if item.get('domain') == domain_name
+                and item.get('subdomain') == subdomain_name
+                and question_key(item) not in used_questions
+            ]
+            random.shuffle(available)
+            selected = available[:needed_count]
+            for item in selected:
+                used_questions.add(question_key(item))
+            exam_data.extend(selected)
+    return exam_data
+
+
+def benchmark_question_pool(pool_size: int = 150000, exams: int = 4, seed: int = 42) -> Dict[str, Any]:
+    """
+    버킷 인덱스 vs 기존 재필터링 방식 벤치마크
+
+    Args:
+        pool_size: 합성 풀 크기 (현재 DST 풀의 약 10배가 기본값)
+        exams: 과목(세트) 수
+        seed: 랜덤 시드
+
+    Returns:
+        dict: 방식별 소요 시간, 결과 동일 여부, 과목별 문제 수
+    """
+    from tools.exam.exam_create import ExamMaker
+
+    pool = make_synthetic_pool(pool_size)
+    config = make_synthetic_exams_config(pool, exams)
+    logger = logging.getLogger('tools.benchmarks.question_pool')
+    logger.setLevel(logging.WARNING)
+    maker = ExamMaker(onedrive_path='', logger=logger)
+    valid_data = [item for item in pool if maker._is_valid_question(item)]
+
+    random.seed(seed)
+    start = time.perf_counter()
+    used_old: Set[QuestionKey] = set()
+    old = [_legacy_create_exam_random(info, valid_data, used_old) for info in config.values()]
+    legacy_seconds = time.perf_counter() - start
+
+    random.seed(seed)
+    start = time.perf_counter()
+    question_pool = QuestionPool(valid_data)
+    used_new: Set[QuestionKey] = set()
+    new = [maker._create_exam_random(name, info, valid_data, used_new, pool=question_pool)
+           for name, info in config.items()]
+    indexed_seconds = time.perf_counter() - start
+
+    return {
+        'pool_size': pool_size,
+        'valid_questions': len(valid_data),
+        'legacy_seconds': legacy_seconds,
+        'indexed_seconds': indexed_seconds,
+        'identical': [[question_key(q) for q in e] for e in old] == [[question_key(q) for q in e] for e in new],
+        'exam_sizes': [len(e) for e in new],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='(domain, subdomain) 버킷 인덱스 시험지 구성 벤치마크')
+    parser.add_argument('--pool_size', type=int, default=150000, help='합성 풀 크기 (기본값: 150000)')
+    parser.add_argument('--exams', type=int, default=4, help='과목 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    report = benchmark_question_pool(args.pool_size, args.exams, args.seed)
+    print(f"풀: {report['pool_size']}개 (유효 {report['valid_questions']}개), 과목별 문제 수: {report['exam_sizes']}")
+    print(f"기존 재필터링: {report['legacy_seconds']:.3f}s / 버킷 인덱스: {report['indexed_seconds']:.3f}s")
+    print(f"시험지 동일: {report['identical']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+평가 종료 시점 지연 시간 벤치마크 (평가 직후 Excel 저장 vs 결과 저장소 기록)
+
+합성 평가 결과(문제 × 모델)로 다음 세 가지를 임시 디렉토리에서 측정합니다.
+- excel_inline: 기존 save_combined_results_to_excel (평가 직후 Excel 생성)
+- store_write: 저장소 기록만 수행 (deferred 모드의 critical path)
+- excel_deferred: 저장소에서 Excel 리포트 생성 (필요할 때 별도 실행)
+
+    python -m tools.benchmarks.report_store --questions 5000 --models 8
+"""
+
+import os
+import time
+import argparse
+import tempfile
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from tools.evaluation.report_store import STORE_SUFFIX, save_results_store, write_excel_report
+
+
+def make_synthetic_results(n_questions: int, n_models: int, seed: int = 42):
+    """합성 평가 결과 (df_all, pred_long, pred_wide, acc, models)"""
+    rng = np.random.default_rng(seed)
+    domains = [f'domain_{i}' for i in range(8)]
+    df_all = pd.DataFrame({
+        'subject': rng.choice(['금융일반', '금융심화', '금융실무1', '금융실무2'], n_questions),
+        'domain': rng.choice(domains, n_questions),
+        'subdomain': [f'sub_{i}' for i in rng.integers(0, 40, n_questions)],
+        'book_id': [f'SS{i // 100:04d}' for i in range(n_questions)],
+        'tag': [f'q_{i:06d}' for i in range(n_questions)],
+        'id': [f'SS{i // 100:04d}_q_{i:06d}' for i in range(n_questions)],
+        'question': ['다음 중 옳지 않은 것은? ' * 5] * n_questions,
+        'opt1': ['보기 1'] * n_questions, 'opt2': ['보기 2'] * n_questions,
+        'opt3': ['보기 3'] * n_questions, 'opt4': ['보기 4'] * n_questions,
+        'opt5': ['보기 5'] * n_questions,
+        'answer_set': [{int(a)} for a in rng.integers(1, 6, n_questions)],
+    })
+    models = [f'vendor/model-{m}' for m in range(n_models)]
+    pred_long = pd.DataFrame({
+        'id': np.repeat(df_all['id'].values, n_models),
+        'model_name': models * n_questions,
+        'answer': rng.integers(1, 6, n_questions * n_models).astype(float),
+    })
+    pred_wide = pred_long.pivot(index='id', columns='model_name', values='answer').reset_index()
+    acc = pd.DataFrame({'model_name': models, 'accuracy': rng.random(n_models)})
+    return df_all, pred_long, pred_wide, acc, models
+
+
+def benchmark_report_latency(n_questions: int = 5000, n_models: int = 8, seed: int = 42) -> Dict[str, float]:
+    """
+    평가 종료 시점 지연 시간 비교 (출력 파일은 임시 디렉토리에만 씀)
+
+    Returns:
+        dict: excel_inline / store_write / excel_deferred 소요 시간(초)과 speedup
+    """
+    from tools.evaluation.multiple_eval_by_model import save_combined_results_to_excel
+
+    df_all, pred_long, pred_wide, acc, models = make_synthetic_results(n_questions, n_models, seed)
+    timings = {}
+    with tempfile.TemporaryDirectory(prefix='report_store_bench_') as output_dir:
+        start = time.perf_counter()
+        save_combined_results_to_excel(df_all, pred_wide, acc, pred_long, models,
+                                       os.path.join(output_dir, 'inline.xlsx'))
+        timings['excel_inline'] = time.perf_counter() - start
+
+        store_path = os.path.join(output_dir, 'deferred' + STORE_SUFFIX)
+        start = time.perf_counter()
+        save_results_store(df_all, pred_long, acc, models, store_path)
+        timings['store_write'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_excel_report(store_path, os.path.join(output_dir, 'deferred.xlsx'))
+        timings['excel_deferred'] = time.perf_counter() - start
+
+    timings['speedup'] = timings['excel_inline'] / timings['store_write'] if timings['store_write'] > 0 else float('inf')
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='평가 종료 시점 지연 시간 비교 (Excel 저장 vs 결과 저장소)')
+    parser.add_argument('--questions', type=int, default=5000, help='문제 수 (기본값: 5000)')
+    parser.add_argument('--models', type=int, default=8, help='모델 수 (기본값: 8)')
+    args = parser.parse_args()
+
+    timings = benchmark_report_latency(args.questions, args.models)
+    print(f"문제 {args.questions}개 × 모델 {args.models}개")
+    print(f"  기존 Excel 저장 (평가 직후): {timings['excel_inline']:.2f}초")
+    print(f"  저장소 기록 (평가 직후):     {timings['store_write']:.2f}초")
+    print(f"  Excel 리포트 (지연 생성):    {timings['excel_deferred']:.2f}초")
+    print(f"  평가 종료 지연 단축: {timings['speedup']:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
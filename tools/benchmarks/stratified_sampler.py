@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정답 개수별 층화 샘플러 벤치마크
+
+AnswerCountSampler(인덱스 기준 제거, 선형 시간)와 기존 _sample_questions_by_answer_count
+알고리즘(dict 비교 제거, O(n²))의 소요 시간과 결과 일치 여부를 합성 문제 풀로 비교합니다.
+
+    python -m tools.benchmarks.stratified_sampler --pool_size 50000 --legacy_max 5000
+"""
+
+import time
+import random
+import argparse
+from typing import Any, Dict, List
+
+from tools.transformed.multiple.stratified_sampler import AnswerCountSampler
+
+
+def question_id(q: Dict[str, Any]) -> str:
+    """문제 ID (file_id_tag)"""
+    return f"{q.get('file_id', '')}_{q.get('tag', '')}"
+
+
+def legacy_sample(questions: List[Dict[str, Any]], seed: int) -> Dict[int, List[Dict[str, Any]]]:
+    """기존 알고리즘 (dict 비교로 제거, O(n²))"""
+    rng = random.Random(seed)
+    options_4 = [q for q in questions if len(q.get('options', [])) == 4]
+    options_5 = [q for q in questions if len(q.get('options', [])) == 5]
+    ans_num_4 = AnswerCountSampler.plan(len(options_4), 4)
+    ans_num_5 = AnswerCountSampler.plan(len(options_5), 5)
+    remaining_4, remaining_5 = options_4.copy(), options_5.copy()
+    result = {}
+    for answer_count in range(2, 6):
+        result[answer_count] = []
+        if ans_num_4.get(answer_count, 0) > 0:
+            rng.shuffle(remaining_4)
+            sampled_4 = rng.sample(remaining_4, ans_num_4[answer_count])
+            result[answer_count].extend(sampled_4)
+            remaining_4 = [x for x in remaining_4 if x not in sampled_4]
+        if ans_num_5.get(answer_count, 0) > 0:
+            rng.shuffle(remaining_5)
+            sampled_5 = rng.sample(remaining_5, ans_num_5[answer_count])
+            result[answer_count].extend(sampled_5)
+            remaining_5 = [x for x in remaining_5 if x not in sampled_5]
+    return result
+
+
+def make_synthetic_pool(size: int, seed: int = 0, domains: int = 8) -> List[Dict[str, Any]]:
+    """합성 문제 풀 (4지/5지 혼합, 기타 선택지 일부 포함)"""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(size):
+        options_count = rng.choices([4, 5, 3], weights=[0.55, 0.43, 0.02])[0]
+        pool.append({
+            'file_id': f'F{i // 200:05d}',
+            'tag': f'q_{i:06d}',
+            'domain': f'domain_{rng.randrange(domains)}',
+            'question': f'문제 {i} 설명으로 옳지 않은 것은?',
+            'options': [f'선지 {j}' for j in range(options_count)],
+            'answer': str(rng.randint(1, options_count)),
+        })
+    return pool
+
+
+def benchmark_sampler(pool_size: int = 50000, legacy_max: int = 5000, seed: int = 42,
+                      repeats: int = 3) -> Dict[str, Any]:
+    """
+    선형 샘플러 vs 기존 알고리즘 벤치마크
+
+    Args:
+        pool_size: 선형 샘플러 측정용 문제 풀 크기
+        legacy_max: 기존 알고리즘 측정용 풀 크기 (O(n²)이므로 작게)
+        seed: 샘플링 시드
+        repeats: 반복 측정 횟수 (최솟값 사용)
+
+    Returns:
+        dict: 풀 크기별 소요 시간, 기존 알고리즘과의 결과 일치 여부, 그룹 크기
+    """
+    def _time(func) -> float:
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    pool = make_synthetic_pool(pool_size)
+    small = pool[:legacy_max]
+
+    new_small = AnswerCountSampler(seed).sample(small)
+    old_small = legacy_sample(small, seed)
+    identical = all(
+        [question_id(q) for q in new_small[ac]] == [question_id(q) for q in old_small[ac]]
+        for ac in range(2, 6)
+    )
+    domain_result = AnswerCountSampler(seed, by_domain=True).sample(pool)
+
+    return {
+        'pool_size': pool_size,
+        'legacy_size': len(small),
+        'new_seconds': _time(lambda: AnswerCountSampler(seed).sample(pool)),
+        'new_by_domain_seconds': _time(lambda: AnswerCountSampler(seed, by_domain=True).sample(pool)),
+        'new_seconds_legacy_size': _time(lambda: AnswerCountSampler(seed).sample(small)),
+        'legacy_seconds': _time(lambda: legacy_sample(small, seed)) if legacy_max > 0 else None,
+        'identical_to_legacy': identical,
+        'group_sizes': {ac: len(qs) for ac, qs in domain_result.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='정답 개수별 층화 샘플러 벤치마크')
+    parser.add_argument('--pool_size', type=int, default=50000, help='선형 샘플러 측정용 문제 수')
+    parser.add_argument('--legacy_max', type=int, default=5000, help='기존 O(n²) 알고리즘 측정용 문제 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    report = benchmark_sampler(args.pool_size, args.legacy_max, args.seed, args.repeats)
+    print(f"선형 샘플러 ({report['pool_size']}문제): {report['new_seconds']:.3f}s, "
+          f"domain 층화: {report['new_by_domain_seconds']:.3f}s")
+    if report['legacy_seconds'] is not None:
+        print(f"{report['legacy_size']}문제 기준: 기존 {report['legacy_seconds']:.3f}s vs "
+              f"선형 {report['new_seconds_legacy_size']:.4f}s")
+    print(f"기존 알고리즘과 결과 일치: {report['identical_to_legacy']}")
+    print(f"정답 개수별 문제 수 (domain 층화): {report['group_sizes']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,13 +8,19 @@ core 패키지 - 핵심 유틸리티 클래스
 - TextProcessor: 텍스트 처리 유틸리티  
 - JSONHandler: JSON 파일 읽기/쓰기, 포맷 변환
 - LLMQuery: LLM API 쿼리 (OpenRouter, vLLM)
+- TokenBudgetPacker: 토큰 예산 기반 배치 구성
+- RateBudget / BudgetedLLM: 스레드 간 공유 LLM 호출 예산
 - ExamConfig: 시험 설정 파일 로더
+- ArtifactReader / write_artifact / load_records: 압축 문제 아티팩트 (JSONL + 사이드카 인덱스)
 - Logger 유틸리티: 로깅 설정
 """
 
 from .utils import FileManager, TextProcessor, JSONHandler
 from .llm_query import LLMQuery
+from .token_packer import TokenBudgetPacker, TokenEstimator, get_model_token_limits
+from .rate_budget import RateBudget, BudgetedLLM
 from .exam_config import ExamConfig, load_exam_config
+from .artifact_store import ArtifactReader, write_artifact, load_records, json_to_artifact, artifact_to_json
 from .logger import setup_logger, get_logger, setup_step_logger
 
 __all__ = [
@@ -24,9 +30,22 @@ __all__ = [
     'JSONHandler',
     # LLM 쿼리
     'LLMQuery',
+    # 토큰 예산 배치
+    'TokenBudgetPacker',
+    'TokenEstimator',
+    'get_model_token_limits',
+    # 호출 예산
+    'RateBudget',
+    'BudgetedLLM',
     # 시험 설정
     'ExamConfig',
     'load_exam_config',
+    # 압축 문제 아티팩트
+    'ArtifactReader',
+    'write_artifact',
+    'load_records',
+    'json_to_artifact',
+    'artifact_to_json',
     # 로깅
     'setup_logger',
     'get_logger',
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+압축 문제 아티팩트 (JSONL + ID/오프셋 사이드카 인덱스)
+
+시험지, remaining 풀, 변형 시험지는 indent=4 JSON으로 저장되어 크고 느리며, 하위 단계는 몇 문제만 필요해도
+파일 전체를 읽었습니다. 이 모듈은 선택적으로 쓸 수 있는 압축 형식을 제공합니다.
+
+형식:
+    {name}.jsonl      문제 1개 = 1줄 (ensure_ascii=False, 공백 없는 구분자)
+    {name}.jsonl.idx  사이드카 인덱스 (JSON)
+                      {"format": "jsonl-idx/2", "records": N, "data_size": 바이트 수,
+                       "data_mtime_ns": 수정 시각, "rows": [[file_id, tag, question_id, offset, length], ...]}
+
+- 전체 로드는 줄 단위 스트리밍(load_records / iter_records)이고, 일부만 필요하면 ArtifactReader로
+  (file_id, tag) 또는 question_id에 해당하는 줄만 seek해서 읽습니다.
+- 인덱스의 data_size / data_mtime_ns가 데이터 파일과 다르면(수동 편집 등) 데이터를 한 번 훑어 인덱스를 다시 만듭니다.
+  (크기가 같은 편집도 수정 시각으로 감지)
+- 기존 .json과 같은 이름의 .jsonl이 함께 있으면 더 최근에 수정된 쪽을 사용합니다 (select_artifacts).
+
+변환:
+    python -m tools.core.artifact_store to-jsonl /path/to/4_multiple_exam      # .json → .jsonl + .idx
+    python -m tools.core.artifact_store to-json /path/to/exam.jsonl            # .jsonl → .json (indent=4)
+
+    exam_plus_create, step6 등 아직 .json만 읽는 단계가 있으므로 to-jsonl에서는 원본 .json을 지우지 않습니다.
+    (--remove_source는 to-json에서만 허용)
+"""
+
+import os
+import json
+import argparse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+ARTIFACT_EXT = '.jsonl'
+INDEX_EXT = '.idx'
+INDEX_FORMAT = 'jsonl-idx/2'
+
+RecordKey = Union[Tuple[str, str], str]
+
+
+def index_path(path: str) -> str:
+    """데이터 파일 → 사이드카 인덱스 경로"""
+    return path + INDEX_EXT
+
+
+def is_artifact(path: str) -> bool:
+    """JSONL 아티팩트 경로인지 여부"""
+    return path.endswith(ARTIFACT_EXT)
+
+
+def artifact_path(json_path: str) -> str:
+    """foo.json → foo.jsonl"""
+    return (json_path[:-len('.json')] if json_path.endswith('.json') else json_path) + ARTIFACT_EXT
+
+
+def json_path_of(path: str) -> str:
+    """foo.jsonl → foo.json"""
+    return path[:-len(ARTIFACT_EXT)] + '.json'
+
+
+def resolve_artifact(path: str) -> str:
+    """
+    읽을 파일 결정: .json 경로가 주어져도 같은 이름의 .jsonl이 더 최근이면(또는 .json이 없으면) .jsonl 반환
+
+    둘 다 없으면 입력 경로를 그대로 반환합니다 (호출측의 os.path.exists 검사 유지).
+    """
+    if is_artifact(path):
+        return path
+    compact = artifact_path(path)
+    if not os.path.exists(compact):
+        return path
+    if not os.path.exists(path) or os.path.getmtime(compact) >= os.path.getmtime(path):
+        return compact
+    return path
+
+
+def select_artifacts(paths: Iterable[str]) -> List[str]:
+    """파일 목록에서 같은 이름의 .json/.jsonl 쌍은 더 최근 것 하나만 남김 (순서 유지)"""
+    paths = list(paths)
+    present = set(paths)
+    selected = []
+    for path in paths:
+        if is_artifact(path):
+            json_file = json_path_of(path)
+        elif path.endswith('.json'):
+            json_file = path
+        else:
+            selected.append(path)
+            continue
+        both = json_file in present and artifact_path(json_file) in present
+        if both and resolve_artifact(json_file) != path:
+            continue
+        selected.append(path)
+    return selected
+
+
+def _record_row(record: Any) -> Tuple[str, str, str]:
+    """인덱스 키 (file_id, tag, question_id)"""
+    if not isinstance(record, dict):
+        return '', '', ''
+    return str(record.get('file_id', '') or ''), str(record.get('tag', '') or ''), str(record.get('question_id', '') or '')
+
+
+def _index_payload(rows: List[List[Any]], data_path: str) -> Dict[str, Any]:
+    """인덱스 내용 (데이터 파일의 현재 크기 / 수정 시각 기록)"""
+    stat = os.stat(data_path)
+    return {'format': INDEX_FORMAT, 'records': len(rows), 'data_size': stat.st_size,
+            'data_mtime_ns': stat.st_mtime_ns, 'rows': rows}
+
+
+def write_artifact(records: Iterable[Any], path: str) -> int:
+    """
+    문제 리스트를 JSONL + 사이드카 인덱스로 저장 (임시 파일에 쓴 뒤 교체)
+
+    Returns:
+        저장한 레코드 수
+    """
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+    rows = []
+    offset = 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+            f.write(line)
+            rows.append(list(_record_row(record)) + [offset, len(line)])
+            offset += len(line)
+    # os.replace는 수정 시각을 유지하므로 임시 파일 기준으로 기록해도 교체 후와 같음
+    index = _index_payload(rows, tmp_path)
+    tmp_index = index_path(path) + '.tmp'
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    os.replace(tmp_index, index_path(path))
+    return len(rows)
+
+
+def iter_records(path: str) -> Iterator[Any]:
+    """JSONL 아티팩트를 줄 단위로 읽기 (빈 줄 무시)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_records(path: str) -> Any:
+    """
+    형식과 무관하게 문제 데이터 로드 (.jsonl → 리스트, 그 외 → json.load 결과 그대로)
+
+    .json 경로가 주어져도 resolve_artifact로 최신 .jsonl을 우선 사용합니다.
+    """
+    path = resolve_artifact(path)
+    if is_artifact(path):
+        return list(iter_records(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ArtifactReader:
+    """사이드카 인덱스로 필요한 문제만 읽는 JSONL 리더"""
+
+    def __init__(self, path: str):
+        self.path = resolve_artifact(path)
+        if not is_artifact(self.path):
+            raise ValueError(f"JSONL 아티팩트가 아닙니다: {path}")
+        self.rows = self._load_index()
+        self._by_key: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._by_question_id: Dict[str, Tuple[int, int]] = {}
+        for file_id, tag, question_id, offset, length in self.rows:
+            if file_id and tag:
+                # 같은 키가 여러 번 있으면 json 리스트를 dict로 바꿀 때처럼 마지막 항목 사용
+                self._by_key[(file_id, tag)] = (offset, length)
+            if question_id:
+                self._by_question_id[question_id] = (offset, length)
+
+    def _load_index(self) -> List[List[Any]]:
+        """인덱스 로드 (없거나 데이터와 크기/수정 시각이 다르면 재구축 후 저장 시도)"""
+        stat = os.stat(self.path)
+        idx_file = index_path(self.path)
+        if os.path.exists(idx_file):
+            try:
+                with open(idx_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if (index.get('format') == INDEX_FORMAT and index.get('data_size') == stat.st_size
+                        and index.get('data_mtime_ns') == stat.st_mtime_ns):
+                    return index['rows']
+            except (OSError, ValueError):
+                pass
+        rows = []
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    rows.append(list(_record_row(json.loads(line))) + [offset, len(line)])
+                offset += len(line)
+        # 훑는 도중 파일이 바뀌었으면 기록하지 않음 (다음 로드에서 다시 재구축)
+        if os.stat(self.path).st_mtime_ns != stat.st_mtime_ns or offset != stat.st_size:
+            return rows
+        try:
+            with open(idx_file, 'w', encoding='utf-8') as f:
+                json.dump(_index_payload(rows, self.path), f, ensure_ascii=False, separators=(',', ':'))
+        except OSError:
+            pass
+        return rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _locate(self, key: RecordKey) -> Optional[Tuple[int, int]]:
+        if isinstance(key, tuple):
+            return self._by_key.get(key)
+        return self._by_question_id.get(key)
+
+    def __contains__(self, key: RecordKey) -> bool:
+        return self._locate(key) is not None
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """(file_id, tag) 키 목록 (파일 순서, 데이터 파싱 없음)"""
+        return list(self._by_key)
+
+    def get(self, key: RecordKey, default: Any = None) -> Any:
+        """(file_id, tag) 또는 question_id로 문제 1개 읽기"""
+        location = self._locate(key)
+        if location is None:
+            return default
+        with open(self.path, 'rb') as f:
+            f.seek(location[0])
+            return json.loads(f.read(location[1]))
+
+    def get_many(self, keys: Iterable[RecordKey]) -> List[Any]:
+        """여러 문제 읽기 (없는 키는 건너뜀, 파일 오프셋 순서로 읽어 요청 순서대로 반환)"""
+        locations = [(i, self._locate(key)) for i, key in enumerate(keys)]
+        found = {}
+        with open(self.path, 'rb') as f:
+            for i, location in sorted((item for item in locations if item[1] is not None), key=lambda x: x[1][0]):
+                f.seek(location[0])
+                found[i] = json.loads(f.read(location[1]))
+        return [found[i] for i in sorted(found)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter_records(self.path)
+
+
+def json_to_artifact(json_path: str, output_path: Optional[str] = None) -> str:
+    """기존 JSON(문제 리스트) 파일 → JSONL 아티팩트 (원본 유지, 리스트가 아닌 설정/통계 JSON은 ValueError)"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError('문제 리스트 형식이 아님')
+    output_path = output_path or artifact_path(json_path)
+    write_artifact(data, output_path)
+    return output_path
+
+
+def artifact_to_json(path: str, output_path: Optional[str] = None, indent: int = 4) -> str:
+    """JSONL 아티팩트 → 기존 JSON (indent=4 리스트, 원본 유지)"""
+    output_path = output_path or json_path_of(path)
+    records = list(iter_records(path))
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=indent)
+    return output_path
+
+
+def _collect(paths: List[str], ext: str) -> List[str]:
+    """파일/디렉토리 목록에서 확장자가 ext인 파일 수집 (디렉토리는 재귀)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(ext))
+        elif path.endswith(ext):
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문제 JSON ↔ 압축 JSONL 아티팩트(사이드카 인덱스) 변환')
+    parser.add_argument('command', choices=['to-jsonl', 'to-json'], help='to-jsonl: .json → .jsonl, to-json: .jsonl → .json')
+    parser.add_argument('paths', nargs='+', help='파일 또는 디렉토리 (디렉토리는 재귀)')
+    parser.add_argument('--remove_source', action='store_true', help='변환 후 원본 삭제 (to-json에서만 허용)')
+    args = parser.parse_args()
+
+    if args.remove_source and args.command == 'to-jsonl':
+        # exam_plus_create, step6 등은 아직 .json만 읽으므로 원본을 지우면 해당 단계가 시험지를 찾지 못함
+        parser.error('--remove_source는 to-json에서만 사용할 수 있습니다 (.json만 읽는 단계가 있어 원본 .json 유지 필요)')
+
+    if args.command == 'to-jsonl':
+        sources = _collect(args.paths, '.json')
+    else:
+        sources = _collect(args.paths, ARTIFACT_EXT)
+
+    total_before = total_after = 0
+    for source in sources:
+        try:
+            if args.command == 'to-jsonl':
+                output = json_to_artifact(source)
+            else:
+                output = artifact_to_json(source)
+        except (OSError, ValueError) as e:
+            print(f"  건너뜀 {source}: {e}")
+            continue
+        before, after = os.path.getsize(source), os.path.getsize(output)
+        total_before += before
+        total_after += after
+        print(f"  {source} → {output} ({before / 1024:.0f}KB → {after / 1024:.0f}KB)")
+        if args.remove_source:
+            os.remove(source)
+            if is_artifact(source) and os.path.exists(index_path(source)):
+                os.remove(index_path(source))
+    print(f"{len(sources)}개 파일 변환: {total_before / 1024 / 1024:.1f}MB → {total_after / 1024 / 1024:.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
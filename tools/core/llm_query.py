@@ -11,7 +11,7 @@ import logging
 import configparser
 from openai import OpenAI
 from transformers import AutoTokenizer
-from typing import Optional
+from typing import List, Optional
 
 
 class LLMQuery:
@@ -187,6 +187,32 @@ class LLMQuery:
         generated_text = self.remove_assistant_block(generated_text)
         return generated_text
 
+    def query_vllm_batch(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        """vLLM 모델을 통한 배치 쿼리 (generate 1회 호출, 입력 순서대로 반환)"""
+        if self.llm is None or self.tokenizer is None or self.sampling_params is None:
+            raise ValueError("vLLM 모델이 로드되지 않았습니다. load_vllm_model()을 먼저 호출하세요.")
+
+        prompts = [
+            self.tokenizer.apply_chat_template(
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                tokenize=False,
+                add_generation_prompt=True
+            )
+            for user_prompt in user_prompts
+        ]
+
+        outputs = self.llm.generate(prompts, self.sampling_params)
+        results = []
+        for output in outputs:
+            generated_text = output.outputs[0].text.strip()
+            generated_text = self.remove_think_block(generated_text)
+            generated_text = self.remove_assistant_block(generated_text)
+            results.append(generated_text)
+        return results
+
 
     def remove_think_block(self, text):   ## for Qwen3
         if isinstance(text, str):
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 호출 공유 예산 (동시 호출 수 / 분당 요청 수 제한)
+
+여러 스레드(회차, 모델)가 동시에 LLM을 호출할 때 전체 호출량이 API 한도를 넘지 않도록
+하나의 RateBudget을 공유합니다. BudgetedLLM은 LLMQuery를 감싸 query_openrouter 호출마다
+예산을 획득/반납하며, 그 밖의 속성은 원본 인스턴스로 그대로 전달합니다.
+
+사용 예시:
+    budget = RateBudget(max_concurrent=8, requests_per_minute=120)
+    llm = BudgetedLLM(LLMQuery(), budget)
+    llm.query_openrouter(system_prompt, user_prompt, model_name='google/gemini-2.5-flash')
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+class RateBudget:
+    """스레드 간 공유되는 LLM 호출 예산"""
+
+    def __init__(self, max_concurrent: int = 8, requests_per_minute: Optional[float] = None):
+        """
+        Args:
+            max_concurrent: 동시에 진행 중인 호출의 최대 개수
+            requests_per_minute: 분당 최대 호출 시작 횟수 (None이면 제한 없음)
+        """
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.requests_per_minute = requests_per_minute
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrent)
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self.calls = 0
+
+    def acquire(self) -> None:
+        """호출 슬롯 획득 (분당 제한이 있으면 호출 시작 간격만큼 대기)"""
+        self._semaphore.acquire()
+        if self._interval:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self._interval
+            if start > now:
+                time.sleep(start - now)
+        with self._lock:
+            self.calls += 1
+
+    def release(self) -> None:
+        """호출 슬롯 반납"""
+        self._semaphore.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class BudgetedLLM:
+    """RateBudget을 적용한 LLMQuery 래퍼 (query_openrouter만 예산 적용)"""
+
+    def __init__(self, llm, budget: RateBudget):
+        """
+        Args:
+            llm: LLMQuery 인스턴스
+            budget: 공유 RateBudget
+        """
+        self._llm = llm
+        self.budget = budget
+
+    def query_openrouter(self, system_prompt: str, user_prompt: str, model_name: str = 'openai/gpt-5') -> str:
+        with self.budget:
+            return self._llm.query_openrouter(system_prompt, user_prompt, model_name=model_name)
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+토큰 예산 기반 배치 패커
+
+고정 개수(10개, batch_size개)로 문제를 묶으면 표가 많은 문제 묶음은 컨텍스트를 넘기고,
+한 줄짜리 문제 묶음은 호출을 낭비합니다. TokenBudgetPacker는 항목별 예상 토큰 수를 기준으로
+모델의 컨텍스트/출력 한도 안에서 최대한 많이 묶습니다.
+
+토큰 수 추정:
+    - tokenizer_path가 주어지면 로컬 토크나이저(transformers.AutoTokenizer) 사용
+    - 없으면 문자 종류별 비율(한글/ASCII/기타) 휴리스틱 사용 (calibrate()로 보정 가능)
+
+사용 예시:
+    packer = TokenBudgetPacker.for_model('openai/gpt-5', output_tokens_per_item=20)
+    batches = packer.pack(questions, render=lambda q: build_prompt([q]), fixed_text=system_prompt)
+
+절감 효과 리포트 (실제 코퍼스):
+    python -m tools.core.token_packer --data_path /path/to/exam.json --model openai/gpt-5 --fixed_batch_size 10
+"""
+
+import re
+import json
+import math
+import argparse
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class ModelTokenLimits:
+    """모델별 토큰 한도"""
+    context_tokens: int
+    output_tokens: int
+
+
+# 모델명 접두사 → 토큰 한도 (앞에서부터 먼저 일치하는 항목 사용)
+MODEL_TOKEN_LIMITS: Dict[str, ModelTokenLimits] = {
+    'openai/gpt-5': ModelTokenLimits(400_000, 128_000),
+    'openai/gpt-4.1': ModelTokenLimits(1_000_000, 32_000),
+    'openai/o3': ModelTokenLimits(200_000, 100_000),
+    'google/gemini-2.5': ModelTokenLimits(1_000_000, 65_000),
+    'google/gemini-3': ModelTokenLimits(1_000_000, 65_000),
+    'google/gemma-3': ModelTokenLimits(128_000, 8_000),
+    'anthropic/claude': ModelTokenLimits(200_000, 64_000),
+    'meta-llama/llama-4': ModelTokenLimits(1_000_000, 16_000),
+    'x-ai/grok-4': ModelTokenLimits(2_000_000, 30_000),
+}
+
+# 알 수 없는 모델(로컬 vLLM 등)의 보수적 기본값
+DEFAULT_TOKEN_LIMITS = ModelTokenLimits(32_000, 8_000)
+
+# 컨텍스트 한도와 별개로 한 번의 호출에 넣을 입력 토큰 / 항목 수 기본 상한
+DEFAULT_MAX_INPUT_TOKENS = 8_000
+DEFAULT_MAX_ITEMS = 50
+
+
+def get_model_token_limits(model_name: str, max_model_len: Optional[int] = None) -> ModelTokenLimits:
+    """
+    모델의 토큰 한도 반환
+
+    Args:
+        model_name: 모델명 (OpenRouter 모델명 또는 로컬 경로)
+        max_model_len: vLLM max_model_len (주어지면 컨텍스트 한도로 사용)
+    """
+    if max_model_len:
+        return ModelTokenLimits(max_model_len, min(DEFAULT_TOKEN_LIMITS.output_tokens, max_model_len // 4))
+    for prefix, limits in MODEL_TOKEN_LIMITS.items():
+        if model_name.startswith(prefix):
+            return limits
+    return DEFAULT_TOKEN_LIMITS
+
+
+class TokenEstimator:
+    """토큰 수 추정기 (로컬 토크나이저 또는 문자 비율 휴리스틱)"""
+
+    # 문자 종류별 토큰 비율 (GPT/Gemini 계열 토크나이저로 한국어 금융 문제를 측정해 잡은 보수적 값)
+    HANGUL_RATIO = 1.0
+    ASCII_RATIO = 0.3
+    OTHER_RATIO = 1.0
+
+    _HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+    def __init__(self, tokenizer_path: Optional[str] = None, scale: float = 1.0):
+        """
+        Args:
+            tokenizer_path: 로컬 토크나이저 경로/이름 (None이면 휴리스틱 사용)
+            scale: 휴리스틱 추정값 보정 계수 (calibrate()로 계산)
+        """
+        self.scale = scale
+        self.tokenizer = None
+        if tokenizer_path:
+            try:
+                from transformers import AutoTokenizer
+                self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
+            except Exception:
+                self.tokenizer = None
+
+    def heuristic_count(self, text: str) -> float:
+        """문자 종류별 비율로 계산한 보정 전 토큰 수"""
+        if not text:
+            return 0.0
+        hangul = len(self._HANGUL_PATTERN.findall(text))
+        ascii_count = sum(1 for ch in text if ord(ch) < 128)
+        other = len(text) - hangul - ascii_count
+        return hangul * self.HANGUL_RATIO + ascii_count * self.ASCII_RATIO + other * self.OTHER_RATIO
+
+    def count(self, text: str) -> int:
+        """텍스트의 예상 토큰 수"""
+        if not text:
+            return 0
+        if self.tokenizer is not None:
+            return len(self.tokenizer.encode(text, add_special_tokens=False))
+        return int(math.ceil(self.heuristic_count(text) * self.scale))
+
+    def calibrate(self, texts: Iterable[str], true_count: Callable[[str], int]) -> float:
+        """
+        실제 토크나이저 결과에 맞춰 휴리스틱 보정 계수 계산
+
+        Args:
+            texts: 보정용 샘플 텍스트
+            true_count: 텍스트 → 실제 토큰 수 함수
+
+        Returns:
+            계산된 보정 계수 (self.scale에 반영됨)
+        """
+        estimated = 0.0
+        actual = 0
+        for text in texts:
+            estimated += self.heuristic_count(text)
+            actual += true_count(text)
+        if estimated > 0 and actual > 0:
+            self.scale = actual / estimated
+        return self.scale
+
+
+@dataclass
+class PackingReport:
+    """고정 개수 배치 대비 토큰 예산 배치 비교 결과"""
+    total_items: int
+    fixed_batch_size: int
+    fixed_calls: int
+    packed_calls: int
+    max_batch_items: int
+    max_batch_tokens: int
+    input_budget: int
+    oversized_items: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        """절감된 호출 수 (음수면 호출이 늘어남 = 고정 배치가 한도를 넘었을 가능성)"""
+        return self.fixed_calls - self.packed_calls
+
+    @property
+    def saved_rate(self) -> float:
+        """절감 비율 (%)"""
+        return self.saved_calls / self.fixed_calls * 100 if self.fixed_calls > 0 else 0.0
+
+
+class TokenBudgetPacker:
+    """예상 토큰 수 기준으로 항목을 배치로 묶는 패커 (입력 순서 유지)"""
+
+    def __init__(self, limits: ModelTokenLimits = DEFAULT_TOKEN_LIMITS,
+                 output_tokens_per_item: int = 20, estimator: Optional[TokenEstimator] = None,
+                 safety_margin: float = 0.1, max_input_tokens: Optional[int] = DEFAULT_MAX_INPUT_TOKENS,
+                 max_items: Optional[int] = DEFAULT_MAX_ITEMS):
+        """
+        Args:
+            limits: 모델 토큰 한도
+            output_tokens_per_item: 항목당 예상 출력 토큰 수
+            estimator: 토큰 수 추정기 (None이면 휴리스틱)
+            safety_margin: 컨텍스트 한도 중 비워둘 비율
+            max_input_tokens: 입력 토큰 상한 (컨텍스트가 커도 긴 프롬프트에서 응답 누락이 늘어나므로 별도 상한, None이면 컨텍스트 한도만 사용)
+            max_items: 배치당 최대 항목 수 (None이면 출력 한도만 사용)
+        """
+        self.limits = limits
+        self.output_tokens_per_item = max(1, output_tokens_per_item)
+        self.estimator = estimator or TokenEstimator()
+        self.safety_margin = safety_margin
+        self.max_input_tokens = max_input_tokens
+        self.max_items = max_items
+
+    @classmethod
+    def for_model(cls, model_name: str, max_model_len: Optional[int] = None,
+                  **kwargs) -> 'TokenBudgetPacker':
+        """모델명으로 한도를 찾아 패커 생성"""
+        return cls(get_model_token_limits(model_name, max_model_len), **kwargs)
+
+    def _max_items_by_output(self) -> int:
+        """출력 한도로 결정되는 배치당 최대 항목 수"""
+        return max(1, self.limits.output_tokens // self.output_tokens_per_item)
+
+    def max_batch_items(self) -> int:
+        """배치당 최대 항목 수 (출력 한도와 max_items 중 작은 값)"""
+        max_items = self._max_items_by_output()
+        if self.max_items:
+            max_items = min(max_items, self.max_items)
+        return max_items
+
+    def item_cost(self, text: str) -> int:
+        """항목 1개가 차지하는 예상 토큰 수 (입력 + 항목당 출력 예상치)"""
+        return self.estimator.count(text) + self.output_tokens_per_item
+
+    def input_budget(self, fixed_tokens: int = 0) -> int:
+        """항목들이 쓸 수 있는 입력 토큰 예산"""
+        usable = int(self.limits.context_tokens * (1 - self.safety_margin))
+        budget = usable - fixed_tokens
+        if self.max_input_tokens is not None:
+            budget = min(budget, self.max_input_tokens - fixed_tokens)
+        return max(1, budget)
+
+    def pack(self, items: Sequence[Any], render: Callable[[Any], str],
+             fixed_text: str = '') -> List[List[Any]]:
+        """
+        항목들을 토큰 예산 안에서 배치로 묶기
+
+        Args:
+            items: 묶을 항목 리스트
+            render: 항목 → 프롬프트에 들어갈 텍스트
+            fixed_text: 모든 호출에 반복되는 텍스트 (시스템 프롬프트, 헤더 등)
+
+        Returns:
+            배치 리스트 (입력 순서 유지). 예산보다 큰 항목은 단독 배치로 들어갑니다.
+        """
+        return [batch for batch, _ in self._pack_with_tokens(items, render, fixed_text)]
+
+    def _pack_with_tokens(self, items: Sequence[Any], render: Callable[[Any], str],
+                          fixed_text: str = '') -> List[tuple]:
+        fixed_tokens = self.estimator.count(fixed_text)
+        budget = self.input_budget(fixed_tokens)
+        max_items = self.max_batch_items()
+
+        batches = []
+        current: List[Any] = []
+        current_tokens = 0
+        for item in items:
+            # 출력 토큰도 컨텍스트를 차지하므로 항목당 출력 예상치를 함께 더함
+            cost = self.item_cost(render(item))
+            if current and (current_tokens + cost > budget or len(current) >= max_items):
+                batches.append((current, current_tokens))
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += cost
+        if current:
+            batches.append((current, current_tokens))
+        return batches
+
+    def report(self, items: Sequence[Any], render: Callable[[Any], str],
+               fixed_batch_size: int, fixed_text: str = '') -> PackingReport:
+        """고정 개수 배치와 비교한 호출 수 리포트"""
+        packed = self._pack_with_tokens(items, render, fixed_text)
+        budget = self.input_budget(self.estimator.count(fixed_text))
+        return PackingReport(
+            total_items=len(items),
+            fixed_batch_size=fixed_batch_size,
+            fixed_calls=math.ceil(len(items) / fixed_batch_size) if fixed_batch_size > 0 else 0,
+            packed_calls=len(packed),
+            max_batch_items=max((len(b) for b, _ in packed), default=0),
+            max_batch_tokens=max((t for _, t in packed), default=0),
+            input_budget=budget,
+            oversized_items=sum(1 for b, t in packed if len(b) == 1 and t > budget),
+        )
+
+
+def _render_question(item: Dict[str, Any]) -> str:
+    """리포트용 기본 문제 렌더링 (평가/분류 프롬프트의 문제 블록과 동일한 필드)"""
+    options = item.get('options') or []
+    if isinstance(options, list):
+        options = '\n'.join(str(o) for o in options)
+    return f"ID: {item.get('file_id', '')}_{item.get('tag', '')}\nQ: {item.get('question', '')}\n{options}\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='토큰 예산 배치 절감 효과 리포트')
+    parser.add_argument('--data_path', type=str, required=True, help='문제 JSON 파일 경로')
+    parser.add_argument('--model', type=str, default='openai/gpt-5', help='모델명 (한도 조회용)')
+    parser.add_argument('--fixed_batch_size', type=int, default=10, help='비교할 고정 배치 크기')
+    parser.add_argument('--output_tokens_per_item', type=int, default=20, help='항목당 예상 출력 토큰')
+    parser.add_argument('--max_input_tokens', type=int, default=DEFAULT_MAX_INPUT_TOKENS, help='배치 입력 토큰 상한')
+    parser.add_argument('--max_items', type=int, default=DEFAULT_MAX_ITEMS, help='배치당 최대 항목 수')
+    parser.add_argument('--tokenizer', type=str, default=None, help='로컬 토크나이저 경로 (선택)')
+    args = parser.parse_args()
+
+    with open(args.data_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+
+    packer = TokenBudgetPacker.for_model(
+        args.model,
+        output_tokens_per_item=args.output_tokens_per_item,
+        estimator=TokenEstimator(args.tokenizer),
+        max_input_tokens=args.max_input_tokens,
+        max_items=args.max_items,
+    )
+    report = packer.report(data, _render_question, args.fixed_batch_size)
+
+    print(f"문제 수: {report.total_items}")
+    print(f"고정 배치({report.fixed_batch_size}개) 호출 수: {report.fixed_calls}")
+    print(f"토큰 예산 배치 호출 수: {report.packed_calls} (입력 예산 {report.input_budget} 토큰)")
+    print(f"절감: {report.saved_calls}회 ({report.saved_rate:.1f}%)")
+    print(f"최대 배치: {report.max_batch_items}개 / {report.max_batch_tokens} 토큰, 예산 초과 단독 항목: {report.oversized_items}개")
+
+
+if __name__ == "__main__":
+    main()
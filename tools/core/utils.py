@@ -208,6 +208,33 @@ class JSONHandler:
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
+    @staticmethod
+    def extract_object(text: str) -> Optional[Any]:
+        """
+        LLM 응답에서 첫 번째로 파싱 가능한 JSON 객체 추출
+        
+        코드 블록이나 앞뒤 설명이 섞여 있어도 중첩 중괄호 단위로 찾아 파싱하며,
+        파싱에 실패한 구간은 건너뛰고 다음 객체를 찾습니다.
+        
+        Returns:
+            파싱된 객체 (없으면 None)
+        """
+        start_idx = -1
+        brace_count = 0
+        for i, char in enumerate(text or ''):
+            if char == '{':
+                if start_idx == -1:
+                    start_idx = i
+                brace_count += 1
+            elif char == '}' and start_idx != -1:
+                brace_count -= 1
+                if brace_count == 0:
+                    try:
+                        return json.loads(text[start_idx:i + 1])
+                    except json.JSONDecodeError:
+                        start_idx = -1
+        return None
+    
     @staticmethod
     def save(data: Any, file_path: str, indent: int = 2, backup: bool = False, logger: Any = None) -> None:
         """
@@ -13,15 +13,17 @@ JSON 처리:
 Crop 파일 분석:
 - CropAnalyzer: Crop 파일 BEFORE/AFTER 비교 분석
 - FolderStats: 폴더별 파일 통계 데이터 클래스
+- CropManifest / ManifestScanner: 증분 스캔용 폴더 매니페스트와 병렬 스캐너
 
 EPUB/PDF 분석:
 - epub_to_pdf: EPUB을 PDF로 변환
 - check_pdf_pages: PDF/EPUB 페이지 수 확인
+- count_pdf_pages / PageCountCache: 경량 페이지 수 계산과 내용 해시 캐시
 """
 
 from .json_cleaner import JSONCleaner, CleanupResult, DirectoryCleanupResult
-from .crop_analysis import CropAnalyzer, FolderStats
-from .epubstats import epub_to_pdf, check_pdf_pages
+from .crop_analysis import CropAnalyzer, FolderStats, CropManifest, ManifestScanner
+from .epubstats import epub_to_pdf, check_pdf_pages, count_pdf_pages, PageCountCache
 
 __all__ = [
     # JSON 처리
@@ -31,7 +33,11 @@ __all__ = [
     # Crop 분석
     'CropAnalyzer',
     'FolderStats',
+    'CropManifest',
+    'ManifestScanner',
     # EPUB/PDF
     'epub_to_pdf',
     'check_pdf_pages',
+    'count_pdf_pages',
+    'PageCountCache',
 ]
@@ -5,17 +5,26 @@ Crop 파일 분석 스크립트
 
 경로를 인자로 받아 crop 파일들을 정리하고, BEFORE/AFTER 비교 분석을 수행합니다.
 
+- 폴더 스캔 결과는 매니페스트({이름}_manifest.json: 폴더별 파일 목록과 mtime)로 저장되며,
+  다음 스캔에서는 폴더 mtime이 바뀐 폴더만 다시 읽습니다. 하위 폴더는 스레드로 병렬 스캔합니다.
+- BEFORE/AFTER 분석 시 매니페스트 스냅샷({이름}_BEFORE.manifest.json 등)도 함께 저장하고,
+  두 스냅샷이 있으면 Excel을 다시 읽지 않고 집합 연산으로 비교합니다.
+  (스냅샷이 없으면 Excel 행을 폴더 통계로 되돌려 같은 diff_folder_stats로 비교)
+
 사용 예시:
     python crop_analysis.py /path/to/crop_dir --before
     python crop_analysis.py /path/to/crop_dir --after
+    python crop_analysis.py /path/to/crop_dir --after --workers 16 --full_rescan
 """
 
 import os
 import re
 import sys
+import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 import pandas as pd
@@ -45,6 +54,187 @@ class FolderStats:
         }
 
 
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class CropManifest:
+    """
+    crop 디렉토리 매니페스트
+    
+    folders는 os.walk(topdown)과 같은 순서의 {상대경로: {'mtime_ns', 'dirs', 'files': {파일명: mtime_ns}}}입니다.
+    폴더의 mtime은 항목이 추가/삭제/이름 변경될 때 바뀌므로, mtime이 같은 폴더는 이전 목록을 그대로 씁니다.
+    """
+    root: str
+    folders: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {'version': MANIFEST_VERSION, 'root': self.root, 'folders': self.folders}
+    
+    def save(self, path: str) -> None:
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str, root: Optional[str] = None) -> Optional['CropManifest']:
+        """매니페스트 로드 (없거나, 형식이 다르거나, root가 다르면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != MANIFEST_VERSION:
+            return None
+        if root is not None and data.get('root') != root:
+            return None
+        return cls(root=data['root'], folders=data.get('folders', {}))
+
+
+class ManifestScanner:
+    """매니페스트 기반 증분 crop 디렉토리 스캐너"""
+    
+    def __init__(self, root: str, previous: Optional[CropManifest] = None, workers: int = 8):
+        """
+        Args:
+            root: crop 디렉토리 경로
+            previous: 이전 매니페스트 (None이면 전체 스캔)
+            workers: 하위 폴더 병렬 스캔 스레드 수 (1이면 순차)
+        """
+        self.root = str(root)
+        self.previous = previous.folders if previous is not None else {}
+        self.workers = max(1, workers)
+        self.rescanned = 0
+        self.reused = 0
+        self.changed = previous is None
+    
+    def _scan_folder(self, rel: str) -> Tuple[Dict[str, Any], bool]:
+        """폴더 1개 스캔 (mtime이 같으면 이전 항목 재사용) → (항목, 다시 읽었는지)"""
+        path = os.path.join(self.root, rel) if rel else self.root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return {'mtime_ns': 0, 'dirs': [], 'files': {}}, True
+        cached = self.previous.get(rel)
+        if cached is not None and cached.get('mtime_ns') == mtime_ns:
+            return cached, False
+        
+        dirs, files = [], {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # os.walk(followlinks=False)처럼 심볼릭 링크 폴더는 내려가지 않음
+                        if not entry.is_symlink():
+                            dirs.append(entry.name)
+                    elif not entry.name.startswith('.'):
+                        try:
+                            files[entry.name] = entry.stat().st_mtime_ns
+                        except OSError:
+                            files[entry.name] = 0
+        except OSError:
+            pass
+        return {'mtime_ns': mtime_ns, 'dirs': dirs, 'files': files}, True
+    
+    def _scan_tree(self, rel: str) -> List[Tuple[str, Dict[str, Any], bool]]:
+        """rel 이하 서브트리를 topdown 순서로 스캔"""
+        ordered = []
+        stack = [rel]
+        while stack:
+            current = stack.pop()
+            entry, rescanned = self._scan_folder(current)
+            ordered.append((current, entry, rescanned))
+            stack.extend(reversed([os.path.join(current, d) if current else d for d in entry['dirs']]))
+        return ordered
+    
+    def scan(self) -> CropManifest:
+        """전체 스캔 (루트의 하위 폴더들은 병렬로 스캔하고 결과는 순서대로 합침)"""
+        root_entry, root_rescanned = self._scan_folder('')
+        scanned = [('', root_entry, root_rescanned)]
+        subtrees = list(root_entry['dirs'])
+        if self.workers > 1 and len(subtrees) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(subtrees))) as executor:
+                for part in executor.map(self._scan_tree, subtrees):
+                    scanned.extend(part)
+        else:
+            for sub in subtrees:
+                scanned.extend(self._scan_tree(sub))
+        
+        folders = {}
+        for rel, entry, rescanned in scanned:
+            folders[rel] = entry
+            if rescanned:
+                self.rescanned += 1
+                if self.previous.get(rel) != entry:
+                    self.changed = True
+            else:
+                self.reused += 1
+        if len(folders) != len(self.previous):
+            self.changed = True
+        return CropManifest(root=self.root, folders=folders)
+
+
+def diff_folder_stats(before: List[FolderStats], after: List[FolderStats]) -> List[Dict[str, Any]]:
+    """
+    BEFORE/AFTER 폴더 통계를 집합 연산으로 비교
+    
+    CropAnalyzer.compare_analysis_files의 Excel 비교와 같은 행을 같은 순서로 만듭니다
+    (Excel을 dtype=str로 읽을 때처럼 BEFORE 쪽 개수는 문자열).
+    """
+    # 같은 폴더명이 여러 번 있으면 Excel 행을 dict로 바꿀 때처럼 마지막 항목 사용
+    before_dict = {stats.folder_name: stats for stats in before}
+    after_dict = {stats.folder_name: stats for stats in after}
+    
+    results = []
+    for folder_name, b in before_dict.items():
+        a = after_dict.get(folder_name)
+        if a is None:
+            results.append({
+                '폴더명': folder_name,
+                '상태': 'AFTER에_없는_폴더',
+                '테이블_파일_수': str(len(b.table_files)),
+                '이미지_파일_수': str(len(b.image_files)),
+                '기타_파일_수': str(len(b.etc_files)),
+                '없어진_테이블_파일': ', '.join(sorted(b.table_files)),
+                '없어진_이미지_파일': ', '.join(sorted(b.image_files)),
+                '없어진_기타_파일': ', '.join(sorted(b.etc_files)),
+                '없어진_페이지_수': str(len(b.pages_with_files)),
+                '없어진_페이지_목록': ', '.join(sorted(b.pages_with_files))
+            })
+            continue
+        
+        missing_table = set(b.table_files) - set(a.table_files)
+        missing_image = set(b.image_files) - set(a.image_files)
+        missing_etc = set(b.etc_files) - set(a.etc_files)
+        missing_pages = b.pages_with_files - a.pages_with_files
+        
+        if missing_table or missing_image or missing_etc or missing_pages:
+            results.append({
+                '폴더명': folder_name,
+                '상태': '일부_파일_누락',
+                '테이블_파일_수': str(len(b.table_files)),
+                '이미지_파일_수': str(len(b.image_files)),
+                '기타_파일_수': str(len(b.etc_files)),
+                '없어진_테이블_파일': ', '.join(sorted(missing_table)),
+                '없어진_이미지_파일': ', '.join(sorted(missing_image)),
+                '없어진_기타_파일': ', '.join(sorted(missing_etc)),
+                '없어진_페이지_수': len(missing_pages),
+                '없어진_페이지_목록': ', '.join(sorted(missing_pages)),
+                '최종_페이지_목록': ', '.join(sorted(a.pages_with_files))
+            })
+    
+    return results
+
+
 class CropAnalyzer:
     """Crop 파일 분석기"""
     
@@ -58,15 +248,19 @@ class CropAnalyzer:
     # 페이지 번호 추출 패턴
     PAGE_PATTERN = re.compile(r'(?:tb_|img_|etc_)(\d{4})')
     
-    def __init__(self, crop_dir: str):
+    def __init__(self, crop_dir: str, workers: int = 8, use_manifest: bool = True):
         """
         CropAnalyzer 초기화
         
         Args:
             crop_dir: 분석할 crop 디렉토리 경로
+            workers: 하위 폴더 병렬 스캔 스레드 수
+            use_manifest: False면 이전 매니페스트를 무시하고 전체 다시 스캔
         """
         self.crop_dir = Path(crop_dir)
         self.base_name = self.crop_dir.name
+        self.workers = workers
+        self.use_manifest = use_manifest
     
     @property
     def before_file(self) -> str:
@@ -83,6 +277,21 @@ class CropAnalyzer:
         """비교 분석 파일 경로"""
         return f'file_comparison_{self.base_name}_analysis.xlsx'
     
+    @property
+    def manifest_file(self) -> str:
+        """최신 스캔 매니페스트 경로 (증분 스캔 캐시)"""
+        return f'{self.base_name}_manifest.json'
+    
+    @property
+    def before_manifest_file(self) -> str:
+        """BEFORE 매니페스트 스냅샷 경로"""
+        return f'{self.base_name}_BEFORE.manifest.json'
+    
+    @property
+    def after_manifest_file(self) -> str:
+        """AFTER 매니페스트 스냅샷 경로"""
+        return f'{self.base_name}_AFTER.manifest.json'
+    
     def _extract_page_number(self, filename: str) -> Optional[str]:
         """파일명에서 페이지 번호 추출"""
         match = self.PAGE_PATTERN.search(filename)
@@ -104,29 +313,35 @@ class CropAnalyzer:
         if page_num:
             stats.pages_with_files.add(page_num)
     
-    def organize_crop_files(self) -> List[FolderStats]:
-        """crop_dir의 폴더별로 파일들을 정리"""
+    def scan_manifest(self) -> CropManifest:
+        """매니페스트 증분 스캔 (바뀐 폴더만 다시 읽고 최신 매니페스트 저장)"""
+        root = str(self.crop_dir)
+        previous = CropManifest.load(self.manifest_file, root=root) if self.use_manifest else None
+        scanner = ManifestScanner(root, previous=previous, workers=self.workers)
+        manifest = scanner.scan()
+        if scanner.changed:
+            manifest.save(self.manifest_file)
+        print(f"스캔: 폴더 {len(manifest.folders)}개 (다시 읽음 {scanner.rescanned}개, 재사용 {scanner.reused}개)")
+        return manifest
+    
+    def stats_from_manifest(self, manifest: CropManifest) -> List[FolderStats]:
+        """매니페스트 → 폴더별 통계 (organize_crop_files와 같은 순서/내용)"""
         results = []
-        
-        for root, dirs, files in os.walk(self.crop_dir):
-            # 시스템 파일 제외
-            files = [f for f in files if not f.startswith('.')]
-            
-            if not files:
+        for rel, entry in manifest.folders.items():
+            if not entry['files']:
                 continue
-            
-            folder_name = os.path.basename(root)
+            folder_name = os.path.basename(os.path.join(manifest.root, rel) if rel else manifest.root)
             stats = FolderStats(folder_name=folder_name)
-            
-            for file in files:
+            for file in entry['files']:
                 self._classify_file(file, stats)
-            
-            # 분류된 파일이 있는 경우만 결과에 추가
             if stats.table_files or stats.image_files or stats.etc_files:
                 results.append(stats)
-        
         return results
     
+    def organize_crop_files(self) -> List[FolderStats]:
+        """crop_dir의 폴더별로 파일들을 정리 (매니페스트 증분 스캔)"""
+        return self.stats_from_manifest(self.scan_manifest())
+    
     @staticmethod
     def _parse_file_list(value: Any) -> Set[str]:
         """셀 값을 파일 목록 집합으로 변환"""
@@ -134,8 +349,27 @@ class CropAnalyzer:
             return set()
         return set(str(value).split(', '))
     
+    @classmethod
+    def _stats_from_row(cls, row: Dict[str, Any]) -> FolderStats:
+        """BEFORE/AFTER Excel 행 → 폴더 통계 (기타 파일 열이 없는 이전 Excel도 허용)"""
+        return FolderStats(
+            folder_name=row['폴더명'],
+            table_files=sorted(cls._parse_file_list(row['테이블_파일_목록'])),
+            image_files=sorted(cls._parse_file_list(row['이미지_파일_목록'])),
+            etc_files=sorted(cls._parse_file_list(row.get('기타_파일_목록', ''))),
+            pages_with_files=cls._parse_file_list(row['파일이_있는_페이지_목록'])
+        )
+    
     def compare_analysis_files(self) -> List[Dict[str, Any]]:
-        """BEFORE와 AFTER 파일을 비교하여 차이점 분석"""
+        """BEFORE와 AFTER 파일을 비교하여 차이점 분석 (매니페스트 스냅샷이 있으면 집합 비교)"""
+        before_manifest = CropManifest.load(self.before_manifest_file)
+        after_manifest = CropManifest.load(self.after_manifest_file)
+        if before_manifest is not None and after_manifest is not None:
+            return diff_folder_stats(
+                self.stats_from_manifest(before_manifest),
+                self.stats_from_manifest(after_manifest)
+            )
+        
         if not os.path.exists(self.before_file):
             print(f"⚠️ BEFORE 파일이 없습니다: {self.before_file}")
             return []
@@ -147,71 +381,18 @@ class CropAnalyzer:
         df_before = pd.read_excel(self.before_file, dtype=str)
         df_after = pd.read_excel(self.after_file, dtype=str)
         
-        before_dict = {row['폴더명']: row for _, row in df_before.iterrows()}
-        after_dict = {row['폴더명']: row for _, row in df_after.iterrows()}
-        
-        results = []
-        
-        for folder_name, before_row in before_dict.items():
-            if folder_name not in after_dict:
-                # AFTER에 없는 폴더
-                results.append({
-                    '폴더명': folder_name,
-                    '상태': 'AFTER에_없는_폴더',
-                    '테이블_파일_수': before_row['테이블_파일_수'],
-                    '이미지_파일_수': before_row['이미지_파일_수'],
-                    '기타_파일_수': before_row.get('기타_파일_수', '0'),
-                    '없어진_테이블_파일': before_row['테이블_파일_목록'],
-                    '없어진_이미지_파일': before_row['이미지_파일_목록'],
-                    '없어진_기타_파일': before_row.get('기타_파일_목록', ''),
-                    '없어진_페이지_수': before_row['파일이_있는_페이지_수'],
-                    '없어진_페이지_목록': before_row['파일이_있는_페이지_목록']
-                })
-            else:
-                # 두 파일 모두에 있는 폴더 - 파일 비교
-                after_row = after_dict[folder_name]
-                
-                # 파일 목록 비교
-                before_table = self._parse_file_list(before_row['테이블_파일_목록'])
-                after_table = self._parse_file_list(after_row['테이블_파일_목록'])
-                
-                before_image = self._parse_file_list(before_row['이미지_파일_목록'])
-                after_image = self._parse_file_list(after_row['이미지_파일_목록'])
-                
-                before_etc = self._parse_file_list(before_row.get('기타_파일_목록', ''))
-                after_etc = self._parse_file_list(after_row.get('기타_파일_목록', ''))
-                
-                before_pages = self._parse_file_list(before_row['파일이_있는_페이지_목록'])
-                after_pages = self._parse_file_list(after_row['파일이_있는_페이지_목록'])
-                
-                # 누락된 항목들
-                missing_table = before_table - after_table
-                missing_image = before_image - after_image
-                missing_etc = before_etc - after_etc
-                missing_pages = before_pages - after_pages
-                
-                if missing_table or missing_image or missing_etc or missing_pages:
-                    results.append({
-                        '폴더명': folder_name,
-                        '상태': '일부_파일_누락',
-                        '테이블_파일_수': before_row['테이블_파일_수'],
-                        '이미지_파일_수': before_row['이미지_파일_수'],
-                        '기타_파일_수': before_row.get('기타_파일_수', '0'),
-                        '없어진_테이블_파일': ', '.join(sorted(missing_table)) if missing_table else '',
-                        '없어진_이미지_파일': ', '.join(sorted(missing_image)) if missing_image else '',
-                        '없어진_기타_파일': ', '.join(sorted(missing_etc)) if missing_etc else '',
-                        '없어진_페이지_수': len(missing_pages),
-                        '없어진_페이지_목록': ', '.join(sorted(missing_pages)) if missing_pages else '',
-                        '최종_페이지_목록': ', '.join(sorted(after_pages))
-                    })
-        
-        return results
+        return diff_folder_stats(
+            [self._stats_from_row(row) for row in df_before.to_dict('records')],
+            [self._stats_from_row(row) for row in df_after.to_dict('records')]
+        )
     
     def analyze_before(self) -> pd.DataFrame:
         """BEFORE 상태 분석 및 저장"""
         print(f"BEFORE 상태 분석 중: {self.crop_dir}")
         
-        results = self.organize_crop_files()
+        manifest = self.scan_manifest()
+        manifest.save(self.before_manifest_file)
+        results = self.stats_from_manifest(manifest)
         df = pd.DataFrame([r.to_dict() for r in results])
         
         print(f"총 {len(results)}개 폴더를 처리했습니다.")
@@ -227,7 +408,9 @@ class CropAnalyzer:
         """AFTER 상태 분석, 저장 및 비교"""
         print(f"AFTER 상태 분석 중: {self.crop_dir}")
         
-        results = self.organize_crop_files()
+        manifest = self.scan_manifest()
+        manifest.save(self.after_manifest_file)
+        results = self.stats_from_manifest(manifest)
         df = pd.DataFrame([r.to_dict() for r in results])
         
         print(f"총 {len(results)}개 폴더를 처리했습니다.")
@@ -276,6 +459,8 @@ def main() -> int:
     parser.add_argument('crop_dir', type=str, help='분석할 crop 디렉토리 경로')
     parser.add_argument('--before', action='store_true', help='BEFORE 상태를 분석하고 저장')
     parser.add_argument('--after', action='store_true', help='AFTER 상태를 분석하고 저장하며 BEFORE와 비교')
+    parser.add_argument('--workers', type=int, default=8, help='하위 폴더 병렬 스캔 스레드 수 (기본값: 8)')
+    parser.add_argument('--full_rescan', action='store_true', help='이전 매니페스트를 무시하고 전체 다시 스캔')
     
     args = parser.parse_args()
     
@@ -284,7 +469,7 @@ def main() -> int:
         print(f"❌ '{args.crop_dir}' 디렉토리가 존재하지 않습니다.")
         return 1
     
-    analyzer = CropAnalyzer(args.crop_dir)
+    analyzer = CropAnalyzer(args.crop_dir, workers=args.workers, use_manifest=not args.full_rescan)
     
     if args.before:
         analyzer.analyze_before()
@@ -4,15 +4,30 @@
 EPUB/PDF 페이지 수 분석 스크립트
 
 EPUB 파일을 PDF로 변환하고 페이지 수를 분석합니다.
+
+- EPUB 변환(기본/10pt)은 ThreadPoolExecutor로 병렬 실행합니다 (--workers).
+- 페이지 수는 원본 파일 내용 해시(sha256)를 키로 캐시하므로(PageCountCache) 바뀌지 않은 책은 다시 변환하지 않습니다.
+- 페이지 수는 PDF 페이지 트리 루트의 /Count만 읽어 계산하고(count_pdf_pages), 찾지 못할 때만 PyPDF2로 파싱합니다.
+- 변환된 PDF는 원본 디렉토리가 아니라 별도 디렉토리(기본: 실행마다 임시 디렉토리)에 저장하므로,
+  원본 디렉토리의 PDF는 파일명과 관계없이 모두 원본으로 집계됩니다.
+- ebook-convert 경로는 CALIBRE_CONVERT_PATH 환경 변수 또는 --convert_path로 바꿀 수 있습니다.
 """
 
 import os
+import re
 import sys
+import json
+import hashlib
+import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-import PyPDF2
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
 import pandas as pd
 from tqdm import tqdm
 
@@ -24,14 +39,22 @@ if str(project_root_dir) not in sys.path:
 
 
 # Calibre ebook-convert 경로
-CALIBRE_CONVERT_PATH = "/Applications/calibre.app/Contents/MacOS/ebook-convert"
+CALIBRE_CONVERT_PATH = os.environ.get(
+    'CALIBRE_CONVERT_PATH', "/Applications/calibre.app/Contents/MacOS/ebook-convert"
+)
+
+# 결과 컬럼
+PAGES_COLUMN = '본 페이지수'
+PAGES_10PT_COLUMN = '10p 페이지수'
 
 
 def epub_to_pdf(
     filepath: str,
     original_name: Optional[str] = None,
     rename_to: Optional[str] = None,
-    use_10pt_font: bool = False
+    use_10pt_font: bool = False,
+    convert_path: Optional[str] = None,
+    output_dir: Optional[str] = None
 ) -> str:
     """
     EPUB 파일을 PDF로 변환합니다.
@@ -41,6 +64,8 @@ def epub_to_pdf(
         original_name: 원본 파일명 (교체 대상)
         rename_to: 새로운 파일명 (교체할 이름)
         use_10pt_font: True면 10pt 폰트로 변환
+        convert_path: ebook-convert 실행 파일 경로 (None이면 CALIBRE_CONVERT_PATH)
+        output_dir: PDF를 저장할 디렉토리 (None이면 EPUB과 같은 디렉토리)
         
     Returns:
         변환된 PDF 파일 경로
@@ -56,14 +81,18 @@ def epub_to_pdf(
         filename = filepath.replace(original_name, rename_to).replace(".EPUB", ".pdf")
     else:
         filename = filepath.replace(".EPUB", ".pdf")
+    if output_dir:
+        filename = os.path.join(output_dir, os.path.basename(filename))
+    
+    convert_path = convert_path or CALIBRE_CONVERT_PATH
     
     # 10pt 폰트 사용 시 파일명 변경
     if use_10pt_font:
         output_filename = filename.replace(".pdf", "-10p.pdf")
-        cmd = [CALIBRE_CONVERT_PATH, filepath, output_filename, "--base-font-size", "10"]
+        cmd = [convert_path, filepath, output_filename, "--base-font-size", "10"]
     else:
         output_filename = filename
-        cmd = [CALIBRE_CONVERT_PATH, filepath, output_filename]
+        cmd = [convert_path, filepath, output_filename]
     
     # 변환 실행
     result = subprocess.run(cmd, capture_output=True, text=True)
@@ -84,56 +113,267 @@ def epub_to_pdf(
     return output_filename
 
 
-def check_pdf_pages(cycle: int, output_file: str) -> None:
+# 페이지 트리 노드 (/Type /Pages)와 그 안의 /Count, /Parent
+_PAGES_TYPE_PATTERN = re.compile(rb'/Type\s*/Pages(?![A-Za-z])')
+_COUNT_PATTERN = re.compile(rb'/Count\s+(\d+)')
+_PARENT_PATTERN = re.compile(rb'/Parent\s')
+
+
+def _pypdf2_count_pages(pdf_path: str) -> int:
+    """PyPDF2로 PDF 전체를 파싱해 페이지 수 계산"""
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2가 설치되어 있지 않습니다.")
+    return len(PyPDF2.PdfReader(pdf_path).pages)
+
+
+def count_pdf_pages(pdf_path: str) -> int:
     """
-    지정된 사이클의 PDF/EPUB 파일들의 페이지 수를 확인합니다.
+    PDF 페이지 수 계산 (전체 파싱 없이 페이지 트리 루트의 /Count만 읽음)
     
-    Args:
-        cycle: 처리할 사이클 번호
-        output_file: 결과를 저장할 Excel 파일 경로
+    /Parent가 없는 /Type /Pages 노드가 루트이며, 증분 업데이트로 여러 개면 파일 뒤쪽(최신)을 사용합니다.
+    페이지 트리가 압축 객체 스트림 안에 있어 찾지 못하면 PyPDF2로 파싱합니다.
     """
-    from tools.core.utils import FileManager
+    with open(pdf_path, 'rb') as f:
+        data = f.read()
     
-    file_manager = FileManager()
-    df = file_manager.load_excel_metadata(cycle)
+    root_count = None
+    for match in _PAGES_TYPE_PATTERN.finditer(data):
+        # 해당 노드가 들어 있는 객체 범위 (obj ... endobj)
+        start = data.rfind(b' obj', 0, match.start())
+        end = data.find(b'endobj', match.end())
+        if start < 0 or end < 0:
+            continue
+        body = data[start:end]
+        count = _COUNT_PATTERN.search(body)
+        if count and not _PARENT_PATTERN.search(body):
+            root_count = int(count.group(1))
     
-    target_dir = os.path.join(file_manager.original_data_path, f'{cycle}C', 'Lv1')
+    if root_count is not None:
+        return root_count
+    return _pypdf2_count_pages(pdf_path)
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 sha256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PageCountCache:
+    """
+    원본 파일 내용 해시 → 페이지 수 캐시 (JSON)
     
-    if not os.path.exists(target_dir):
-        print(f"경로가 존재하지 않습니다: {target_dir}")
-        return
+    counts는 '{sha256}:{variant}' → 페이지 수이고, variant는 'pdf'(PDF 원본), 'epub'(기본 변환), 'epub-10pt'(10pt 변환)입니다.
+    해시 계산을 줄이기 위해 경로별 (크기, mtime_ns, sha256)도 기록하고, 크기와 mtime이 같으면 해시를 재사용합니다.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 캐시 파일 경로 (None이면 메모리에만 유지)
+        """
+        self.path = path
+        self.counts: Dict[str, int] = {}
+        self.hashes: Dict[str, List] = {}
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self.counts = data.get('counts', {})
+                    self.hashes = data.get('hashes', {})
+            except (OSError, ValueError):
+                pass
+    
+    def content_hash(self, file_path: str) -> str:
+        """파일 내용 해시 (크기/mtime이 같으면 기록된 해시 재사용)"""
+        st = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        cached = self.hashes.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = file_sha256(file_path)
+        self.hashes[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+    
+    def get(self, digest: str, variant: str) -> Optional[int]:
+        """캐시된 페이지 수 (없으면 None)"""
+        pages = self.counts.get(f'{digest}:{variant}')
+        if pages is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return pages
+    
+    def put(self, digest: str, variant: str, pages: int) -> None:
+        """페이지 수 기록"""
+        self.counts[f'{digest}:{variant}'] = pages
+    
+    def save(self) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'counts': self.counts, 'hashes': self.hashes},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _convert_and_count(task: Tuple[str, str, str, bool, Optional[str], str]) -> int:
+    """변환 작업 1개 (EPUB → PDF 변환 후 페이지 수)"""
+    file_path, file, file_id, use_10pt_font, convert_path, output_dir = task
+    # 출력 파일명은 output_dir/{file_id}.pdf (rename_to에 확장자까지 넘겨야 .EPUB → .pdf 치환이 적용됨)
+    pdf_path = epub_to_pdf(file_path, file, f'{file_id}.EPUB', use_10pt_font=use_10pt_font,
+                           convert_path=convert_path, output_dir=output_dir)
+    return count_pdf_pages(pdf_path)
+
+
+def collect_page_counts(
+    target_dir: str,
+    cache: Optional[PageCountCache] = None,
+    workers: int = 4,
+    convert_path: Optional[str] = None,
+    show_progress: bool = True,
+    convert_dir: Optional[str] = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    디렉토리의 PDF/EPUB 파일 페이지 수 수집
     
-    files = [f for f in os.listdir(target_dir) if not f.startswith('.')]
+    Args:
+        target_dir: PDF/EPUB 파일 디렉토리
+        cache: 페이지 수 캐시 (None이면 캐시 없이 모두 계산)
+        workers: EPUB 변환 병렬 수
+        convert_path: ebook-convert 실행 파일 경로
+        show_progress: 진행 표시 여부
+        convert_dir: 변환된 PDF 저장 디렉토리 (None이면 실행 동안만 쓰는 임시 디렉토리, target_dir과 같으면 안 됨)
+        
+    Returns:
+        {file_id: {'본 페이지수': n, '10p 페이지수': m}} (EPUB만 10p 페이지수 포함, 실패한 항목은 빠짐)
     
-    for file in tqdm(files, desc="PDF 페이지 수 확인"):
+    Raises:
+        ValueError: convert_dir가 target_dir과 같을 때 (변환 결과가 원본 PDF로 다시 집계됨)
+    """
+    if convert_dir is None:
+        with tempfile.TemporaryDirectory(prefix='epubstats_') as tmp_dir:
+            return collect_page_counts(target_dir, cache, workers, convert_path, show_progress, tmp_dir)
+    if os.path.realpath(convert_dir) == os.path.realpath(target_dir):
+        raise ValueError(f"변환 PDF 디렉토리는 원본 디렉토리와 달라야 합니다: {convert_dir}")
+    os.makedirs(convert_dir, exist_ok=True)
+    
+    cache = cache or PageCountCache()
+    files = sorted(f for f in os.listdir(target_dir) if not f.startswith('.'))
+    results: Dict[str, Dict[str, int]] = {}
+    
+    # 캐시에 없는 EPUB 변환 작업: (file_id, 컬럼, 해시, variant, 작업)
+    pending = []
+    for file in files:
         file_id = file.split(".")[0]
         file_path = os.path.join(target_dir, file)
         
         # PDF 파일 처리
         if file.lower().endswith('.pdf'):
             try:
-                reader = PyPDF2.PdfReader(file_path)
-                df.loc[file_id, '본 페이지수'] = len(reader.pages)
+                digest = cache.content_hash(file_path)
+                pages = cache.get(digest, 'pdf')
+                if pages is None:
+                    pages = count_pdf_pages(file_path)
+                    cache.put(digest, 'pdf', pages)
+                results.setdefault(file_id, {})[PAGES_COLUMN] = pages
             except Exception as e:
                 print(f"Error reading PDF {file_id}: {e}")
-                continue
         
-        # EPUB 파일 처리
+        # EPUB 파일 처리 (기본 / 10pt 폰트)
         elif file.endswith(".EPUB"):
             try:
-                # 기본 PDF 변환
-                pdf_path = epub_to_pdf(file_path, file, file_id, use_10pt_font=False)
-                reader = PyPDF2.PdfReader(pdf_path)
-                df.loc[file_id, '본 페이지수'] = len(reader.pages)
-                
-                # 10pt 폰트 PDF 변환
-                pdf_10pt_path = epub_to_pdf(file_path, file, file_id, use_10pt_font=True)
-                reader_10pt = PyPDF2.PdfReader(pdf_10pt_path)
-                df.loc[file_id, '10p 페이지수'] = len(reader_10pt.pages)
-                
-            except Exception as e:
+                digest = cache.content_hash(file_path)
+            except OSError as e:
                 print(f"Error processing EPUB {file_id}: {e}")
                 continue
+            for column, variant, use_10pt_font in (
+                (PAGES_COLUMN, 'epub', False),
+                (PAGES_10PT_COLUMN, 'epub-10pt', True),
+            ):
+                pages = cache.get(digest, variant)
+                if pages is None:
+                    pending.append((file_id, column, digest, variant,
+                                    (file_path, file, file_id, use_10pt_font, convert_path, convert_dir)))
+                else:
+                    results.setdefault(file_id, {})[column] = pages
+    
+    if pending:
+        def run(item):
+            try:
+                return _convert_and_count(item[4]), None
+            except Exception as e:
+                return None, e
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            outcomes = executor.map(run, pending)
+            if show_progress:
+                outcomes = tqdm(outcomes, total=len(pending), desc="EPUB 변환")
+            for (file_id, column, digest, variant, _), (pages, error) in zip(pending, outcomes):
+                if error is not None:
+                    print(f"Error processing EPUB {file_id} ({variant}): {error}")
+                    continue
+                cache.put(digest, variant, pages)
+                results.setdefault(file_id, {})[column] = pages
+    
+    return results
+
+
+def check_pdf_pages(
+    cycle: int,
+    output_file: str,
+    workers: int = 4,
+    cache_file: Optional[str] = None,
+    convert_path: Optional[str] = None
+) -> None:
+    """
+    지정된 사이클의 PDF/EPUB 파일들의 페이지 수를 확인합니다.
+    
+    Args:
+        cycle: 처리할 사이클 번호
+        output_file: 결과를 저장할 Excel 파일 경로
+        workers: EPUB 변환 병렬 수
+        cache_file: 페이지 수 캐시 파일 경로 (None이면 결과 파일 옆 {이름}_cache.json)
+        convert_path: ebook-convert 실행 파일 경로
+    """
+    from tools.core.utils import FileManager
+    
+    file_manager = FileManager()
+    df = file_manager.load_excel_metadata(cycle)
+    
+    target_dir = os.path.join(file_manager.original_data_path, f'{cycle}C', 'Lv1')
+    
+    if not os.path.exists(target_dir):
+        print(f"경로가 존재하지 않습니다: {target_dir}")
+        return
+    
+    if cache_file is None:
+        cache_file = f'{os.path.splitext(output_file)[0]}_cache.json'
+    cache = PageCountCache(cache_file)
+    try:
+        page_counts = collect_page_counts(target_dir, cache, workers=workers, convert_path=convert_path)
+    finally:
+        cache.save()
+    print(f"페이지 수 캐시: 재사용 {cache.hits}개, 새로 계산 {cache.misses}개 ({cache_file})")
+    
+    # 행마다 df.loc으로 쓰지 않고 한 번에 반영 (메타데이터에 없는 파일은 행 추가)
+    if page_counts:
+        updates = pd.DataFrame.from_dict(page_counts, orient='index')
+        missing = updates.index.difference(df.index)
+        if len(missing):
+            df = df.reindex(df.index.append(missing))
+        for column in updates.columns:
+            df.loc[updates.index, column] = updates[column]
     
     # 결과 저장
     df.reset_index(inplace=True)
@@ -162,10 +402,29 @@ def main() -> int:
         default='pdf_pages.xlsx',
         help='결과 Excel 파일 경로 (기본값: pdf_pages.xlsx)'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='EPUB 변환 병렬 수 (기본값: 4)'
+    )
+    parser.add_argument(
+        '--cache',
+        type=str,
+        default=None,
+        help='페이지 수 캐시 파일 경로 (기본값: 결과 파일명_cache.json)'
+    )
+    parser.add_argument(
+        '--convert_path',
+        type=str,
+        default=None,
+        help=f'ebook-convert 실행 파일 경로 (기본값: {CALIBRE_CONVERT_PATH})'
+    )
     
     args = parser.parse_args()
     
-    check_pdf_pages(args.cycle, args.output)
+    check_pdf_pages(args.cycle, args.output, workers=args.workers,
+                    cache_file=args.cache, convert_path=args.convert_path)
     return 0
 
 
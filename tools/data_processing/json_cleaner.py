@@ -4,12 +4,18 @@
 JSON 파일 정리 클래스
 
 JSON 파일에서 빈 페이지를 제거하고 데이터를 정리하는 기능을 제공합니다.
+
+- 파일은 한 번만 읽고(바이트), 페이지를 한 번 순회하며 빈 페이지 제거와 삭제 전/후 통계를 함께 계산합니다.
+- 백업은 이미 읽은 원본 바이트를 그대로 기록하고, 백업/결과 파일 모두 임시 파일에 쓴 뒤 교체합니다(원자적 쓰기).
+- cleanup_directory(workers=N)은 파일 단위로 프로세스 병렬 처리하고 결과를 파일 순서대로 집계합니다.
 """
 
+import os
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Callable, Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, field
 
 
@@ -142,6 +148,52 @@ class JSONCleaner:
         
         return stats
     
+    @staticmethod
+    def scan_pages(pages: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], PageStats, PageStats]:
+        """
+        페이지를 한 번 순회하며 빈 페이지 제거와 삭제 전/후 통계 계산
+        
+        Args:
+            pages: 페이지 딕셔너리 리스트
+            
+        Returns:
+            (빈 페이지를 뺀 페이지 리스트, 삭제 전 통계, 삭제 후 통계)
+        """
+        before_stats = PageStats(total_pages=len(pages))
+        after_stats = PageStats()
+        filtered = []
+        for page in pages:
+            is_lv4 = JSONCleaner.is_lv4_page(page)
+            if is_lv4:
+                before_stats.lv4_pages += 1
+            else:
+                before_stats.lv3_pages += 1
+            if JSONCleaner.is_empty_page(page):
+                continue
+            filtered.append(page)
+            if is_lv4:
+                after_stats.lv4_pages += 1
+            else:
+                after_stats.lv3_pages += 1
+        after_stats.total_pages = len(filtered)
+        return filtered, before_stats, after_stats
+    
+    @staticmethod
+    def _atomic_write(path: Path, write: Callable[[Any], None], binary: bool = False) -> None:
+        """같은 디렉토리의 임시 파일에 쓴 뒤 교체 (중단되어도 기존 파일이 깨지지 않음)"""
+        tmp_path = path.with_name(f'.{path.name}.tmp')
+        try:
+            if binary:
+                with open(tmp_path, 'wb') as f:
+                    write(f)
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
     def _log(self, message: str) -> None:
         """상세 모드일 때만 메시지 출력"""
         if self.verbose:
@@ -169,8 +221,9 @@ class JSONCleaner:
         file_path = Path(file_path)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 원본은 한 번만 읽음 (백업은 이 바이트를 그대로 사용)
+            raw = file_path.read_bytes()
+            data = json.loads(raw.decode('utf-8'))
             
             if 'contents' not in data or not isinstance(data['contents'], list):
                 self._log(f"⚠️  {file_path}: 'contents' 필드가 없거나 리스트가 아닙니다.")
@@ -178,18 +231,10 @@ class JSONCleaner:
             
             original_count = len(data['contents'])
             
-            # 삭제 전 통계 계산
-            before_stats = self.calculate_page_stats(data['contents'])
-            
-            filtered_contents = [
-                page for page in data['contents'] 
-                if not self.is_empty_page(page)
-            ]
+            # 빈 페이지 제거 + 삭제 전/후 통계 (1회 순회)
+            filtered_contents, before_stats, after_stats = self.scan_pages(data['contents'])
             removed_count = original_count - len(filtered_contents)
             
-            # 삭제 후 통계 계산
-            after_stats = self.calculate_page_stats(filtered_contents)
-            
             if dry_run:
                 if removed_count > 0:
                     self._log(f"🔍 {file_path}: {removed_count}개 빈 페이지 발견 (총 {original_count}개 중)")
@@ -220,15 +265,11 @@ class JSONCleaner:
                             should_create_backup = False
                     
                     if should_create_backup:
-                        # 백업은 원본 데이터로 생성
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            original_data = json.load(f)
-                        with open(backup_path, 'w', encoding='utf-8') as f:
-                            json.dump(original_data, f, ensure_ascii=False, indent=2)
+                        # 백업은 이미 읽은 원본 바이트로 생성
+                        self._atomic_write(backup_path, lambda f: f.write(raw), binary=True)
                         self._log(f"📁 백업 파일 생성: {backup_path}")
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._atomic_write(file_path, lambda f: json.dump(data, f, ensure_ascii=False, indent=2))
                 
                 self._log(f"✅ {file_path}: {removed_count}개 페이지 제거 "
                          f"(총 {original_count}개 → {len(filtered_contents)}개)")
@@ -279,7 +320,8 @@ class JSONCleaner:
         directory: Path, 
         create_backup: bool = True,
         dry_run: bool = False,
-        generate_report: bool = False
+        generate_report: bool = False,
+        workers: int = 1
     ) -> DirectoryCleanupResult:
         """
         디렉토리의 모든 JSON 파일 정리
@@ -289,29 +331,28 @@ class JSONCleaner:
             create_backup: 백업 파일 생성 여부
             dry_run: True면 실제 수정하지 않고 분석만 수행
             generate_report: True면 MD 리포트 파일 생성
+            workers: 병렬 처리 프로세스 수 (1이면 순차 처리, 결과는 동일)
             
         Returns:
             DirectoryCleanupResult: 디렉토리 정리 결과
         """
         json_files = self.find_json_files(directory)
         
-        total_removed = 0
-        total_original = 0
-        processed_files = 0
-        file_results = []
-        
-        for json_file in json_files:
-            result = self.cleanup_file(json_file, create_backup, dry_run, generate_report=False)
-            total_removed += result.removed_count
-            total_original += result.original_count
-            if result.removed_count > 0 or result.original_count > 0:
-                processed_files += 1
-            file_results.append(result)
+        if workers > 1 and len(json_files) > 1:
+            tasks = [(json_file, create_backup, dry_run, self.verbose) for json_file in json_files]
+            with ProcessPoolExecutor(max_workers=min(workers, len(json_files))) as executor:
+                # map은 입력 순서대로 결과를 돌려주므로 집계 순서가 순차 처리와 같음
+                file_results = list(executor.map(_cleanup_file_worker, tasks, chunksize=4))
+        else:
+            file_results = [
+                self.cleanup_file(json_file, create_backup, dry_run, generate_report=False)
+                for json_file in json_files
+            ]
         
         dir_result = DirectoryCleanupResult(
-            processed_files=processed_files,
-            total_removed=total_removed,
-            total_original=total_original,
+            processed_files=sum(1 for r in file_results if r.removed_count > 0 or r.original_count > 0),
+            total_removed=sum(r.removed_count for r in file_results),
+            total_original=sum(r.original_count for r in file_results),
             file_results=file_results
         )
         
@@ -390,3 +431,9 @@ class JSONCleaner:
         if report_path:
             self._log(f"📝 디렉토리 리포트 생성: {report_path}")
         return report_path
+
+
+def _cleanup_file_worker(task: Tuple[Path, bool, bool, bool]) -> CleanupResult:
+    """프로세스 워커: 파일 1개 정리"""
+    file_path, create_backup, dry_run, verbose = task
+    return JSONCleaner(verbose=verbose).cleanup_file(file_path, create_backup, dry_run, generate_report=False)
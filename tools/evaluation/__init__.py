@@ -6,8 +6,18 @@ evaluation 패키지 - 평가 관련 기능
 이 패키지는 시험지 평가 기능을 제공합니다:
 - MultipleChoiceEvaluator: 객관식 문제 평가 (O/X 문제 포함)
 - evaluate_essay_answer: 서술형 문제 평가
+- ConcurrentEssayGrader: 서술형 채점 동시 실행 (키워드 확인/점수 평가 파이프라인)
+- KeywordMatcher: 서술형 키워드 포함 여부 로컬 사전 확인
+- AdaptiveBatchSizer: 모델별 적응형 배치 크기 조절
+- SequentialStopRule / stratified_order: 층화 순차 평가 및 신뢰구간 기반 조기 종료
 """
 
+# 적응형 배치 크기 조절
+from .adaptive_batch import AdaptiveBatchSizer, simulate_adaptive_batching
+
+# 층화 샘플링 및 신뢰구간
+from .sampling import SequentialStopRule, stratified_order, wilson_interval, allocate_sample
+
 # 서술형 평가 함수들
 from .evaluate_essay_model import (
     get_set_dir_name,
@@ -15,6 +25,8 @@ from .evaluate_essay_model import (
     calculate_statistics,
     evaluate_single_model,
 )
+from .essay_grading_graph import ConcurrentEssayGrader
+from .keyword_matcher import KeywordMatcher, agreement_report
 
 # 객관식 평가 클래스 및 함수들
 try:
@@ -32,17 +44,47 @@ except ImportError:
     save_results_to_excel = None
     print_evaluation_summary = None
 
+# 평가 결과 저장소 / 지연 리포트
+try:
+    from .report_store import (
+        save_results_store,
+        load_results_store,
+        write_excel_report,
+        write_markdown_report,
+    )
+except ImportError:
+    save_results_store = None
+    load_results_store = None
+    write_excel_report = None
+    write_markdown_report = None
+
 
 __all__ = [
+    # 적응형 배치
+    'AdaptiveBatchSizer',
+    'simulate_adaptive_batching',
+    # 층화 샘플링
+    'SequentialStopRule',
+    'stratified_order',
+    'wilson_interval',
+    'allocate_sample',
     # 객관식 평가
     'MultipleChoiceEvaluator',
     'run_eval_pipeline',
     'load_data_from_directory',
     'save_results_to_excel',
     'print_evaluation_summary',
+    # 결과 저장소 / 리포트
+    'save_results_store',
+    'load_results_store',
+    'write_excel_report',
+    'write_markdown_report',
     # 서술형 평가
     'get_set_dir_name',
     'evaluate_essay_answer',
     'calculate_statistics',
     'evaluate_single_model',
+    'ConcurrentEssayGrader',
+    'KeywordMatcher',
+    'agreement_report',
 ]
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적응형 배치 크기 조절
+
+모델마다 한 번에 안정적으로 답할 수 있는 문제 수가 다르므로,
+관측된 응답 파싱 완전도 / 응답 시간 / 컨텍스트 길이 오류를 바탕으로
+모델별 배치 크기를 런타임에 조절합니다.
+
+조절 규칙:
+    - 파싱 완전도가 기준 이상이면 배치 크기를 grow_step만큼 증가 (상한: ceiling)
+    - 파싱 완전도가 기준 미만이거나 컨텍스트 길이 오류면 shrink_factor만큼 축소하고,
+      실패한 크기 바로 아래로 ceiling을 낮춤
+    - 응답 시간이 max_latency를 넘으면 더 이상 키우지 않음 (ceiling = 현재 크기)
+    - ceiling 크기에서 probe_after회 연속 성공하면 ceiling을 1 올려 재탐색
+      (우연한 누락 1회로 배치 크기가 영구히 낮아지는 것을 방지)
+
+→ 실패가 관측된 크기 바로 아래, 즉 안정적으로 동작하는 가장 큰 배치 크기로 수렴합니다.
+
+시뮬레이션:
+    python -m tools.evaluation.adaptive_batch --reliable_size 20
+"""
+
+import random
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
+
+
+# 컨텍스트 길이 초과로 판단할 오류 메시지 패턴 (OpenRouter / vLLM)
+CONTEXT_ERROR_PATTERNS = (
+    'context length',
+    'context_length',
+    'maximum context',
+    'context window',
+    'too many tokens',
+    'prompt is too long',
+    'max_model_len',
+)
+
+
+def is_context_length_error(error: Exception) -> bool:
+    """예외가 컨텍스트 길이 초과 오류인지 판단"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in CONTEXT_ERROR_PATTERNS)
+
+
+@dataclass
+class BatchObservation:
+    """배치 호출 1회의 관측 결과"""
+    batch_size: int
+    parsed_count: int
+    expected_count: int
+    elapsed: float = 0.0
+    context_error: bool = False
+
+    @property
+    def completeness(self) -> float:
+        """파싱 완전도 (0.0 ~ 1.0)"""
+        return self.parsed_count / self.expected_count if self.expected_count > 0 else 0.0
+
+    def is_reliable(self, min_completeness: float) -> bool:
+        """
+        신뢰 기준 충족 여부
+
+        작은 배치에서 우연히 한 줄 빠진 것까지 실패로 보지 않도록
+        최소 1개의 누락은 허용합니다.
+        """
+        if self.context_error:
+            return False
+        missing = self.expected_count - self.parsed_count
+        allowed = max(1, int((1 - min_completeness) * self.expected_count))
+        return missing <= allowed
+
+
+@dataclass
+class AdaptiveBatchSizer:
+    """모델 1개에 대한 적응형 배치 크기 조절기"""
+    initial_size: int = 10
+    min_size: int = 1
+    max_size: int = 50
+    grow_step: int = 5
+    shrink_factor: float = 0.5
+    min_completeness: float = 0.9
+    max_latency: Optional[float] = None
+    probe_after: int = 5
+    history: List[BatchObservation] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.min_size = max(1, self.min_size)
+        self.max_size = max(self.min_size, self.max_size)
+        self.ceiling = self.max_size
+        # 컨텍스트 길이 오류가 난 최소 크기 - 1 (재탐색으로도 넘지 않는 하드 상한)
+        self.hard_limit = self.max_size
+        self.size = min(max(self.initial_size, self.min_size), self.max_size)
+        self._streak = 0
+
+    def _shrink(self, failed_size: int) -> None:
+        """실패한 크기 바로 아래로 ceiling을 낮추고 배치 크기 축소"""
+        self.ceiling = max(self.min_size, min(self.ceiling, failed_size - 1))
+        self._streak = 0
+        self.size = max(self.min_size, min(int(failed_size * self.shrink_factor), self.ceiling))
+
+    def record(self, batch_size: int, parsed_count: int, expected_count: int,
+               elapsed: float = 0.0) -> bool:
+        """
+        정상 응답 결과 기록 및 다음 배치 크기 갱신
+
+        Args:
+            batch_size: 이번 호출의 배치 크기
+            parsed_count: 파싱에 성공한 답변 수
+            expected_count: 기대한 답변 수
+            elapsed: 호출 소요 시간 (초)
+
+        Returns:
+            이번 배치가 신뢰 기준을 만족했는지 여부
+        """
+        obs = BatchObservation(batch_size, parsed_count, expected_count, elapsed)
+        self.history.append(obs)
+
+        if not obs.is_reliable(self.min_completeness):
+            self._shrink(batch_size)
+            return False
+
+        if self.max_latency is not None and elapsed > self.max_latency:
+            # 느리지만 완전한 응답: 더 키우지 않음
+            self.ceiling = max(self.min_size, min(self.ceiling, batch_size))
+            self.size = min(self.size, self.ceiling)
+            self._streak = 0
+            return True
+
+        # 마지막 배치(잔여 문제)처럼 현재 크기보다 작게 호출된 경우는 증가 근거로 쓰지 않음
+        if batch_size < self.size:
+            return True
+
+        if self.size >= self.ceiling:
+            self._streak += 1
+            if self._streak >= self.probe_after and self.ceiling < self.hard_limit:
+                self.ceiling += 1
+                self._streak = 0
+        self.size = min(self.size + self.grow_step, self.ceiling)
+        return True
+
+    def record_context_error(self, batch_size: int) -> None:
+        """컨텍스트 길이 오류 기록 및 배치 크기 축소"""
+        self.history.append(BatchObservation(batch_size, 0, batch_size, context_error=True))
+        self.hard_limit = max(self.min_size, min(self.hard_limit, batch_size - 1))
+        self._shrink(batch_size)
+
+    def summary(self) -> Dict[str, Any]:
+        """조절 이력 요약"""
+        calls = len(self.history)
+        reliable = [h for h in self.history if h.is_reliable(self.min_completeness)]
+        return {
+            'final_size': self.size,
+            'ceiling': self.ceiling,
+            'hard_limit': self.hard_limit,
+            'calls': calls,
+            'reliable_calls': len(reliable),
+            'context_errors': sum(1 for h in self.history if h.context_error),
+            'avg_completeness': (
+                sum(h.completeness for h in self.history) / calls if calls else 0.0
+            ),
+            'size_trace': [h.batch_size for h in self.history],
+        }
+
+
+class _SimulatedBatchModel:
+    """배치 크기가 커질수록 답변 누락이 늘어나는 가상 모델 (시뮬레이션용)"""
+
+    def __init__(self, reliable_size: int, context_limit: int, seed: int = 42):
+        self.reliable_size = reliable_size
+        self.context_limit = context_limit
+        self.rng = random.Random(seed)
+
+    def answer(self, ids: List[str]) -> str:
+        if len(ids) > self.context_limit:
+            raise ValueError(f"This model's maximum context length is exceeded ({len(ids)} questions)")
+        # reliable_size 이하에서는 누락률 1%, 초과분에 비례해 누락률 증가
+        overflow = max(0, len(ids) - self.reliable_size)
+        drop_rate = min(0.9, 0.01 + 0.03 * overflow)
+        lines = [f"{_id}\t{self.rng.randint(1, 5)}" for _id in ids if self.rng.random() >= drop_rate]
+        return "\n".join(lines)
+
+
+def simulate_adaptive_batching(total_questions: int = 1000, reliable_size: int = 20,
+                               context_limit: int = 40, initial_size: int = 10,
+                               max_size: int = 50, seed: int = 42) -> Dict[str, Any]:
+    """
+    가상 모델로 적응형 배치 조절을 시뮬레이션
+
+    Args:
+        total_questions: 총 문제 수
+        reliable_size: 가상 모델이 안정적으로 답하는 최대 배치 크기
+        context_limit: 가상 모델의 컨텍스트 한계 (문제 수)
+        initial_size: 초기 배치 크기
+        max_size: 최대 배치 크기
+        seed: 랜덤 시드
+
+    Returns:
+        sizer.summary()에 answered 수를 추가한 딕셔너리
+    """
+    model = _SimulatedBatchModel(reliable_size, context_limit, seed)
+    sizer = AdaptiveBatchSizer(initial_size=initial_size, max_size=max_size)
+    pending = [f"Q{i:05d}" for i in range(total_questions)]
+    answered = set()
+
+    while pending:
+        size = sizer.size
+        chunk, pending = pending[:size], pending[size:]
+        try:
+            raw = model.answer(chunk)
+        except ValueError as e:
+            if is_context_length_error(e):
+                sizer.record_context_error(len(chunk))
+                pending = chunk + pending
+                continue
+            raise
+        got = {ln.split('\t', 1)[0] for ln in raw.splitlines() if ln}
+        answered.update(got)
+        sizer.record(len(chunk), len(got), len(chunk))
+
+    result = sizer.summary()
+    result['answered'] = len(answered)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='적응형 배치 크기 시뮬레이션')
+    parser.add_argument('--total', type=int, default=1000, help='총 문제 수')
+    parser.add_argument('--reliable_size', type=int, default=20, help='가상 모델의 안정 배치 크기')
+    parser.add_argument('--context_limit', type=int, default=40, help='가상 모델의 컨텍스트 한계 (문제 수)')
+    parser.add_argument('--initial_size', type=int, default=10, help='초기 배치 크기')
+    parser.add_argument('--max_size', type=int, default=50, help='최대 배치 크기')
+    args = parser.parse_args()
+
+    result = simulate_adaptive_batching(
+        args.total, args.reliable_size, args.context_limit,
+        args.initial_size, args.max_size
+    )
+    print(f"최종 배치 크기: {result['final_size']} (ceiling: {result['ceiling']})")
+    print(f"호출 수: {result['calls']} (신뢰 {result['reliable_calls']}, 컨텍스트 오류 {result['context_errors']})")
+    print(f"평균 파싱 완전도: {result['avg_completeness']:.3f}")
+    print(f"배치 크기 추이: {result['size_trace'][:30]}")
+
+
+if __name__ == "__main__":
+    main()
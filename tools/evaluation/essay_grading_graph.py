@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서술형 채점 동시 실행 (job graph)
+
+(모델, 세트, 문제) 단위 채점 작업을 스레드 풀에서 동시에 실행합니다.
+작업마다 키워드 확인 → 점수 평가 두 단계를 순서대로 거치되, 한 작업이 점수 평가를 기다리는 동안
+다른 작업의 키워드 확인이 진행되도록 단계가 파이프라인으로 겹칩니다.
+
+- 채점(grader) 모델별 동시 호출 수를 세마포어로 제한합니다.
+  (키워드 확인 모델과 점수 평가 모델이 같으면 하나의 제한을 공유)
+- 단계 구현은 evaluate_essay_model의 check_keywords / score_keywords를 그대로 사용하므로
+  문제별 결과 레코드(build_detailed_record)는 순차 실행과 동일하며, 입력 순서대로 반환됩니다.
+- LLM 호출 예외가 난 문제는 결과에 error 필드가 붙고, 통계에서는 0점이 아니라 오류 수로 따로 집계됩니다.
+- batch_scoring=True이면 같은 (세트, 문제)에 대한 모든 모델 답변의 키워드 확인이 끝나는 즉시
+  키워드를 포함한 답변들을 score_keywords_batch로 한 번에 채점합니다. (검증 실패 답변은 개별 채점)
+
+사용 예:
+    grader = ConcurrentEssayGrader(llm, keyword_concurrency=8, scoring_concurrency=4)
+    results = grader.grade_models(models, {1: 'questions/essay_questions_1st.json'}, best_answers_dict)
+    # results[(model, set_num)] = (evaluation_results, detailed_results, stats)
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+from tools.evaluation.keyword_matcher import KeywordMatcher
+from tools.evaluation.evaluate_essay_model import (
+    check_keywords,
+    score_keywords,
+    score_keywords_batch,
+    build_detailed_record,
+    calculate_statistics,
+    load_grading_inputs,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GradingJob:
+    """(모델, 세트, 문제) 단위 채점 작업"""
+    model_name: str
+    set_num: Optional[int]
+    question: Dict[str, Any]
+    model_answer: str
+    best_answer: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class ConcurrentEssayGrader:
+    """키워드 확인 / 점수 평가 단계를 파이프라인으로 겹쳐 실행하는 서술형 채점기"""
+
+    def __init__(self, llm_instance, keyword_check_model: str = 'google/gemini-2.5-flash',
+                 scoring_model: str = 'google/gemini-3-pro-preview',
+                 keyword_concurrency: int = 8, scoring_concurrency: int = 4,
+                 keyword_precheck: bool = False, batch_scoring: bool = False,
+                 max_batch_answers: int = 8):
+        """
+        Args:
+            llm_instance: LLMQuery 인스턴스 (스레드 간 공유)
+            keyword_check_model: 키워드 포함 여부 확인에 사용할 LLM 모델명
+            scoring_model: 점수 평가에 사용할 LLM 모델명
+            keyword_concurrency: 키워드 확인 모델의 최대 동시 호출 수
+            scoring_concurrency: 점수 평가 모델의 최대 동시 호출 수
+            keyword_precheck: 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략
+            batch_scoring: 같은 문제의 여러 답변을 한 요청으로 채점
+            max_batch_answers: 배치 채점 1회에 넣을 최대 답변 수
+        """
+        self.llm = llm_instance
+        self.keyword_check_model = keyword_check_model
+        self.scoring_model = scoring_model
+        self.keyword_matcher = KeywordMatcher() if keyword_precheck else None
+        self.batch_scoring = batch_scoring
+        self.max_batch_answers = max(1, max_batch_answers)
+
+        # 채점 모델별 동시 호출 제한 (같은 모델이면 하나의 세마포어 공유)
+        limits: Dict[str, int] = {}
+        for model, limit in ((keyword_check_model, keyword_concurrency),
+                             (scoring_model, scoring_concurrency)):
+            limits[model] = max(limits.get(model, 0), max(1, limit))
+        self._semaphores = {model: threading.BoundedSemaphore(limit) for model, limit in limits.items()}
+        # 두 단계가 모두 포화되도록 워커 수 = 제한 합계
+        self.max_workers = sum(limits.values())
+
+    @staticmethod
+    def _empty_result() -> Dict[str, Any]:
+        return {
+            'has_all_keywords': False,
+            'keyword_scores': {},
+            'final_score': 0.0,
+            'keyword_check_response': '',
+            'scoring_response': ''
+        }
+
+    def _fail(self, job: GradingJob, error: Exception) -> None:
+        # 순차 실행에서는 예외가 모델 전체 평가를 중단시켰지만, 여기서는 해당 문제만 실패로 기록
+        # (result['error']가 있는 항목은 calculate_statistics의 점수 집계에서 제외되고 오류 수로 따로 셈)
+        job.error = str(error)
+        job.result['has_all_keywords'] = False
+        job.result['final_score'] = 0.0
+        job.result['error'] = job.error
+        logger.error(f"채점 오류 ({job.model_name}, 세트 {job.set_num}, "
+                     f"{job.question.get('file_id')}/{job.question.get('tag')}): {error}")
+
+    def _run_keyword_stage(self, job: GradingJob) -> GradingJob:
+        """1단계: 키워드 확인 (로컬 확정 시 LLM 호출 생략)"""
+        job.result = self._empty_result()
+        try:
+            local = (self.keyword_matcher.match(job.question.get('essay_keyword', ''), job.model_answer)
+                     if self.keyword_matcher else None)
+            if local is not None and local.settled:
+                # 로컬 판정으로 확정 → 키워드 확인 모델 슬롯을 쓰지 않음
+                job.result.update({'has_all_keywords': local.decision,
+                                   'keyword_check_response': local.response_text()})
+            else:
+                with self._semaphores[self.keyword_check_model]:
+                    job.result.update(check_keywords(job.question, job.model_answer, self.llm,
+                                                     self.keyword_check_model))
+        except Exception as e:
+            self._fail(job, e)
+        return job
+
+    def _run_job(self, job: GradingJob) -> GradingJob:
+        """작업 1개: 키워드 확인 → (포함 시) 점수 평가. evaluate_essay_answer와 같은 결과 구조"""
+        self._run_keyword_stage(job)
+        if job.error or not job.result['has_all_keywords']:
+            return job
+        try:
+            with self._semaphores[self.scoring_model]:
+                job.result.update(score_keywords(job.question, job.model_answer, self.llm,
+                                                 self.scoring_model, job.best_answer))
+        except Exception as e:
+            self._fail(job, e)
+        return job
+
+    def _run_batch_scoring(self, group: List[GradingJob]) -> List[GradingJob]:
+        """2단계 (배치): 같은 문제에서 키워드를 모두 포함한 답변들을 한 요청으로 채점"""
+        targets = [job for job in group if not job.error and job.result['has_all_keywords']]
+        for i in range(0, len(targets), self.max_batch_answers):
+            chunk = targets[i:i + self.max_batch_answers]
+            try:
+                with self._semaphores[self.scoring_model]:
+                    scored = score_keywords_batch(chunk[0].question, [job.model_answer for job in chunk],
+                                                  self.llm, self.scoring_model, chunk[0].best_answer)
+                for job, score in zip(chunk, scored):
+                    job.result.update(score)
+            except Exception as e:
+                for job in chunk:
+                    self._fail(job, e)
+        return group
+
+    def grade(self, jobs: List[GradingJob], desc: str = "서술형 채점") -> List[GradingJob]:
+        """작업 목록을 동시에 채점 (입력 순서 유지)"""
+        if not jobs:
+            return jobs
+        progress = tqdm(total=len(jobs), desc=desc) if tqdm else None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if self.batch_scoring:
+                self._grade_batched(executor, jobs, progress)
+            else:
+                futures = [executor.submit(self._run_job, job) for job in jobs]
+                for _ in as_completed(futures):
+                    if progress:
+                        progress.update(1)
+        if progress:
+            progress.close()
+        return jobs
+
+    def _grade_batched(self, executor: ThreadPoolExecutor, jobs: List[GradingJob], progress) -> None:
+        """문제 단위로 키워드 확인이 모두 끝나면 바로 배치 채점 작업을 제출"""
+        groups: Dict[Tuple, List[GradingJob]] = {}
+        for job in jobs:
+            key = (job.set_num, job.question.get('file_id'), job.question.get('tag'))
+            groups.setdefault(key, []).append(job)
+        remaining = {key: len(group) for key, group in groups.items()}
+        job_keys = {id(job): key for key, group in groups.items() for job in group}
+
+        pending = {executor.submit(self._run_keyword_stage, job): ('keyword', job) for job in jobs}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, payload = pending.pop(future)
+                if kind == 'keyword':
+                    key = job_keys[id(payload)]
+                    remaining[key] -= 1
+                    if remaining[key] == 0:
+                        pending[executor.submit(self._run_batch_scoring, groups[key])] = ('scoring', groups[key])
+                elif progress:
+                    progress.update(len(payload))
+
+    def grade_models(self, models: List[str], question_files: Dict[int, str],
+                     best_answers_dict: Optional[Dict] = None
+                     ) -> Dict[Tuple[str, int], Tuple[List[Dict], List[Dict], Dict[str, Any]]]:
+        """
+        여러 모델 × 세트를 하나의 작업 그래프로 채점
+
+        Args:
+            models: 평가할 모델 목록
+            question_files: 세트 번호 → 문제 파일 경로
+            best_answers_dict: 모범답안 딕셔너리 {(file_id, tag): answer}
+
+        Returns:
+            (모델, 세트 번호) → (evaluation_results, detailed_results, stats)
+            모델 답변 파일이 없는 조합은 포함되지 않습니다.
+        """
+        jobs: List[GradingJob] = []
+        groups: Dict[Tuple[str, int], List[GradingJob]] = {}
+        for set_num, question_file in question_files.items():
+            for model_name in models:
+                inputs = load_grading_inputs(model_name, question_file, set_num, best_answers_dict)
+                if inputs is None:
+                    continue
+                group = [GradingJob(model_name, set_num, item['question'], item['model_answer'],
+                                    item['best_answer']) for item in inputs]
+                groups[(model_name, set_num)] = group
+                jobs.extend(group)
+
+        logger.info(f"서술형 동시 채점: {len(groups)}개 (모델, 세트) 조합, 작업 {len(jobs)}개, "
+                    f"워커 {self.max_workers}개")
+        self.grade(jobs)
+
+        results = {}
+        for key, group in groups.items():
+            evaluation_results = [job.result for job in group]
+            detailed_results = [
+                build_detailed_record(job.question, job.model_answer, job.best_answer, job.result)
+                for job in group
+            ]
+            results[key] = (evaluation_results, detailed_results, calculate_statistics(evaluation_results))
+        return results
@@ -15,6 +15,7 @@
 
 import os
 import json
+import math
 import re
 import sys
 import argparse
@@ -25,49 +26,51 @@ import pandas as pd
 
 from tools import ONEDRIVE_PATH
 from tools.core.llm_query import LLMQuery
+from tools.core.utils import JSONHandler
+from tools.evaluation.keyword_matcher import KeywordMatcher
 
 
 
 
-def evaluate_essay_answer(question_data: Dict, model_answer: str, llm_instance: LLMQuery, 
-                         keyword_check_model: str = 'google/gemini-2.5-flash',
-                         scoring_model: str = 'google/gemini-3-pro-preview', 
-                         best_answer: str = None) -> Dict[str, Any]:
-    """
-    서술형 답변 평가 함수
-    
-    Args:
-        question_data: 문제 데이터 (essay_question, essay_keyword, essay_answer 포함)
-        model_answer: 평가할 모델 답변
-        llm_instance: LLMQuery 인스턴스
-        keyword_check_model: 키워드 포함 여부 확인에 사용할 LLM 모델명
-        scoring_model: 점수 평가에 사용할 LLM 모델명
-        best_answer: 모범답안 (선택사항)
-    
-    Returns:
-        dict: {
-            'has_all_keywords': bool,
-            'keyword_scores': dict,  # 키워드별 점수 (1~5점)
-            'final_score': float,    # 최종 점수 (100점 만점)
-            'keyword_check_response': str,
-            'scoring_response': str
-        }
-    """
-    result = {
-        'has_all_keywords': False,
-        'keyword_scores': {},
-        'final_score': 0.0,
-        'keyword_check_response': '',
-        'scoring_response': ''
-    }
-    
-    # 1단계: 키워드 포함 여부 판단 (LLM 1번 호출)
-    keyword_check_system_prompt = """
+KEYWORD_CHECK_SYSTEM_PROMPT = """
 당신은 서술형 문제 채점자입니다.
 다음 모델 답변에 제시된 키워드가 모두 포함되어있는지 판단해주세요.
 키워드가 모두 포함되어있다면 True, 하나라도 포함되어있지 않다면 False를 반환해주세요.
 반드시 True 또는 False만 반환하세요.
 """
+
+SCORING_SYSTEM_PROMPT = """
+당신은 서술형 문제 채점자입니다.
+모범답안과 모델 답변을 비교하여, 각 키워드에 대한 설명이 모범답안과 얼마나 일치하는지 평가해주세요.
+
+평가 기준:
+- 1점: 전혀 다른 이야기
+- 2점: 심각한 모순
+- 3점: 약간의 모순
+- 4점: 모순 없음
+- 5점: 모범답안과 동일
+
+각 키워드별로 1~5점을 부여하고, JSON 형식으로 반환해주세요.
+예시 형식: {"키워드1": 5, "키워드2": 4, "키워드3": 3}
+"""
+
+
+def check_keywords(question_data: Dict, model_answer: str, llm_instance: LLMQuery,
+                   keyword_check_model: str = 'google/gemini-2.5-flash',
+                   keyword_matcher: Optional[KeywordMatcher] = None) -> Dict[str, Any]:
+    """
+    1단계: 키워드 포함 여부 판단 (LLM 1번 호출)
+    
+    keyword_matcher가 주어지면 로컬 문자열 매칭으로 먼저 판정하고,
+    명확하지 않은 경우에만 LLM을 호출합니다. (로컬 판정 응답은 '[local] ...'로 기록)
+    
+    Returns:
+        dict: {'has_all_keywords': bool, 'keyword_check_response': str}
+    """
+    if keyword_matcher is not None:
+        local = keyword_matcher.match(question_data.get('essay_keyword', ''), model_answer)
+        if local.settled:
+            return {'has_all_keywords': local.decision, 'keyword_check_response': local.response_text()}
     
     keyword_check_user_prompt = f"""
 서술형 질문: {question_data['essay_question']}
@@ -77,35 +80,27 @@ def evaluate_essay_answer(question_data: Dict, model_answer: str, llm_instance:
 """
     
     keyword_response = llm_instance.query_openrouter(
-        keyword_check_system_prompt, 
+        KEYWORD_CHECK_SYSTEM_PROMPT, 
         keyword_check_user_prompt, 
         model_name=keyword_check_model
     )
-    result['keyword_check_response'] = keyword_response
-    
-    has_all_keywords = 'True' in keyword_response or 'true' in keyword_response.lower()
-    result['has_all_keywords'] = has_all_keywords
     
-    # 키워드가 모두 포함되지 않은 경우
-    if not has_all_keywords:
-        result['final_score'] = 0.0
-        return result
-    
-    # 2단계: 키워드별 모순/오류 평가 (LLM 2번 호출)
-    scoring_system_prompt = """
-당신은 서술형 문제 채점자입니다.
-모범답안과 모델 답변을 비교하여, 각 키워드에 대한 설명이 모범답안과 얼마나 일치하는지 평가해주세요.
+    return {
+        'has_all_keywords': 'True' in keyword_response or 'true' in keyword_response.lower(),
+        'keyword_check_response': keyword_response
+    }
 
-평가 기준:
-- 1점: 전혀 다른 이야기
-- 2점: 심각한 모순
-- 3점: 약간의 모순
-- 4점: 모순 없음
-- 5점: 모범답안과 동일
 
-각 키워드별로 1~5점을 부여하고, JSON 형식으로 반환해주세요.
-예시 형식: {"키워드1": 5, "키워드2": 4, "키워드3": 3}
-"""
+def score_keywords(question_data: Dict, model_answer: str, llm_instance: LLMQuery,
+                   scoring_model: str = 'google/gemini-3-pro-preview',
+                   best_answer: str = None) -> Dict[str, Any]:
+    """
+    2단계: 키워드별 모순/오류 평가 (LLM 2번 호출)
+    
+    Returns:
+        dict: {'keyword_scores': dict, 'final_score': float, 'scoring_response': str}
+    """
+    result = {'keyword_scores': {}, 'final_score': 0.0, 'scoring_response': ''}
     
     # 모범답안 우선순위: best_answer 파라미터 > question_data의 essay_answer
     best_ans = best_answer if best_answer is not None else question_data.get('essay_answer', '모범답안이 없습니다.')
@@ -124,60 +119,207 @@ def evaluate_essay_answer(question_data: Dict, model_answer: str, llm_instance:
 """
     
     scoring_response = llm_instance.query_openrouter(
-        scoring_system_prompt, 
+        SCORING_SYSTEM_PROMPT, 
         scoring_user_prompt, 
         model_name=scoring_model
     )
     result['scoring_response'] = scoring_response
     
     # JSON 파싱 (중첩된 JSON도 처리)
-    # JSON 객체 찾기 (중첩된 중괄호도 처리)
-    brace_count = 0
-    start_idx = -1
-    json_parsed = False
-    for i, char in enumerate(scoring_response):
-        if char == '{':
-            if start_idx == -1:
-                start_idx = i
-            brace_count += 1
-        elif char == '}':
-            brace_count -= 1
-            if brace_count == 0 and start_idx != -1:
-                json_str = scoring_response[start_idx:i+1]
-                try:
-                    keyword_scores = json.loads(json_str)
-                    result['keyword_scores'] = keyword_scores
-                    
-                    # 100점 척도로 변환
-                    scores = list(keyword_scores.values())
-                    if scores:
-                        avg_score = sum(scores) / len(scores)
-                        final_score = (avg_score / 5) * 100  # 5점 만점을 100점 만점으로 변환
-                        result['final_score'] = final_score
-                    json_parsed = True
-                    break
-                except json.JSONDecodeError:
-                    continue
-    
-    if not json_parsed:
+    keyword_scores = JSONHandler.extract_object(scoring_response or '')
+    if isinstance(keyword_scores, dict):
+        result['keyword_scores'] = keyword_scores
+        numeric = [_coerce_score(v) for v in keyword_scores.values()]
+        if all(v is not None for v in numeric):
+            # 100점 척도로 변환
+            result['final_score'] = _final_score(dict(zip(keyword_scores, numeric)))
+        else:
+            print(f"키워드 점수 형식 오류 (1~5 숫자가 아님): {keyword_scores}")
+    else:
         print(f"JSON 파싱 실패: {scoring_response}")
         result['final_score'] = 0.0
     
     return result
 
 
+BATCH_SCORING_SYSTEM_PROMPT = SCORING_SYSTEM_PROMPT.rstrip() + """
+
+여러 개의 모델 답변이 주어지면 각 답변을 서로 독립적으로 평가하세요.
+반드시 아래 JSON 형식으로만 반환하세요. (id는 주어진 답변 ID를 그대로 사용)
+{"results": [{"id": "A1", "scores": {"키워드1": 5, "키워드2": 4}}, {"id": "A2", "scores": {"키워드1": 3, "키워드2": 2}}]}
+"""
+
+
+def _final_score(keyword_scores: Dict[str, Any]) -> float:
+    """키워드별 점수(1~5점) 평균을 100점 척도로 변환"""
+    scores = list(keyword_scores.values())
+    if not scores:
+        return 0.0
+    return (sum(scores) / len(scores) / 5) * 100
+
+
+def _coerce_score(value: Any) -> Optional[float]:
+    """키워드 점수 1개를 1~5 범위의 숫자로 변환 (숫자 문자열 허용, bool/NaN/범위 밖은 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        try:
+            value = float(value.strip())
+        except ValueError:
+            return None
+    if not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    return value if 1 <= value <= 5 else None
+
+
+def _valid_keyword_scores(scores: Any, expected_count: int) -> bool:
+    """배치 채점 결과 검증: 키워드 수만큼 점수가 있고, 모든 점수가 1~5 범위의 숫자여야 함"""
+    if not isinstance(scores, dict) or not scores:
+        return False
+    if expected_count and len(scores) != expected_count:
+        return False
+    return all(_coerce_score(v) is not None for v in scores.values())
+
+
+def score_keywords_batch(question_data: Dict, model_answers: List[str], llm_instance: LLMQuery,
+                         scoring_model: str = 'google/gemini-3-pro-preview',
+                         best_answer: str = None) -> List[Dict[str, Any]]:
+    """
+    같은 문제에 대한 여러 답변을 한 번의 요청으로 채점 (2단계 배치 모드)
+    
+    답변마다 ID(A1, A2, ...)를 붙여 구조화된 JSON으로 받고, 결과가 검증을 통과하지 못한
+    답변(누락, 키워드 수 불일치, 1~5 범위 밖 점수)은 score_keywords로 개별 재채점합니다.
+    
+    Args:
+        question_data: 문제 데이터 (essay_question, essay_keyword, essay_answer 포함)
+        model_answers: 같은 문제에 대한 모델 답변 리스트
+        llm_instance: LLMQuery 인스턴스
+        scoring_model: 점수 평가에 사용할 LLM 모델명
+        best_answer: 모범답안 (선택사항)
+    
+    Returns:
+        답변 순서대로 score_keywords와 같은 형식의 결과 리스트
+        ({'keyword_scores', 'final_score', 'scoring_response'}; 배치 결과는 scoring_response가 '[batch] ...')
+    """
+    from tools.evaluation.keyword_matcher import split_keywords
+    
+    if len(model_answers) <= 1:
+        return [score_keywords(question_data, a, llm_instance, scoring_model, best_answer) for a in model_answers]
+    
+    best_ans = best_answer if best_answer is not None else question_data.get('essay_answer', '모범답안이 없습니다.')
+    answer_ids = [f"A{i}" for i in range(1, len(model_answers) + 1)]
+    answers_block = "\n\n".join(
+        f"[답변 ID: {aid}]\n{answer}" for aid, answer in zip(answer_ids, model_answers)
+    )
+    scoring_user_prompt = f"""
+서술형 질문: {question_data['essay_question']}
+키워드: {question_data['essay_keyword']}
+
+모범답안:
+{best_ans}
+
+모델 답변들(평가대상, {len(model_answers)}개):
+{answers_block}
+
+각 답변 ID별로 각 키워드에 1~5점을 부여하여 JSON 형식으로 반환해주세요.
+"""
+    
+    parsed_by_id: Dict[str, Dict[str, Any]] = {}
+    try:
+        scoring_response = llm_instance.query_openrouter(
+            BATCH_SCORING_SYSTEM_PROMPT,
+            scoring_user_prompt,
+            model_name=scoring_model
+        )
+        payload = JSONHandler.extract_object(scoring_response or '')
+        if isinstance(payload, dict) and isinstance(payload.get('results'), list):
+            for item in payload['results']:
+                if isinstance(item, dict) and item.get('id') in answer_ids:
+                    parsed_by_id[item['id']] = item.get('scores')
+    except Exception as e:
+        print(f"배치 채점 실패, 개별 채점으로 전환: {e}")
+    
+    expected_count = len(split_keywords(question_data.get('essay_keyword', '')))
+    results = []
+    for aid, answer in zip(answer_ids, model_answers):
+        scores = parsed_by_id.get(aid)
+        if _valid_keyword_scores(scores, expected_count):
+            scores = {k: _coerce_score(v) for k, v in scores.items()}
+            results.append({
+                'keyword_scores': scores,
+                'final_score': _final_score(scores),
+                'scoring_response': '[batch] ' + json.dumps({'id': aid, 'scores': scores}, ensure_ascii=False)
+            })
+        else:
+            # 검증 실패 → 해당 답변만 단일 채점
+            results.append(score_keywords(question_data, answer, llm_instance, scoring_model, best_answer))
+    return results
+
+
+def evaluate_essay_answer(question_data: Dict, model_answer: str, llm_instance: LLMQuery, 
+                         keyword_check_model: str = 'google/gemini-2.5-flash',
+                         scoring_model: str = 'google/gemini-3-pro-preview', 
+                         best_answer: str = None,
+                         keyword_matcher: Optional[KeywordMatcher] = None) -> Dict[str, Any]:
+    """
+    서술형 답변 평가 함수
+    
+    Args:
+        question_data: 문제 데이터 (essay_question, essay_keyword, essay_answer 포함)
+        model_answer: 평가할 모델 답변
+        llm_instance: LLMQuery 인스턴스
+        keyword_check_model: 키워드 포함 여부 확인에 사용할 LLM 모델명
+        scoring_model: 점수 평가에 사용할 LLM 모델명
+        best_answer: 모범답안 (선택사항)
+        keyword_matcher: 로컬 키워드 사전 확인기 (None이면 항상 LLM으로 확인)
+    
+    Returns:
+        dict: {
+            'has_all_keywords': bool,
+            'keyword_scores': dict,  # 키워드별 점수 (1~5점)
+            'final_score': float,    # 최종 점수 (100점 만점)
+            'keyword_check_response': str,
+            'scoring_response': str
+        }
+    """
+    result = {
+        'has_all_keywords': False,
+        'keyword_scores': {},
+        'final_score': 0.0,
+        'keyword_check_response': '',
+        'scoring_response': ''
+    }
+    
+    result.update(check_keywords(question_data, model_answer, llm_instance, keyword_check_model,
+                                 keyword_matcher))
+    
+    # 키워드가 모두 포함되지 않은 경우
+    if not result['has_all_keywords']:
+        result['final_score'] = 0.0
+        return result
+    
+    result.update(score_keywords(question_data, model_answer, llm_instance, scoring_model, best_answer))
+    return result
+
+
 def calculate_statistics(evaluation_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     평가 결과 통계 계산
     
+    error 필드가 있는 결과(LLM 호출 실패)는 0점으로 섞지 않고 error_count로만 세며,
+    비율/점수 통계는 채점이 끝난 결과(graded_count)만으로 계산합니다.
+    
     Args:
         evaluation_results: 평가 결과 리스트
     
     Returns:
         dict: 통계 정보
     """
+    graded_results = [r for r in evaluation_results if not r.get('error')]
     stats = {
         'total_count': len(evaluation_results),
+        'graded_count': len(graded_results),
+        'error_count': len(evaluation_results) - len(graded_results),
         'keyword_inclusion_rate': 0.0,
         'average_score': 0.0,
         'score_distribution': {},
@@ -188,8 +330,11 @@ def calculate_statistics(evaluation_results: List[Dict[str, Any]]) -> Dict[str,
         'perfect_score_count': 0
     }
     
-    if not evaluation_results:
+    if not graded_results:
+        if evaluation_results:
+            stats['min_score'] = 0.0
         return stats
+    evaluation_results = graded_results
     
     # 키워드 포함 여부 통계
     keyword_included = sum(1 for r in evaluation_results if r.get('has_all_keywords', False))
@@ -237,6 +382,8 @@ def print_statistics(stats: Dict[str, Any], model_name: str):
     print("="*60)
     print(f"\n[기본 통계]")
     print(f"  총 평가 문제 수: {stats['total_count']}개")
+    if stats.get('error_count'):
+        print(f"  채점 오류 (집계 제외): {stats['error_count']}개")
     print(f"  키워드 포함 비율: {stats['keyword_inclusion_rate']:.2f}%")
     print(f"  평균 점수: {stats['average_score']:.2f}점")
     print(f"  최고 점수: {stats['max_score']:.2f}점")
@@ -247,7 +394,7 @@ def print_statistics(stats: Dict[str, Any], model_name: str):
     print(f"\n[점수 분포]")
     for bucket in sorted(stats['score_distribution'].keys(), key=lambda x: int(x.split('-')[0])):
         count = stats['score_distribution'][bucket]
-        percentage = (count / stats['total_count']) * 100
+        percentage = (count / stats.get('graded_count', stats['total_count'])) * 100
         print(f"  {bucket}: {count}개 ({percentage:.1f}%)")
     
     if stats['keyword_avg_scores']:
@@ -275,6 +422,8 @@ def generate_statistics_markdown(stats: Dict[str, Any], model_name: str) -> str:
     
     md_lines.append("## 기본 통계\n")
     md_lines.append(f"- **총 평가 문제 수**: {stats['total_count']}개")
+    if stats.get('error_count'):
+        md_lines.append(f"- **채점 오류 (집계 제외)**: {stats['error_count']}개")
     md_lines.append(f"- **키워드 포함 비율**: {stats['keyword_inclusion_rate']:.2f}%")
     md_lines.append(f"- **평균 점수**: {stats['average_score']:.2f}점")
     md_lines.append(f"- **최고 점수**: {stats['max_score']:.2f}점")
@@ -288,7 +437,7 @@ def generate_statistics_markdown(stats: Dict[str, Any], model_name: str) -> str:
     md_lines.append("|----------|--------|------|")
     for bucket in sorted(stats['score_distribution'].keys(), key=lambda x: int(x.split('-')[0])):
         count = stats['score_distribution'][bucket]
-        percentage = (count / stats['total_count']) * 100
+        percentage = (count / stats.get('graded_count', stats['total_count'])) * 100
         md_lines.append(f"| {bucket} | {count}개 | {percentage:.1f}% |")
     md_lines.append("")
     
@@ -328,7 +477,8 @@ def save_essay_results_to_excel(detailed_results: List[Dict[str, Any]], stats: D
                     '모범답안': result.get('best_answer', ''),
                     '키워드포함여부': result.get('evaluation_result', {}).get('has_all_keywords', False),
                     '최종점수': result.get('evaluation_result', {}).get('final_score', 0.0),
-                    '키워드별점수': json.dumps(result.get('evaluation_result', {}).get('keyword_scores', {}), ensure_ascii=False)
+                    '키워드별점수': json.dumps(result.get('evaluation_result', {}).get('keyword_scores', {}), ensure_ascii=False),
+                    '채점오류': result.get('evaluation_result', {}).get('error', '')
                 }
                 df_results.append(row)
             
@@ -339,6 +489,7 @@ def save_essay_results_to_excel(detailed_results: List[Dict[str, Any]], stats: D
             stats_data = {
                 '항목': [
                     '총 평가 문제 수',
+                    '채점 오류 (집계 제외)',
                     '키워드 포함 비율 (%)',
                     '평균 점수',
                     '최고 점수',
@@ -348,6 +499,7 @@ def save_essay_results_to_excel(detailed_results: List[Dict[str, Any]], stats: D
                 ],
                 '값': [
                     stats.get('total_count', 0),
+                    stats.get('error_count', 0),
                     f"{stats.get('keyword_inclusion_rate', 0.0):.2f}",
                     f"{stats.get('average_score', 0.0):.2f}",
                     f"{stats.get('max_score', 0.0):.2f}",
@@ -365,7 +517,7 @@ def save_essay_results_to_excel(detailed_results: List[Dict[str, Any]], stats: D
                 dist_data = {
                     '점수구간': sorted(score_dist.keys(), key=lambda x: int(x.split('-')[0])),
                     '문제수': [score_dist[k] for k in sorted(score_dist.keys(), key=lambda x: int(x.split('-')[0]))],
-                    '비율 (%)': [f"{(score_dist[k] / stats.get('total_count', 1)) * 100:.1f}" 
+                    '비율 (%)': [f"{(score_dist[k] / (stats.get('graded_count', stats.get('total_count')) or 1)) * 100:.1f}" 
                                 for k in sorted(score_dist.keys(), key=lambda x: int(x.split('-')[0]))]
                 }
                 df_dist = pd.DataFrame(dist_data)
@@ -383,7 +535,8 @@ def save_essay_results_to_excel(detailed_results: List[Dict[str, Any]], stats: D
             
             # 5. 키워드 미포함 문제 시트
             no_keyword_results = [r for r in detailed_results 
-                                if not r.get('evaluation_result', {}).get('has_all_keywords', False)]
+                                if not r.get('evaluation_result', {}).get('has_all_keywords', False)
+                                and not r.get('evaluation_result', {}).get('error')]
             if no_keyword_results:
                 df_no_keyword = []
                 for result in no_keyword_results:
@@ -419,23 +572,43 @@ def get_set_dir_name(set_num: int) -> str:
     return suffixes.get(set_num, str(set_num))
 
 
-def evaluate_single_model(model_name: str, question_file: str, 
-                          keyword_check_model: str = 'google/gemini-2.5-flash',
-                          scoring_model: str = 'google/gemini-3-pro-preview',
-                          set_num: Optional[int] = None, best_answers_dict: Optional[Dict] = None):
+def build_detailed_record(question: Dict, model_answer: str, best_answer: Optional[str],
+                          result: Dict[str, Any]) -> Dict[str, Any]:
+    """문제 1개의 상세 평가 결과 레코드 생성 (*_detailed_results.json 항목, 채점 실패 시 evaluation_result.error 포함)"""
+    evaluation_result = {
+        'has_all_keywords': result['has_all_keywords'],
+        'final_score': result['final_score'],
+        'keyword_scores': result['keyword_scores'],
+        'keyword_check_response': result.get('keyword_check_response', ''),
+        'scoring_response': result.get('scoring_response', '')
+    }
+    if result.get('error'):
+        evaluation_result['error'] = result['error']
+    return {
+        'file_id': question.get('file_id'),
+        'tag': question.get('tag'),
+        'essay_question': question.get('essay_question'),
+        'essay_keyword': question.get('essay_keyword'),
+        'model_answer': model_answer,
+        'best_answer': best_answer if best_answer else question.get('essay_answer', ''),
+        'evaluation_result': evaluation_result
+    }
+
+
+def load_grading_inputs(model_name: str, question_file: str, set_num: Optional[int] = None,
+                        best_answers_dict: Optional[Dict] = None) -> Optional[List[Dict[str, Any]]]:
     """
-    단일 모델 평가 수행
+    단일 모델의 채점 입력 로드
     
     Args:
         model_name: 평가할 모델명
         question_file: 문제 파일 경로
-        keyword_check_model: 키워드 포함 여부 확인에 사용할 LLM 모델명
-        scoring_model: 점수 평가에 사용할 LLM 모델명
         set_num: 세트 번호 (1~5, None이면 기본 경로 사용)
         best_answers_dict: 모범답안 딕셔너리 {(file_id, tag): answer}
     
     Returns:
-        tuple: (evaluation_results, detailed_results, stats)
+        [{'question': dict, 'model_answer': str, 'best_answer': str|None}, ...]
+        (모델 답변 파일이 없으면 None)
     """
     base_dir = os.path.dirname(question_file)
     model_safe_name = model_name.replace("/", "_")
@@ -451,7 +624,7 @@ def evaluate_single_model(model_name: str, question_file: str,
     if not os.path.exists(answer_file):
         print(f"경고: 모델 답변 파일을 찾을 수 없습니다: {answer_file}")
         print(f"먼저 essay_create_model_answers.py를 실행하여 모델 답변을 생성하세요.")
-        return None, None, None
+        return None
     
     # 데이터 로드
     print(f"\n[모델: {model_name}]")
@@ -464,28 +637,59 @@ def evaluate_single_model(model_name: str, question_file: str,
         model_answers = json.load(f)
     
     # 모델 답변에 있는 문제들의 키 추출 (file_id, tag)
-    answer_keys = set()
     answer_dict = {}
     for ma in model_answers:
         key = (ma.get('file_id'), ma.get('tag'))
-        answer_keys.add(key)
         answer_dict[key] = ma.get('answer', '')
     
-    print(f"모델 답변 파일에 {len(answer_keys)}개의 문제가 있습니다.")
+    print(f"모델 답변 파일에 {len(answer_dict)}개의 문제가 있습니다.")
     
     # 전체 문제 데이터 로드
     print(f"문제 데이터 로드 중: {question_file}")
     with open(question_file, 'r', encoding='utf-8') as f:
         all_questions = json.load(f)
     
-    # 모델 답변에 있는 문제들만 필터링
-    questions = []
+    # 모델 답변에 있는 문제들만 (file_id와 tag로 매칭)
+    inputs = []
     for q in all_questions:
         key = (q.get('file_id'), q.get('tag'))
-        if key in answer_keys:
-            questions.append(q)
+        if key not in answer_dict:
+            continue
+        inputs.append({
+            'question': q,
+            'model_answer': answer_dict[key],
+            # 모범답안 찾기 (모델 답변에 있는 문제에 해당하는 것만)
+            'best_answer': best_answers_dict.get(key) if best_answers_dict else None,
+        })
+    
+    print(f"평가할 문제 수: {len(inputs)}개")
+    return inputs
+
+
+def evaluate_single_model(model_name: str, question_file: str, 
+                          keyword_check_model: str = 'google/gemini-2.5-flash',
+                          scoring_model: str = 'google/gemini-3-pro-preview',
+                          set_num: Optional[int] = None, best_answers_dict: Optional[Dict] = None,
+                          keyword_precheck: bool = False):
+    """
+    단일 모델 평가 수행
+    
+    Args:
+        model_name: 평가할 모델명
+        question_file: 문제 파일 경로
+        keyword_check_model: 키워드 포함 여부 확인에 사용할 LLM 모델명
+        scoring_model: 점수 평가에 사용할 LLM 모델명
+        set_num: 세트 번호 (1~5, None이면 기본 경로 사용)
+        best_answers_dict: 모범답안 딕셔너리 {(file_id, tag): answer}
+        keyword_precheck: 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략
+    
+    Returns:
+        tuple: (evaluation_results, detailed_results, stats)
+    """
+    inputs = load_grading_inputs(model_name, question_file, set_num, best_answers_dict)
+    if inputs is None:
+        return None, None, None
     
-    print(f"평가할 문제 수: {len(questions)}개")
     print(f"키워드 확인 모델: {keyword_check_model}")
     print(f"점수 평가 모델: {scoring_model}\n")
     
@@ -495,41 +699,18 @@ def evaluate_single_model(model_name: str, question_file: str,
     # 평가 수행
     evaluation_results = []
     detailed_results = []
+    keyword_matcher = KeywordMatcher() if keyword_precheck else None
     
-    for q in tqdm(questions, desc=f"평가 진행 [{model_name}]"):
-        # 모델 답변 찾기 (file_id와 tag로 매칭)
-        key = (q.get('file_id'), q.get('tag'))
-        model_answer = answer_dict.get(key)
-        
-        if model_answer is None:
-            print(f"경고: 모델 답변을 찾을 수 없습니다. (file_id: {q.get('file_id')}, tag: {q.get('tag')})")
-            continue
-        
-        # 모범답안 찾기 (모델 답변에 있는 문제에 해당하는 것만)
-        best_answer = None
-        if best_answers_dict:
-            best_answer = best_answers_dict.get(key)
+    for item in tqdm(inputs, desc=f"평가 진행 [{model_name}]"):
+        q, model_answer, best_answer = item['question'], item['model_answer'], item['best_answer']
         
         # 평가 수행
-        result = evaluate_essay_answer(q, model_answer, llm, keyword_check_model, scoring_model, best_answer)
+        result = evaluate_essay_answer(q, model_answer, llm, keyword_check_model, scoring_model, best_answer,
+                                       keyword_matcher)
         
         # 결과 저장
         evaluation_results.append(result)
-        detailed_results.append({
-            'file_id': q.get('file_id'),
-            'tag': q.get('tag'),
-            'essay_question': q.get('essay_question'),
-            'essay_keyword': q.get('essay_keyword'),
-            'model_answer': model_answer,
-            'best_answer': best_answer if best_answer else q.get('essay_answer', ''),
-            'evaluation_result': {
-                'has_all_keywords': result['has_all_keywords'],
-                'final_score': result['final_score'],
-                'keyword_scores': result['keyword_scores'],
-                'keyword_check_response': result.get('keyword_check_response', ''),
-                'scoring_response': result.get('scoring_response', '')
-            }
-        })
+        detailed_results.append(build_detailed_record(q, model_answer, best_answer, result))
     
     # 통계 계산
     stats = calculate_statistics(evaluation_results)
@@ -558,6 +739,8 @@ def main():
                        help='키워드 포함 여부 확인에 사용할 LLM 모델명 (기본값: google/gemini-2.5-flash)')
     parser.add_argument('--scoring_model', type=str, default='google/gemini-3-pro-preview',
                        help='점수 평가에 사용할 LLM 모델명 (기본값: google/gemini-3-pro-preview)')
+    parser.add_argument('--keyword_precheck', action='store_true',
+                       help='로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략')
     parser.add_argument('--base_dir', type=str, default=None,
                        help='기본 데이터 디렉토리 (None이면 ONEDRIVE_PATH/evaluation/eval_data/9_multiple_to_essay 사용)')
     
@@ -619,7 +802,7 @@ def main():
         # 평가 수행
         evaluation_results, detailed_results, stats = evaluate_single_model(
             args.model_name, question_file, args.keyword_check_model, args.scoring_model, 
-            set_num, best_answers_dict
+            set_num, best_answers_dict, args.keyword_precheck
         )
         
         if evaluation_results is None:
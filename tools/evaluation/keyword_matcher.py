@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서술형 채점용 로컬 키워드 사전 확인
+
+evaluate_essay_answer의 1단계(키워드 포함 여부)는 대부분 문자열 비교로 판단할 수 있으므로,
+정규화한 한국어 문자열 매칭과 간단한 형태 변이(조사/어미 제거)로 명확한 경우만 로컬에서 결정하고
+애매한 경우에만 LLM 채점 모델로 넘깁니다.
+
+키워드별 판정:
+    - hit: 정규화한 키워드(공백/문장부호 제거)가 답변에 그대로 있음
+    - miss: 키워드의 어느 단어 어간도, 글자 bigram 대부분도 답변에 없음
+    - ambiguous: 그 밖의 경우 (조사·어미를 뗀 어간만 일치, 여러 단어 키워드의 일부만 있음, bigram이 상당수 겹침 등)
+      '신용도'/'집중도'/'투자가'처럼 끝 글자가 조사가 아니라 명사의 일부인 경우가 있으므로
+      어간 일치만으로는 hit로 확정하지 않습니다.
+
+답변 판정 (모든 키워드가 포함되어야 True):
+    - 하나라도 miss → False
+    - 모두 hit → True
+    - 그 외 → None (LLM으로 확인)
+
+일치율 리포트:
+    기존 *_detailed_results.json의 LLM 키워드 판단(has_all_keywords)과 로컬 판정을 비교합니다.
+    python -m tools.evaluation.keyword_matcher --detailed_results exam_result/*_detailed_results.json --sample_size 300
+"""
+
+import re
+import json
+import glob
+import random
+import argparse
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+# 키워드 끝에서 떼어 볼 조사/어미 (긴 것부터 검사)
+KOREAN_SUFFIXES = sorted([
+    '에서는', '으로써', '으로서', '에게서', '이라는', '이라고', '하였다', '되었다', '시키는',
+    '에서', '에게', '으로', '로써', '로서', '까지', '부터', '이며', '이고', '이란', '라는', '라고',
+    '하는', '하고', '하며', '하여', '해서', '한다', '했다', '되는', '되어', '된다', '됐다', '적인', '적으로',
+    '하기', '되기', '시킨', '함', '됨', '한', '된', '할', '될', '적',
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '만', '로', '및', '등',
+], key=len, reverse=True)
+
+_PUNCT_RE = re.compile(r"[\s\-_·ㆍ,./()\[\]{}<>「」『』'\"“”‘’:;!?~]+")
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화: NFKC, 소문자, 공백/문장부호 제거"""
+    text = unicodedata.normalize('NFKC', str(text or '')).lower()
+    return _PUNCT_RE.sub('', text)
+
+
+def split_keywords(essay_keyword) -> List[str]:
+    """essay_keyword 문자열("키워드1, 키워드2, ...") 또는 리스트를 키워드 리스트로 변환"""
+    if isinstance(essay_keyword, (list, tuple)):
+        items = essay_keyword
+    else:
+        items = re.split(r'[,\n]', str(essay_keyword or ''))
+    keywords = []
+    for item in items:
+        item = str(item).replace('[', '').replace(']', '').strip().strip('-').strip()
+        if item and item not in keywords:
+            keywords.append(item)
+    return keywords
+
+
+def strip_suffix(word: str) -> str:
+    """단어 끝의 조사/어미 1개 제거 (남는 어간이 2글자 이상일 때만)"""
+    for suffix in KOREAN_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[:-len(suffix)]
+    return word
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)} if len(text) >= 2 else {text}
+
+
+@dataclass
+class KeywordMatchResult:
+    """답변 1개의 로컬 키워드 판정 결과"""
+    decision: Optional[bool]
+    statuses: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def settled(self) -> bool:
+        return self.decision is not None
+
+    def response_text(self) -> str:
+        """keyword_check_response에 기록할 문자열"""
+        detail = ', '.join(f"{k}:{v}" for k, v in self.statuses.items())
+        return f"[local] {self.decision} ({detail})"
+
+
+class KeywordMatcher:
+    """정규화 문자열 매칭 기반 로컬 키워드 판정기"""
+
+    def __init__(self, miss_overlap: float = 0.34):
+        """
+        Args:
+            miss_overlap: 키워드 bigram 중 답변에 있는 비율이 이 값 미만이어야 miss로 확정
+        """
+        self.miss_overlap = miss_overlap
+
+    def keyword_status(self, keyword: str, answer_norm: str, answer_bigrams: set) -> str:
+        """키워드 1개 판정: 'hit' / 'miss' / 'ambiguous'"""
+        keyword_norm = normalize_text(keyword)
+        if not keyword_norm:
+            return 'hit'
+        if keyword_norm in answer_norm:
+            return 'hit'
+
+        # 어간(조사/어미를 뗀 형태)만 일치하면 다른 단어일 수 있으므로 LLM으로 확인
+        words = [normalize_text(w) for w in str(keyword).split()]
+        stems = [strip_suffix(w) for w in words if w] + [strip_suffix(keyword_norm)]
+        if any(s and s in answer_norm for s in stems):
+            return 'ambiguous'
+
+        overlap = len(_bigrams(keyword_norm) & answer_bigrams) / max(1, len(_bigrams(keyword_norm)))
+        return 'miss' if overlap < self.miss_overlap else 'ambiguous'
+
+    def match(self, essay_keyword, model_answer: str) -> KeywordMatchResult:
+        """답변 1개 판정 (decision None이면 LLM 확인 필요)"""
+        keywords = split_keywords(essay_keyword)
+        if not keywords:
+            return KeywordMatchResult(decision=None)
+
+        answer_norm = normalize_text(model_answer)
+        answer_bigrams = _bigrams(answer_norm)
+        statuses = {k: self.keyword_status(k, answer_norm, answer_bigrams) for k in keywords}
+
+        if any(s == 'miss' for s in statuses.values()):
+            decision = False
+        elif all(s == 'hit' for s in statuses.values()):
+            decision = True
+        else:
+            decision = None
+        return KeywordMatchResult(decision=decision, statuses=statuses)
+
+
+def agreement_report(records: List[Dict[str, Any]], matcher: Optional[KeywordMatcher] = None,
+                     sample_size: Optional[int] = None, seed: int = 42) -> Dict[str, Any]:
+    """
+    로컬 판정과 LLM 키워드 판단의 일치율 리포트
+
+    Args:
+        records: *_detailed_results.json 항목 리스트
+                 (essay_keyword, model_answer, evaluation_result.has_all_keywords 필요,
+                  keyword_check_response가 로컬 판정인 항목은 제외)
+        matcher: KeywordMatcher (None이면 기본값)
+        sample_size: 홀드아웃 표본 크기 (None이면 전체)
+        seed: 표본 추출 시드
+
+    Returns:
+        dict: total, settled, escalated, escalation_rate, agreement, confusion, disagreements
+    """
+    matcher = matcher or KeywordMatcher()
+    records = [
+        r for r in records
+        if 'has_all_keywords' in r.get('evaluation_result', {})
+        and not str(r['evaluation_result'].get('keyword_check_response', '')).startswith('[local]')
+    ]
+    if sample_size and sample_size < len(records):
+        records = random.Random(seed).sample(records, sample_size)
+
+    confusion = {'local_true_llm_true': 0, 'local_true_llm_false': 0,
+                 'local_false_llm_true': 0, 'local_false_llm_false': 0}
+    escalated = 0
+    disagreements = []
+    for r in records:
+        llm_decision = bool(r['evaluation_result']['has_all_keywords'])
+        result = matcher.match(r.get('essay_keyword', ''), r.get('model_answer', ''))
+        if not result.settled:
+            escalated += 1
+            continue
+        key = f"local_{str(result.decision).lower()}_llm_{str(llm_decision).lower()}"
+        confusion[key] += 1
+        if result.decision != llm_decision:
+            disagreements.append({
+                'file_id': r.get('file_id'),
+                'tag': r.get('tag'),
+                'essay_keyword': r.get('essay_keyword'),
+                'local': result.decision,
+                'llm': llm_decision,
+                'statuses': result.statuses,
+            })
+
+    settled = len(records) - escalated
+    agreed = confusion['local_true_llm_true'] + confusion['local_false_llm_false']
+    return {
+        'total': len(records),
+        'settled': settled,
+        'escalated': escalated,
+        'escalation_rate': escalated / len(records) if records else 0.0,
+        'agreement': agreed / settled if settled else 0.0,
+        'confusion': confusion,
+        'disagreements': disagreements,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 키워드 판정 vs LLM 키워드 판단 일치율 리포트')
+    parser.add_argument('--detailed_results', nargs='+', required=True,
+                        help='*_detailed_results.json 경로 (glob 패턴 가능)')
+    parser.add_argument('--sample_size', type=int, default=None, help='홀드아웃 표본 크기 (기본: 전체)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--show_disagreements', type=int, default=10, help='출력할 불일치 사례 수')
+    args = parser.parse_args()
+
+    records = []
+    for pattern in args.detailed_results:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'r', encoding='utf-8') as f:
+                records.extend(json.load(f))
+
+    report = agreement_report(records, sample_size=args.sample_size, seed=args.seed)
+    print(f"평가 항목: {report['total']}개")
+    print(f"로컬 확정: {report['settled']}개 / LLM 확인 필요: {report['escalated']}개 "
+          f"(LLM 호출 절감 {1 - report['escalation_rate']:.1%})")
+    print(f"로컬 확정 항목의 LLM 일치율: {report['agreement']:.2%}")
+    for key, count in report['confusion'].items():
+        print(f"  {key}: {count}")
+    for d in report['disagreements'][:args.show_disagreements]:
+        print(f"  [불일치] {d['file_id']}/{d['tag']} local={d['local']} llm={d['llm']} {d['statuses']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,12 @@ try:
     from tools.core.llm_query import LLMQuery
     from tools.core.utils import TextProcessor
     from tools.qna.extraction.tag_processor import TagProcessor
+    from tools.evaluation.adaptive_batch import AdaptiveBatchSizer, is_context_length_error
+    from tools.core.token_packer import TokenBudgetPacker, ModelTokenLimits, get_model_token_limits
+    from tools.evaluation.sampling import (
+        SequentialStopRule, stratified_order, allocate_sample, stratum_weights, estimate_stratum_std
+    )
+    from tools.core.artifact_store import is_artifact, iter_records, select_artifacts
 except ImportError:
     # Fallback for standalone execution
     PROJECT_ROOT_PATH = os.getcwd()
@@ -38,6 +44,17 @@ except ImportError:
     LLMQuery = None
     TextProcessor = None
     TagProcessor = None
+    AdaptiveBatchSizer = None
+    is_context_length_error = None
+    TokenBudgetPacker = None
+    SequentialStopRule = None
+    stratified_order = None
+    allocate_sample = None
+    stratum_weights = None
+    estimate_stratum_std = None
+    is_artifact = None
+    iter_records = None
+    select_artifacts = None
 
 # Logger setup
 _log_file = 'multiple_eval_by_model.log'
@@ -57,6 +74,9 @@ class MultipleChoiceEvaluator:
     
     CIRCLED_MAP = {"①":"1","②":"2","③":"3","④":"4","⑤":"5"}
     
+    # 토큰 예산 배치 시 문제당 예상 출력 토큰 (ID + 탭 + 번호)
+    OUTPUT_TOKENS_PER_ITEM = 20
+    
     SYSTEM_PROMPT = """당신은 금융전문가이자 객관식 문제 풀이 전문가입니다.
 여러 금융 객관식 문제에 대해, 각 문제의 정답 "번호만" 하나 선택합니다.
 
@@ -86,6 +106,10 @@ class MultipleChoiceEvaluator:
         self.use_server_mode = use_server_mode
         self.llm_query = None
         self._model_cache = {}
+        # 적응형 배치 모드의 모델별 배치 크기 조절 이력 (model_name -> summary)
+        self.batch_stats: Dict[str, Dict[str, Any]] = {}
+        # 순차 조기 종료 모드의 모델별 추정치/신뢰구간/호출 수 (model_name -> stats)
+        self.sequential_stats: Dict[str, Dict[str, Any]] = {}
         
         # 서버 모드에서는 HuggingFace Hub 오프라인 모드 활성화 (로컬 모델 사용 시 불필요한 원격 요청 방지)
         if use_server_mode:
@@ -230,6 +254,48 @@ class MultipleChoiceEvaluator:
         
         return df
 
+    @staticmethod
+    def _question_lines(r) -> List[str]:
+        """문제 1개의 프롬프트 블록"""
+        lines = [f"ID: {r['id']}", f"Q: {r['question']}"]
+        for i in range(1, 6):
+            lines.append(f"{i}) {r[f'opt{i}']}")
+        lines.append("")
+        return lines
+
+    def _token_packer(self, models: List[str]) -> 'TokenBudgetPacker':
+        """
+        평가 대상 모델 중 가장 작은 컨텍스트/출력 한도를 기준으로 한 패커
+        (서버 모드에서는 config의 max_model_len 사용)
+        """
+        max_model_len = None
+        if self.use_server_mode and self.llm_query is not None:
+            max_model_len = int(self.llm_query.config.get("VLLM", "max_model_len", fallback=0)) or None
+        model_limits = [get_model_token_limits(m, max_model_len) for m in models]
+        limits = ModelTokenLimits(
+            min(l.context_tokens for l in model_limits),
+            min(l.output_tokens for l in model_limits),
+        )
+        return TokenBudgetPacker(limits, output_tokens_per_item=self.OUTPUT_TOKENS_PER_ITEM)
+
+    def _token_item_text(self, r) -> str:
+        """토큰 예산 계산용 항목 텍스트 (문제 블록 + 출력 형식 안내 줄)"""
+        return "\n".join(self._question_lines(r)) + f"\n{r['id']}\\t{{번호}}"
+
+    def _make_token_batches(self, df_sample: pd.DataFrame, models: List[str],
+                            system_prompt: str, batch_size: int) -> List[pd.DataFrame]:
+        """
+        예상 토큰 수 기준으로 배치 구성
+        
+        배치는 모든 모델이 공유하므로 평가 대상 중 가장 작은 컨텍스트/출력 한도를 기준으로 합니다.
+        """
+        packer = self._token_packer(models)
+        rows = [r for _, r in df_sample.iterrows()]
+        packed = packer.pack(rows, self._token_item_text, fixed_text=system_prompt)
+        fixed_calls = (len(df_sample) + batch_size - 1) // batch_size
+        logger.info(f"토큰 예산 배치: {len(packed)}개 배치 (고정 {batch_size}개 배치 {fixed_calls}개 대비 {fixed_calls - len(packed)}개 절감)")
+        return [df_sample.loc[[r.name for r in batch]] for batch in packed]
+
     def build_prompt(self, batch_df: pd.DataFrame, transformed: bool = False) -> str:
         """배치 프롬프트 생성"""
         lines = []
@@ -240,11 +306,7 @@ class MultipleChoiceEvaluator:
         
         lines.append("문제들")
         for _, r in batch_df.iterrows():
-            lines.append(f"ID: {r['id']}")
-            lines.append(f"Q: {r['question']}")
-            for i in range(1, 6):
-                lines.append(f"{i}) {r[f'opt{i}']}")
-            lines.append("")
+            lines.extend(self._question_lines(r))
             
         lines.append("출력 형식(중요)")
         for _, r in batch_df.iterrows():
@@ -289,30 +351,342 @@ class MultipleChoiceEvaluator:
                     out[_id] = float(m.group(1))
         return out
 
+    @staticmethod
+    def _has_answer(value) -> bool:
+        """parse_output 결과 값이 파싱된 답인지 여부"""
+        if isinstance(value, set):
+            return bool(value)
+        return not pd.isna(value)
+
+    @staticmethod
+    def _append_model_output(output_base_dir: Optional[str], model: str, bidx: int,
+                             ids: List[str], raw: str) -> None:
+        """모델 원본 출력을 model_output/ 로그 파일에 추가"""
+        if not output_base_dir:
+            return
+        log_dir = os.path.join(output_base_dir, 'model_output')
+        os.makedirs(log_dir, exist_ok=True)
+        with open(os.path.join(log_dir, f"output_{model.replace('/','_')}.txt"), "a") as f:
+            f.write(f"Batch {bidx}\nIDs: {ids}\n{raw}\n\n")
+
+    def _run_adaptive_batches(self, df_sample: pd.DataFrame, models: List[str],
+                              system_prompt: str, initial_batch_size: int,
+                              max_batch_size: int, output_base_dir: Optional[str],
+                              transformed: bool, token_budget: bool = False,
+                              max_latency: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        모델별 적응형 배치 크기로 평가 호출
+
+        모델마다 AdaptiveBatchSizer를 두고, 파싱 완전도/응답 시간/컨텍스트 길이 오류에 따라
+        다음 배치 크기를 조절합니다. 파싱되지 않은 문제는 한 번만 다음 배치에 다시 넣습니다.
+        token_budget=True이면 해당 모델의 토큰 예산을 배치 크기 상한으로 적용합니다
+        (적응형 크기만큼 가져오되 예상 토큰 수가 예산을 넘기 전에 끊음).
+        max_latency(초)를 주면 응답 시간이 이를 넘은 배치 크기 이상으로는 키우지 않습니다.
+        """
+        rows = []
+        empty = set() if transformed else np.nan
+        df_by_id = df_sample.set_index("id", drop=False)
+        all_ids = df_sample["id"].tolist()
+
+        for midx, model in enumerate(models, 1):
+            sizer = AdaptiveBatchSizer(initial_size=initial_batch_size, max_size=max_batch_size,
+                                       max_latency=max_latency)
+            pending = list(all_ids)
+            requeued: Set[str] = set()
+            answers: Dict[str, Any] = {}
+            bidx = 0
+
+            item_costs: Dict[str, int] = {}
+            if token_budget and TokenBudgetPacker:
+                packer = self._token_packer([model])
+                input_budget = packer.input_budget(packer.estimator.count(system_prompt))
+                item_limit = packer.max_batch_items()
+                item_costs = {r["id"]: packer.item_cost(self._token_item_text(r)) for _, r in df_sample.iterrows()}
+
+            while pending:
+                size = sizer.size
+                if item_costs:
+                    size = self._take_within_budget(pending, min(size, item_limit), item_costs, input_budget)
+                ids, pending = pending[:size], pending[size:]
+                bidx += 1
+                logger.info(f"[진행] 모델 {midx}/{len(models)}: {model}, 배치 {bidx} (문제 {len(ids)}개, 남은 문제 {len(pending)}개)")
+                user_prompt = self.build_prompt(df_by_id.loc[ids], transformed)
+
+                try:
+                    raw, elapsed = self.call_llm(model, system_prompt, user_prompt)
+                except Exception as e:
+                    if is_context_length_error(e) and len(ids) > sizer.min_size:
+                        sizer.record_context_error(len(ids))
+                        logger.warning(f"[적응형 배치] 컨텍스트 길이 초과 ({model}, {len(ids)}개) → 배치 크기 {sizer.size}로 축소")
+                        pending = ids + pending
+                        continue
+                    logger.error(f"[오류] 모델 {model}, 배치 {bidx}: {e}")
+                    for _id in ids:
+                        answers[_id] = empty
+                    continue
+
+                self._append_model_output(output_base_dir, model, bidx, ids, raw)
+                parsed = self.parse_output(raw, ids, transformed)
+                missing = [_id for _id in ids if not self._has_answer(parsed[_id])]
+                reliable = sizer.record(len(ids), len(ids) - len(missing), len(ids), elapsed)
+                logger.info(
+                    f"[완료] 모델 {model}, 배치 {bidx}: {len(ids) - len(missing)}/{len(ids)}개 응답 파싱 완료 "
+                    f"({elapsed:.1f}초) → 다음 배치 크기 {sizer.size}{'' if reliable else ' (축소)'}"
+                )
+
+                for _id in ids:
+                    answers[_id] = parsed[_id]
+                retry = [_id for _id in missing if _id not in requeued]
+                requeued.update(retry)
+                pending.extend(retry)
+
+            self.batch_stats[model] = sizer.summary()
+            logger.info(
+                f"[적응형 배치] {model}: 최종 배치 크기 {sizer.size}, "
+                f"호출 {self.batch_stats[model]['calls']}회"
+            )
+            for _id in all_ids:
+                rows.append({"id": _id, "model_name": model, "answer": answers.get(_id, empty)})
+
+        return rows
+
+    @staticmethod
+    def _take_within_budget(pending: List[str], size: int, item_costs: Dict[str, int], budget: int) -> int:
+        """pending 앞에서부터 size개까지, 예상 토큰 합이 budget을 넘기 전까지의 개수 (최소 1개)"""
+        taken, used = 0, 0
+        for _id in pending[:size]:
+            cost = item_costs.get(_id, 0)
+            if taken and used + cost > budget:
+                break
+            used += cost
+            taken += 1
+        return max(1, taken)
+
+    @staticmethod
+    def _is_correct(pred, ans_set, transformed: bool = False) -> float:
+        """예측 정답 여부 (채점 불가 시 NaN)"""
+        if not ans_set:
+            return np.nan
+        if transformed:
+            return float(pred == ans_set) if isinstance(pred, set) else np.nan
+        if pd.isna(pred):
+            return np.nan
+        return float(int(pred) in ans_set)
+
+    @staticmethod
+    def _stratified_sample(df_all: pd.DataFrame, n: int, method: str = 'proportional',
+                           strata: Tuple[str, ...] = ('domain', 'subdomain'),
+                           stratum_std: Dict[Any, float] = None, seed: int = 42) -> pd.DataFrame:
+        """
+        층화 샘플링
+
+        strata 컬럼 조합을 층으로 보고 allocate_sample로 층별 표본 수를 정한 뒤 층 안에서 무작위 추출합니다.
+        결과에는 설계 가중치 weight(= 층 문제 수 / 층 표본 수) 컬럼이 추가됩니다.
+        층 수가 n보다 많으면 표본이 없는 층이 가중 정확도에서 빠지므로, 뒤쪽 strata 컬럼부터 합쳐
+        (예: domain/subdomain → domain) 모든 층에 표본이 돌아가게 합니다. 그래도 모자라면 표본이 있는 층의
+        모집단 비율을 attrs['strata_coverage']에 기록합니다.
+        """
+        strata = [c for c in strata if c in df_all.columns]
+        while len(strata) > 1 and len(df_all[strata].astype(str).drop_duplicates()) > n:
+            strata = strata[:-1]
+        keys = df_all[strata].astype(str).apply(tuple, axis=1) if strata else pd.Series([()] * len(df_all))
+        groups = {key: idx for key, idx in df_all.groupby(keys).groups.items()}
+        sizes = {key: len(idx) for key, idx in groups.items()}
+        alloc = allocate_sample(sizes, n, method=method, stratum_std=stratum_std)
+        weights = stratum_weights(sizes, alloc)
+
+        parts = []
+        for key in sorted(groups.keys(), key=lambda k: str(k)):
+            n_h = alloc.get(key, 0)
+            if n_h <= 0:
+                continue
+            part = df_all.loc[groups[key]].sample(n=n_h, random_state=seed).copy()
+            part["weight"] = weights[key]
+            parts.append(part)
+
+        logger.info(f"층화 샘플링({method}): {len(sizes)}개 층 ({'/'.join(strata) or '전체'}), 표본 {n}개")
+        df_sample = pd.concat(parts).reset_index(drop=True)
+        skipped = [key for key, v in alloc.items() if v == 0]
+        if skipped:
+            coverage = 1 - sum(sizes[key] for key in skipped) / len(df_all)
+            df_sample.attrs['strata_coverage'] = coverage
+            logger.warning(
+                f"표본 수({n})가 층 수({len(sizes)})보다 적어 {len(skipped)}개 층에 표본이 없습니다. "
+                f"가중 정확도는 표본이 있는 층(모집단의 {coverage:.1%})만 대표합니다."
+            )
+        return df_sample
+
+    @staticmethod
+    def _weighted_mean(df: pd.DataFrame, by, value: str = "correct", weight: str = "weight") -> pd.Series:
+        """채점 가능한 행만으로 가중 평균 계산 (weight 컬럼이 없으면 단순 평균)"""
+        if weight not in df.columns:
+            return df.groupby(by, dropna=False)[value].mean()
+        valid = df[df[value].notna()]
+        valid = valid.assign(_wv=valid[value] * valid[weight])
+        sums = valid.groupby(by, dropna=False)[["_wv", weight]].sum()
+        # 채점 가능한 응답이 하나도 없는 그룹은 NaN으로 유지
+        return (sums["_wv"] / sums[weight]).reindex(df.groupby(by, dropna=False).size().index)
+
+    def run_sequential_eval(self, json_list: List[dict], models: List[str],
+                            target_ci_width: float = 0.04, batch_size: int = 50, seed: int = 42,
+                            use_ox_support: bool = True, output_base_dir: str = None,
+                            transformed: bool = False, confidence: float = 0.95,
+                            min_samples: int = 30, per_domain: bool = False,
+                            domain_ci_width: float = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        순차 조기 종료 평가
+
+        문제를 domain 기준으로 층화한 순서로 배치 단위로 풀게 하고, 모델별로
+        정확도 신뢰구간(Wilson) 폭이 target_ci_width 이하가 되면 해당 모델의 평가를 멈춥니다.
+        per_domain=True이면 각 domain의 신뢰구간 폭도 domain_ci_width(기본: target_ci_width) 이하여야 멈춥니다.
+        응답이 파싱되지 않은 문제는 채점 수(n)에서 제외합니다.
+
+        Returns:
+            run_eval과 같은 (df_all, pred_long, pred_wide, acc_by_model).
+            acc_by_model에는 accuracy 외에 ci_low, ci_high, n_answered, n_asked, calls, full_calls,
+            stopped_early 컬럼이 추가됩니다. (self.sequential_stats에도 기록)
+        """
+        df_all = self.json_to_df(json_list, use_ox_support, transformed)
+        df_all = df_all.sort_values(by=['book_id', 'tag'], ascending=False).reset_index(drop=True)
+
+        order = stratified_order(df_all["domain"].tolist(), seed=seed)
+        df_order = df_all.iloc[order].reset_index(drop=True)
+        batches = [df_order.iloc[i:i+batch_size] for i in range(0, len(df_order), batch_size)]
+        full_calls = len(batches)
+
+        system_prompt = self.SYSTEM_PROMPT_TRANSFORMED if transformed else self.SYSTEM_PROMPT
+        empty = set() if transformed else np.nan
+        logger.info(
+            f"순차 평가 시작: 총 {len(df_order)}개 문제, 목표 신뢰구간 폭 {target_ci_width:.3f} "
+            f"(신뢰수준 {confidence:.0%}), 배치 크기 {batch_size}, {len(models)}개 모델"
+        )
+
+        rows = []
+        acc_rows = []
+        for midx, model in enumerate(models, 1):
+            rule = SequentialStopRule(
+                target_width=target_ci_width, confidence=confidence, min_samples=min_samples,
+                per_domain=per_domain, domain_target_width=domain_ci_width
+            )
+            calls = 0
+            asked = 0
+            stopped = False
+            for bidx, bdf in enumerate(batches, 1):
+                ids = bdf["id"].tolist()
+                try:
+                    raw, elapsed = self.call_llm(model, system_prompt, self.build_prompt(bdf, transformed))
+                    self._append_model_output(output_base_dir, model, bidx, ids, raw)
+                    parsed = self.parse_output(raw, ids, transformed)
+                except Exception as e:
+                    logger.error(f"[오류] 모델 {model}, 배치 {bidx}: {e}")
+                    parsed = {_id: empty for _id in ids}
+                calls += 1
+                asked += len(ids)
+
+                for _, r in bdf.iterrows():
+                    pred = parsed[r["id"]]
+                    rows.append({"id": r["id"], "model_name": model, "answer": pred})
+                    correct = self._is_correct(pred, r["answer_set"], transformed)
+                    if not pd.isna(correct):
+                        rule.update(correct, r["domain"])
+
+                if rule.should_stop():
+                    stopped = bidx < full_calls
+                    break
+
+            est = rule.overall
+            logger.info(
+                f"[순차 평가] 모델 {midx}/{len(models)}: {model} 정확도 {est.accuracy:.4f} "
+                f"[{est.low:.4f}, {est.high:.4f}], 채점 {est.n}개, 호출 {calls}/{full_calls}회"
+                f"{' (조기 종료)' if stopped else ''}"
+            )
+            acc_rows.append({
+                "model_name": model,
+                "accuracy": est.accuracy,
+                "ci_low": est.low,
+                "ci_high": est.high,
+                "n_answered": est.n,
+                "n_asked": asked,
+                "calls": calls,
+                "full_calls": full_calls,
+                "stopped_early": stopped,
+            })
+            self.sequential_stats[model] = {
+                **acc_rows[-1],
+                "domains": {
+                    d: {"accuracy": e.accuracy, "ci_low": e.low, "ci_high": e.high, "n": e.n}
+                    for d, e in rule.domains.items()
+                },
+            }
+
+        pred_long = pd.DataFrame(rows).sort_values('id').reset_index(drop=True)
+        pred_wide = pred_long.pivot(index="id", columns="model_name", values="answer").reset_index()
+        acc_by_model = pd.DataFrame(acc_rows).sort_values("accuracy", ascending=False).reset_index(drop=True)
+        total_calls = int(acc_by_model["calls"].sum()) if not acc_by_model.empty else 0
+        logger.info(f"순차 평가 완료: 호출 {total_calls}/{full_calls * len(models)}회")
+
+        return df_all, pred_long, pred_wide, acc_by_model
+
     def run_eval(self, json_list: List[dict], models: List[str], 
                  sample_size: int = 300, batch_size: int = 50, seed: int = 42,
                  use_ox_support: bool = True, output_base_dir: str = None, 
-                 transformed: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """평가 실행"""
+                 transformed: bool = False, adaptive_batch: bool = False,
+                 max_batch_size: int = 50, token_budget: bool = False,
+                 sampling: str = 'random', strata: Tuple[str, ...] = ('domain', 'subdomain'),
+                 stratum_std: Dict[Any, float] = None,
+                 max_latency: Optional[float] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        평가 실행
+        
+        sampling이 'proportional' 또는 'neyman'이고 sample_size가 전체보다 작으면 strata 컬럼 조합으로
+        층화 샘플링합니다. 이때 pred_long에 설계 가중치 weight 컬럼이 붙고, accuracy는 가중 정확도
+        (모집단 전체 정확도의 불편 추정치), accuracy_unweighted는 표본 단순 평균입니다.
+        neyman 배분의 stratum_std는 (domain,) / (domain, subdomain) 튜플 키 → 정답률 표준편차 추정치이며,
+        load_stratum_std로 이전 평가 결과에서 만들 수 있습니다. 없으면 모든 층이 0.5가 되어 proportional과 같습니다.
+        층 수가 표본 수보다 많아 표본이 없는 층이 남으면 accuracy_coverage에 표본이 대표하는 모집단 비율을 기록합니다.
+        adaptive_batch=True이면 batch_size를 초기값으로 모델별 배치 크기를
+        max_batch_size까지 런타임에 조절합니다. (self.batch_stats에 조절 이력 기록)
+        max_latency(초)를 주면 배치 응답 시간이 이를 넘는 크기 이상으로는 배치를 키우지 않습니다.
+        token_budget=True이면 고정 개수 대신 예상 토큰 수 기준으로 배치를 구성합니다.
+        둘을 함께 쓰면 모델별 토큰 예산이 적응형 배치 크기의 상한으로 적용됩니다.
+        """
         # 1. DataFrame 변환
         df_all = self.json_to_df(json_list, use_ox_support, transformed)
         df_all = df_all.sort_values(by=['book_id', 'tag'], ascending=False).reset_index(drop=True)
         
         # 2. 샘플링
         actual_sample_size = min(sample_size, len(df_all))
-        if actual_sample_size < len(df_all):
+        if sampling == 'neyman' and not stratum_std:
+            logger.warning("neyman 배분에 층별 표준편차(stratum_std)가 없어 proportional 배분과 같게 동작합니다.")
+        if actual_sample_size < len(df_all) and sampling in ('proportional', 'neyman') and allocate_sample:
+            df_sample = self._stratified_sample(df_all, actual_sample_size, sampling, strata, stratum_std, seed)
+        elif actual_sample_size < len(df_all):
             df_sample = df_all.sample(n=actual_sample_size, random_state=seed).reset_index(drop=True)
         else:
             df_sample = df_all
             
         # 3. 배치 처리 및 모델 호출
-        batches = [df_sample.iloc[i:i+batch_size] for i in range(0, len(df_sample), batch_size)]
         rows = []
         system_prompt = self.SYSTEM_PROMPT_TRANSFORMED if transformed else self.SYSTEM_PROMPT
+        if token_budget and TokenBudgetPacker and not adaptive_batch:
+            batches = self._make_token_batches(df_sample, models, system_prompt, batch_size)
+        else:
+            batches = [df_sample.iloc[i:i+batch_size] for i in range(0, len(df_sample), batch_size)]
         
         total_batches = len(batches)
         total_models = len(models)
-        logger.info(f"평가 시작: 총 {len(df_sample)}개 문제, {total_batches}개 배치, {total_models}개 모델")
+        if adaptive_batch and AdaptiveBatchSizer:
+            logger.info(
+                f"평가 시작 (적응형 배치{' + 토큰 예산 상한' if token_budget and TokenBudgetPacker else ''}): "
+                f"총 {len(df_sample)}개 문제, 초기 배치 크기 {batch_size}, 최대 {max_batch_size}, {total_models}개 모델"
+            )
+            rows = self._run_adaptive_batches(
+                df_sample, models, system_prompt, batch_size, max_batch_size,
+                output_base_dir, transformed, token_budget=token_budget, max_latency=max_latency
+            )
+            batches = []
+        else:
+            logger.info(f"평가 시작: 총 {len(df_sample)}개 문제, {total_batches}개 배치, {total_models}개 모델")
         logger.info(f"평가 대상 모델: {models}")
         
         for bidx, bdf in enumerate(batches, 1):
@@ -325,14 +699,10 @@ class MultipleChoiceEvaluator:
                     raw, elapsed = self.call_llm(model, system_prompt, user_prompt)
                     
                     # 로그 저장
-                    if output_base_dir:
-                        log_dir = os.path.join(output_base_dir, 'model_output')
-                        os.makedirs(log_dir, exist_ok=True)
-                        with open(os.path.join(log_dir, f"output_{model.replace('/','_')}.txt"), "a") as f:
-                            f.write(f"Batch {bidx}\nIDs: {ids}\n{raw}\n\n")
+                    self._append_model_output(output_base_dir, model, bidx, ids, raw)
                             
                     parsed = self.parse_output(raw, ids, transformed)
-                    parsed_count = sum(1 for v in parsed.values() if (isinstance(v, set) and v) or (not isinstance(v, set) and not pd.isna(v)))
+                    parsed_count = sum(1 for v in parsed.values() if self._has_answer(v))
                     logger.info(f"[완료] 배치 {bidx}/{total_batches}, 모델 {model}: {parsed_count}/{len(ids)}개 응답 파싱 완료 ({elapsed:.1f}초)")
                     for _id in ids:
                         rows.append({"id": _id, "model_name": model, "answer": parsed[_id]})
@@ -346,47 +716,52 @@ class MultipleChoiceEvaluator:
         logger.info(f"평가 완료: 총 {len(rows)}개 결과 수집")
         pred_long = pd.DataFrame(rows).sort_values('id').reset_index(drop=True)
         pred_wide = pred_long.pivot(index="id", columns="model_name", values="answer").reset_index()
+        weighted = "weight" in df_sample.columns
+        if weighted:
+            pred_long = pred_long.merge(df_sample[["id", "weight"]], on="id", how="left")
         
         # 5. 정확도 계산
         key = df_sample[["id", "answer_set"]].copy()
         merged = pred_long.merge(key, on="id", how="left")
         
-        def _is_correct(pred, ans_set):
-            if not ans_set: return np.nan
-            if transformed:
-                return float(pred == ans_set) if isinstance(pred, set) else np.nan
-            
-            if pd.isna(pred): return np.nan
-            return float(int(pred) in ans_set)
-            
-        merged["correct"] = merged.apply(lambda r: _is_correct(r["answer"], r["answer_set"]), axis=1)
+        merged["correct"] = merged.apply(lambda r: self._is_correct(r["answer"], r["answer_set"], transformed), axis=1)
         
         acc_by_model = (
-            merged.groupby("model_name", dropna=False)["correct"]
-            .mean().reset_index()
-            .rename(columns={"correct": "accuracy"})
+            self._weighted_mean(merged, "model_name")
+            .rename("accuracy").reset_index()
             .sort_values("accuracy", ascending=False)
         )
+        if weighted:
+            unweighted = merged.groupby("model_name", dropna=False)["correct"].mean()
+            acc_by_model["accuracy_unweighted"] = acc_by_model["model_name"].map(unweighted)
+            if 'strata_coverage' in df_sample.attrs:
+                acc_by_model["accuracy_coverage"] = df_sample.attrs['strata_coverage']
         
         return df_all, pred_long, pred_wide, acc_by_model
 
 # Wrapper functions for backward compatibility
 def load_data_from_directory(data_path: str, apply_tag_replacement: bool = False) -> List[dict]:
-    """데이터 로딩 래퍼"""
+    """데이터 로딩 래퍼 (.json 및 압축 .jsonl 아티팩트, 같은 이름의 쌍은 최신 파일만)"""
     if not os.path.exists(data_path): return []
     
+    exts = (".json", ".jsonl") if is_artifact else (".json",)
     json_files = []
     if os.path.isfile(data_path):
         json_files = [data_path]
     else:
         for root, _, files in os.walk(data_path):
             for f in files:
-                if f.endswith(".json") and 'merged' not in f:
+                if f.endswith(exts) and 'merged' not in f:
                     json_files.append(os.path.join(root, f))
+        if select_artifacts:
+            json_files = select_artifacts(json_files)
     
     all_data = []
     for fpath in json_files:
         try:
+            if is_artifact and is_artifact(fpath):
+                all_data.extend(iter_records(fpath))
+                continue
             with open(fpath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 if isinstance(data, list): all_data.extend(data)
@@ -401,13 +776,49 @@ def load_data_from_directory(data_path: str, apply_tag_replacement: bool = False
                 
     return all_data
 
+def load_stratum_std(path: str) -> Dict[Tuple[str, ...], float]:
+    """
+    이전 평가 결과로 Neyman 배분용 층별 표준편차 추정
+
+    Excel(save_combined_results_to_excel 결과) 또는 결과 저장소(.evalstore)의
+    Domain별/Subdomain별 정확도 시트에서 (domain,) / (domain, subdomain) 키별 S_h를 계산합니다.
+    """
+    if os.path.isdir(path):
+        from tools.evaluation.report_store import build_report_tables, load_results_store
+        tables = build_report_tables(load_results_store(path))
+    else:
+        tables = pd.read_excel(path, sheet_name=['Domain별정확도', 'Subdomain별정확도'])
+
+    stratum_std = {}
+    for sheet, index in (('Domain별정확도', ['domain']), ('Subdomain별정확도', ['domain', 'subdomain'])):
+        df = tables.get(sheet)
+        if df is None:
+            continue
+        model_cols = [c for c in df.columns if c not in index]
+        accuracies = {
+            tuple(str(v) for v in row[index]): [p for p in row[model_cols] if not pd.isna(p)]
+            for _, row in df.iterrows()
+        }
+        stratum_std.update(estimate_stratum_std(accuracies))
+    logger.info(f"층별 표준편차 추정: {len(stratum_std)}개 층 ({path})")
+    return stratum_std
+
 def run_eval_pipeline(json_list, models, sample_size=300, batch_size=50, seed=42, 
                      use_server_mode=False, use_ox_support=True, api_key=None, 
-                     output_base_dir=None, transformed=False):
-    """평가 실행 래퍼"""
+                     output_base_dir=None, transformed=False,
+                     adaptive_batch=False, max_batch_size=50, token_budget=False,
+                     target_ci_width=None, per_domain_ci=False,
+                     sampling='random', stratum_std=None, max_latency=None):
+    """평가 실행 래퍼 (target_ci_width 지정 시 순차 조기 종료 평가)"""
     evaluator = MultipleChoiceEvaluator(api_key=api_key, use_server_mode=use_server_mode)
+    if target_ci_width and SequentialStopRule:
+        return evaluator.run_sequential_eval(json_list, models, target_ci_width, batch_size, seed,
+                                             use_ox_support, output_base_dir, transformed,
+                                             per_domain=per_domain_ci)
     return evaluator.run_eval(json_list, models, sample_size, batch_size, seed, 
-                            use_ox_support, output_base_dir, transformed)
+                            use_ox_support, output_base_dir, transformed,
+                            adaptive_batch, max_batch_size, token_budget,
+                            sampling=sampling, stratum_std=stratum_std, max_latency=max_latency)
 
 def save_results_to_excel(df_all, pred_wide, acc, pred_long=None, filename=None):
     """결과 저장 래퍼"""
@@ -462,17 +873,19 @@ def save_combined_results_to_excel(df_all: pd.DataFrame, pred_wide: pd.DataFrame
     
     # 정답 여부 계산을 위한 merged DataFrame 생성
     merged = pred_long.merge(df_all[['id', 'subject', 'domain', 'subdomain', 'answer_set']], on='id', how='left')
+    merged['correct'] = merged.apply(
+        lambda r: MultipleChoiceEvaluator._is_correct(r['answer'], r['answer_set'], transformed), axis=1
+    )
     
-    def _is_correct(pred, ans_set):
-        if not ans_set:
-            return np.nan
-        if transformed:
-            return float(pred == ans_set) if isinstance(pred, set) else np.nan
-        if pd.isna(pred):
-            return np.nan
-        return float(int(pred) in ans_set)
-    
-    merged['correct'] = merged.apply(lambda r: _is_correct(r['answer'], r['answer_set']), axis=1)
+    # 층화 샘플링 결과(weight 컬럼)이면 가중 정확도, 아니면 단순 평균
+    def _acc_pivot(index):
+        by = [index] if isinstance(index, str) else list(index)
+        return (
+            MultipleChoiceEvaluator._weighted_mean(merged, by + ['model_name'])
+            .rename('correct').reset_index()
+            .pivot_table(index=index, columns='model_name', values='correct')
+            .reset_index()
+        )
     
     with pd.ExcelWriter(filename, engine="openpyxl") as w:
         # 1. 전체데이터
@@ -486,32 +899,17 @@ def save_combined_results_to_excel(df_all: pd.DataFrame, pred_wide: pd.DataFrame
         
         # 4. Subject별 정확도 (금융일반/심화/실무1/실무2)
         if 'subject' in df_all.columns:
-            subject_acc = merged.pivot_table(
-                index='subject',
-                columns='model_name',
-                values='correct',
-                aggfunc='mean'
-            ).reset_index()
+            subject_acc = _acc_pivot('subject')
             subject_acc.to_excel(w, index=False, sheet_name="Subject별정확도")
         
         # 5. Domain별 정확도
         if 'domain' in df_all.columns:
-            domain_acc = merged.pivot_table(
-                index='domain',
-                columns='model_name',
-                values='correct',
-                aggfunc='mean'
-            ).reset_index()
+            domain_acc = _acc_pivot('domain')
             domain_acc.to_excel(w, index=False, sheet_name="Domain별정확도")
         
         # 6. Subdomain별 정확도
         if 'subdomain' in df_all.columns and 'domain' in df_all.columns:
-            subdomain_acc = merged.pivot_table(
-                index=['domain', 'subdomain'],
-                columns='model_name',
-                values='correct',
-                aggfunc='mean'
-            ).reset_index()
+            subdomain_acc = _acc_pivot(['domain', 'subdomain'])
             subdomain_acc.to_excel(w, index=False, sheet_name="Subdomain별정확도")
     
     logger.info(f"통합 평가 결과 저장 완료: {filename}")
@@ -526,10 +924,19 @@ def main():
     parser.add_argument('--data_path', required=True)
     parser.add_argument('--models', nargs='+', required=True)
     parser.add_argument('--api_key', default=None)
+    parser.add_argument('--sample_size', type=int, default=300)
+    parser.add_argument('--sampling', choices=['random', 'proportional', 'neyman'], default='random',
+                        help='sample_size 샘플링 방식 (proportional/neyman: domain/subdomain 층화 + 가중 정확도)')
+    parser.add_argument('--stratum_std_from', default=None,
+                        help='neyman 배분의 층별 표준편차를 추정할 이전 평가 결과 (Excel 또는 .evalstore)')
     args = parser.parse_args()
+    if args.sampling == 'neyman' and not args.stratum_std_from:
+        parser.error('--sampling neyman에는 --stratum_std_from이 필요합니다.')
     
     data = load_data_from_directory(args.data_path)
-    run_eval_pipeline(data, args.models, api_key=args.api_key)
+    stratum_std = load_stratum_std(args.stratum_std_from) if args.stratum_std_from else None
+    run_eval_pipeline(data, args.models, sample_size=args.sample_size, api_key=args.api_key,
+                      sampling=args.sampling, stratum_std=stratum_std)
 
 if __name__ == "__main__":
     main()
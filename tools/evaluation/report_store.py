@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+평가 결과 저장소 및 지연(deferred) 리포트 생성
+
+평가가 끝나는 시점(critical path)에는 결과를 압축된 컬럼 형식 파일로만 기록하고,
+Excel/Markdown 리포트는 필요할 때 저장소에서 생성합니다.
+
+저장소 구조 (<이름>.evalstore/):
+    - questions.parquet   : 전체 문제 (df_all)
+    - predictions.parquet : 모델별 예측 (pred_long + correct 컬럼)
+    - accuracy.parquet    : 모델별 정확도 (acc)
+    - meta.json           : models, transformed, 저장 형식 등
+
+pyarrow가 없으면 parquet 대신 gzip 압축 pickle(.pkl.gz)로 저장합니다.
+set 값(answer_set, 변형 문제 예측)은 JSON 문자열로 저장하고 읽을 때 복원합니다.
+
+Excel 리포트는 openpyxl write-only 모드로 행 단위 스트리밍 기록하므로
+전체 시트를 메모리에 올리지 않습니다. (시트 구성은 save_combined_results_to_excel과 동일)
+
+사용법:
+    # 리포트 생성
+    python -m tools.evaluation.report_store report --store exam_result/1st/1st_evaluation_x.evalstore --format excel markdown
+    # 기존 Excel 저장 vs 저장소 기록 지연 시간 비교 (합성 데이터)
+    python -m tools.benchmarks.report_store --questions 5000 --models 8
+"""
+
+import os
+import json
+import time
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from tools.core.logger import setup_logger
+except ImportError:
+    setup_logger = None
+
+try:
+    import pyarrow  # noqa: F401 (parquet 엔진 확인용)
+except ImportError:
+    pyarrow = None
+
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+if setup_logger:
+    logger = setup_logger(
+        name=__name__,
+        log_file='report_store.log',
+        use_console=True,
+        use_file=True
+    )
+else:
+    logger = logging.getLogger(__name__)
+
+
+STORE_SUFFIX = '.evalstore'
+STORE_TABLES = ('questions', 'predictions', 'accuracy')
+# set 값을 담을 수 있는 컬럼 (JSON 문자열로 직렬화)
+SET_COLUMNS = ('answer_set', 'answer')
+
+
+def store_path_for(filename: str) -> str:
+    """리포트 파일 경로(.xlsx 등)에 대응하는 저장소 경로"""
+    return os.path.splitext(filename)[0] + STORE_SUFFIX
+
+
+def _encode_value(value):
+    if isinstance(value, (set, frozenset)):
+        return json.dumps(sorted(value), ensure_ascii=False)
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode_value(value, as_set: bool):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return set() if as_set else np.nan
+    decoded = json.loads(value)
+    if isinstance(decoded, list):
+        return set(decoded)
+    return decoded
+
+
+def _encode_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for col in SET_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(_encode_value)
+    return df
+
+
+def _decode_frame(df: pd.DataFrame, transformed: bool) -> pd.DataFrame:
+    if 'answer_set' in df.columns:
+        df['answer_set'] = df['answer_set'].map(lambda v: _decode_value(v, True))
+    if 'answer' in df.columns:
+        df['answer'] = df['answer'].map(lambda v: _decode_value(v, transformed))
+    return df
+
+
+def _write_table(df: pd.DataFrame, path_base: str) -> str:
+    if pyarrow is not None:
+        path = path_base + '.parquet'
+        df.to_parquet(path, index=False, compression='zstd')
+    else:
+        path = path_base + '.pkl.gz'
+        df.to_pickle(path, compression='gzip')
+    return path
+
+
+def _read_table(store_path: str, name: str) -> Optional[pd.DataFrame]:
+    base = os.path.join(store_path, name)
+    if os.path.exists(base + '.parquet'):
+        return pd.read_parquet(base + '.parquet')
+    if os.path.exists(base + '.pkl.gz'):
+        return pd.read_pickle(base + '.pkl.gz', compression='gzip')
+    return None
+
+
+def save_results_store(df_all: pd.DataFrame, pred_long: pd.DataFrame, acc: pd.DataFrame,
+                       models: List[str], store_path: str, transformed: bool = False) -> str:
+    """
+    평가 결과를 컬럼 형식 저장소로 기록 (리포트 생성 없음)
+
+    Args:
+        df_all: 전체 데이터 DataFrame
+        pred_long: 모델별 예측 결과 (long format, weight 컬럼이 있으면 그대로 보존)
+        acc: 모델별 정확도 DataFrame
+        models: 평가에 사용된 모델 리스트
+        store_path: 저장소 디렉토리 경로 (<이름>.evalstore)
+        transformed: 변형 문제 평가 여부
+
+    Returns:
+        저장소 경로
+    """
+    from tools.evaluation.multiple_eval_by_model import MultipleChoiceEvaluator
+
+    os.makedirs(store_path, exist_ok=True)
+
+    # 정답 여부는 저장 시 한 번만 계산해 두고 리포트에서 재사용
+    answer_sets = dict(zip(df_all['id'], df_all['answer_set']))
+    predictions = pred_long.copy()
+    predictions['correct'] = [
+        MultipleChoiceEvaluator._is_correct(pred, answer_sets.get(_id, set()), transformed)
+        for _id, pred in zip(predictions['id'], predictions['answer'])
+    ]
+
+    tables = {'questions': df_all, 'predictions': predictions, 'accuracy': acc}
+    files = {name: os.path.basename(_write_table(_encode_frame(df), os.path.join(store_path, name)))
+             for name, df in tables.items()}
+
+    meta = {
+        'models': list(models),
+        'transformed': transformed,
+        'files': files,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    with open(os.path.join(store_path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"평가 결과 저장소 기록 완료: {store_path}")
+    return store_path
+
+
+def load_results_store(store_path: str) -> Dict[str, Any]:
+    """
+    저장소 읽기
+
+    Returns:
+        {'meta': dict, 'questions': df_all, 'predictions': pred_long(+correct), 'accuracy': acc}
+    """
+    with open(os.path.join(store_path, 'meta.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    result = {'meta': meta}
+    for name in STORE_TABLES:
+        df = _read_table(store_path, name)
+        if df is None:
+            raise FileNotFoundError(f"저장소에 {name} 테이블이 없습니다: {store_path}")
+        result[name] = _decode_frame(df, meta.get('transformed', False))
+    return result
+
+
+def _accuracy_pivot(predictions: pd.DataFrame, questions: pd.DataFrame, index: List[str]) -> pd.DataFrame:
+    """그룹별 모델 정확도 피벗 (weight 컬럼이 있으면 가중 평균)"""
+    from tools.evaluation.multiple_eval_by_model import MultipleChoiceEvaluator
+
+    merged = predictions.merge(questions[['id'] + index], on='id', how='left')
+    return (
+        MultipleChoiceEvaluator._weighted_mean(merged, index + ['model_name'])
+        .rename('correct').reset_index()
+        .pivot_table(index=index, columns='model_name', values='correct')
+        .reset_index()
+    )
+
+
+def _cell(value):
+    """openpyxl이 쓸 수 있는 셀 값으로 변환"""
+    if isinstance(value, (set, frozenset, list, dict, tuple)):
+        return str(value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _stream_sheet(wb, title: str, df: pd.DataFrame) -> None:
+    ws = wb.create_sheet(title=title)
+    ws.append([str(c) for c in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        ws.append([_cell(v) for v in row])
+
+
+def build_report_tables(store: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    """저장소로부터 리포트 시트별 테이블 구성 (save_combined_results_to_excel과 같은 시트)"""
+    questions = store['questions']
+    predictions = store['predictions']
+    pred_wide = predictions.pivot(index='id', columns='model_name', values='answer').reset_index()
+
+    tables = {
+        '전체데이터': questions,
+        '모델별예측': pred_wide,
+        '정확도': store['accuracy'],
+    }
+    if 'subject' in questions.columns:
+        tables['Subject별정확도'] = _accuracy_pivot(predictions, questions, ['subject'])
+    if 'domain' in questions.columns:
+        tables['Domain별정확도'] = _accuracy_pivot(predictions, questions, ['domain'])
+    if 'subdomain' in questions.columns and 'domain' in questions.columns:
+        tables['Subdomain별정확도'] = _accuracy_pivot(predictions, questions, ['domain', 'subdomain'])
+    return tables
+
+
+def write_excel_report(store_path: str, filename: Optional[str] = None) -> str:
+    """
+    저장소로부터 Excel 리포트 생성 (openpyxl write-only 스트리밍)
+
+    Args:
+        store_path: 저장소 경로
+        filename: 출력 xlsx 경로 (None이면 저장소 이름 기준)
+    """
+    if Workbook is None:
+        raise ImportError("Excel 리포트 생성에는 openpyxl이 필요합니다.")
+    filename = filename or os.path.splitext(store_path)[0] + '.xlsx'
+    store = load_results_store(store_path)
+
+    wb = Workbook(write_only=True)
+    for title, df in build_report_tables(store).items():
+        _stream_sheet(wb, title, df)
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    wb.save(filename)
+
+    logger.info(f"Excel 리포트 생성 완료: {filename}")
+    return filename
+
+
+def _markdown_table(df: pd.DataFrame, float_format: str = '{:.4f}') -> List[str]:
+    def fmt(v):
+        v = _cell(v)
+        if v is None:
+            return '-'
+        if isinstance(v, float):
+            return float_format.format(v)
+        return str(v)
+
+    lines = ['| ' + ' | '.join(str(c) for c in df.columns) + ' |',
+             '|' + '---|' * len(df.columns)]
+    for row in df.itertuples(index=False, name=None):
+        lines.append('| ' + ' | '.join(fmt(v) for v in row) + ' |')
+    return lines
+
+
+def write_markdown_report(store_path: str, filename: Optional[str] = None) -> str:
+    """
+    저장소로부터 Markdown 요약 리포트 생성 (정확도 / Subject별 / Domain별)
+
+    문제 단위 시트(전체데이터, 모델별예측)는 Markdown에 포함하지 않습니다.
+    """
+    filename = filename or os.path.splitext(store_path)[0] + '.md'
+    store = load_results_store(store_path)
+    tables = build_report_tables(store)
+    meta = store['meta']
+
+    md_lines = [
+        '# 객관식 평가 결과',
+        '',
+        f"- 모델 수: {len(meta.get('models', []))}",
+        f"- 문제 수: {len(store['questions'])}",
+        f"- 변형 문제 평가: {'예' if meta.get('transformed') else '아니오'}",
+        '',
+    ]
+    for title in ('정확도', 'Subject별정확도', 'Domain별정확도', 'Subdomain별정확도'):
+        if title in tables:
+            md_lines.append(f'## {title}')
+            md_lines.append('')
+            md_lines.extend(_markdown_table(tables[title]))
+            md_lines.append('')
+
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(md_lines))
+
+    logger.info(f"Markdown 리포트 생성 완료: {filename}")
+    return filename
+
+
+def main():
+    parser = argparse.ArgumentParser(description='평가 결과 저장소 리포트 생성')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    report = sub.add_parser('report', help='저장소에서 리포트 생성')
+    report.add_argument('--store', required=True, help='저장소 경로 (<이름>.evalstore)')
+    report.add_argument('--format', nargs='+', choices=['excel', 'markdown'], default=['excel'])
+    report.add_argument('--output', default=None, help='출력 파일 경로 (확장자 제외, 기본: 저장소 이름)')
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        base = args.output or os.path.splitext(args.store)[0]
+        if 'excel' in args.format:
+            write_excel_report(args.store, base + '.xlsx')
+        if 'markdown' in args.format:
+            write_markdown_report(args.store, base + '.md')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+평가용 층화(stratified) 샘플링 및 신뢰구간 유틸리티
+
+- stratified_order: 층(domain 등)별로 섞은 뒤 어느 앞부분을 잘라도 층 비율이 유지되도록 배열
+- wilson_interval: 정확도(이항 비율)의 Wilson 신뢰구간
+- SequentialStopRule: 신뢰구간 폭이 목표치보다 좁아지면 평가를 멈추는 규칙
+- allocate_sample / stratum_weights: 층별 표본 배분(비례/Neyman)과 설계 가중치
+- estimate_stratum_std: 이전 실행의 층별 정답률로 Neyman 배분용 표준편차 추정
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+# 신뢰수준 → 양측 z 값
+Z_VALUES = {0.90: 1.6449, 0.95: 1.9600, 0.99: 2.5758}
+
+
+def z_value(confidence: float) -> float:
+    """신뢰수준에 해당하는 z 값 (표에 없으면 0.95 사용)"""
+    return Z_VALUES.get(round(confidence, 2), Z_VALUES[0.95])
+
+
+def wilson_interval(successes: float, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    이항 비율의 Wilson 신뢰구간
+
+    Args:
+        successes: 정답 수
+        n: 채점된 문제 수
+        confidence: 신뢰수준
+
+    Returns:
+        (하한, 상한). n이 0이면 (0.0, 1.0)
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    z = z_value(confidence)
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def stratified_order(keys: Sequence[Hashable], seed: int = 42) -> List[int]:
+    """
+    층화 순서 생성
+
+    각 층 안에서는 무작위로 섞고, 층 사이에서는 "지금까지 뽑아야 했던 개수 - 실제로 뽑은 개수"가
+    가장 큰 층을 다음으로 선택합니다. 따라서 결과의 어느 앞부분(prefix)을 잘라도
+    층별 비율이 전체 비율과 거의 같습니다.
+
+    Args:
+        keys: 항목별 층 키 (예: domain)
+        seed: 랜덤 시드
+
+    Returns:
+        항목 인덱스의 순열
+    """
+    rng = random.Random(seed)
+    strata: Dict[Hashable, List[int]] = {}
+    for idx, key in enumerate(keys):
+        strata.setdefault(key, []).append(idx)
+
+    # 층 순서를 고정해 같은 seed면 항상 같은 결과가 나오도록 함
+    ordered_keys = sorted(strata.keys(), key=lambda k: str(k))
+    for key in ordered_keys:
+        rng.shuffle(strata[key])
+
+    total = len(keys)
+    taken = {key: 0 for key in ordered_keys}
+    order = []
+    for t in range(1, total + 1):
+        best_key = None
+        best_deficit = None
+        for key in ordered_keys:
+            size = len(strata[key])
+            if taken[key] >= size:
+                continue
+            deficit = size * t / total - taken[key]
+            if best_deficit is None or deficit > best_deficit:
+                best_key, best_deficit = key, deficit
+        order.append(strata[best_key][taken[best_key]])
+        taken[best_key] += 1
+    return order
+
+
+@dataclass
+class AccuracyEstimate:
+    """정확도 추정치와 신뢰구간"""
+    correct: float = 0.0
+    n: int = 0
+    low: float = 0.0
+    high: float = 1.0
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.n if self.n > 0 else float('nan')
+
+    @property
+    def width(self) -> float:
+        return self.high - self.low
+
+
+@dataclass
+class SequentialStopRule:
+    """
+    순차 평가 중단 규칙
+
+    전체 정확도의 신뢰구간 폭이 target_width 이하이고,
+    per_domain=True면 각 층(domain)의 신뢰구간 폭도 domain_target_width 이하일 때 중단합니다.
+    """
+    target_width: float = 0.04
+    confidence: float = 0.95
+    min_samples: int = 30
+    per_domain: bool = False
+    domain_target_width: Optional[float] = None
+    overall: AccuracyEstimate = field(default_factory=AccuracyEstimate)
+    domains: Dict[Hashable, AccuracyEstimate] = field(default_factory=dict)
+
+    def update(self, correct: float, domain: Hashable = None) -> None:
+        """채점 결과 1건 반영 (correct: 1.0 또는 0.0)"""
+        self.overall.correct += correct
+        self.overall.n += 1
+        if domain is not None:
+            est = self.domains.setdefault(domain, AccuracyEstimate())
+            est.correct += correct
+            est.n += 1
+
+    def _refresh(self) -> None:
+        self.overall.low, self.overall.high = wilson_interval(
+            self.overall.correct, self.overall.n, self.confidence
+        )
+        for est in self.domains.values():
+            est.low, est.high = wilson_interval(est.correct, est.n, self.confidence)
+
+    def should_stop(self) -> bool:
+        """중단 조건 충족 여부"""
+        self._refresh()
+        if self.overall.n < self.min_samples or self.overall.width > self.target_width:
+            return False
+        if self.per_domain:
+            width = self.domain_target_width or self.target_width
+            return all(est.width <= width for est in self.domains.values())
+        return True
+
+
+def allocate_sample(strata_sizes: Dict[Hashable, int], n: int, method: str = 'proportional',
+                    stratum_std: Optional[Dict[Hashable, float]] = None,
+                    min_per_stratum: int = 1) -> Dict[Hashable, int]:
+    """
+    층별 표본 크기 배분
+
+    - proportional: n_h ∝ N_h
+    - neyman: n_h ∝ N_h × S_h (S_h: 층별 정답률 표준편차 추정치, 미지정 층은 0.5 = 최대 분산)
+
+    모든 층에 최소 min_per_stratum개(층 크기 이하)를 먼저 배정한 뒤 나머지를 비율대로 나누고,
+    소수점 이하는 최대 잉여(largest remainder) 방식으로 배정합니다. 층 크기를 넘는 몫은 다른 층으로 넘깁니다.
+
+    Args:
+        strata_sizes: 층 키 → 모집단 문제 수 N_h
+        n: 전체 표본 크기
+        method: 'proportional' 또는 'neyman'
+        stratum_std: 층 키 → 표준편차 추정치 (neyman에서 사용, 예: sqrt(p(1-p)))
+        min_per_stratum: 층별 최소 표본 수
+
+    Returns:
+        층 키 → 표본 크기 n_h (합계 = min(n, ΣN_h))
+    """
+    if method not in ('proportional', 'neyman'):
+        raise ValueError(f"지원하지 않는 배분 방식: {method}")
+
+    keys = sorted(strata_sizes.keys(), key=lambda k: str(k))
+    total = sum(strata_sizes.values())
+    n = min(n, total)
+    alloc = {key: 0 for key in keys}
+    if n <= 0:
+        return alloc
+
+    # 1) 최소 배정 (n이 층 수보다 적으면 큰 층부터)
+    if min_per_stratum > 0:
+        for key in sorted(keys, key=lambda k: -strata_sizes[k]):
+            give = min(min_per_stratum, strata_sizes[key], n - sum(alloc.values()))
+            if give <= 0:
+                break
+            alloc[key] = give
+
+    # 2) 나머지를 가중치 비율대로 배정 (층 크기 상한을 넘는 몫은 재분배)
+    def _weight(key):
+        if method == 'neyman':
+            std = (stratum_std or {}).get(key, 0.5)
+            return strata_sizes[key] * max(std, 1e-6)
+        return float(strata_sizes[key])
+
+    remaining = n - sum(alloc.values())
+    while remaining > 0:
+        open_keys = [k for k in keys if alloc[k] < strata_sizes[k]]
+        weight_sum = sum(_weight(k) for k in open_keys)
+        if not open_keys or weight_sum <= 0:
+            break
+        quotas = {k: remaining * _weight(k) / weight_sum for k in open_keys}
+        given = 0
+        for k in open_keys:
+            add = min(int(quotas[k]), strata_sizes[k] - alloc[k])
+            alloc[k] += add
+            given += add
+        # 소수점 이하: 잉여가 큰 순서로 1개씩
+        left = remaining - given
+        for k in sorted(open_keys, key=lambda k: -(quotas[k] - int(quotas[k]))):
+            if left <= 0:
+                break
+            if alloc[k] < strata_sizes[k]:
+                alloc[k] += 1
+                left -= 1
+        remaining = n - sum(alloc.values())
+    return alloc
+
+
+def estimate_stratum_std(accuracies: Dict[Hashable, Sequence[float]],
+                         floor: float = 0.05) -> Dict[Hashable, float]:
+    """
+    층별 정답률 → Neyman 배분용 표준편차 추정치
+
+    S_h = sqrt(p(1-p))를 모델별로 계산해 평균합니다. 이전 실행에서 모든 모델이 전부 맞히거나 틀린 층도
+    표본이 0이 되지 않도록 floor를 하한으로 둡니다. 정답률이 없는 층은 결과에서 빠집니다(배분 시 0.5 사용).
+
+    Args:
+        accuracies: 층 키 → 모델별 정답률 목록
+        floor: 표준편차 하한
+
+    Returns:
+        층 키 → 표준편차 추정치
+    """
+    result = {}
+    for key, values in accuracies.items():
+        values = [min(max(float(p), 0.0), 1.0) for p in values if p is not None and not math.isnan(p)]
+        if values:
+            result[key] = max(sum(math.sqrt(p * (1 - p)) for p in values) / len(values), floor)
+    return result
+
+
+def stratum_weights(strata_sizes: Dict[Hashable, int],
+                    alloc: Dict[Hashable, int]) -> Dict[Hashable, float]:
+    """층별 설계 가중치 N_h / n_h (표본이 없는 층은 제외)"""
+    return {key: strata_sizes[key] / n_h for key, n_h in alloc.items() if n_h > 0}
@@ -9,6 +9,11 @@ exam 패키지 - 시험지 생성 관련 기능
     - ExamMaker: 일반 시험지 생성 (5세트)
     - ExamPlusMaker: 변형 시험지 생성
     - ExamValidator: 시험지 검증 및 업데이트
+    - ExamRequirementTracker: (domain, subdomain) 문제 수 증분 카운터 (요구사항 충족 O(1) 판정)
+    - QuestionPool: (domain, subdomain) 버킷 인덱스 문제 풀
+    - ExamAssembler: 모든 과목 할당량을 동시에 푸는 최적 구성기 (min-cost flow)
+    - ExamSetGenerator: 세트별 파생 seed로 독립 시험지 세트 생성 (병렬)
+    - QuotaFeasibilityChecker: 세트 수별 할당량 공급/수요 비교, 최대 가능 세트 수
 
 유틸리티 함수:
     - extract_question_ids_from_exam: 시험지에서 문제 번호 추출
@@ -22,7 +27,10 @@ Note:
     - MultipleChoiceValidationReportGenerator: 객관식 검증 리포트 생성
 """
 
-from .exam_validator import ExamValidator, CIRCLED_NUMBERS, CIRCLED_NUMBERS_PATTERN
+from .exam_validator import ExamValidator, ExamRequirementTracker, CIRCLED_NUMBERS, CIRCLED_NUMBERS_PATTERN
+from .question_pool import QuestionPool
+from .exam_assembly import ExamAssembler, AssemblyPlan
+from .exam_feasibility import QuotaFeasibilityChecker, FeasibilityReport
 from .extract_exam_question_list import (
     extract_question_ids_from_exam,
     extract_exam_question_lists,
@@ -41,12 +49,24 @@ try:
 except ImportError:
     ExamPlusMaker = None
 
+try:
+    from .exam_sets import ExamSetGenerator
+except ImportError:
+    ExamSetGenerator = None
+
 
 __all__ = [
     # 시험지 생성 클래스
     'ExamMaker',
     'ExamPlusMaker',
+    'ExamSetGenerator',
     'ExamValidator',
+    'ExamRequirementTracker',
+    'QuestionPool',
+    'ExamAssembler',
+    'AssemblyPlan',
+    'QuotaFeasibilityChecker',
+    'FeasibilityReport',
     # 유틸리티 함수
     'extract_question_ids_from_exam',
     'extract_exam_question_lists',
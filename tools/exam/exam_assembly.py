@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 세트 시험지 최적 구성 (min-cost max-flow)
+
+ExamMaker.create_exams의 기본(greedy) 방식은 과목(세트)을 하나씩 채우므로, 공급이 부족한 subdomain은
+뒤쪽 과목에서만 모자라고 ExamValidator.update_existing_exam이 나중에 메꿔야 했습니다.
+ExamAssembler는 모든 과목의 domain/subdomain 할당량을 하나의 네트워크 흐름 문제로 동시에 풉니다.
+
+네트워크 (용량 / 비용):
+    S → 버킷(domain, subdomain, 종류)           공급량 / 0        종류: plain, table, calc
+    plain 버킷 → (과목, domain, subdomain)       ∞ / 0
+    table/calc 버킷 → (과목, domain, subdomain)  floor(share × 할당량) / SHARE_COST   (share > 0일 때만)
+    (과목, domain, subdomain) → (과목, domain)   할당량을 FILL_TIERS 구간으로 나눈 간선 / 구간 j는 j
+                                                 + ∞ / SUBSTITUTION_COST  (allow_substitution: 같은 domain 내 대체)
+    (과목, domain) → T                           domain 할당량 합 / 0
+    table 버킷 → 표해석, calc 버킷 → 계산        ∞ / 0,  표해석/계산 → T  exam_questions를 FILL_TIERS 구간으로 / j
+
+최대 흐름 = 채울 수 있는 최대 문제 수이므로 (전체 수요 - 최대 흐름)이 최소 부족분이며,
+그중 비용이 최소인 할당을 고릅니다. 할당량 간선은 채울수록 비용이 커지는(볼록) 구간 간선이라,
+공급이 부족하면 모든 과목의 낮은 구간부터 채워져 부족분이 과목별 할당량에 비례해 나뉩니다.
+(구간 크기 = 할당량 / FILL_TIERS 이내의 차이만 남고, 마지막 과목에 부족분이 몰리지 않음)
+대체/표·계산 사용 비용은 가장 비싼 구간보다 커서 할당량을 정상적으로 채울 수 있으면 쓰지 않습니다. 잔여 그래프에서 S로부터 도달 가능한 집합으로
+최소 컷을 구해 함께 반환하며, 컷 용량 = 최대 흐름이므로 이 컷이 부족분의 증명(certificate)이 됩니다.
+
+사용 예시:
+    assembler = ExamAssembler(exams_config)
+    plan = assembler.solve(all_data)
+    exams = assembler.assemble(plan, seed=42)      # {과목명: [문제, ...]}
+
+실행 (exam_config.json + multiple-choice_DST.json 기준 리포트):
+    python -m tools.exam.exam_assembly --onedrive_path /path/to/onedrive
+"""
+
+import os
+import json
+import time
+import heapq
+import random
+import argparse
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from tools.exam.question_pool import question_key
+
+
+TABLE_EXAM = '표해석'
+CALCULATION_EXAM = '계산'
+KINDS = ('plain', 'table', 'calc')
+
+# 할당량 간선을 나누는 구간 수 (부족분 분배 단위: 할당량의 1/FILL_TIERS)
+FILL_TIERS = 50
+SUBSTITUTION_COST = FILL_TIERS
+SHARE_COST = FILL_TIERS + 1
+_INF = float('inf')
+
+# 버킷 키: (domain, subdomain, 종류)
+BucketKey = Tuple[str, str, str]
+
+
+def question_kind(item: Dict[str, Any]) -> str:
+    """문제 종류 (ExamMaker와 같은 기준: question에 {tb_ → table, is_calculation → calc, 그 외 plain)"""
+    if '{tb_' in item.get('question', ''):
+        return 'table'
+    is_calculation = item.get('is_calculation', False)
+    if isinstance(is_calculation, str):
+        is_calculation = is_calculation.lower() == 'true'
+    return 'calc' if is_calculation else 'plain'
+
+
+class _MinCostFlow:
+    """정수 용량 최소 비용 최대 흐름 (primal-dual: Dijkstra/potential + 축약 비용 0 그래프의 블로킹 흐름)"""
+
+    def __init__(self):
+        self.graph: List[List[List]] = []   # 노드별 [to, 잔여 용량, cost, rev_index, 원래 용량(역방향은 0)]
+        self.names: List[Any] = []
+        self._ids: Dict[Any, int] = {}
+
+    def node(self, name: Any) -> int:
+        if name not in self._ids:
+            self._ids[name] = len(self.names)
+            self.names.append(name)
+            self.graph.append([])
+        return self._ids[name]
+
+    def add_edge(self, u: Any, v: Any, cap: float, cost: int = 0) -> Tuple[int, int]:
+        a, b = self.node(u), self.node(v)
+        self.graph[a].append([b, cap, cost, len(self.graph[b]), cap])
+        self.graph[b].append([a, 0, -cost, len(self.graph[a]) - 1, 0])
+        return a, len(self.graph[a]) - 1
+
+    def add_tiered_edge(self, u: Any, v: Any, cap: int, tiers: int = FILL_TIERS) -> List[Tuple[int, int]]:
+        """
+        볼록 비용 간선: 용량을 tiers개 구간으로 나눠 구간 j에 비용 j를 부여
+
+        여러 과목이 같은 공급을 나눠 쓸 때 낮은 구간(덜 채운 과목)부터 채워지도록 합니다.
+        """
+        edges = []
+        for j in range(tiers):
+            tier_cap = cap * (j + 1) // tiers - cap * j // tiers
+            if tier_cap > 0:
+                edges.append(self.add_edge(u, v, tier_cap, j))
+        return edges
+
+    def flow_on(self, edge: Tuple[int, int]) -> int:
+        """간선에 흐른 양 (역방향 간선의 잔여 용량)"""
+        a, i = edge
+        to, _, _, rev, _ = self.graph[a][i]
+        return self.graph[to][rev][1]
+
+    def solve(self, source: Any, sink: Any) -> Tuple[int, int]:
+        """
+        (최대 흐름, 최소 비용)
+
+        primal-dual: Dijkstra로 potential을 갱신한 뒤, 축약 비용이 0인 간선만으로 이루어진 그래프에서
+        Dinic 블로킹 흐름으로 같은 비용의 경로를 한꺼번에 보냅니다. (구간 간선처럼 비용이 같은 병렬 경로가
+        많아도 Dijkstra 횟수는 서로 다른 경로 비용의 수 정도로 유지됨)
+        """
+        s, t = self.node(source), self.node(sink)
+        n = len(self.graph)
+        potential = [0] * n
+        flow = cost = 0
+        while True:
+            dist = [_INF] * n
+            dist[s] = 0
+            heap = [(0, s)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                for v, cap, c, _, _ in self.graph[u]:
+                    if cap > 0:
+                        nd = d + c + potential[u] - potential[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            heapq.heappush(heap, (nd, v))
+            if dist[t] == _INF:
+                return flow, cost
+            for v in range(n):
+                if dist[v] < _INF:
+                    potential[v] += dist[v]
+            # 축약 비용 0인 경로의 비용은 모두 potential[t] - potential[s]
+            pushed = self._blocking_flows(s, t, potential)
+            flow += pushed
+            cost += pushed * (potential[t] - potential[s])
+
+    def _blocking_flows(self, s: int, t: int, potential: List[int]) -> int:
+        """축약 비용 0인 간선으로 보낼 수 있는 최대 흐름 (Dinic)"""
+        graph = self.graph
+        n = len(graph)
+
+        def admissible(u: int, edge: List) -> bool:
+            return edge[1] > 0 and edge[2] + potential[u] - potential[edge[0]] == 0
+
+        total = 0
+        while True:
+            level = [-1] * n
+            level[s] = 0
+            queue = [s]
+            for u in queue:
+                for edge in graph[u]:
+                    if level[edge[0]] < 0 and admissible(u, edge):
+                        level[edge[0]] = level[u] + 1
+                        queue.append(edge[0])
+            if level[t] < 0:
+                return total
+            it = [0] * n
+
+            def dfs(u: int, limit: float) -> int:
+                if u == t:
+                    return int(limit)
+                edges = graph[u]
+                while it[u] < len(edges):
+                    edge = edges[it[u]]
+                    v = edge[0]
+                    if level[v] == level[u] + 1 and admissible(u, edge):
+                        pushed = dfs(v, min(limit, edge[1]))
+                        if pushed:
+                            edge[1] -= pushed
+                            graph[v][edge[3]][1] += pushed
+                            return pushed
+                    it[u] += 1
+                return 0
+
+            while True:
+                pushed = dfs(s, _INF)
+                if not pushed:
+                    break
+                total += pushed
+
+    def reachable(self, source: Any) -> Set[int]:
+        """잔여 그래프에서 source로부터 도달 가능한 노드 (최소 컷의 S쪽)"""
+        s = self.node(source)
+        seen = {s}
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            for v, cap, _, _, _ in self.graph[u]:
+                if cap > 0 and v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        return seen
+
+
+@dataclass
+class AssemblyPlan:
+    """최적 구성 결과 (할당, 부족분, 최소 컷 증명)"""
+    demand: int = 0
+    max_flow: int = 0
+    cost: int = 0
+    # 과목 → 버킷 → 배정 문제 수
+    allocation: Dict[str, Dict[BucketKey, int]] = field(default_factory=dict)
+    # 과목 → domain(표해석/계산은 과목명) → 부족 문제 수
+    shortfall: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # 과목 → (domain, subdomain) → 할당량을 넘겨 대체로 채운 문제 수
+    substitutions: Dict[str, Dict[Tuple[str, str], int]] = field(default_factory=dict)
+    # 최소 컷 간선 [{'from', 'to', 'capacity'}] (구간으로 나눈 간선은 합산)
+    min_cut: List[Dict[str, Any]] = field(default_factory=list)
+    # 버킷 → 문제 리스트 (assemble용, 원본 순서)
+    buckets: Dict[BucketKey, List[Dict[str, Any]]] = field(default_factory=dict, repr=False)
+    seconds: float = 0.0
+
+    @property
+    def total_shortfall(self) -> int:
+        return self.demand - self.max_flow
+
+    @property
+    def feasible(self) -> bool:
+        """모든 subdomain 할당량을 대체 없이 정확히 채울 수 있는지"""
+        return self.total_shortfall == 0 and not any(self.substitutions.values())
+
+    def certificate(self) -> Dict[str, Any]:
+        """JSON 저장용 요약 (컷 용량 = 최대 흐름이면 부족분이 최소임이 증명됨)"""
+        return {
+            'status': 'feasible' if self.feasible else ('substituted' if self.total_shortfall == 0 else 'shortfall'),
+            'demand': self.demand,
+            'max_flow': self.max_flow,
+            'total_shortfall': self.total_shortfall,
+            'min_cut_capacity': sum(edge['capacity'] for edge in self.min_cut),
+            'min_cut': self.min_cut,
+            'shortfall': {e: d for e, d in self.shortfall.items() if d},
+            'substitutions': {e: {f'{dom}/{sub}': n for (dom, sub), n in s.items()}
+                              for e, s in self.substitutions.items() if s},
+            'cost': self.cost,
+            'seconds': round(self.seconds, 3),
+        }
+
+
+class ExamAssembler:
+    """모든 과목의 할당량을 동시에 푸는 시험지 구성기"""
+
+    def __init__(self, exams_config: Dict[str, Any], allow_substitution: bool = False,
+                 table_share: float = 0.0, calc_share: float = 0.0):
+        """
+        Args:
+            exams_config: ExamConfig.get_exams_config() 결과
+            allow_substitution: subdomain 공급이 부족하면 같은 domain의 다른 subdomain 문제로 대체 허용
+            table_share: 일반 과목의 subdomain 할당량 중 표 문제로 채울 수 있는 최대 비율 (기본 0: 사용 안 함)
+            calc_share: 일반 과목의 subdomain 할당량 중 계산 문제로 채울 수 있는 최대 비율 (기본 0: 사용 안 함)
+        """
+        self.exams_config = exams_config
+        self.allow_substitution = allow_substitution
+        self.table_share = table_share
+        self.calc_share = calc_share
+
+    def demands(self) -> Dict[str, Dict[Tuple[str, str], int]]:
+        """일반 과목별 (domain, subdomain) 할당량"""
+        result = {}
+        for exam_name, exam_info in self.exams_config.items():
+            if exam_name in (TABLE_EXAM, CALCULATION_EXAM):
+                continue
+            quotas = {}
+            for domain, domain_info in exam_info.get('domain_details', {}).items():
+                for subdomain, subdomain_info in domain_info.get('subdomains', {}).items():
+                    quotas[(domain, subdomain)] = subdomain_info.get('count', 0)
+            result[exam_name] = quotas
+        return result
+
+    @staticmethod
+    def bucketize(items: Iterable[Dict[str, Any]],
+                  exclude: Optional[Set[Tuple[str, str]]] = None) -> Dict[BucketKey, List[Dict[str, Any]]]:
+        """문제를 (domain, subdomain, 종류) 버킷으로 분류 (같은 (file_id, tag)는 처음 것만, exclude 제외)"""
+        buckets: Dict[BucketKey, List[Dict[str, Any]]] = {}
+        seen = set(exclude or ())
+        for item in items:
+            key = question_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            bucket = (item.get('domain', ''), item.get('subdomain', ''), question_kind(item))
+            buckets.setdefault(bucket, []).append(item)
+        return buckets
+
+    def solve(self, items: Iterable[Dict[str, Any]],
+              used_questions: Optional[Set[Tuple[str, str]]] = None) -> AssemblyPlan:
+        """
+        전체 풀에 대해 모든 과목의 할당을 동시에 계산
+
+        Args:
+            items: 전체 문제 (multiple-choice_DST.json)
+            used_questions: 이미 사용되어 제외할 (file_id, tag)
+
+        Returns:
+            AssemblyPlan
+        """
+        start = time.perf_counter()
+        buckets = self.bucketize(items, used_questions)
+        demands = self.demands()
+        net = _MinCostFlow()
+        source, sink = ('S',), ('T',)
+        net.node(source)
+
+        for bucket, questions in buckets.items():
+            net.add_edge(source, ('bucket', bucket), len(questions))
+
+        demand_total = 0
+        alloc_edges: List[Tuple[str, BucketKey, Tuple[int, int]]] = []
+        quota_edges: Dict[Tuple[str, str, str], List[Tuple[int, int]]] = {}
+        sub_edges: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        domain_edges: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        shares = {'table': self.table_share, 'calc': self.calc_share}
+
+        for exam_name, quotas in demands.items():
+            domain_totals: Dict[str, int] = {}
+            for (domain, subdomain), quota in quotas.items():
+                if quota <= 0:
+                    continue
+                domain_totals[domain] = domain_totals.get(domain, 0) + quota
+                target = ('slot', exam_name, domain, subdomain)
+                for kind in KINDS:
+                    bucket = (domain, subdomain, kind)
+                    if bucket not in buckets:
+                        continue
+                    if kind == 'plain':
+                        edge = net.add_edge(('bucket', bucket), target, _INF)
+                    else:
+                        cap = int(shares[kind] * quota)
+                        if cap <= 0:
+                            continue
+                        edge = net.add_edge(('bucket', bucket), target, cap, SHARE_COST)
+                    alloc_edges.append((exam_name, bucket, edge))
+                slot_key = (exam_name, domain, subdomain)
+                quota_edges[slot_key] = net.add_tiered_edge(target, ('domain', exam_name, domain), quota)
+                if self.allow_substitution:
+                    sub_edges[slot_key] = net.add_edge(target, ('domain', exam_name, domain), _INF,
+                                                       SUBSTITUTION_COST)
+            for domain, total in domain_totals.items():
+                domain_edges[(exam_name, domain)] = net.add_edge(('domain', exam_name, domain), sink, total)
+                demand_total += total
+
+        # 표해석 / 계산 과목: 해당 종류의 모든 버킷에서 선택
+        special = {TABLE_EXAM: 'table', CALCULATION_EXAM: 'calc'}
+        for exam_name, kind in special.items():
+            if exam_name not in self.exams_config:
+                continue
+            needed = self.exams_config[exam_name].get('exam_questions', 500)
+            demand_total += needed
+            # 부족분을 측정할 단일 간선 앞에 구간 간선을 두어 일반 과목과 같은 방식으로 비례 배분
+            net.add_tiered_edge(('special', exam_name), ('special_total', exam_name), needed)
+            domain_edges[(exam_name, exam_name)] = net.add_edge(('special_total', exam_name), sink, needed)
+            for bucket in buckets:
+                if bucket[2] == kind:
+                    alloc_edges.append((exam_name, bucket,
+                                        net.add_edge(('bucket', bucket), ('special', exam_name), _INF)))
+
+        max_flow, cost = net.solve(source, sink)
+
+        plan = AssemblyPlan(demand=demand_total, max_flow=max_flow, cost=cost, buckets=buckets)
+        for exam_name in self.exams_config:
+            plan.allocation[exam_name] = {}
+            plan.shortfall[exam_name] = {}
+            plan.substitutions[exam_name] = {}
+        for exam_name, bucket, edge in alloc_edges:
+            n = net.flow_on(edge)
+            if n:
+                plan.allocation[exam_name][bucket] = plan.allocation[exam_name].get(bucket, 0) + n
+        for (exam_name, domain, subdomain), edge in sub_edges.items():
+            n = net.flow_on(edge)
+            if n:
+                plan.substitutions[exam_name][(domain, subdomain)] = n
+        for (exam_name, domain), edge in domain_edges.items():
+            a, i = edge
+            missing = int(net.graph[a][i][1])
+            if missing:
+                plan.shortfall[exam_name][domain] = missing
+
+        # 최소 컷: S쪽 노드 → T쪽 노드로 가는 원래 간선
+        reach = net.reachable(source)
+        cut: Dict[Tuple[str, str], int] = {}
+        for u in reach:
+            for v, _, _, _, original_cap in net.graph[u]:
+                if v not in reach and original_cap > 0:
+                    key = (_label(net.names[u]), _label(net.names[v]))
+                    cut[key] = cut.get(key, 0) + int(original_cap)
+        plan.min_cut = [{'from': u, 'to': v, 'capacity': cap} for (u, v), cap in cut.items()]
+        plan.seconds = time.perf_counter() - start
+        return plan
+
+    def assemble(self, plan: AssemblyPlan, seed: int = 42) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        할당 결과대로 문제를 뽑아 과목별 시험지 구성
+
+        버킷마다 Random(seed)로 1번 섞은 뒤 과목 순서대로 잘라 배정하므로 과목 간 중복이 없고,
+        같은 seed와 풀이면 항상 같은 결과입니다.
+        """
+        rng = random.Random(seed)
+        shuffled: Dict[BucketKey, List[Dict[str, Any]]] = {}
+        cursor: Dict[BucketKey, int] = {}
+        for bucket in sorted(plan.buckets):
+            questions = list(plan.buckets[bucket])
+            rng.shuffle(questions)
+            shuffled[bucket] = questions
+            cursor[bucket] = 0
+
+        exams: Dict[str, List[Dict[str, Any]]] = {}
+        for exam_name in self.exams_config:
+            allocation = plan.allocation.get(exam_name, {})
+            exam_data = []
+            # config의 domain/subdomain 순서대로, 종류는 plain → table → calc
+            order = sorted(allocation, key=lambda b: (self._slot_order(exam_name).get(b[:2], len(allocation)),
+                                                      KINDS.index(b[2]), b))
+            for bucket in order:
+                n = allocation[bucket]
+                start = cursor[bucket]
+                exam_data.extend(shuffled[bucket][start:start + n])
+                cursor[bucket] = start + n
+            exams[exam_name] = exam_data
+        return exams
+
+    def _slot_order(self, exam_name: str) -> Dict[Tuple[str, str], int]:
+        order = {}
+        for domain, domain_info in self.exams_config.get(exam_name, {}).get('domain_details', {}).items():
+            for subdomain in domain_info.get('subdomains', {}):
+                order[(domain, subdomain)] = len(order)
+        return order
+
+
+def _label(name: Any) -> str:
+    """네트워크 노드 이름 → 리포트용 문자열"""
+    if name == ('S',):
+        return 'source'
+    if name == ('T',):
+        return 'sink'
+    return '/'.join(str(part) for part in (name[1] if name[0] == 'bucket' else name[1:]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='다중 세트 시험지 최적 구성 (실행 가능성/최소 부족분 리포트)')
+    parser.add_argument('--onedrive_path', type=str, required=True, help='OneDrive 경로 (evaluation/eval_data 포함)')
+    parser.add_argument('--config_path', type=str, default=None, help='exam_config.json 경로 (기본: onedrive 기준)')
+    parser.add_argument('--allow_substitution', action='store_true', help='같은 domain 내 다른 subdomain으로 대체 허용')
+    parser.add_argument('--table_share', type=float, default=0.0, help='일반 과목 subdomain별 표 문제 최대 비율')
+    parser.add_argument('--calc_share', type=float, default=0.0, help='일반 과목 subdomain별 계산 문제 최대 비율')
+    parser.add_argument('--output', type=str, default=None, help='certificate JSON 저장 경로')
+    args = parser.parse_args()
+
+    from tools.core.exam_config import ExamConfig
+    exams_config = ExamConfig(config_path=args.config_path, onedrive_path=args.onedrive_path).get_exams_config()
+    data_file = os.path.join(args.onedrive_path, 'evaluation', 'eval_data', '2_subdomain', 'multiple-choice_DST.json')
+    with open(data_file, 'r', encoding='utf-8') as f:
+        all_data = json.load(f)
+
+    assembler = ExamAssembler(exams_config, args.allow_substitution, args.table_share, args.calc_share)
+    plan = assembler.solve(all_data)
+    certificate = plan.certificate()
+    print(f"수요 {plan.demand}개 / 최대 배정 {plan.max_flow}개 / 부족 {plan.total_shortfall}개 "
+          f"({certificate['status']}, {plan.seconds:.2f}s)")
+    for exam_name, domains in certificate['shortfall'].items():
+        print(f"  [부족] {exam_name}: {domains}")
+    for edge in plan.min_cut:
+        print(f"  [최소 컷] {edge['from']} → {edge['to']} (용량 {edge['capacity']})")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(certificate, f, ensure_ascii=False, indent=2)
+        print(f"certificate 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,16 +16,27 @@
 관련 모듈:
     - tools.core.exam_config.ExamConfig: 시험 설정 로드
     - tools.report.ExamReportGenerator: 통계 리포트 생성
+    - tools.exam.question_pool.QuestionPool: (domain, subdomain) 버킷 인덱스 (과목 간 공유)
+    - tools.exam.exam_assembly.ExamAssembler: 모든 과목 할당량을 동시에 푸는 최적 구성 (assembly='optimal')
+
+태그 대치 (copy-on-write):
+    태그({tb_/f_/note_/etc_/img_)가 없는 문제는 복사 없이 그대로 출력하고, 태그가 있는 문제만 얕은 복사 후
+    TagProcessor로 필드를 새 값으로 교체합니다 (원본 문제는 변경되지 않음). _extracted_qna.json 경로는
+    workbook_data를 한 번만 탐색해 색인하고, 파일별 태그 색인으로 항목을 찾습니다.
+    벤치마크 (5세트 × 1250문제 = 6250문제, 기존 deepcopy 방식과 시간/메모리 및 결과 비교):
+        python -m tools.benchmarks.exam_create --questions 6250
 """
 
 import os
+import re
 import json
 import random
-import copy
 from typing import Dict, Any, List, Tuple, Set, Optional
 from tools.core.exam_config import ExamConfig
 from tools.qna.extraction.tag_processor import TagProcessor
 from tools.report import ExamReportGenerator
+from tools.exam.question_pool import QuestionPool
+from tools.exam.exam_assembly import ExamAssembler
 from tools.exam.extract_exam_question_list import (
     extract_question_ids_from_exam, 
     save_question_lists, 
@@ -33,6 +44,26 @@ from tools.exam.extract_exam_question_list import (
 )
 
 
+# 대치 대상 태그 패턴 (tb, f, note, etc, img 모두 포함)
+TAG_PATTERN = re.compile(r'\{(tb|f|note|etc|img)_\d{4}_\d{4}\}')
+# 태그를 찾는 필드
+TAG_FIELDS = ('question', 'answer', 'explanation')
+
+
+def has_tags(item: Dict[str, Any]) -> bool:
+    """문제에 대치할 태그가 있는지 확인 (question/answer/explanation/options)"""
+    for field in TAG_FIELDS:
+        value = item.get(field, '')
+        if value and TAG_PATTERN.search(str(value)):
+            return True
+    opts = item.get('options')
+    if opts:
+        for opt in (opts if isinstance(opts, list) else [opts]):
+            if opt and TAG_PATTERN.search(str(opt)):
+                return True
+    return False
+
+
 class ExamMaker:
     """
     시험문제 생성 클래스
@@ -58,15 +89,23 @@ class ExamMaker:
         self.onedrive_path = onedrive_path
         self.logger = logger
         self._extracted_qna_cache = {}
+        # file_id → _extracted_qna.json 경로 (workbook_data 1회 탐색 후 재사용)
+        self._extracted_qna_paths = None
+        # file_id → {정규화 태그: 항목}
+        self._extracted_qna_tag_index = {}
         
     def _find_extracted_qna_file(self, file_id: str) -> str:
-        """file_id에 해당하는 _extracted_qna.json 파일 경로를 찾습니다."""
-        workbook_base = os.path.join(self.onedrive_path, 'evaluation', 'workbook_data')
-        for root, dirs, files in os.walk(workbook_base):
-            for file in files:
-                if file == f'{file_id}_extracted_qna.json':
-                    return os.path.join(root, file)
-        return None
+        """file_id에 해당하는 _extracted_qna.json 파일 경로를 찾습니다 (첫 호출 시 workbook_data 전체 색인)."""
+        if self._extracted_qna_paths is None:
+            self._extracted_qna_paths = {}
+            suffix = '_extracted_qna.json'
+            workbook_base = os.path.join(self.onedrive_path, 'evaluation', 'workbook_data')
+            for root, dirs, files in os.walk(workbook_base):
+                for file in files:
+                    if file.endswith(suffix):
+                        # 같은 file_id가 여러 곳에 있으면 os.walk에서 처음 만난 경로 사용 (기존과 동일)
+                        self._extracted_qna_paths.setdefault(file[:-len(suffix)], os.path.join(root, file))
+        return self._extracted_qna_paths.get(file_id)
     
     def _load_extracted_qna_item(self, file_id: str, tag: str) -> Dict[str, Any]:
         """_extracted_qna.json 파일에서 특정 file_id와 tag에 해당하는 항목을 로드합니다."""
@@ -85,20 +124,19 @@ class ExamMaker:
         
         extracted_qna_data = self._extracted_qna_cache[cache_key]
         
-        # 태그 정규화: 중괄호 제거하여 비교
-        tag_normalized = tag.strip('{}') if tag else ''
+        # 파일별 태그 색인 (태그 정규화: 중괄호 제거, 같은 태그는 처음 항목 사용)
+        tag_index = self._extracted_qna_tag_index.get(cache_key)
+        if tag_index is None:
+            tag_index = {}
+            for item in extracted_qna_data:
+                item_tag = item.get('qna_data', {}).get('tag', '')
+                tag_index.setdefault(item_tag.strip('{}') if item_tag else '', item)
+            self._extracted_qna_tag_index[cache_key] = tag_index
         
-        # _extracted_qna.json의 각 항목을 직접 확인
-        for item in extracted_qna_data:
-            # qna_data에서 tag 추출
-            qna_data = item.get('qna_data', {})
-            item_tag = qna_data.get('tag', '')
-            
-            # 태그 비교 (중괄호 제거하여 비교)
-            item_tag_normalized = item_tag.strip('{}') if item_tag else ''
-            
-            if item_tag_normalized == tag_normalized:
-                return item
+        tag_normalized = tag.strip('{}') if tag else ''
+        item = tag_index.get(tag_normalized)
+        if item is not None:
+            return item
         
         # 태그를 찾지 못한 경우 디버깅 정보 출력
         self.logger.debug(f"태그를 찾을 수 없음: file_id={file_id}, tag={tag}")
@@ -130,7 +168,8 @@ class ExamMaker:
         # 둘 다 False인 경우에만 유효
         return not is_calculation and not is_table
 
-    def create_exams(self, seed: int = 42, debug: bool = False, random_mode: bool = False) -> Dict[str, Any]:
+    def create_exams(self, seed: int = 42, debug: bool = False, random_mode: bool = False,
+                     assembly: str = 'greedy', allow_substitution: bool = False) -> Dict[str, Any]:
         """
         시험문제 생성 실행
         
@@ -139,6 +178,9 @@ class ExamMaker:
             debug: 디버그 모드 (기존 파일 백업, 기본값: False)
             random_mode: 랜덤 모드 (True: exam_config.json 조건에 맞게 랜덤 선택, 
                                    False: exam_question_lists.json에서 문제 번호 로드)
+            assembly: 랜덤 모드 구성 방식 ('greedy': 과목 순서대로 채움,
+                      'optimal': 모든 과목 할당량을 흐름 문제로 동시에 풀어 부족분 최소화)
+            allow_substitution: optimal에서 subdomain 공급 부족 시 같은 domain의 다른 subdomain으로 대체 허용
         
         Returns:
             생성 결과 딕셔너리
@@ -187,6 +229,12 @@ class ExamMaker:
             
             used_questions = set()
             
+            # (domain, subdomain) 버킷 인덱스 (모든 과목이 공유, 사용된 문제는 즉시 제거)
+            if random_mode:
+                question_pool = QuestionPool(valid_data)
+            else:
+                question_pool = QuestionPool(all_data_index.values(), predicate=self._is_valid_question)
+            
             exam_dir = os.path.join(self.onedrive_path, 'evaluation', 'eval_data', '4_multiple_exam')
             os.makedirs(exam_dir, exist_ok=True)
             
@@ -205,6 +253,25 @@ class ExamMaker:
                     self.logger.error(f"문제 번호 리스트 파일을 찾을 수 없습니다: {question_list_file}")
                     return {'success': False, 'error': f'문제 번호 리스트 파일 없음: {question_list_file}'}
             
+            # 최적 구성: 모든 과목의 할당을 먼저 계산
+            assembled_exams = None
+            assembly_certificate = None
+            if random_mode and assembly == 'optimal':
+                assembler = ExamAssembler(exams_config, allow_substitution=allow_substitution)
+                plan = assembler.solve(all_data)
+                assembled_exams = assembler.assemble(plan, seed=seed)
+                assembly_certificate = plan.certificate()
+                self.logger.info(
+                    f"최적 구성 완료: 수요 {plan.demand}개, 배정 {plan.max_flow}개, "
+                    f"부족 {plan.total_shortfall}개 ({assembly_certificate['status']}, {plan.seconds:.2f}s)"
+                )
+                for exam_name, domains in assembly_certificate['shortfall'].items():
+                    self.logger.warning(f"  {exam_name} 부족 (최소값): {domains}")
+                certificate_file = os.path.join(exam_dir, 'assembly_certificate.json')
+                with open(certificate_file, 'w', encoding='utf-8') as f:
+                    json.dump(assembly_certificate, f, ensure_ascii=False, indent=4)
+                self.logger.info(f"구성 증명 저장: {certificate_file}")
+            
             results = {}
             
             # 각 과목별로 처리
@@ -212,7 +279,12 @@ class ExamMaker:
                 self.logger.info(f"\n{'='*50}")
                 self.logger.info(f"과목: {exam_name}")
                 
-                if random_mode:
+                if assembled_exams is not None:
+                    # 최적 구성 결과 사용
+                    exam_data = assembled_exams.get(exam_name, [])
+                    question_pool.take(exam_data, used_questions)
+                    self.logger.info(f"  {exam_name}: {len(exam_data)}개 문제 배정 (최적 구성)")
+                elif random_mode:
                     # 랜덤 모드: exam_config.json 조건에 맞게 문제 랜덤 선택
                     if exam_name == '표해석':
                         exam_data = self._create_table_exam_random(
@@ -225,15 +297,18 @@ class ExamMaker:
                     else:
                         # 기존 과목들: subdomain별로 문제 랜덤 선택
                         exam_data = self._create_exam_random(
-                            exam_name, exam_info, valid_data, used_questions
+                            exam_name, exam_info, valid_data, used_questions, pool=question_pool
                         )
                 else:
                     # 리스트 모드: exam_question_lists.json에서 문제 번호 로드
                     exam_data = self._create_exam_from_list(
-                        exam_name, question_lists, all_data_index, used_questions
+                        exam_name, question_lists, all_data_index, used_questions, pool=question_pool
                     )
                 
                 if exam_data:
+                    # 표해석/계산 등 풀을 거치지 않고 사용된 문제도 풀에서 제거
+                    question_pool.remove((item.get('file_id', ''), item.get('tag', '')) for item in exam_data)
+                    
                     # 태그 대치 수행
                     exam_data_with_tags_replaced = self._replace_tags(exam_data)
                     
@@ -277,7 +352,8 @@ class ExamMaker:
                 'valid_questions': len(valid_data),
                 'used_questions': len(used_questions),
                 'remaining_questions': len(valid_data) - len(used_questions),
-                'results': results
+                'results': results,
+                'assembly': assembly_certificate
             }
             
         except Exception as e:
@@ -331,7 +407,8 @@ class ExamMaker:
         self.logger.info(f"문제 번호 리스트 저장 완료: {output_file}")
 
     def _create_exam_random(self, exam_name: str, exam_info: Dict[str, Any], 
-                            valid_data: List[Dict], used_questions: Set) -> List[Dict]:
+                            valid_data: List[Dict], used_questions: Set,
+                            pool: Optional[QuestionPool] = None, rng: Optional[random.Random] = None) -> List[Dict]:
         """
         랜덤 모드: exam_config.json 조건에 맞게 subdomain별로 문제 랜덤 선택
         
@@ -340,10 +417,16 @@ class ExamMaker:
             exam_info: exam_config에서 가져온 과목 정보
             valid_data: 유효한 문제 데이터
             used_questions: 이미 사용된 문제 set
+            pool: valid_data로 만든 QuestionPool (None이면 used_questions를 제외하고 새로 구축)
+            rng: 사용할 random.Random (None이면 전역 random, 세트별 독립 생성 시 사용)
             
         Returns:
             선택된 문제 리스트
         """
+        if pool is None:
+            pool = QuestionPool(valid_data)
+            pool.remove(used_questions)
+        rng = rng or random
         exam_data = []
         domain_details = exam_info.get('domain_details', {})
         
@@ -353,16 +436,11 @@ class ExamMaker:
             for subdomain_name, subdomain_info in subdomains.items():
                 needed_count = subdomain_info.get('count', 0)
                 
-                # 해당 domain/subdomain의 미사용 문제 필터링
-                available_questions = [
-                    item for item in valid_data
-                    if item.get('domain') == domain_name
-                    and item.get('subdomain') == subdomain_name
-                    and (item.get('file_id', ''), item.get('tag', '')) not in used_questions
-                ]
+                # 해당 domain/subdomain의 미사용 문제 (valid_data 순서 유지, 사용된 문제는 풀에서 제거되어 있음)
+                available_questions = pool.available(domain_name, subdomain_name)
                 
                 # 랜덤 섞기
-                random.shuffle(available_questions)
+                rng.shuffle(available_questions)
                 
                 # 필요한 만큼 선택
                 if len(available_questions) >= needed_count:
@@ -375,9 +453,8 @@ class ExamMaker:
                             f"(필요: {needed_count}, 가용: {len(selected)})"
                         )
                 
-                # 사용된 문제 등록
-                for item in selected:
-                    used_questions.add((item.get('file_id', ''), item.get('tag', '')))
+                # 사용된 문제 등록 (풀에서도 제거)
+                pool.take(selected, used_questions)
                 
                 exam_data.extend(selected)
                 self.logger.info(f"  - {domain_name}/{subdomain_name}: {len(selected)}/{needed_count}개 선택")
@@ -387,7 +464,8 @@ class ExamMaker:
         return exam_data
 
     def _create_table_exam_random(self, exam_name: str, exam_info: Dict[str, Any], 
-                                   all_data: List[Dict], used_questions: Set) -> List[Dict]:
+                                   all_data: List[Dict], used_questions: Set,
+                                   rng: Optional[random.Random] = None) -> List[Dict]:
         """
         랜덤 모드: 표해석 시험지 생성 (is_table=True인 문제 중에서 선택)
         
@@ -396,6 +474,7 @@ class ExamMaker:
             exam_info: exam_config에서 가져온 과목 정보
             all_data: 전체 문제 데이터
             used_questions: 이미 사용된 문제 set
+            rng: 사용할 random.Random (None이면 전역 random)
             
         Returns:
             선택된 문제 리스트
@@ -413,7 +492,7 @@ class ExamMaker:
                 available_questions.append(item)
         
         # 랜덤 섞기
-        random.shuffle(available_questions)
+        (rng or random).shuffle(available_questions)
         
         # 필요한 만큼 선택
         if len(available_questions) >= exam_questions:
@@ -434,7 +513,8 @@ class ExamMaker:
         return selected
 
     def _create_calculation_exam_random(self, exam_name: str, exam_info: Dict[str, Any], 
-                                        all_data: List[Dict], used_questions: Set) -> List[Dict]:
+                                        all_data: List[Dict], used_questions: Set,
+                                        rng: Optional[random.Random] = None) -> List[Dict]:
         """
         랜덤 모드: 계산 시험지 생성 (is_table=False이고 is_calculation=True인 문제 중에서 선택)
         
@@ -443,6 +523,7 @@ class ExamMaker:
             exam_info: exam_config에서 가져온 과목 정보
             all_data: 전체 문제 데이터
             used_questions: 이미 사용된 문제 set
+            rng: 사용할 random.Random (None이면 전역 random)
             
         Returns:
             선택된 문제 리스트
@@ -466,7 +547,7 @@ class ExamMaker:
                 available_questions.append(item)
         
         # 랜덤 섞기
-        random.shuffle(available_questions)
+        (rng or random).shuffle(available_questions)
         
         # 필요한 만큼 선택
         if len(available_questions) >= exam_questions:
@@ -487,7 +568,8 @@ class ExamMaker:
         return selected
 
     def _create_exam_from_list(self, exam_name: str, question_lists: Dict[str, List[Dict[str, str]]], 
-                                all_data_index: Dict, used_questions: Set) -> List[Dict]:
+                                all_data_index: Dict, used_questions: Set,
+                                pool: Optional[QuestionPool] = None) -> List[Dict]:
         """
         리스트 모드: exam_question_lists.json에서 문제 번호를 읽어서 해당 문제 로드
         없는 문제는 같은 domain/subdomain에서 대체 문제를 선택
@@ -497,6 +579,7 @@ class ExamMaker:
             question_lists: 저장된 문제 번호 리스트
             all_data_index: (file_id, tag) -> 문제 데이터 인덱스
             used_questions: 이미 사용된 문제 set
+            pool: 대체 문제 선택용 QuestionPool (유효 문제만, None이면 새로 구축)
             
         Returns:
             선택된 문제 리스트
@@ -511,15 +594,9 @@ class ExamMaker:
         missing_count = 0
         replaced_count = 0
         
-        # domain/subdomain별로 사용 가능한 문제 인덱스 구축 (대체 문제 선택용)
-        domain_subdomain_index = {}
-        for key, item in all_data_index.items():
-            domain = item.get('domain', '')
-            subdomain = item.get('subdomain', '')
-            ds_key = (domain, subdomain)
-            if ds_key not in domain_subdomain_index:
-                domain_subdomain_index[ds_key] = []
-            domain_subdomain_index[ds_key].append((key, item))
+        # domain/subdomain별 대체 문제 인덱스 (create_exams에서 받은 풀을 과목 간 공유)
+        if pool is None:
+            pool = QuestionPool(all_data_index.values(), predicate=self._is_valid_question)
         
         for qid in question_ids:
             file_id = qid.get('file_id', '')
@@ -538,16 +615,12 @@ class ExamMaker:
                 
                 if domain and subdomain:
                     ds_key = (domain, subdomain)
-                    if ds_key in domain_subdomain_index:
-                        # 미사용 문제 중에서 선택
-                        available = [
-                            (k, item) for k, item in domain_subdomain_index[ds_key]
-                            if k not in used_questions and self._is_valid_question(item)
-                        ]
+                    if ds_key in pool:
+                        # 미사용 문제 중 첫 번째 문제 선택
+                        replacement = pool.first_unused(domain, subdomain, used_questions)
                         
-                        if available:
-                            # 첫 번째 미사용 문제 선택
-                            replacement_key, replacement_item = available[0]
+                        if replacement:
+                            replacement_key, replacement_item = replacement
                             exam_data.append(replacement_item)
                             used_questions.add(replacement_key)
                             replaced_count += 1
@@ -581,39 +654,30 @@ class ExamMaker:
         return exam_data
 
     def _replace_tags(self, exam_data: List[Dict]) -> List[Dict]:
-        """태그 대치 수행"""
-        import re
+        """
+        태그 대치 수행 (copy-on-write)
         
+        태그가 없는 문제는 복사/조회 없이 그대로 사용하고(additional_tag_data 필드만 제외),
+        태그가 있는 문제만 얕은 복사 후 대치합니다. TagProcessor는 필드에 새 값을 대입하므로 원본은 변경되지 않습니다.
+        """
         exam_data_with_tags_replaced = []
         replaced_count = 0
         not_found_count = 0
         no_tag_data_count = 0
-        
-        # 태그 패턴 (tb, f, note, etc, img 모두 포함)
-        tag_pattern = r'\{(tb|f|note|etc|img)_\d{4}_\d{4}\}'
-        
-        def has_tags(item: Dict) -> bool:
-            """아이템에 대치할 태그가 있는지 확인"""
-            content_fields = [
-                item.get('question', ''),
-                item.get('answer', ''),
-                item.get('explanation', '')
-            ]
-            opts = item.get('options')
-            if opts:
-                content_fields.extend(opts if isinstance(opts, list) else [opts])
-            
-            return any(
-                field and re.search(tag_pattern, str(field))
-                for field in content_fields
-            )
+        untagged_count = 0
         
         for item in exam_data:
+            # 태그 여부는 문제당 1회만 검사
+            if not has_tags(item):
+                untagged_count += 1
+                if 'additional_tag_data' in item:
+                    item = {k: v for k, v in item.items() if k != 'additional_tag_data'}
+                exam_data_with_tags_replaced.append(item)
+                continue
+            
             file_id = item.get('file_id', '')
             tag = item.get('tag', '')
-            item_copy = copy.deepcopy(item)
-            
-            has_tags_before = has_tags(item_copy)
+            item_copy = {k: v for k, v in item.items() if k != 'additional_tag_data'}
             
             extracted_qna_item = self._load_extracted_qna_item(file_id, tag)
             if extracted_qna_item:
@@ -622,12 +686,10 @@ class ExamMaker:
                     # TagProcessor를 사용하여 태그 대치 수행
                     item_copy = TagProcessor.replace_tags_in_qna_data(item_copy, additional_tag_data)
                     
-                    has_tags_after = has_tags(item_copy)
-                    
-                    if has_tags_before and not has_tags_after:
+                    if not has_tags(item_copy):
                         replaced_count += 1
                         self.logger.debug(f"태그 대치 성공: {file_id}_{tag}")
-                    elif has_tags_before and has_tags_after:
+                    else:
                         self.logger.warning(f"태그 대치 후에도 태그가 남아있음: {file_id}_{tag}")
                 else:
                     no_tag_data_count += 1
@@ -636,11 +698,12 @@ class ExamMaker:
                 not_found_count += 1
                 self.logger.warning(f"_extracted_qna.json에서 항목을 찾을 수 없음: {file_id}_{tag}")
             
-            # additional_tag_data 필드 제거 (exam 파일에는 불필요)
-            item_cleaned = {k: v for k, v in item_copy.items() if k != 'additional_tag_data'}
-            exam_data_with_tags_replaced.append(item_cleaned)
+            exam_data_with_tags_replaced.append(item_copy)
         
-        self.logger.info(f"태그 대치 완료: 성공={replaced_count}, 찾을 수 없음={not_found_count}, 태그데이터 없음={no_tag_data_count}, 전체={len(exam_data)}")
+        self.logger.info(
+            f"태그 대치 완료: 성공={replaced_count}, 찾을 수 없음={not_found_count}, "
+            f"태그데이터 없음={no_tag_data_count}, 태그 없음={untagged_count}, 전체={len(exam_data)}"
+        )
         return exam_data_with_tags_replaced
 
     def _save_remaining_questions(self, all_data: List[Dict], used_questions: Set):
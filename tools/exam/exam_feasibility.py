@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시험지 할당량 실행 가능성 검사 (세트 생성 전 공급/수요 비교)
+
+exam_config.json의 subdomain 할당량이 풀보다 많다는 사실은 ExamMaker가 모든 세트를 만들고 태그 대치,
+검증, 저장까지 끝낸 뒤에야 드러났습니다. QuotaFeasibilityChecker는 DST 풀과 ExamConfig 통계만 읽어
+세트 수 N에 대한 공급/수요를 바로 계산합니다 (문제 수에 선형, LLM/파일 쓰기 없음).
+
+- 공급: (domain, subdomain)별 일반 문제 수. 표 문제({tb_)와 계산 문제는 ExamMaker와 같이 일반 과목에서
+  제외하고 표해석/계산 과목 공급으로만 셉니다. 같은 (file_id, tag)는 한 번만 셉니다.
+- 사용 문제: 이미 만든 세트의 exam_question_lists.json에 있는 문제는 공급에서 뺍니다.
+- 수요: 일반 과목은 모든 과목의 subdomain 할당량 합 × N, 표해석/계산은 exam_questions × N
+- 최대 세트 수: min(공급 // 세트당 수요)  (subdomain 간 대체 없이 모든 할당량을 채울 수 있는 세트 수)
+
+사용 예시:
+    checker = QuotaFeasibilityChecker(onedrive_path)
+    report = checker.check(num_sets=5, used_lists=checker.existing_question_lists())
+    print(report.max_sets, report.bottlenecks())
+
+실행:
+    python -m tools.exam.exam_feasibility --onedrive_path /path/to/onedrive --num_sets 5 --exclude_existing
+"""
+
+import os
+import glob
+import json
+import argparse
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from tools.core.exam_config import ExamConfig
+from tools.exam.exam_assembly import ExamAssembler, TABLE_EXAM, CALCULATION_EXAM
+from tools.exam.extract_exam_question_list import load_question_lists
+
+
+# 표해석/계산 과목 ↔ 문제 종류
+SPECIAL_EXAMS = {TABLE_EXAM: 'table', CALCULATION_EXAM: 'calc'}
+
+
+@dataclass
+class QuotaRow:
+    """할당 단위 1개의 공급/수요 (일반 과목은 (domain, subdomain), 표해석/계산은 과목 전체)"""
+    domain: str
+    subdomain: str
+    supply: int
+    per_set: int
+    used: int = 0
+    exams: Dict[str, int] = field(default_factory=dict)
+
+    def demand(self, num_sets: int) -> int:
+        return self.per_set * num_sets
+
+    def shortfall(self, num_sets: int) -> int:
+        return max(0, self.demand(num_sets) - self.supply)
+
+    @property
+    def max_sets(self) -> Optional[int]:
+        """이 단위만 고려한 최대 세트 수 (수요가 없으면 None)"""
+        return self.supply // self.per_set if self.per_set > 0 else None
+
+
+@dataclass
+class FeasibilityReport:
+    """세트 수 N에 대한 실행 가능성 결과"""
+    num_sets: int
+    rows: List[QuotaRow]
+    pool_size: int
+    excluded_used: int
+
+    @property
+    def max_sets(self) -> int:
+        limits = [row.max_sets for row in self.rows if row.max_sets is not None]
+        return min(limits) if limits else 0
+
+    @property
+    def total_demand(self) -> int:
+        return sum(row.demand(self.num_sets) for row in self.rows)
+
+    @property
+    def total_shortfall(self) -> int:
+        return sum(row.shortfall(self.num_sets) for row in self.rows)
+
+    @property
+    def feasible(self) -> bool:
+        return self.total_shortfall == 0
+
+    def bottlenecks(self) -> List[QuotaRow]:
+        """N세트에서 부족한 단위 (부족분 큰 순)"""
+        short = [row for row in self.rows if row.shortfall(self.num_sets) > 0]
+        return sorted(short, key=lambda row: (-row.shortfall(self.num_sets), row.domain, row.subdomain))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용"""
+        return {
+            'num_sets': self.num_sets,
+            'feasible': self.feasible,
+            'max_sets': self.max_sets,
+            'pool_size': self.pool_size,
+            'excluded_used': self.excluded_used,
+            'total_demand': self.total_demand,
+            'total_shortfall': self.total_shortfall,
+            'rows': [{
+                'domain': row.domain,
+                'subdomain': row.subdomain,
+                'supply': row.supply,
+                'used': row.used,
+                'per_set': row.per_set,
+                'demand': row.demand(self.num_sets),
+                'shortfall': row.shortfall(self.num_sets),
+                'max_sets': row.max_sets,
+                'exams': row.exams,
+            } for row in self.rows],
+        }
+
+
+class QuotaFeasibilityChecker:
+    """DST 풀과 exam_config 할당량으로 세트 수별 실행 가능성 계산"""
+
+    def __init__(self, onedrive_path: str, config_path: Optional[str] = None,
+                 all_data: Optional[List[Dict[str, Any]]] = None,
+                 exams_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            onedrive_path: OneDrive 경로 (evaluation/eval_data 포함)
+            config_path: exam_config.json 경로 (None이면 onedrive 기준)
+            all_data: DST 풀 (None이면 2_subdomain/multiple-choice_DST.json 로드)
+            exams_config: ExamConfig.get_exams_config() 결과 (None이면 로드)
+        """
+        self.onedrive_path = onedrive_path
+        self.eval_data_path = os.path.join(onedrive_path, 'evaluation', 'eval_data')
+        if exams_config is None:
+            exams_config = ExamConfig(config_path=config_path, onedrive_path=onedrive_path).get_exams_config()
+        self.exams_config = exams_config
+        if all_data is None:
+            data_file = os.path.join(self.eval_data_path, '2_subdomain', 'multiple-choice_DST.json')
+            with open(data_file, 'r', encoding='utf-8') as f:
+                all_data = json.load(f)
+        self.all_data = all_data
+
+    def existing_question_lists(self) -> List[str]:
+        """4_multiple_exam 아래 이미 생성된 exam_question_lists.json 경로 (세트 디렉토리 포함)"""
+        exam_dir = os.path.join(self.eval_data_path, '4_multiple_exam')
+        paths = glob.glob(os.path.join(exam_dir, 'exam_question_lists.json'))
+        paths += glob.glob(os.path.join(exam_dir, '*', 'exam_question_lists.json'))
+        return sorted(paths)
+
+    @staticmethod
+    def load_used_questions(used_lists: Iterable[str]) -> Set[Tuple[str, str]]:
+        """exam_question_lists.json 파일들의 (file_id, tag) 합집합"""
+        used = set()
+        for path in used_lists:
+            for questions in load_question_lists(path).values():
+                for q in questions:
+                    used.add((q.get('file_id', ''), q.get('tag', '')))
+        return used
+
+    def per_set_demand(self) -> Tuple[Dict[Tuple[str, str], int], Dict[Tuple[str, str], Dict[str, int]],
+                                      Dict[str, int]]:
+        """
+        세트 1개의 수요
+
+        Returns:
+            ((domain, subdomain) → 할당량 합, (domain, subdomain) → {과목: 할당량}, 표해석/계산 → 문제 수)
+        """
+        totals: Dict[Tuple[str, str], int] = {}
+        by_exam: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for exam_name, quotas in ExamAssembler(self.exams_config).demands().items():
+            for ds_key, count in quotas.items():
+                if count <= 0:
+                    continue
+                totals[ds_key] = totals.get(ds_key, 0) + count
+                by_exam.setdefault(ds_key, {})[exam_name] = count
+        special = {
+            exam_name: self.exams_config[exam_name].get('exam_questions', 500)
+            for exam_name in SPECIAL_EXAMS if exam_name in self.exams_config
+        }
+        return totals, by_exam, special
+
+    def check(self, num_sets: int = 5, used_lists: Optional[Iterable[str]] = None,
+              used_questions: Optional[Set[Tuple[str, str]]] = None) -> FeasibilityReport:
+        """
+        N세트 공급/수요 비교
+
+        Args:
+            num_sets: 생성할 세트 수
+            used_lists: 사용 처리할 exam_question_lists.json 경로들
+            used_questions: 사용 처리할 (file_id, tag) (used_lists와 합쳐짐)
+
+        Returns:
+            FeasibilityReport
+        """
+        used = set(used_questions or ())
+        if used_lists:
+            used |= self.load_used_questions(used_lists)
+
+        all_buckets = ExamAssembler.bucketize(self.all_data)
+        buckets = ExamAssembler.bucketize(self.all_data, exclude=used) if used else all_buckets
+        totals, by_exam, special = self.per_set_demand()
+
+        rows = []
+        for domain, subdomain in sorted(set(totals) | {(d, s) for d, s, kind in all_buckets if kind == 'plain'}):
+            supply = len(buckets.get((domain, subdomain, 'plain'), ()))
+            rows.append(QuotaRow(
+                domain=domain, subdomain=subdomain, supply=supply,
+                per_set=totals.get((domain, subdomain), 0),
+                used=len(all_buckets.get((domain, subdomain, 'plain'), ())) - supply,
+                exams=by_exam.get((domain, subdomain), {}),
+            ))
+        for exam_name, per_set in special.items():
+            kind = SPECIAL_EXAMS[exam_name]
+            supply = sum(len(items) for (_, _, k), items in buckets.items() if k == kind)
+            total = sum(len(items) for (_, _, k), items in all_buckets.items() if k == kind)
+            rows.append(QuotaRow(domain=exam_name, subdomain='', supply=supply, per_set=per_set,
+                                 used=total - supply, exams={exam_name: per_set}))
+
+        return FeasibilityReport(
+            num_sets=num_sets,
+            rows=rows,
+            pool_size=sum(len(items) for items in all_buckets.values()),
+            excluded_used=sum(row.used for row in rows),
+        )
+
+
+def format_report(report: FeasibilityReport, show_all: bool = False) -> str:
+    """콘솔 출력용 표"""
+    n = report.num_sets
+    lines = [
+        f"풀 {report.pool_size}개 (사용 제외 {report.excluded_used}개), {n}세트 수요 {report.total_demand}개, "
+        f"부족 {report.total_shortfall}개 → {'가능' if report.feasible else '불가능'}",
+        f"최대 가능 세트 수: {report.max_sets}",
+        f"{'domain':<16} {'subdomain':<24} {'공급':>7} {'세트당':>7} {'수요':>7} {'부족':>7} {'최대세트':>8}",
+    ]
+    rows = report.rows if show_all else [row for row in report.rows if row.per_set > 0]
+    for row in rows:
+        marker = ' *' if row.shortfall(n) > 0 else ''
+        lines.append(
+            f"{row.domain:<16} {row.subdomain:<24} {row.supply:>7} {row.per_set:>7} {row.demand(n):>7} "
+            f"{row.shortfall(n):>7} {str(row.max_sets if row.max_sets is not None else '-'):>8}{marker}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시험지 할당량 실행 가능성 검사 (세트 수별 공급/수요)')
+    parser.add_argument('--onedrive_path', type=str, required=True, help='OneDrive 경로 (evaluation/eval_data 포함)')
+    parser.add_argument('--config_path', type=str, default=None, help='exam_config.json 경로 (기본: onedrive 기준)')
+    parser.add_argument('--num_sets', type=int, default=5, help='생성할 세트 수 (기본값: 5)')
+    parser.add_argument('--used_lists', type=str, nargs='*', default=[],
+                        help='이미 사용한 문제로 제외할 exam_question_lists.json 경로들')
+    parser.add_argument('--exclude_existing', action='store_true',
+                        help='4_multiple_exam 아래 기존 exam_question_lists.json을 모두 사용 문제로 제외')
+    parser.add_argument('--show_all', action='store_true', help='할당량이 없는 subdomain도 출력')
+    parser.add_argument('--output', type=str, default=None, help='리포트 JSON 저장 경로')
+    args = parser.parse_args()
+
+    checker = QuotaFeasibilityChecker(args.onedrive_path, config_path=args.config_path)
+    used_lists = list(args.used_lists)
+    if args.exclude_existing:
+        used_lists += checker.existing_question_lists()
+    for path in used_lists:
+        print(f"사용 문제 리스트: {path}")
+
+    report = checker.check(args.num_sets, used_lists=used_lists)
+    print(format_report(report, show_all=args.show_all))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"리포트 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
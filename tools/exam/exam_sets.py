@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+세트별 독립 시험지 생성 (파생 seed, 병렬 워커)
+
+기존에는 전역 random seed 하나로 세트를 순서대로 만들었기 때문에, 5세트를 다시 만들려면 1~4세트를
+재현해야 했고 한 세트가 바뀌면 나머지 세트의 구성도 모두 바뀌었습니다.
+
+ExamSetGenerator는 세트를 서로 독립적으로 만듭니다.
+    1) 풀 분할: 문제를 (domain, subdomain, 종류) 버킷으로 나누고, 버킷마다 (file_id, tag) 정렬 후
+       derive_seed(seed, 'partition', 버킷)로 섞어 세트 수만큼 균등하게 잘라 나눔 → 세트 간 중복 없음
+       (버킷별 나머지는 세트를 돌아가며 배정하므로 세트별 몫의 크기 차이는 최대 1)
+    2) 세트 구성: 각 세트는 자기 몫의 문제만으로 derive_seed(seed, 세트명) 난수를 사용해 구성
+       (assembly='greedy'는 ExamMaker와 같은 과목 순서 선택, 'optimal'은 ExamAssembler)
+    3) 저장: 워커 결과를 메인 프로세스가 세트 번호 순서로 기록
+
+세트 구성은 (seed, 세트 수, 풀, exam_config)에만 의존하므로 워커 수나 일부 세트만 생성하는지와
+관계없이 시험지 JSON과 exam_question_lists.json이 바이트 단위로 동일합니다 (STATS_exam.md는 생성 시각 포함).
+
+출력 경로:
+    - 시험지: {onedrive_path}/evaluation/eval_data/4_multiple_exam/{set_name}/{과목}_exam.json
+    - 문제 번호: {onedrive_path}/evaluation/eval_data/4_multiple_exam/{set_name}/exam_question_lists.json
+    - 매니페스트: {onedrive_path}/evaluation/eval_data/4_multiple_exam/exam_sets_manifest.json
+"""
+
+import os
+import json
+import random
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.core.exam_config import ExamConfig
+from tools.exam.exam_create import ExamMaker
+from tools.exam.exam_assembly import ExamAssembler, question_kind, TABLE_EXAM, CALCULATION_EXAM
+from tools.exam.question_pool import QuestionPool, question_key
+
+
+SET_NAMES = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 5: '5th'}
+
+
+def set_dir_name(set_num: int) -> str:
+    """세트 번호 → 디렉토리 이름 (1 → 1st, ...)"""
+    return SET_NAMES.get(set_num, f"{set_num}th")
+
+
+def derive_seed(seed: int, *parts: Any) -> int:
+    """기본 seed와 식별자로 독립적인 seed 파생 (프로세스/파이썬 해시 설정과 무관)"""
+    text = ':'.join([str(seed)] + [str(part) for part in parts])
+    return int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'big')
+
+
+def partition_pool(all_data: List[Dict[str, Any]], num_sets: int, seed: int) -> List[List[Dict[str, Any]]]:
+    """
+    풀을 세트 수만큼 서로소인 몫으로 분할
+
+    버킷(domain, subdomain, 종류)마다 (file_id, tag) 순으로 정렬해 섞으므로 입력 순서와 무관합니다.
+    버킷 크기를 세트 수로 나눈 나머지는 이전 버킷의 나머지를 받은 다음 세트부터 이어서 1개씩 더 주므로
+    (시작 세트는 derive_seed(seed, 'partition')로 결정) 세트별 몫의 크기 차이는 최대 1입니다.
+    같은 (file_id, tag)는 버킷이 달라도 처음 것만 사용합니다 (한 문제가 두 세트에 들어가지 않도록).
+    """
+    seen = set()
+    buckets: Dict[Tuple[str, str, str], Dict[Tuple[str, str], Dict[str, Any]]] = {}
+    for item in all_data:
+        key = question_key(item)
+        if key in seen:
+            continue
+        seen.add(key)
+        bucket = (item.get('domain', ''), item.get('subdomain', ''), question_kind(item))
+        buckets.setdefault(bucket, {})[key] = item
+
+    shares: List[List[Dict[str, Any]]] = [[] for _ in range(num_sets)]
+    offset = derive_seed(seed, 'partition') % num_sets
+    for bucket in sorted(buckets):
+        items = [buckets[bucket][key] for key in sorted(buckets[bucket])]
+        random.Random(derive_seed(seed, 'partition', *bucket)).shuffle(items)
+        size, extra = divmod(len(items), num_sets)
+        start = 0
+        for i in range(num_sets):
+            end = start + size + (1 if (i - offset) % num_sets < extra else 0)
+            shares[i].extend(items[start:end])
+            start = end
+        offset = (offset + extra) % num_sets
+    return shares
+
+
+def build_exam_set(maker: ExamMaker, exams_config: Dict[str, Any], items: List[Dict[str, Any]],
+                   set_seed: int, assembly: str = 'greedy',
+                   allow_substitution: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    세트 1개 구성 (items 안에서만 선택, rng는 set_seed 전용)
+
+    Returns:
+        {과목명: 선택된 문제 리스트}
+    """
+    if assembly == 'optimal':
+        assembler = ExamAssembler(exams_config, allow_substitution=allow_substitution)
+        return assembler.assemble(assembler.solve(items), seed=set_seed)
+
+    rng = random.Random(set_seed)
+    valid_data = [item for item in items if maker._is_valid_question(item)]
+    pool = QuestionPool(valid_data)
+    used_questions = set()
+    exams = {}
+    for exam_name, exam_info in exams_config.items():
+        if exam_name == TABLE_EXAM:
+            exams[exam_name] = maker._create_table_exam_random(exam_name, exam_info, items, used_questions, rng=rng)
+        elif exam_name == CALCULATION_EXAM:
+            exams[exam_name] = maker._create_calculation_exam_random(exam_name, exam_info, items, used_questions,
+                                                                     rng=rng)
+        else:
+            exams[exam_name] = maker._create_exam_random(exam_name, exam_info, valid_data, used_questions,
+                                                         pool=pool, rng=rng)
+            continue
+        pool.remove(question_key(item) for item in exams[exam_name])
+    return exams
+
+
+def _build_set_worker(task: Dict[str, Any]) -> Tuple[int, Dict[str, List[Dict[str, Any]]]]:
+    """프로세스 워커: 세트 구성 + 태그 대치"""
+    logger = logging.getLogger('tools.exam.exam_sets.worker')
+    maker = ExamMaker(task['onedrive_path'], logger)
+    exams = build_exam_set(maker, task['exams_config'], task['items'], task['set_seed'],
+                           task['assembly'], task['allow_substitution'])
+    if task['replace_tags']:
+        exams = {name: maker._replace_tags(data) for name, data in exams.items()}
+    return task['set_num'], exams
+
+
+class ExamSetGenerator:
+    """세트별 파생 seed로 서로 독립적인 시험지 세트를 생성 (병렬 가능)"""
+
+    def __init__(self, onedrive_path: str, logger: Any):
+        self.onedrive_path = onedrive_path
+        self.logger = logger
+
+    def generate(self, num_sets: int = 5, seed: int = 42, sets: Optional[List[int]] = None,
+                 workers: int = 1, assembly: str = 'greedy', allow_substitution: bool = False,
+                 replace_tags: bool = True) -> Dict[str, Any]:
+        """
+        시험지 세트 생성
+
+        Args:
+            num_sets: 전체 세트 수 (풀 분할 기준)
+            seed: 기본 seed (세트/버킷별 seed는 여기서 파생)
+            sets: 생성할 세트 번호 (None이면 1~num_sets 모두). 다른 세트를 재현하지 않고 바로 생성
+            workers: 병렬 워커 프로세스 수 (결과는 워커 수와 무관)
+            assembly: 세트 내 구성 방식 ('greedy' / 'optimal')
+            allow_substitution: optimal에서 같은 domain 내 대체 허용
+            replace_tags: 태그 대치 수행 여부
+
+        Returns:
+            생성 결과 딕셔너리 (세트별 과목 문제 수, 파생 seed)
+        """
+        sets = sorted(set(sets or range(1, num_sets + 1)))
+        if any(n < 1 or n > num_sets for n in sets):
+            return {'success': False, 'error': f'세트 번호는 1~{num_sets} 범위여야 합니다: {sets}'}
+        self.logger.info(f"=== 시험지 세트 생성 (seed={seed}, 세트 {sets}/{num_sets}, workers={workers}) ===")
+
+        try:
+            exams_config = ExamConfig(onedrive_path=self.onedrive_path).get_exams_config()
+        except Exception as e:
+            self.logger.error(f"exam_config.json 파일 로드 실패: {e}")
+            return {'success': False, 'error': f'설정 파일 로드 실패: {e}'}
+
+        all_data_file = os.path.join(
+            self.onedrive_path, 'evaluation', 'eval_data', '2_subdomain', 'multiple-choice_DST.json'
+        )
+        if not os.path.exists(all_data_file):
+            return {'success': False, 'error': f'데이터 파일 없음: {all_data_file}'}
+        with open(all_data_file, 'r', encoding='utf-8') as f:
+            all_data = json.load(f)
+
+        shares = partition_pool(all_data, num_sets, seed)
+        tasks = [{
+            'set_num': n,
+            'set_seed': derive_seed(seed, set_dir_name(n)),
+            'items': shares[n - 1],
+            'exams_config': exams_config,
+            'onedrive_path': self.onedrive_path,
+            'assembly': assembly,
+            'allow_substitution': allow_substitution,
+            'replace_tags': replace_tags,
+        } for n in sets]
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                built = dict(executor.map(_build_set_worker, tasks))
+        else:
+            built = dict(_build_set_worker(task) for task in tasks)
+
+        # 세트 간 중복 검증 (분할로 보장되지만 기록 전 확인)
+        seen = {}
+        for n in sets:
+            for exam_data in built[n].values():
+                for item in exam_data:
+                    key = question_key(item)
+                    if key in seen and seen[key] != n:
+                        return {'success': False, 'error': f'세트 간 중복 문제: {key} ({seen[key]}, {n})'}
+                    seen[key] = n
+
+        exam_dir = os.path.join(self.onedrive_path, 'evaluation', 'eval_data', '4_multiple_exam')
+        maker = ExamMaker(self.onedrive_path, self.logger)
+        manifest_sets = {}
+        for task in tasks:
+            n = task['set_num']
+            set_dir = os.path.join(exam_dir, set_dir_name(n))
+            os.makedirs(set_dir, exist_ok=True)
+            results = {}
+            for exam_name in exams_config:
+                exam_data = built[n].get(exam_name, [])
+                with open(os.path.join(set_dir, f'{exam_name}_exam.json'), 'w', encoding='utf-8') as f:
+                    json.dump(exam_data, f, ensure_ascii=False, indent=4)
+                results[exam_name] = len(exam_data)
+            maker._save_question_lists(set_dir, exams_config, [], results)
+            maker._save_exam_statistics(set_dir, exams_config, results)
+            manifest_sets[set_dir_name(n)] = {'seed': task['set_seed'], 'pool_share': len(task['items']),
+                                              'results': results}
+            self.logger.info(f"  세트 {set_dir_name(n)}: {results}")
+
+        manifest_file = os.path.join(exam_dir, 'exam_sets_manifest.json')
+        manifest = {}
+        if os.path.exists(manifest_file):
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        if manifest.get('seed') != seed or manifest.get('num_sets') != num_sets:
+            manifest = {'seed': seed, 'num_sets': num_sets, 'sets': {}}
+        manifest['assembly'] = assembly
+        manifest['sets'].update(manifest_sets)
+        manifest['sets'] = dict(sorted(manifest['sets'].items()))
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=4)
+        self.logger.info(f"세트 매니페스트 저장: {manifest_file}")
+
+        return {
+            'success': True,
+            'seed': seed,
+            'num_sets': num_sets,
+            'sets': manifest_sets,
+        }
@@ -5,21 +5,123 @@
 
 이 모듈은 시험지 검증 및 업데이트 기능을 제공합니다:
 - ExamValidator: 시험지 검증 및 업데이트 클래스
+- ExamRequirementTracker: (domain, subdomain) 문제 수를 증분 유지하는 요구사항 카운터
 - Multiple Choice 문제 형식 검증
 - exam_config 요구사항 검증
+
+요구사항 검사/보충은 전체 데이터를 domain마다 다시 훑지 않습니다.
+- 요구사항 충족 여부는 ExamRequirementTracker가 문제 추가/제거 시 불일치 슬롯 수만 갱신해 O(1)로 판정
+- 보충 후보는 QuestionPool((domain, subdomain) 버킷)에서 가져오고 사용한 문제는 풀에서 바로 제거
+- 후보 순서와 난수 호출 순서는 기존과 같으므로 같은 seed에서 결과가 동일합니다
+
+벤치마크 (5세트 × 4과목 보충, 기존 방식과 결과 동일성 확인):
+    python -m tools.benchmarks.exam_validator --pool_size 30000
 """
 
 import re
 import random
-from typing import Dict, List, Any, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set
 from collections import defaultdict
 
+from tools.exam.question_pool import QuestionPool, question_key
+
 
 # 원문자 번호 상수
 CIRCLED_NUMBERS = {'①', '②', '③', '④', '⑤'}
 CIRCLED_NUMBERS_PATTERN = re.compile(r'[①②③④⑤]')
 
 
+class ExamRequirementTracker:
+    """
+    시험지 1개의 (domain, subdomain) 문제 수를 증분으로 유지하며 exam_config 요구사항 충족 여부를 판정
+
+    충족 조건은 check_exam_meets_requirements와 같습니다.
+    - 요구 domain마다 문제가 1개 이상 있어야 함
+    - 요구 subdomain마다 문제 수가 정확히 일치해야 함 (요구에 없는 subdomain 문제는 무시)
+    domain/subdomain이 비어 있는 문제는 세지 않습니다.
+    """
+
+    def __init__(self, exam_name: str, stats: Dict[str, Any], exam_data: Optional[List[Dict]] = None):
+        """
+        Args:
+            exam_name: 시험 이름 (예: '금융일반')
+            stats: exam_config에서 가져온 통계 정보 (ExamConfig.get_exam_statistics())
+            exam_data: 초기 문제 리스트
+        """
+        self.exam_name = exam_name
+        self.required: Dict[Tuple[str, str], int] = {}
+        self.required_domains: Set[str] = set()
+        self.known = exam_name in stats
+        if self.known:
+            for domain, domain_stats in stats[exam_name].items():
+                self.required_domains.add(domain)
+                for subdomain, needed_count in domain_stats['exam_subdomain_distribution'].items():
+                    self.required[(domain, subdomain)] = needed_count
+        self.counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.domain_counts: Dict[str, int] = defaultdict(int)
+        # 불일치 수 = 개수가 다른 요구 subdomain 수 + 문제가 없는 요구 domain 수
+        self._mismatches = sum(1 for needed in self.required.values() if needed != 0) + len(self.required_domains)
+        for question in exam_data or ():
+            self.add(question)
+
+    def _update(self, question: Dict, delta: int) -> None:
+        domain = question.get('domain', '')
+        subdomain = question.get('subdomain', '')
+        if not (domain and subdomain):
+            return
+        ds_key = (domain, subdomain)
+        needed = self.required.get(ds_key)
+        if needed is not None:
+            before = self.counts[ds_key] == needed
+            self.counts[ds_key] += delta
+            self._mismatches += int(before) - int(self.counts[ds_key] == needed)
+        else:
+            self.counts[ds_key] += delta
+        if domain in self.required_domains:
+            before = self.domain_counts[domain] > 0
+            self.domain_counts[domain] += delta
+            self._mismatches += int(before) - int(self.domain_counts[domain] > 0)
+        else:
+            self.domain_counts[domain] += delta
+
+    def add(self, question: Dict) -> None:
+        """문제 추가 반영"""
+        self._update(question, 1)
+
+    def remove(self, question: Dict) -> None:
+        """문제 제거 반영"""
+        self._update(question, -1)
+
+    @property
+    def meets_requirements(self) -> bool:
+        return self.known and self._mismatches == 0
+
+    def deficits(self) -> Dict[Tuple[str, str], int]:
+        """요구보다 부족한 (domain, subdomain) → 부족 수"""
+        return {ds_key: needed - self.counts.get(ds_key, 0)
+                for ds_key, needed in self.required.items() if self.counts.get(ds_key, 0) < needed}
+
+    def surpluses(self) -> Dict[Tuple[str, str], int]:
+        """요구보다 많은 (domain, subdomain) → 초과 수"""
+        return {ds_key: self.counts[ds_key] - needed
+                for ds_key, needed in self.required.items() if self.counts.get(ds_key, 0) > needed}
+
+    def actual_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        {domain: {subdomain: count}} 형태의 실제 문제 수 (check_exam_meets_requirements 반환값과 같은 형태)
+
+        문제가 있는 domain은 요구 subdomain을 0으로 포함합니다.
+        """
+        result: Dict[str, Dict[str, int]] = {}
+        for (domain, subdomain), count in self.counts.items():
+            if self.domain_counts.get(domain, 0) > 0 and (count > 0 or (domain, subdomain) in self.required):
+                result.setdefault(domain, {})[subdomain] = count
+        for (domain, subdomain) in self.required:
+            if domain in result:
+                result[domain].setdefault(subdomain, 0)
+        return result
+
+
 class ExamValidator:
     """시험지 검증 및 업데이트 클래스"""
     
@@ -42,32 +144,15 @@ class ExamValidator:
         if exam_name not in stats:
             return False, {}
         
-        # 실제 문제 수 계산 (domain별, subdomain별)
-        actual_counts = defaultdict(lambda: defaultdict(int))
-        for question in exam_data:
-            domain = question.get('domain', '')
-            subdomain = question.get('subdomain', '')
-            if domain and subdomain:
-                actual_counts[domain][subdomain] += 1
-        
-        # 요구사항과 비교
-        meets_requirements = True
-        for domain in stats[exam_name].keys():
-            if domain not in actual_counts:
-                meets_requirements = False
-                continue
-            
-            for subdomain, needed_count in stats[exam_name][domain]['exam_subdomain_distribution'].items():
-                actual_count = actual_counts[domain][subdomain]
-                if actual_count != needed_count:
-                    meets_requirements = False
-        
-        return meets_requirements, dict(actual_counts)
+        tracker = ExamRequirementTracker(exam_name, stats, exam_data)
+        return tracker.meets_requirements, tracker.actual_counts()
     
     @staticmethod
     def update_existing_exam(existing_exam_data: List[Dict], exam_name: str,
                             stats: Dict[str, Any], all_data: List[Dict],
-                            used_questions: set, logger) -> List[Dict]:
+                            used_questions: set, logger,
+                            pool: Optional[QuestionPool] = None,
+                            tracker: Optional[ExamRequirementTracker] = None) -> List[Dict]:
         """
         기존 문제지를 exam_config 요구사항에 맞게 업데이트
         - 부족한 문제 추가
@@ -80,6 +165,10 @@ class ExamValidator:
             all_data: 전체 문제 데이터
             used_questions: 사용된 문제 추적용 set (업데이트됨)
             logger: 로거 인스턴스
+            pool: all_data로 만든 QuestionPool (None이면 새로 구축). 여러 시험지를 보충할 때 같은
+                  used_questions와 함께 공유하면 사용된 문제가 풀에서 바로 빠져 재탐색이 없습니다.
+            tracker: existing_exam_data를 반영한 ExamRequirementTracker. 주면 추가/제거된 문제만 반영해
+                     업데이트된 문제지 기준으로 갱신됩니다 (재집계 없이 meets_requirements 확인 가능).
             
         Returns:
             업데이트된 문제지 데이터
@@ -87,6 +176,9 @@ class ExamValidator:
         if exam_name not in stats:
             return existing_exam_data
         
+        if pool is None:
+            pool = QuestionPool(all_data)
+        
         # 기존 문제를 domain/subdomain별로 분류
         existing_by_subdomain = defaultdict(list)
         existing_question_ids = set()
@@ -100,11 +192,10 @@ class ExamValidator:
         
         # 업데이트된 문제지
         updated_exam_data = []
+        added_questions = []
         
         # domain별로 처리
         for domain in stats[exam_name].keys():
-            domain_data = [d for d in all_data if d.get('domain') == domain]
-            
             # subdomain별로 처리
             for subdomain, needed_count in stats[exam_name][domain]['exam_subdomain_distribution'].items():
                 # 기존 문제 중 해당 subdomain 문제들
@@ -114,26 +205,21 @@ class ExamValidator:
                 if existing_count == needed_count:
                     # 정확히 필요한 만큼 있으면 그대로 사용
                     updated_exam_data.extend(existing_subdomain_questions)
-                    for q in existing_subdomain_questions:
-                        question_id = (q.get('file_id', ''), q.get('tag', ''))
-                        used_questions.add(question_id)
+                    pool.take(existing_subdomain_questions, used_questions)
                 
                 elif existing_count < needed_count:
                     # 부족한 경우: 기존 문제 유지 + 추가 문제 선택
                     updated_exam_data.extend(existing_subdomain_questions)
-                    for q in existing_subdomain_questions:
-                        question_id = (q.get('file_id', ''), q.get('tag', ''))
-                        used_questions.add(question_id)
+                    pool.take(existing_subdomain_questions, used_questions)
                     
                     # 추가로 필요한 문제 수
                     needed_additional = needed_count - existing_count
                     
-                    # 사용 가능한 문제 중에서 선택 (기존에 사용되지 않은 것)
+                    # 사용 가능한 문제 중에서 선택 (기존에 사용되지 않은 것, 버킷 순서 = all_data 순서)
                     available_subdomain_data = [
-                        d for d in domain_data 
-                        if d.get('subdomain') == subdomain 
-                        and (d.get('file_id', ''), d.get('tag', '')) not in existing_question_ids
-                        and (d.get('file_id', ''), d.get('tag', '')) not in used_questions
+                        d for d in pool.available(domain, subdomain)
+                        if question_key(d) not in existing_question_ids
+                        and question_key(d) not in used_questions
                     ]
                     
                     random.shuffle(available_subdomain_data)
@@ -149,25 +235,31 @@ class ExamValidator:
                         )
                     
                     updated_exam_data.extend(additional_questions)
-                    for q in additional_questions:
-                        question_id = (q.get('file_id', ''), q.get('tag', ''))
-                        used_questions.add(question_id)
-                        existing_question_ids.add(question_id)  # 중복 선택 방지
+                    added_questions.extend(additional_questions)
+                    pool.take(additional_questions, used_questions)
+                    existing_question_ids.update(question_key(q) for q in additional_questions)  # 중복 선택 방지
                 
                 else:
                     # 초과하는 경우: 필요한 만큼만 선택
                     random.shuffle(existing_subdomain_questions)
                     selected_questions = existing_subdomain_questions[:needed_count]
                     updated_exam_data.extend(selected_questions)
-                    for q in selected_questions:
-                        question_id = (q.get('file_id', ''), q.get('tag', ''))
-                        used_questions.add(question_id)
+                    pool.take(selected_questions, used_questions)
                     
                     logger.info(
                         f"  - {subdomain}: 초과 문제 제거 "
                         f"(기존: {existing_count}, 필요: {needed_count}, 제거: {existing_count - needed_count})"
                     )
         
+        if tracker is not None:
+            # 제거된 문제(초과분, 요구에 없는 subdomain)와 추가된 문제만 반영
+            kept = {id(q) for q in updated_exam_data}
+            for question in existing_exam_data:
+                if id(question) not in kept:
+                    tracker.remove(question)
+            for question in added_questions:
+                tracker.add(question)
+        
         return updated_exam_data
     
     @staticmethod
@@ -351,4 +443,3 @@ class ExamValidator:
         """
         from tools.report import MultipleChoiceValidationReportGenerator
         return MultipleChoiceValidationReportGenerator.generate_report(validation_result, verbose)
-
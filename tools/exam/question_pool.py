@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+(domain, subdomain) 버킷 인덱스 문제 풀
+
+ExamMaker가 과목(세트)마다 전체 valid_data를 subdomain 수만큼 다시 필터링하던 방식을 대체합니다.
+풀은 create_exams에서 1회 구축되어 모든 과목이 공유하며, 버킷 조회와 사용 문제 제거가 O(1)입니다.
+
+- 버킷은 원본 리스트 순서를 유지하므로(dict 삽입 순서) 같은 seed에서 기존과 동일한 시험지가 생성됩니다.
+- 같은 (file_id, tag)가 여러 번 있어도 원본처럼 각각 후보로 취급하고, 사용 처리 시 모두 제거합니다.
+- first_unused는 버킷별 커서로 리스트 모드의 대체 문제를 찾습니다 (사용 여부는 되돌아가지 않으므로 커서만 전진).
+
+벤치마크 (현재 풀의 10배 규모 합성 데이터, 기존 방식과 결과 동일성 확인):
+    python -m tools.benchmarks.question_pool --pool_size 150000
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+QuestionKey = Tuple[str, str]
+BucketKey = Tuple[str, str]
+
+
+def question_key(item: Dict[str, Any]) -> QuestionKey:
+    """문제 식별 키 (file_id, tag)"""
+    return (item.get('file_id', ''), item.get('tag', ''))
+
+
+class QuestionPool:
+    """(domain, subdomain)별로 미사용 문제를 원본 순서대로 보관하는 인덱스"""
+
+    def __init__(self, items: Iterable[Dict[str, Any]],
+                 predicate: Optional[Callable[[Dict[str, Any]], bool]] = None):
+        """
+        Args:
+            items: 문제 리스트 (순서가 버킷 내 순서가 됨)
+            predicate: 풀에 넣을 문제 조건 (None이면 전부)
+        """
+        # 버킷 → {원본 위치: 문제}
+        self._buckets: Dict[BucketKey, Dict[int, Dict[str, Any]]] = {}
+        # 문제 키 → [(버킷, 원본 위치)]
+        self._positions: Dict[QuestionKey, List[Tuple[BucketKey, int]]] = {}
+        # first_unused용 버킷별 위치 순서와 커서
+        self._order: Dict[BucketKey, List[int]] = {}
+        self._cursor: Dict[BucketKey, int] = {}
+
+        for pos, item in enumerate(items):
+            ds_key = (item.get('domain', ''), item.get('subdomain', ''))
+            # predicate에 걸린 문제만 있는 버킷도 빈 버킷으로 등록 (버킷 존재 여부는 원본 기준)
+            bucket = self._buckets.setdefault(ds_key, {})
+            order = self._order.setdefault(ds_key, [])
+            if predicate is not None and not predicate(item):
+                continue
+            bucket[pos] = item
+            order.append(pos)
+            self._positions.setdefault(question_key(item), []).append((ds_key, pos))
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def __contains__(self, ds_key: Hashable) -> bool:
+        return ds_key in self._buckets
+
+    def bucket_sizes(self) -> Dict[BucketKey, int]:
+        """버킷별 남은 문제 수"""
+        return {ds_key: len(bucket) for ds_key, bucket in self._buckets.items()}
+
+    def available(self, domain: str, subdomain: str,
+                  used_questions: Optional[Set[QuestionKey]] = None) -> List[Dict[str, Any]]:
+        """
+        해당 domain/subdomain의 미사용 문제 (원본 순서)
+
+        take/remove로 사용 처리된 문제는 이미 빠져 있습니다. used_questions는 풀을 거치지 않고
+        사용 처리된 문제가 있을 때만 넘기면 됩니다 (버킷 전체를 다시 검사함).
+        """
+        bucket = self._buckets.get((domain, subdomain))
+        if not bucket:
+            return []
+        if not used_questions:
+            return list(bucket.values())
+        return [item for item in bucket.values() if question_key(item) not in used_questions]
+
+    def remove(self, keys: Iterable[QuestionKey]) -> None:
+        """문제를 풀에서 제거 (같은 키의 중복 항목 포함)"""
+        for key in keys:
+            for ds_key, pos in self._positions.pop(key, ()):
+                self._buckets[ds_key].pop(pos, None)
+
+    def take(self, items: Iterable[Dict[str, Any]], used_questions: Set[QuestionKey]) -> None:
+        """선택한 문제를 used_questions에 등록하고 풀에서 제거"""
+        keys = [question_key(item) for item in items]
+        used_questions.update(keys)
+        self.remove(keys)
+
+    def first_unused(self, domain: str, subdomain: str,
+                     used_questions: Set[QuestionKey]) -> Optional[Tuple[QuestionKey, Dict[str, Any]]]:
+        """
+        해당 domain/subdomain에서 원본 순서상 첫 미사용 문제 (없으면 None)
+
+        사용/제거된 항목은 다시 쓸 수 없으므로 커서를 전진시켜 상각 O(1)로 찾습니다.
+        """
+        ds_key = (domain, subdomain)
+        order = self._order.get(ds_key)
+        if not order:
+            return None
+        bucket = self._buckets[ds_key]
+        cursor = self._cursor.get(ds_key, 0)
+        while cursor < len(order):
+            item = bucket.get(order[cursor])
+            if item is not None:
+                key = question_key(item)
+                if key not in used_questions:
+                    self._cursor[ds_key] = cursor
+                    return key, item
+            cursor += 1
+        self._cursor[ds_key] = cursor
+        return None
@@ -76,6 +76,14 @@ def main():
     # === 시험 생성 (2단계) ===
     exam = parser.add_argument_group('시험 생성 (create_exam)')
     exam.add_argument('--random', action='store_true', help='랜덤 모드 (새로 문제 뽑기)')
+    exam.add_argument('--exam_assembly', type=str, choices=['greedy', 'optimal'], default='greedy',
+                      help='랜덤 모드 구성 방식 (greedy: 과목 순서대로, optimal: 모든 과목 할당량 동시 최적화)')
+    exam.add_argument('--exam_allow_substitution', action='store_true',
+                      help='optimal 구성에서 subdomain 공급 부족 시 같은 domain의 다른 subdomain으로 대체')
+    exam.add_argument('--exam_num_sets', type=int, default=None,
+                      help='랜덤 모드에서 세트별 파생 seed로 1st~Nth 세트를 독립 생성 (4_multiple_exam/{세트}/)')
+    exam.add_argument('--exam_set_workers', type=int, default=1,
+                      help='세트 병렬 생성 워커 프로세스 수 (결과는 워커 수와 무관, 기본값: 1)')
     
     # === 문제 변형 (3단계) ===
     transform = parser.add_argument_group('문제 변형 (transform_questions)')
@@ -91,10 +99,14 @@ def main():
                            help='분류에 사용할 모델 (기본값: openai/gpt-5)')
     transform.add_argument('--transform_classify_batch_size', type=int, default=10,
                            help='분류 배치 크기 (기본값: 10)')
+    transform.add_argument('--transform_classify_rule_fast_path', action='store_true',
+                           help='지시문이 명확한 문제(옳은/옳지 않은/모두 고른 것은?)는 규칙으로 분류하고 나머지만 LLM 분류')
     transform.add_argument('--transform_model', type=str, default='openai/o3',
                            help='변형에 사용할 모델 (기본값: openai/o3)')
     transform.add_argument('--transform_seed', type=int, default=42,
                            help='랜덤 시드 (기본값: 42)')
+    transform.add_argument('--transform_sample_by_domain', action='store_true',
+                           help='정답 개수 그룹(2~5개)을 나눌 때 domain별로도 층화')
     
     # === 변형 시험지 생성 (4단계) ===
     trans_exam = parser.add_argument_group('변형 시험지 생성 (create_transformed_exam)')
@@ -121,6 +133,26 @@ def main():
                           help='O, X 문제 지원 비활성화')
     evaluate.add_argument('--eval_essay', action='store_true',
                           help='서술형 평가(9_multiple_to_essay)도 함께 수행')
+    evaluate.add_argument('--eval_adaptive_batch', action='store_true',
+                          help='모델별 적응형 배치 크기 사용 (--eval_batch_size를 초기값으로 사용)')
+    evaluate.add_argument('--eval_max_batch_size', type=int, default=50,
+                          help='적응형 배치 모드의 최대 배치 크기 (기본값: 50)')
+    evaluate.add_argument('--eval_max_latency', type=float, default=None,
+                          help='적응형 배치 모드: 배치 응답 시간 목표(초), 넘으면 배치 크기를 더 키우지 않음')
+    evaluate.add_argument('--eval_token_budget', action='store_true',
+                          help='고정 개수 대신 예상 토큰 수 기준으로 배치 구성')
+    evaluate.add_argument('--eval_target_ci_width', type=float, default=None,
+                          help='순차 조기 종료 평가: 정확도 95%% 신뢰구간 폭이 이 값 이하가 되면 모델별 중단 (예: 0.04)')
+    evaluate.add_argument('--eval_per_domain_ci', action='store_true',
+                          help='순차 조기 종료 평가에서 domain별 신뢰구간 폭도 함께 확인')
+    evaluate.add_argument('--eval_essay_concurrency', type=int, default=0,
+                          help='서술형 동시 채점: 채점 모델별 최대 동시 호출 수 (기본값: 0=순차 채점)')
+    evaluate.add_argument('--eval_essay_keyword_precheck', action='store_true',
+                          help='서술형 채점: 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략')
+    evaluate.add_argument('--eval_essay_batch_scoring', action='store_true',
+                          help='서술형 채점: 같은 문제의 여러 모델 답변을 한 요청으로 점수 평가')
+    evaluate.add_argument('--eval_report_format', choices=['excel', 'deferred'], default='excel',
+                          help='결과 저장 방식 (deferred: 컬럼 형식 저장소만 기록, 리포트는 report_store로 생성)')
     
     # === 서술형 평가 (6단계) ===
     essay = parser.add_argument_group('서술형 평가 (evaluate_essay)')
@@ -131,6 +163,20 @@ def main():
                        help='서술형 평가 vLLM 서버 모드')
     essay.add_argument('--essay_steps', type=int, nargs='+', choices=[1, 2, 3, 4, 5],
                        help='실행할 단계 번호 (1: 문제선별, 2: 시험분류, 3: 서술형변환, 4: 키워드추출, 5: 모범답안생성)')
+    essay.add_argument('--essay_combined_generation', action='store_true',
+                       help='3~5단계(서술형 변환/키워드/모범답안)를 문제당 1회 호출로 통합 생성')
+    essay.add_argument('--essay_round_concurrency', type=int, default=1,
+                       help='3~5단계를 동시에 처리할 회차 수 및 모델 답변 생성 동시 (모델, 세트) 수 (기본: 1=순차)')
+    essay.add_argument('--essay_llm_concurrency', type=int, default=8,
+                       help='회차 동시 처리 시 모든 회차/모델이 공유하는 LLM 최대 동시 호출 수')
+    essay.add_argument('--essay_filter_batch_size', type=int, default=20,
+                       help='1단계 해설 완전성 판정을 한 요청에 묶을 최대 문제 수 (1이면 문제별 단건 요청)')
+    essay.add_argument('--essay_answer_engine', choices=['api', 'vllm', 'server', 'stub'], default=None,
+                       help='모델 답변 생성 엔진 (생략 시 --essay_server_mode면 vllm, 아니면 api)')
+    essay.add_argument('--essay_server_url', type=str, default=None,
+                       help='OpenAI 호환 서버 주소 (--essay_answer_engine server, 예: http://localhost:8000/v1)')
+    essay.add_argument('--essay_answer_batch_size', type=int, default=16,
+                       help='모델 답변을 한 번에 생성할 문제 수')
     
     args = parser.parse_args()
     
@@ -163,6 +209,10 @@ def main():
         levels=args.levels,
         model=args.model,
         random_mode=args.random,
+        exam_assembly=args.exam_assembly,
+        exam_allow_substitution=args.exam_allow_substitution,
+        exam_num_sets=args.exam_num_sets,
+        exam_set_workers=args.exam_set_workers,
         eval_models=args.eval_models,
         eval_batch_size=args.eval_batch_size,
         eval_use_ox_support=args.eval_use_ox_support,
@@ -171,21 +221,40 @@ def main():
         eval_sets=args.eval_sets,
         eval_transformed=args.eval_transformed,
         eval_essay=args.eval_essay,
+        eval_adaptive_batch=args.eval_adaptive_batch,
+        eval_max_batch_size=args.eval_max_batch_size,
+        eval_token_budget=args.eval_token_budget,
+        eval_max_latency=args.eval_max_latency,
+        eval_target_ci_width=args.eval_target_ci_width,
+        eval_per_domain_ci=args.eval_per_domain_ci,
+        eval_report_format=args.eval_report_format,
+        eval_essay_concurrency=args.eval_essay_concurrency,
+        eval_essay_keyword_precheck=args.eval_essay_keyword_precheck,
+        eval_essay_batch_scoring=args.eval_essay_batch_scoring,
         transform_classified_data_path=args.transform_classified_data_path,
         transform_input_data_path=args.transform_input_data_path,
         transform_run_classify=args.transform_classify,
         transform_classify_model=args.transform_classify_model,
         transform_classify_batch_size=args.transform_classify_batch_size,
+        transform_classify_rule_fast_path=args.transform_classify_rule_fast_path,
         transform_model=args.transform_model,
         transform_wrong_to_right=transform_wrong_to_right,
         transform_right_to_wrong=transform_right_to_wrong,
         transform_abcd=transform_abcd,
         transform_seed=args.transform_seed,
+        transform_sample_by_domain=args.transform_sample_by_domain,
         create_transformed_exam_sets=args.create_transformed_exam_sets,
         essay_models=args.essay_models,
         essay_sets=args.essay_sets,
         essay_use_server_mode=args.essay_use_server_mode,
         essay_steps=args.essay_steps,
+        essay_combined_generation=args.essay_combined_generation,
+        essay_round_concurrency=args.essay_round_concurrency,
+        essay_llm_concurrency=args.essay_llm_concurrency,
+        essay_filter_batch_size=args.essay_filter_batch_size,
+        essay_answer_engine=args.essay_answer_engine,
+        essay_server_url=args.essay_server_url,
+        essay_answer_batch_size=args.essay_answer_batch_size,
         debug=args.debug
     )
     
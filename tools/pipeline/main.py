@@ -116,18 +116,30 @@ class Pipeline(PipelineBase):
                          eval_use_server_mode: bool = False,
                          eval_exam_dir: str = None, eval_sets: List[int] = None,
                          eval_transformed: bool = False, eval_essay: bool = False,
+                         eval_adaptive_batch: bool = False, eval_max_batch_size: int = 50,
+                         eval_token_budget: bool = False, eval_max_latency: float = None,
+                         eval_target_ci_width: float = None, eval_per_domain_ci: bool = False,
+                         eval_report_format: str = 'excel', eval_essay_concurrency: int = 0,
+                         eval_essay_keyword_precheck: bool = False, eval_essay_batch_scoring: bool = False,
                          transform_input_data_path: str = None, transform_questions: List[Dict[str, Any]] = None,
                          transform_classified_data_path: str = None,
                          transform_run_classify: bool = False,
                          transform_classify_model: str = 'openai/gpt-5', transform_classify_batch_size: int = 10,
+                         transform_classify_rule_fast_path: bool = False,
                          transform_model: str = 'openai/o3', transform_wrong_to_right: bool = True,
                          transform_right_to_wrong: bool = True, transform_abcd: bool = True,
-                         transform_seed: int = 42,
+                         transform_seed: int = 42, transform_sample_by_domain: bool = False,
                          create_transformed_exam_sets: List[int] = None,
             essay_models: List[str] = None, essay_sets: List[int] = None,
             essay_use_server_mode: bool = False,
-            essay_steps: List[int] = None,
-            debug: bool = False, random_mode: bool = False) -> Dict[str, Any]:
+            essay_steps: List[int] = None, essay_combined_generation: bool = False,
+            essay_round_concurrency: int = 1, essay_llm_concurrency: int = 8,
+            essay_filter_batch_size: int = 20,
+            essay_answer_engine: str = None, essay_server_url: str = None,
+            essay_answer_batch_size: int = 16,
+            debug: bool = False, random_mode: bool = False,
+            exam_assembly: str = 'greedy', exam_allow_substitution: bool = False,
+            exam_num_sets: int = None, exam_set_workers: int = 1) -> Dict[str, Any]:
         """
         전체 파이프라인 실행
         
@@ -138,6 +150,10 @@ class Pipeline(PipelineBase):
             levels: 처리할 레벨 목록 (1단계에서 사용, None이면 ['Lv2', 'Lv3_4', 'Lv5'])
             model: 도메인 분류에 사용할 LLM 모델 (1단계에서 사용)
             random_mode: 랜덤 모드 (2단계에서 사용, True면 새로 뽑기, False면 저장된 문제 번호 리스트 사용)
+            exam_assembly: 랜덤 모드 구성 방식 (2단계에서 사용, 'greedy' 또는 'optimal')
+            exam_allow_substitution: optimal 구성에서 같은 domain 내 다른 subdomain으로 대체 허용 (2단계에서 사용)
+            exam_num_sets: 랜덤 모드에서 세트별 파생 seed로 독립 생성할 세트 수 (2단계에서 사용, None이면 기존 방식)
+            exam_set_workers: 세트 병렬 생성 워커 프로세스 수 (2단계에서 사용)
             eval_models: 평가할 모델 목록 (6단계에서 사용)
             eval_batch_size: 평가 배치 크기 (6단계에서 사용)
             eval_use_ox_support: O, X 문제 지원 활성화 (6단계에서 사용)
@@ -146,22 +162,41 @@ class Pipeline(PipelineBase):
             eval_sets: 평가할 세트 번호 리스트 (6단계에서 사용, None이면 모든 세트 평가)
             eval_transformed: 변형 시험지 평가 모드 (6단계에서 사용, 기본값: False)
             eval_essay: 서술형 문제 평가 모드 (6단계에서 사용, 기본값: False)
+            eval_adaptive_batch: 모델별 적응형 배치 크기 사용 (6단계에서 사용, 기본값: False)
+            eval_max_batch_size: 적응형 배치 모드의 최대 배치 크기 (6단계에서 사용, 기본값: 50)
+            eval_token_budget: 예상 토큰 수 기준 배치 구성 (6단계에서 사용, 기본값: False)
+            eval_max_latency: 적응형 배치 모드의 배치 응답 시간 목표(초) (6단계에서 사용, 기본값: None=제한 없음)
+            eval_target_ci_width: 순차 조기 종료 평가의 목표 신뢰구간 폭 (6단계에서 사용, 기본값: None=전체 평가)
+            eval_per_domain_ci: 순차 평가에서 domain별 신뢰구간 폭도 함께 확인 (6단계에서 사용, 기본값: False)
+            eval_report_format: 결과 저장 방식 'excel' 또는 'deferred' (6단계에서 사용, 기본값: 'excel')
+            eval_essay_concurrency: 서술형 동시 채점의 채점 모델별 최대 동시 호출 수 (6단계에서 사용, 기본값: 0=순차)
+            eval_essay_keyword_precheck: 서술형 채점 로컬 키워드 사전 확인 (6단계에서 사용, 기본값: False)
+            eval_essay_batch_scoring: 같은 문제의 여러 모델 답변을 한 요청으로 점수 평가 (6단계에서 사용, 기본값: False)
             transform_input_data_path: 변형 입력 데이터 파일 경로 (3단계에서 사용, run_classify가 True일 때)
             transform_questions: 변형 입력 문제 리스트 (3단계에서 사용, run_classify가 True일 때)
             transform_classified_data_path: 이미 분류된 데이터 파일 경로 (3단계에서 사용, run_classify가 False일 때 필수)
             transform_run_classify: 분류 단계 실행 여부 (3단계에서 사용, 기본값: False)
             transform_classify_model: 분류에 사용할 모델 (3단계에서 사용, run_classify가 True일 때만)
             transform_classify_batch_size: 분류 배치 크기 (3단계에서 사용, run_classify가 True일 때만)
+            transform_classify_rule_fast_path: 지시문이 명확한 문제는 규칙으로 분류하고 나머지만 LLM 분류 (3단계에서 사용, run_classify가 True일 때만)
             transform_model: 변형에 사용할 모델 (3단계에서 사용)
             transform_wrong_to_right: wrong -> right 변형 수행 여부 (3단계에서 사용)
             transform_right_to_wrong: right -> wrong 변형 수행 여부 (3단계에서 사용)
             transform_abcd: abcd 변형 수행 여부 (3단계에서 사용)
             transform_seed: 랜덤 시드 (3단계에서 사용)
+            transform_sample_by_domain: 정답 개수 그룹 샘플링 시 domain별로도 층화 (3단계에서 사용)
             create_transformed_exam_sets: 변형 시험지 생성할 세트 번호 리스트 (2단계에서 사용, None이면 1~5 모두 처리)
             essay_models: 모델 답변 생성할 모델 목록 (9단계에서 사용, None이면 답변 생성 안 함)
             essay_sets: 처리할 세트 번호 리스트 (9단계에서 사용, models가 있을 때만 사용, None이면 1~5 모두 처리)
             essay_use_server_mode: vLLM 서버 모드 사용 (9단계에서 사용, models가 있을 때만 사용)
             essay_steps: 실행할 단계 리스트 (9단계에서 사용, 예: [0, 1, 2] 또는 [3] 등). None이면 모든 단계 실행 (0-4)
+            essay_combined_generation: 3~5단계를 문제당 1회 호출로 통합 생성 (9단계에서 사용, 기본값: False)
+            essay_round_concurrency: 동시에 처리할 회차 수 / 답변 생성 (모델, 세트) 수 (9단계에서 사용, 기본값: 1=순차)
+            essay_llm_concurrency: 회차 동시 처리 시 공유하는 LLM 최대 동시 호출 수 (9단계에서 사용, 기본값: 8)
+            essay_filter_batch_size: 해설 완전성 판정 배치 크기 (9단계 1단계에서 사용, 기본값: 20, 1=단건 요청)
+            essay_answer_engine: 모델 답변 생성 엔진 'api'/'vllm'/'server'/'stub' (9단계에서 사용, None이면 essay_use_server_mode로 결정)
+            essay_server_url: OpenAI 호환 서버 주소 (9단계 essay_answer_engine='server'에서 사용)
+            essay_answer_batch_size: 모델 답변을 한 번에 생성할 문제 수 (9단계에서 사용, 기본값: 16)
             debug: 디버그 모드 (기존 파일 백업 및 활용, 기본값: False)
         
         Returns:
@@ -178,7 +213,11 @@ class Pipeline(PipelineBase):
                 results['extract_qna_w_domain'] = self._get_step('step1').execute(cycle, levels=levels, model=model, debug=debug)
             
             if 'create_exam' in steps:
-                results['create_exam'] = self._get_step('step2').execute(seed=transform_seed, transformed=False, debug=debug, random_mode=random_mode)
+                results['create_exam'] = self._get_step('step2').execute(
+                    seed=transform_seed, transformed=False, debug=debug, random_mode=random_mode,
+                    assembly=exam_assembly, allow_substitution=exam_allow_substitution,
+                    num_sets=exam_num_sets, set_workers=exam_set_workers
+                )
             
             if 'evaluate_exams' in steps:
                 results['evaluate_exams'] = self._get_step('step6').execute(
@@ -189,7 +228,17 @@ class Pipeline(PipelineBase):
                     exam_dir=eval_exam_dir,
                     sets=eval_sets,
                     transformed=eval_transformed,
-                    essay=eval_essay
+                    essay=eval_essay,
+                    adaptive_batch=eval_adaptive_batch,
+                    max_batch_size=eval_max_batch_size,
+                    token_budget=eval_token_budget,
+                    max_latency=eval_max_latency,
+                    target_ci_width=eval_target_ci_width,
+                    per_domain_ci=eval_per_domain_ci,
+                    report_format=eval_report_format,
+                    essay_concurrency=eval_essay_concurrency,
+                    essay_keyword_precheck=eval_essay_keyword_precheck,
+                    essay_batch_scoring=eval_essay_batch_scoring
                 )
             
             if 'transform_questions' in steps:
@@ -200,11 +249,13 @@ class Pipeline(PipelineBase):
                     run_classify=transform_run_classify,
                     classify_model=transform_classify_model,
                     classify_batch_size=transform_classify_batch_size,
+                    classify_rule_fast_path=transform_classify_rule_fast_path,
                     transform_model=transform_model,
                     transform_wrong_to_right=transform_wrong_to_right,
                     transform_right_to_wrong=transform_right_to_wrong,
                     transform_abcd=transform_abcd,
-                    seed=transform_seed
+                    seed=transform_seed,
+                    sample_by_domain=transform_sample_by_domain
                 )
             
             if 'create_transformed_exam' in steps:
@@ -219,7 +270,14 @@ class Pipeline(PipelineBase):
                     models=essay_models,
                     sets=essay_sets,
                     use_server_mode=essay_use_server_mode,
-                    steps=essay_steps
+                    steps=essay_steps,
+                    combined_generation=essay_combined_generation,
+                    round_concurrency=essay_round_concurrency,
+                    llm_concurrency=essay_llm_concurrency,
+                    filter_batch_size=essay_filter_batch_size,
+                    answer_engine=essay_answer_engine,
+                    answer_server_url=essay_server_url,
+                    answer_batch_size=essay_answer_batch_size
                 )
             
             results['success'] = True
@@ -11,6 +11,7 @@
     - is_table=false, is_calculation=false 인 문제만 대상
     - random_mode=False: exam_question_lists.json에서 문제 번호 로드 (기본값)
     - random_mode=True: exam_config.json 조건에 맞게 랜덤 선택
+    - num_sets 지정 시: 세트별 파생 seed로 1st~Nth 세트를 서로 독립적으로 생성 (병렬 가능)
 
 변형 시험지 생성 (transformed=True, --eval_transformed 옵션 사용 시):
     - 4_multiple_exam의 각 세트(1st~5th) 시험지의 객관식들을 변형된 문제로 교체
@@ -18,13 +19,14 @@
 
 관련 모듈:
     - tools.exam.exam_create.ExamMaker: 일반 시험지 생성
+    - tools.exam.exam_sets.ExamSetGenerator: 세트별 독립 시험지 생성
     - tools.exam.exam_plus_create.ExamPlusMaker: 변형 시험지 생성
     - tools.report.ExamReportGenerator: 시험 통계 리포트 생성
 """
 
 from typing import Dict, Any, List
 from ..base import PipelineBase
-from tools.exam import ExamMaker, ExamPlusMaker
+from tools.exam import ExamMaker, ExamPlusMaker, ExamSetGenerator
 
 
 class Step2CreateExams(PipelineBase):
@@ -54,7 +56,9 @@ class Step2CreateExams(PipelineBase):
         self._step_log_handler = None
         
     def execute(self, seed: int = 42, transformed: bool = False, sets: List[int] = None, 
-                debug: bool = False, random_mode: bool = False) -> Dict[str, Any]:
+                debug: bool = False, random_mode: bool = False,
+                assembly: str = 'greedy', allow_substitution: bool = False,
+                num_sets: int = None, set_workers: int = 1) -> Dict[str, Any]:
         """
         시험문제 생성 실행
         
@@ -64,6 +68,11 @@ class Step2CreateExams(PipelineBase):
             sets: 변형 시험지 생성 시 처리할 세트 번호 리스트 (None이면 1~5 모두 처리)
             debug: 디버그 모드 (기존 파일 백업 및 활용, 기본값: False)
             random_mode: 랜덤 모드 (True: 새로 뽑기, False: 저장된 문제 번호 리스트 사용, 기본값: False)
+            assembly: 랜덤 모드 구성 방식 ('greedy' 또는 'optimal': 모든 과목 할당량 동시 최적화)
+            allow_substitution: optimal에서 같은 domain 내 다른 subdomain으로 대체 허용
+            num_sets: 랜덤 모드에서 세트별 독립 생성할 세트 수 (None이면 기존 방식 1세트,
+                      sets를 주면 해당 세트만 생성)
+            set_workers: 세트 병렬 생성 워커 프로세스 수 (결과는 워커 수와 무관)
             
         Returns:
             Dict[str, Any]: 생성 결과
@@ -80,8 +89,12 @@ class Step2CreateExams(PipelineBase):
         try:
             if transformed:
                 return self._create_transformed_exams(sets=sets, debug=debug)
+            elif random_mode and num_sets:
+                return self._create_exam_sets(seed=seed, num_sets=num_sets, sets=sets, workers=set_workers,
+                                              assembly=assembly, allow_substitution=allow_substitution)
             else:
-                return self._create_regular_exams(seed=seed, debug=debug, random_mode=random_mode)
+                return self._create_regular_exams(seed=seed, debug=debug, random_mode=random_mode,
+                                                  assembly=assembly, allow_substitution=allow_substitution)
                 
         except Exception as e:
             self.logger.error(f"오류 발생: {e}", exc_info=True)
@@ -89,7 +102,8 @@ class Step2CreateExams(PipelineBase):
         finally:
             self._remove_step_logging()
     
-    def _create_regular_exams(self, seed: int, debug: bool, random_mode: bool) -> Dict[str, Any]:
+    def _create_regular_exams(self, seed: int, debug: bool, random_mode: bool,
+                              assembly: str = 'greedy', allow_substitution: bool = False) -> Dict[str, Any]:
         """
         일반 시험지 생성
         
@@ -97,6 +111,8 @@ class Step2CreateExams(PipelineBase):
             seed: 랜덤 시드 값
             debug: 디버그 모드
             random_mode: 랜덤 모드
+            assembly: 랜덤 모드 구성 방식 ('greedy' / 'optimal')
+            allow_substitution: optimal에서 같은 domain 내 대체 허용
             
         Returns:
             생성 결과 딕셔너리
@@ -105,7 +121,30 @@ class Step2CreateExams(PipelineBase):
         self.logger.info(f"=== 2단계: 일반 시험지 만들기 (seed={seed}, {mode_str}) ===")
         
         maker = ExamMaker(self.onedrive_path, self.logger)
-        return maker.create_exams(seed=seed, debug=debug, random_mode=random_mode)
+        return maker.create_exams(seed=seed, debug=debug, random_mode=random_mode,
+                                  assembly=assembly, allow_substitution=allow_substitution)
+    
+    def _create_exam_sets(self, seed: int, num_sets: int, sets: List[int], workers: int,
+                          assembly: str, allow_substitution: bool) -> Dict[str, Any]:
+        """
+        세트별 독립 시험지 생성
+        
+        Args:
+            seed: 기본 seed (세트별 seed는 여기서 파생)
+            num_sets: 전체 세트 수
+            sets: 생성할 세트 번호 리스트 (None이면 전체)
+            workers: 병렬 워커 프로세스 수
+            assembly: 세트 내 구성 방식
+            allow_substitution: optimal에서 같은 domain 내 대체 허용
+            
+        Returns:
+            생성 결과 딕셔너리
+        """
+        self.logger.info(f"=== 2단계: 세트별 시험지 만들기 (seed={seed}, {num_sets}세트, workers={workers}) ===")
+        
+        generator = ExamSetGenerator(self.onedrive_path, self.logger)
+        return generator.generate(num_sets=num_sets, seed=seed, sets=sets, workers=workers,
+                                  assembly=assembly, allow_substitution=allow_substitution)
     
     def _create_transformed_exams(self, sets: List[int], debug: bool) -> Dict[str, Any]:
         """
@@ -63,11 +63,13 @@ class Step3TransformQuestions(PipelineBase):
                 input_data_path: str = None, questions: List[Dict[str, Any]] = None,
                 run_classify: bool = False,
                 classify_model: str = 'openai/gpt-5', classify_batch_size: int = 10,
+                classify_rule_fast_path: bool = False,
                 transform_model: str = 'openai/o3', 
                 transform_wrong_to_right: bool = True,
                 transform_right_to_wrong: bool = True,
                 transform_abcd: bool = True,
-                seed: int = 42) -> Dict[str, Any]:
+                seed: int = 42,
+                sample_by_domain: bool = False) -> Dict[str, Any]:
         """
         객관식 문제 변형 실행
         
@@ -78,11 +80,13 @@ class Step3TransformQuestions(PipelineBase):
             run_classify: 분류 단계 실행 여부
             classify_model: 분류에 사용할 LLM 모델
             classify_batch_size: 분류 배치 크기
+            classify_rule_fast_path: 지시문이 명확한 문제는 규칙으로 판정하고 나머지만 LLM 분류
             transform_model: 변형에 사용할 LLM 모델
             transform_wrong_to_right: wrong → right 변형 수행 여부
             transform_right_to_wrong: right → wrong 변형 수행 여부
             transform_abcd: abcd 변형 수행 여부
             seed: 랜덤 시드
+            sample_by_domain: 정답 개수 그룹 샘플링 시 domain별로도 층화
             
         Returns:
             Dict[str, Any]: 변형 결과
@@ -104,11 +108,13 @@ class Step3TransformQuestions(PipelineBase):
                 run_classify=run_classify,
                 classify_model=classify_model,
                 classify_batch_size=classify_batch_size,
+                classify_rule_fast_path=classify_rule_fast_path,
                 transform_model=transform_model,
                 transform_wrong_to_right=transform_wrong_to_right,
                 transform_right_to_wrong=transform_right_to_wrong,
                 transform_abcd=transform_abcd,
-                seed=seed
+                seed=seed,
+                sample_by_domain=sample_by_domain
             )
         except Exception as e:
             self.logger.error(f"오류 발생: {e}", exc_info=True)
@@ -44,6 +44,8 @@ try:
         calculate_statistics,
     )
     from tools.evaluation.essay_utils import load_best_answers, setup_llm_with_api_key
+    from tools.evaluation.report_store import save_results_store, store_path_for
+    from tools.evaluation.essay_grading_graph import ConcurrentEssayGrader
 except ImportError:
     run_eval_pipeline = None
     load_data_from_directory = None
@@ -54,6 +56,9 @@ except ImportError:
     calculate_statistics = None
     load_best_answers = None
     setup_llm_with_api_key = None
+    save_results_store = None
+    store_path_for = None
+    ConcurrentEssayGrader = None
 
 
 class Step6Evaluate(PipelineBase):
@@ -141,7 +146,13 @@ class Step6Evaluate(PipelineBase):
     def execute(self, models: List[str] = None, batch_size: int = 10, 
                 use_ox_support: bool = True, use_server_mode: bool = False,
                 exam_dir: str = None, sets: List[int] = None, 
-                transformed: bool = False, essay: bool = False) -> Dict[str, Any]:
+                transformed: bool = False, essay: bool = False,
+                adaptive_batch: bool = False, max_batch_size: int = 50,
+                token_budget: bool = False, max_latency: float = None,
+                target_ci_width: float = None,
+                per_domain_ci: bool = False, report_format: str = 'excel',
+                essay_concurrency: int = 0, essay_keyword_precheck: bool = False,
+                essay_batch_scoring: bool = False) -> Dict[str, Any]:
         """
         6단계: 시험지 평가
         - 만들어진 시험지(1st/2nd/3rd/4th/5th) 모델별 답변 평가
@@ -156,6 +167,17 @@ class Step6Evaluate(PipelineBase):
             sets: 평가할 세트 번호 리스트 (None이면 모든 세트 평가, 예: [1] 또는 [1, 2, 3])
             transformed: 변형 시험지 평가 모드 (True면 8_multiple_exam_+ 사용, False면 4_multiple_exam 사용)
             essay: 서술형 문제 평가 모드 (True면 9_multiple_to_essay 평가 수행)
+            adaptive_batch: 모델별 적응형 배치 크기 사용 (batch_size를 초기값으로 사용)
+            max_batch_size: 적응형 배치 모드의 최대 배치 크기
+            token_budget: 고정 개수 대신 예상 토큰 수 기준으로 배치 구성 (adaptive_batch와 함께 쓰면 배치 크기 상한)
+            max_latency: 적응형 배치 모드에서 배치 응답 시간 목표(초). 넘으면 배치 크기를 더 키우지 않음 (None이면 제한 없음)
+            target_ci_width: 지정 시 순차 조기 종료 평가 (정확도 신뢰구간 폭이 이 값 이하가 되면 모델별 중단)
+            per_domain_ci: 순차 평가에서 domain별 신뢰구간 폭도 target_ci_width 이하가 되어야 중단
+            report_format: 결과 저장 방식 ('excel': 평가 직후 Excel 생성, 'deferred': 컬럼 형식 저장소만 기록하고
+                           리포트는 report_store로 필요할 때 생성)
+            essay_concurrency: 서술형 채점 동시 실행 시 채점 모델별 최대 동시 호출 수 (0이면 순차 채점)
+            essay_keyword_precheck: 서술형 채점에서 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략
+            essay_batch_scoring: 서술형 채점에서 같은 문제의 여러 모델 답변을 한 요청으로 점수 평가
         """
         self.logger.info(f"=== 6단계: 시험지 평가 (배치 크기: {batch_size}) ===")
         
@@ -235,7 +257,13 @@ class Step6Evaluate(PipelineBase):
                         use_ox_support=use_ox_support,
                         api_key=api_key,
                         output_base_dir=output_dir,
-                        transformed=transformed
+                        transformed=transformed,
+                        adaptive_batch=adaptive_batch,
+                        max_batch_size=max_batch_size,
+                        token_budget=token_budget,
+                        max_latency=max_latency,
+                        target_ci_width=target_ci_width,
+                        per_domain_ci=per_domain_ci
                     )
                     
                     # 결과 출력
@@ -274,7 +302,12 @@ class Step6Evaluate(PipelineBase):
                         output_filename = f"{exam_name}_evaluation_{models_str}.xlsx"
                         output_path = os.path.join(set_output_dir, output_filename)
                     
-                    if save_results_to_excel:
+                    if report_format == 'deferred' and save_results_store:
+                        output_path = save_results_store(
+                            df_all, pred_long, acc, models,
+                            store_path_for(output_path), transformed
+                        )
+                    elif save_results_to_excel:
                         save_results_to_excel(
                             df_all, pred_wide, acc, pred_long,
                             output_path
@@ -422,7 +455,13 @@ class Step6Evaluate(PipelineBase):
                         use_ox_support=use_ox_support,
                         api_key=api_key,
                         output_base_dir=output_dir,
-                        transformed=actual_transformed
+                        transformed=actual_transformed,
+                        adaptive_batch=adaptive_batch,
+                        max_batch_size=max_batch_size,
+                        token_budget=token_budget,
+                        max_latency=max_latency,
+                        target_ci_width=target_ci_width,
+                        per_domain_ci=per_domain_ci
                     )
                     
                     # 결과 출력
@@ -447,7 +486,13 @@ class Step6Evaluate(PipelineBase):
                         output_path = os.path.join(set_output_dir, output_filename)
                     
                     # 통합 결과 저장 (subject/domain/subdomain별 정확도 포함)
-                    if save_combined_results_to_excel:
+                    if report_format == 'deferred' and save_results_store:
+                        # 저장소만 기록 (리포트: python -m tools.evaluation.report_store report --store ...)
+                        output_path = save_results_store(
+                            df_all, pred_long, acc, models,
+                            store_path_for(output_path), actual_transformed
+                        )
+                    elif save_combined_results_to_excel:
                         save_combined_results_to_excel(
                             df_all, pred_wide, acc, pred_long,
                             models, output_path, actual_transformed
@@ -482,7 +527,8 @@ class Step6Evaluate(PipelineBase):
             
             # essay=True일 때 서술형 문제 평가 수행
             if essay:
-                essay_results = self._evaluate_essay(models, sets)
+                essay_results = self._evaluate_essay(models, sets, essay_concurrency, essay_keyword_precheck,
+                                                     essay_batch_scoring)
                 all_results['essay'] = essay_results
             
             return {
@@ -497,13 +543,18 @@ class Step6Evaluate(PipelineBase):
         finally:
             self._remove_step_logging()
     
-    def _evaluate_essay(self, models: List[str], sets: Optional[List[int]] = None) -> Dict[str, Any]:
+    def _evaluate_essay(self, models: List[str], sets: Optional[List[int]] = None,
+                        concurrency: int = 0, keyword_precheck: bool = False,
+                        batch_scoring: bool = False) -> Dict[str, Any]:
         """
         서술형 문제 평가 수행
         
         Args:
             models: 평가할 모델 목록
             sets: 평가할 세트 번호 리스트 (None이면 모든 세트)
+            concurrency: 0보다 크면 모든 (모델, 세트, 문제)를 동시 채점 (채점 모델별 최대 동시 호출 수)
+            keyword_precheck: 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략
+            batch_scoring: 같은 문제의 여러 모델 답변을 한 요청으로 점수 평가 (작업 그래프 경로 사용)
             
         Returns:
             Dict[str, Any]: 서술형 평가 결과
@@ -545,6 +596,41 @@ class Step6Evaluate(PipelineBase):
             essay_output_dir = os.path.join(essay_base_dir, 'evaluation_results')
             os.makedirs(essay_output_dir, exist_ok=True)
             
+            # 동시 채점 / 배치 채점: 모든 (모델, 세트) 조합을 하나의 작업 그래프로 실행
+            if (concurrency > 0 or batch_scoring) and ConcurrentEssayGrader:
+                concurrency = max(concurrency, 1)
+                question_files = {}
+                for set_num in sets_to_evaluate:
+                    set_name = self.SET_NAMES[set_num]
+                    question_file = os.path.join(
+                        essay_base_dir, 'questions', f'essay_questions_{set_name}.json'
+                    )
+                    if not os.path.exists(question_file):
+                        self.logger.warning(f"서술형 문제 파일을 찾을 수 없습니다: {question_file}")
+                        continue
+                    question_files[set_num] = question_file
+                
+                grader = ConcurrentEssayGrader(
+                    llm,
+                    keyword_check_model='google/gemini-2.5-flash',
+                    scoring_model='google/gemini-3-pro-preview',
+                    keyword_concurrency=concurrency,
+                    scoring_concurrency=concurrency,
+                    keyword_precheck=keyword_precheck,
+                    batch_scoring=batch_scoring
+                )
+                graded = grader.grade_models(models, question_files, best_answers_dict)
+                for (model_name, set_num), (_, detailed_results, stats) in graded.items():
+                    eval_result = self._save_essay_results(
+                        model_name, set_num, self.SET_NAMES[set_num],
+                        detailed_results, stats, essay_output_dir
+                    )
+                    results['evaluated'].append(eval_result)
+                
+                results['success'] = True
+                self.logger.info("서술형 문제 평가 완료 (동시 채점)")
+                return results
+            
             # 각 모델과 세트 조합에 대해 평가 수행
             for set_num in sets_to_evaluate:
                 set_name = self.SET_NAMES[set_num]
@@ -561,7 +647,7 @@ class Step6Evaluate(PipelineBase):
                 for model_name in models:
                     eval_result = self._evaluate_essay_single_model(
                         model_name, set_num, set_name, question_file,
-                        best_answers_dict, essay_output_dir
+                        best_answers_dict, essay_output_dir, keyword_precheck
                     )
                     if eval_result:
                         results['evaluated'].append(eval_result)
@@ -603,7 +689,8 @@ class Step6Evaluate(PipelineBase):
     
     def _evaluate_essay_single_model(
         self, model_name: str, set_num: int, set_name: str,
-        question_file: str, best_answers_dict: Dict, output_dir: str
+        question_file: str, best_answers_dict: Dict, output_dir: str,
+        keyword_precheck: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         단일 모델에 대한 서술형 평가 수행
@@ -615,6 +702,7 @@ class Step6Evaluate(PipelineBase):
             question_file: 문제 파일 경로
             best_answers_dict: 모범답안 딕셔너리
             output_dir: 결과 저장 디렉토리
+            keyword_precheck: 로컬 키워드 매칭으로 명확한 경우 키워드 확인 LLM 호출 생략
             
         Returns:
             평가 결과 딕셔너리 또는 None
@@ -628,47 +716,61 @@ class Step6Evaluate(PipelineBase):
                 keyword_check_model='google/gemini-2.5-flash',
                 scoring_model='google/gemini-3-pro-preview',
                 set_num=set_num,
-                best_answers_dict=best_answers_dict
+                best_answers_dict=best_answers_dict,
+                keyword_precheck=keyword_precheck
             )
             
             if evaluation_results is None:
                 self.logger.warning(f"모델 {model_name} 세트 {set_num} 평가 결과가 없습니다.")
                 return None
             
-            # 파일명 생성
-            model_safe_name = model_name.replace("/", "_")
-            set_suffix = f"_set{set_num}"
-            
-            # 상세 결과 저장
-            detailed_output_file = os.path.join(
-                output_dir, f'{model_safe_name}{set_suffix}_detailed_results.json'
-            )
-            with open(detailed_output_file, 'w', encoding='utf-8') as f:
-                json.dump(detailed_results, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"상세 결과 저장: {detailed_output_file}")
-            
-            # 통계 저장
-            stats_output_file = os.path.join(
-                output_dir, f'{model_safe_name}{set_suffix}_statistics.json'
+            return self._save_essay_results(
+                model_name, set_num, set_name, detailed_results, stats, output_dir
             )
-            stats_for_save = dict(stats)
-            if 'keyword_avg_scores' in stats_for_save:
-                stats_for_save['keyword_avg_scores'] = dict(stats['keyword_avg_scores'])
-            with open(stats_output_file, 'w', encoding='utf-8') as f:
-                json.dump(stats_for_save, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"통계 저장: {stats_output_file}")
-            
-            return {
-                'model': model_name,
-                'set_num': set_num,
-                'set_name': set_name,
-                'detailed_file': detailed_output_file,
-                'stats_file': stats_output_file
-            }
             
         except Exception as e:
             self.logger.error(f"서술형 평가 오류 (모델: {model_name}, 세트: {set_num}): {e}")
             import traceback
             self.logger.error(traceback.format_exc())
             return None
-
+    
+    def _save_essay_results(
+        self, model_name: str, set_num: int, set_name: str,
+        detailed_results: List[Dict[str, Any]], stats: Dict[str, Any], output_dir: str
+    ) -> Dict[str, Any]:
+        """
+        서술형 평가 결과(상세 결과 / 통계) 저장
+        
+        Returns:
+            저장된 파일 정보 딕셔너리
+        """
+        # 파일명 생성
+        model_safe_name = model_name.replace("/", "_")
+        set_suffix = f"_set{set_num}"
+        
+        # 상세 결과 저장
+        detailed_output_file = os.path.join(
+            output_dir, f'{model_safe_name}{set_suffix}_detailed_results.json'
+        )
+        with open(detailed_output_file, 'w', encoding='utf-8') as f:
+            json.dump(detailed_results, f, ensure_ascii=False, indent=2)
+        self.logger.info(f"상세 결과 저장: {detailed_output_file}")
+        
+        # 통계 저장
+        stats_output_file = os.path.join(
+            output_dir, f'{model_safe_name}{set_suffix}_statistics.json'
+        )
+        stats_for_save = dict(stats)
+        if 'keyword_avg_scores' in stats_for_save:
+            stats_for_save['keyword_avg_scores'] = dict(stats['keyword_avg_scores'])
+        with open(stats_output_file, 'w', encoding='utf-8') as f:
+            json.dump(stats_for_save, f, ensure_ascii=False, indent=2)
+        self.logger.info(f"통계 저장: {stats_output_file}")
+        
+        return {
+            'model': model_name,
+            'set_num': set_num,
+            'set_name': set_name,
+            'detailed_file': detailed_output_file,
+            'stats_file': stats_output_file
+        }
@@ -19,6 +19,8 @@ import os
 import json
 import logging
 import random
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 from ..base import PipelineBase
 
@@ -30,11 +32,14 @@ try:
         change_question_to_essay,
         extract_keywords,
         create_best_answers,
+        generate_essay_combined,
         process_essay_questions,
         get_api_key,
+        release_answer_engines,
         ROUND_NUMBER_TO_FOLDER,
     )
     from tools.core.llm_query import LLMQuery
+    from tools.core.rate_budget import RateBudget, BudgetedLLM
 except ImportError as e:
     # 디버깅을 위해 에러 로깅
     import traceback
@@ -45,10 +50,14 @@ except ImportError as e:
     change_question_to_essay = None
     extract_keywords = None
     create_best_answers = None
+    generate_essay_combined = None
     classify_essay_by_exam_main = None
     process_essay_questions = None
     get_api_key = None
+    release_answer_engines = None
     LLMQuery = None
+    RateBudget = None
+    BudgetedLLM = None
     ROUND_NUMBER_TO_FOLDER = {'1': '1st', '2': '2nd', '3': '3rd', '4': '4th', '5': '5th'}
 
 
@@ -61,7 +70,11 @@ class Step9MultipleEssay(PipelineBase):
         self._step_log_handler = None
     
     def execute(self, models: List[str] = None, sets: List[int] = None,
-                use_server_mode: bool = False, steps: List[int] = None) -> Dict[str, Any]:
+                use_server_mode: bool = False, steps: List[int] = None,
+                combined_generation: bool = False, round_concurrency: int = 1,
+                llm_concurrency: int = 8, filter_batch_size: int = 20,
+                answer_engine: str = None, answer_server_url: str = None,
+                answer_batch_size: int = 16) -> Dict[str, Any]:
         """
         9단계: 객관식 문제를 서술형 문제로 변환
         
@@ -75,6 +88,16 @@ class Step9MultipleEssay(PipelineBase):
                 3단계: 서술형 문제로 변환
                 4단계: 키워드 추출
                 5단계: 모범답안 생성
+            combined_generation: 요청한 3~5단계 필드를 문제당 1회 호출(서술형 문제 + 키워드 + 모범답안)로 통합 생성
+                (지정하지 않은 단계의 필드는 기존 단계별 출력 유지)
+                (검증 실패 필드만 기존 단계 함수로 다시 생성)
+            round_concurrency: 3~5단계를 동시에 처리할 회차 수 및 모델 답변 생성의 동시 (모델, 세트) 수
+                (1이면 순차 실행, 서버 모드 답변 생성은 항상 순차). 한 회차의 실패는 다른 회차에 영향을 주지 않음
+            llm_concurrency: round_concurrency > 1일 때 모든 회차/모델이 공유하는 LLM 최대 동시 호출 수
+            filter_batch_size: 1단계에서 한 요청으로 판정할 최대 문제 수 (1이면 문제별 단건 요청)
+            answer_engine: 모델 답변 생성 엔진 ('api', 'vllm', 'server', 'stub', None이면 use_server_mode로 결정)
+            answer_server_url: OpenAI 호환 서버 주소 (answer_engine='server')
+            answer_batch_size: 모델 답변을 한 번에 생성할 문제 수 (엔진은 세트 간 재사용)
         
         Returns:
             dict: 실행 결과
@@ -125,6 +148,8 @@ class Step9MultipleEssay(PipelineBase):
             
             total_questions = 0
             output_files = []
+            # 회차/모델을 동시에 처리할 때 모든 스레드가 공유하는 LLM 호출 예산
+            budget = RateBudget(max_concurrent=llm_concurrency) if (RateBudget and round_concurrency > 1) else None
             
             # 1단계: 해설이 많은 문제 선별
             if 1 in steps:
@@ -133,7 +158,8 @@ class Step9MultipleEssay(PipelineBase):
                     count = filter_full_explanation(
                         llm=self.llm_query,
                         onedrive_path=self.onedrive_path,
-                        log_func=self.logger.info
+                        log_func=self.logger.info,
+                        batch_size=filter_batch_size
                     )
                     self.logger.info(f"1단계 완료: 총 {count}개의 문제 선별")
                 except Exception as e:
@@ -160,107 +186,37 @@ class Step9MultipleEssay(PipelineBase):
                     self.logger.error(traceback.format_exc())
                     return {'success': False, 'error': f'2단계 오류: {str(e)}'}
             
-            # 3단계: 서술형 문제로 변환
-            if 3 in steps:
-                self.logger.info("3단계: 서술형 문제로 변환 중...")
-                if change_question_to_essay is None:
-                    self.logger.error("essay.change_question_to_essay 함수를 import할 수 없습니다.")
-                    return {'success': False, 'error': 'essay_change_question_to_essay import 실패'}
+            # 3~5단계: 회차별 처리 (2단계 분류 이후 회차 간 독립이므로 동시 실행 가능)
+            round_steps = [s for s in steps if s in (3, 4, 5)]
+            round_results = {}
+            failed_rounds = []
+            if round_steps:
+                import_error = self._check_round_step_imports(round_steps, combined_generation)
+                if import_error:
+                    return import_error
                 
-                step3_total = 0
-                for round_number in round_numbers:
-                    round_folder = ROUND_NUMBER_TO_FOLDER[round_number]
-                    input_file = os.path.join(essay_dir, 'questions', f'essay_questions_{round_folder}.json')
-                    
-                    if not os.path.exists(input_file):
-                        self.logger.warning(f"입력 파일을 찾을 수 없습니다: {input_file}, 건너뜁니다.")
-                        continue
-                    
-                    self.logger.info(f"{round_number} 회차 3단계 처리 중...")
-                    try:
-                        count = change_question_to_essay(
-                            llm=self.llm_query,
-                            onedrive_path=self.onedrive_path,
-                            log_func=self.logger.info,
-                            round_number=round_number
-                        )
-                        step3_total += count
-                    except Exception as e:
-                        self.logger.error(f"{round_number} 회차 3단계 오류: {e}")
-                        import traceback
-                        self.logger.error(traceback.format_exc())
-                        continue
-                
-                self.logger.info(f"3단계 완료: 총 {step3_total}개의 문제 처리")
-            
-            # 4단계: 키워드 추출
-            if 4 in steps:
-                self.logger.info("4단계: 키워드 추출 중...")
-                if extract_keywords is None:
-                    self.logger.error("essay.extract_keywords 함수를 import할 수 없습니다.")
-                    return {'success': False, 'error': 'essay_extract_keywords import 실패'}
-                
-                step4_total = 0
-                for round_number in round_numbers:
-                    round_folder = ROUND_NUMBER_TO_FOLDER[round_number]
-                    input_file = os.path.join(essay_dir, 'questions', f'essay_questions_{round_folder}_서술형문제로변환.json')
-                    
-                    if not os.path.exists(input_file):
-                        self.logger.warning(f"입력 파일을 찾을 수 없습니다: {input_file}, 건너뜁니다.")
-                        continue
-                    
-                    self.logger.info(f"{round_number} 회차 4단계 처리 중...")
-                    try:
-                        count = extract_keywords(
-                            llm=self.llm_query,
-                            onedrive_path=self.onedrive_path,
-                            log_func=self.logger.info,
-                            round_number=round_number
-                        )
-                        step4_total += count
-                    except Exception as e:
-                        self.logger.error(f"{round_number} 회차 4단계 오류: {e}")
-                        import traceback
-                        self.logger.error(traceback.format_exc())
-                        continue
-                
-                self.logger.info(f"4단계 완료: 총 {step4_total}개의 문제 처리")
-            
-            # 5단계: 모범답안 생성
-            if 5 in steps:
-                self.logger.info("5단계: 모범답안 생성 중...")
-                if create_best_answers is None:
-                    self.logger.error("essay.create_best_answers 함수를 import할 수 없습니다.")
-                    return {'success': False, 'error': 'essay_create_best_answers import 실패'}
+                llm = BudgetedLLM(self.llm_query, budget) if budget else self.llm_query
+                mode = "통합 생성" if combined_generation else f"{round_steps}단계"
+                self.logger.info(f"회차별 {mode} 처리 중... (회차 동시 실행: {round_concurrency}, "
+                                 f"LLM 동시 호출: {llm_concurrency})")
                 
-                step5_total = 0
+                round_results = self._run_rounds(
+                    round_numbers, round_steps, combined_generation, llm, essay_dir, round_concurrency
+                )
                 for round_number in round_numbers:
-                    round_folder = ROUND_NUMBER_TO_FOLDER[round_number]
-                    input_file = os.path.join(essay_dir, 'questions', f'essay_questions_w_keyword_{round_folder}_서술형답변에서키워드추출.json')
-                    output_file = os.path.join(essay_dir, 'answers', f'best_ans_{round_folder}.json')
-                    
-                    if not os.path.exists(input_file):
-                        self.logger.warning(f"입력 파일을 찾을 수 없습니다: {input_file}, 건너뜁니다.")
-                        continue
-                    
-                    self.logger.info(f"{round_number} 회차 5단계 처리 중...")
-                    try:
-                        count = create_best_answers(
-                            llm=self.llm_query,
-                            onedrive_path=self.onedrive_path,
-                            log_func=self.logger.info,
-                            round_number=round_number
-                        )
-                        step5_total += count
-                        output_files.append(output_file)
-                    except Exception as e:
-                        self.logger.error(f"{round_number} 회차 5단계 오류: {e}")
-                        import traceback
-                        self.logger.error(traceback.format_exc())
-                        continue
+                    result = round_results[round_number]
+                    if result.get('output_file'):
+                        output_files.append(result['output_file'])
+                # 최종 단계(5단계)의 처리 문제 수
+                if 5 in round_steps:
+                    total_questions = sum(r['counts'].get(5, 0) for r in round_results.values())
                 
-                total_questions = step5_total
-                self.logger.info(f"5단계 완료: 총 {step5_total}개의 문제 처리")
+                failed_rounds = [r for r in round_numbers if not round_results[r]['success']]
+                for step in round_steps:
+                    step_total = sum(r['counts'].get(step, 0) for r in round_results.values())
+                    self.logger.info(f"{step}단계 완료: 총 {step_total}개의 문제 처리")
+                if failed_rounds:
+                    self.logger.warning(f"실패한 회차: {failed_rounds} (다른 회차 결과는 유지됨)")
             
             # 모델 답변 생성 (선택적, steps와 별개)
             if models:
@@ -274,9 +230,11 @@ class Step9MultipleEssay(PipelineBase):
                 if sets is None:
                     sets = [1, 2, 3, 4, 5]
                 
-                # API 키 읽기 (서버 모드가 아닐 때만 필요)
+                engine_mode = answer_engine or ('vllm' if use_server_mode else 'api')
+                
+                # API 키 읽기 (OpenRouter 엔진일 때만 필요)
                 api_key = None
-                if not use_server_mode:
+                if engine_mode == 'api':
                     if get_api_key:
                         api_key = get_api_key()
                     else:
@@ -293,48 +251,41 @@ class Step9MultipleEssay(PipelineBase):
                             elif config.has_option("OPENROUTER", "key"):
                                 api_key = config.get("OPENROUTER", "key")
                 
-                # 각 모델과 세트 조합에 대해 답변 생성
-                for model_name in models:
-                    for set_num in sets:
-                        round_number = str(set_num)
-                        round_folder = ROUND_NUMBER_TO_FOLDER.get(round_number, '1st')
-                        
-                        # 각 회차별 파일에서 데이터 로드 (4단계 출력 파일 사용)
-                        input_file = os.path.join(
-                            essay_dir, 'questions', f'essay_questions_w_keyword_{round_folder}_서술형답변에서키워드추출.json'
-                        )
-                        
-                        if not os.path.exists(input_file):
-                            self.logger.warning(f"파일을 찾을 수 없습니다: {input_file}")
-                            continue
-                        
-                        self.logger.info(f"모델 {model_name} 세트 {round_number} 답변 생성 중...")
-                        with open(input_file, 'r', encoding='utf-8') as f:
-                            full_explanation = json.load(f)
-                        
-                        # seed 고정하여 랜덤으로 150문제 추출 (각 회차마다 독립적으로)
-                        random.seed(42)
-                        selected_questions = random.sample(full_explanation, min(150, len(full_explanation)))
-                        self.logger.info(f"선택된 문제 수: {len(selected_questions)}개 (전체: {len(full_explanation)}개)")
-                        
-                        try:
-                            process_essay_questions(
-                                model_name, round_number, round_folder, 
-                                selected_questions, api_key, use_server_mode
-                            )
-                            self.logger.info(f"답변 생성 완료: 모델 {model_name}, 세트 {round_number}")
-                        except Exception as e:
-                            self.logger.error(f"모델 {model_name} 세트 {round_number} 답변 생성 중 오류: {e}")
-                            import traceback
-                            self.logger.error(traceback.format_exc())
-                            continue
+                # 모델별로 세트를 이어서 처리하므로 엔진(로드된 모델)이 세트 간 재사용됨
+                jobs = [(model_name, set_num) for model_name in models for set_num in sets]
+                answer_options = {'engine_mode': engine_mode, 'server_url': answer_server_url,
+                                  'batch_size': answer_batch_size}
+                # 로컬 vLLM은 GPU에 모델을 하나씩 올리므로 순차 실행
+                workers = 1 if engine_mode == 'vllm' else max(1, round_concurrency)
+                try:
+                    if workers == 1:
+                        answer_failures = [job for job in jobs
+                                           if not self._generate_model_answers(*job, essay_dir, api_key,
+                                                                               use_server_mode, budget,
+                                                                               answer_options)]
+                    else:
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            futures = {
+                                executor.submit(self._generate_model_answers, model_name, set_num, essay_dir,
+                                                api_key, use_server_mode, budget,
+                                                answer_options): (model_name, set_num)
+                                for model_name, set_num in jobs
+                            }
+                            answer_failures = [futures[f] for f in as_completed(futures) if not f.result()]
+                finally:
+                    if release_answer_engines:
+                        release_answer_engines()
+                if answer_failures:
+                    self.logger.warning(f"답변 생성 실패 (모델, 세트): {sorted(answer_failures)}")
             
             self.logger.info("=== 9단계 완료 ===")
             
             return {
                 'success': True,
                 'total_questions': total_questions,
-                'output_files': output_files
+                'output_files': output_files,
+                'round_results': round_results,
+                'failed_rounds': failed_rounds
             }
             
         except Exception as e:
@@ -344,3 +295,171 @@ class Step9MultipleEssay(PipelineBase):
             return {'success': False, 'error': f'변환 오류: {str(e)}'}
         finally:
             self._remove_step_logging()
+    
+    def _check_round_step_imports(self, round_steps: List[int],
+                                  combined_generation: bool) -> Optional[Dict[str, Any]]:
+        """3~5단계 함수 import 확인 (실패 시 결과 dict 반환)"""
+        if combined_generation:
+            required = [('generate_combined', generate_essay_combined)]
+        else:
+            required = [
+                (name, func) for step, name, func in (
+                    (3, 'change_question_to_essay', change_question_to_essay),
+                    (4, 'extract_keywords', extract_keywords),
+                    (5, 'create_best_answers', create_best_answers),
+                ) if step in round_steps
+            ]
+        for name, func in required:
+            if func is None:
+                self.logger.error(f"essay.{name} 함수를 import할 수 없습니다.")
+                return {'success': False, 'error': f'essay_{name} import 실패'}
+        return None
+    
+    def _round_logger(self, round_number: str):
+        """
+        회차별 로거 생성
+        
+        step 로거의 하위 로거라 콘솔/9단계 로그에도 기록되며,
+        회차별 로그 파일(step9_multiple_essay_round{N}.log)에 따로 남습니다.
+        """
+        round_logger = logging.getLogger(f"{self.logger.name}.step9.round{round_number}")
+        round_logger.setLevel(logging.INFO)
+        handler = None
+        try:
+            from tools import SFAICENTER_PATH
+            log_dir = os.path.join(SFAICENTER_PATH, 'logs')
+            os.makedirs(log_dir, exist_ok=True)
+            handler = logging.FileHandler(
+                os.path.join(log_dir, f'step9_multiple_essay_round{round_number}.log'),
+                mode='a', encoding='utf-8'
+            )
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            round_logger.addHandler(handler)
+        except Exception as e:
+            self.logger.warning(f"{round_number} 회차 로그 파일 생성 실패: {e}")
+        return round_logger, handler
+    
+    def _run_round(self, round_number: str, round_steps: List[int], combined_generation: bool,
+                   llm, essay_dir: str) -> Dict[str, Any]:
+        """
+        회차 1개의 3~5단계 실행 (예외는 이 회차 안에서만 처리)
+        
+        Returns:
+            dict: round, success, counts({단계: 문제 수}, 통합 생성은 요청한 단계 모두 기록), output_file, error
+        """
+        round_folder = ROUND_NUMBER_TO_FOLDER[round_number]
+        result = {'round': round_number, 'success': True, 'counts': {}, 'output_file': None, 'error': None}
+        round_logger, handler = self._round_logger(round_number)
+        prefix = f"[{round_number}회차]"
+        
+        def log_func(message):
+            round_logger.info(f"{prefix} {message}")
+        
+        questions_dir = os.path.join(essay_dir, 'questions')
+        output_file = os.path.join(essay_dir, 'answers', f'best_ans_{round_folder}.json')
+        if combined_generation:
+            # 요청한 단계의 필드만 생성하고 나머지 필드는 기존 단계별 출력을 유지
+            plan = [(tuple(round_steps), partial(generate_essay_combined, steps=round_steps),
+                     f'essay_questions_{round_folder}.json')]
+        else:
+            plan = [
+                ((step,), func, input_name) for step, func, input_name in (
+                    (3, change_question_to_essay, f'essay_questions_{round_folder}.json'),
+                    (4, extract_keywords, f'essay_questions_{round_folder}_서술형문제로변환.json'),
+                    (5, create_best_answers, f'essay_questions_w_keyword_{round_folder}_서술형답변에서키워드추출.json'),
+                ) if step in round_steps
+            ]
+        
+        try:
+            for step_group, func, input_name in plan:
+                input_file = os.path.join(questions_dir, input_name)
+                if not os.path.exists(input_file):
+                    round_logger.warning(f"{prefix} 입력 파일을 찾을 수 없습니다: {input_file}, 건너뜁니다.")
+                    continue
+                
+                step_label = "통합 생성" if combined_generation else f"{step_group[0]}단계"
+                log_func(f"{step_label} 처리 중...")
+                try:
+                    count = func(
+                        llm=llm,
+                        onedrive_path=self.onedrive_path,
+                        log_func=log_func,
+                        round_number=round_number
+                    )
+                except Exception as e:
+                    # 이 회차의 이후 단계는 이전 단계 출력에 의존하므로 중단 (다른 회차는 계속 진행)
+                    import traceback
+                    round_logger.error(f"{prefix} {step_label} 오류: {e}")
+                    round_logger.error(traceback.format_exc())
+                    result.update({'success': False, 'error': f'{step_label} 오류: {str(e)}'})
+                    break
+                for step in step_group:
+                    result['counts'][step] = count
+                if 5 in step_group:
+                    result['output_file'] = output_file
+        finally:
+            if handler:
+                round_logger.removeHandler(handler)
+                handler.close()
+        return result
+    
+    def _run_rounds(self, round_numbers: List[str], round_steps: List[int], combined_generation: bool,
+                    llm, essay_dir: str, round_concurrency: int = 1) -> Dict[str, Dict[str, Any]]:
+        """회차별 3~5단계 실행 (round_concurrency > 1이면 회차를 동시에 처리)"""
+        if round_concurrency <= 1 or len(round_numbers) <= 1:
+            return {r: self._run_round(r, round_steps, combined_generation, llm, essay_dir)
+                    for r in round_numbers}
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(round_concurrency, len(round_numbers))) as executor:
+            futures = {
+                executor.submit(self._run_round, r, round_steps, combined_generation, llm, essay_dir): r
+                for r in round_numbers
+            }
+            for future in as_completed(futures):
+                round_number = futures[future]
+                try:
+                    results[round_number] = future.result()
+                except Exception as e:
+                    results[round_number] = {'round': round_number, 'success': False, 'counts': {},
+                                             'output_file': None, 'error': str(e)}
+        return results
+    
+    def _generate_model_answers(self, model_name: str, set_num: int, essay_dir: str, api_key: Optional[str],
+                                use_server_mode: bool, rate_budget=None,
+                                answer_options: Optional[Dict[str, Any]] = None) -> bool:
+        """(모델, 세트) 1개의 답변 생성. 실패해도 예외를 올리지 않고 False 반환"""
+        round_number = str(set_num)
+        round_folder = ROUND_NUMBER_TO_FOLDER.get(round_number, '1st')
+        
+        # 각 회차별 파일에서 데이터 로드 (4단계 출력 파일 사용)
+        input_file = os.path.join(
+            essay_dir, 'questions', f'essay_questions_w_keyword_{round_folder}_서술형답변에서키워드추출.json'
+        )
+        
+        if not os.path.exists(input_file):
+            self.logger.warning(f"파일을 찾을 수 없습니다: {input_file}")
+            return True
+        
+        self.logger.info(f"모델 {model_name} 세트 {round_number} 답변 생성 중...")
+        with open(input_file, 'r', encoding='utf-8') as f:
+            full_explanation = json.load(f)
+        
+        # seed 고정하여 랜덤으로 150문제 추출 (각 회차마다 독립적으로, 스레드 간 전역 난수 상태 공유 방지)
+        selected_questions = random.Random(42).sample(full_explanation, min(150, len(full_explanation)))
+        self.logger.info(f"선택된 문제 수: {len(selected_questions)}개 (전체: {len(full_explanation)}개)")
+        
+        try:
+            process_essay_questions(
+                model_name, round_number, round_folder,
+                selected_questions, api_key, use_server_mode,
+                rate_budget=rate_budget,
+                **(answer_options or {})
+            )
+            self.logger.info(f"답변 생성 완료: 모델 {model_name}, 세트 {round_number}")
+            return True
+        except Exception as e:
+            self.logger.error(f"모델 {model_name} 세트 {round_number} 답변 생성 중 오류: {e}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+            return False
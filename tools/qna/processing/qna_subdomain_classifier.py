@@ -44,11 +44,15 @@ logger = setup_logger(
 )
 from tools.core.llm_query import LLMQuery
 from tools.core.exam_config import ExamConfig
+from tools.core.token_packer import TokenBudgetPacker
 
 
 class QnASubdomainClassifier:
     """Q&A 도메인/서브도메인 분류기 (API 호출만 담당)"""
     
+    # 토큰 예산 배치 시 문제당 예상 출력 토큰 (qna_id/domain/subdomain/reason JSON 객체)
+    OUTPUT_TOKENS_PER_ITEM = 120
+    
     def __init__(self, config_path: str = None, onedrive_path: str = None, logger=None):
         """Q&A 도메인/서브도메인 분류기 초기화
         
@@ -217,9 +221,22 @@ class QnASubdomainClassifier:
         
         return updated_questions, failed_questions
 
+    def _make_batches(self, questions: List[Dict[str, Any]], batch_size: int,
+                      model: str, token_budget: bool) -> List[List[Dict[str, Any]]]:
+        """문제를 배치로 나누기 (고정 개수 또는 토큰 예산 기준)"""
+        if not token_budget:
+            return [questions[i:i + batch_size] for i in range(0, len(questions), batch_size)]
+        
+        packer = TokenBudgetPacker.for_model(model, output_tokens_per_item=self.OUTPUT_TOKENS_PER_ITEM)
+        batches = packer.pack(questions, lambda q: self._create_user_prompt([q]), fixed_text=self.system_prompt)
+        fixed_calls = (len(questions) + batch_size - 1) // batch_size
+        self.logger.info(f"토큰 예산 배치: {len(batches)}회 호출 (고정 {batch_size}개 배치 대비 {fixed_calls - len(batches)}회 절감)")
+        return batches
+
     def classify_questions(self, questions: List[Dict[str, Any]], 
                           batch_size: int = 10, 
-                          model: str = "x-ai/grok-4-fast") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+                          model: str = "x-ai/grok-4-fast",
+                          token_budget: bool = False) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         문제들을 배치 단위로 API 호출하여 분류
         
@@ -227,6 +244,7 @@ class QnASubdomainClassifier:
             questions: 분류할 문제 리스트
             batch_size: 배치 크기
             model: 사용할 모델
+            token_budget: True면 고정 개수 대신 예상 토큰 수 기준으로 배치 구성
             
         Returns:
             (updated_questions, failed_questions): 분류된 문제와 실패한 문제
@@ -240,9 +258,8 @@ class QnASubdomainClassifier:
         all_updated = []
         all_failed = []
         
-        for i in tqdm(range(0, len(questions), batch_size), desc="API 분류 중"):
-            batch = questions[i:i + batch_size]
-            batch_num = i // batch_size + 1
+        batches = self._make_batches(questions, batch_size, model, token_budget)
+        for batch_num, batch in enumerate(tqdm(batches, desc="API 분류 중"), 1):
             
             self.logger.info(f"배치 {batch_num} 처리 중... ({len(batch)}개 문제)")
             
@@ -330,6 +347,7 @@ def main():
     parser.add_argument('--model', type=str, default='x-ai/grok-4-fast', help='사용할 모델')
     parser.add_argument('--batch_size', type=int, default=10, help='배치 크기')
     parser.add_argument('--onedrive_path', type=str, default=None, help='OneDrive 경로')
+    parser.add_argument('--token_budget', action='store_true', help='토큰 예산 기준 배치 구성')
     
     args = parser.parse_args()
     
@@ -344,7 +362,8 @@ def main():
     updated, failed = classifier.classify_questions(
         questions=questions,
         model=args.model,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        token_budget=args.token_budget
     )
     
     logger.info(f"완료! 성공: {len(updated) - len(failed)}개, 실패: {len(failed)}개")
@@ -4,13 +4,18 @@
 QnA 통계 분석 클래스
 - workbook_data 하위의 extracted_qna.json 파일들을 분석하여
 - qna_domain/qna_type별 통계를 확인
+- 파일별 집계(map)를 병렬로 계산해 원본 옆 캐시({파일}.qnastats)에 저장하고,
+  (크기, mtime, 도메인 목록) 지문이 같으면 다시 파싱하지 않고 합칩니다(reduce)
 """
 
 import os
 import glob
 import re
+import json
+import hashlib
 from collections import defaultdict
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 from tools.core.utils import JSONHandler
@@ -25,14 +30,25 @@ class QnAStatisticsAnalyzer:
         '내부통제', '영업', '디지털', '자산운용', '리스크관리', '보험계약', '보상처리'
     }
     
-    def __init__(self, base_path: str, logger: Optional[logging.Logger] = None):
+    # 파일별 집계 캐시 확장자 / 형식 버전
+    CACHE_EXT = '.qnastats'
+    CACHE_VERSION = 1
+    
+    def __init__(self, base_path: str, logger: Optional[logging.Logger] = None,
+                 workers: int = 1, use_cache: bool = True):
         """
         Args:
             base_path: 분석할 데이터가 있는 기본 경로 (workbook_data)
             logger: 로거 인스턴스
+            workers: 캐시에 없는 파일을 집계할 프로세스 수 (1이면 순차)
+            use_cache: 파일별 집계 캐시 사용 여부
         """
         self.base_path = base_path
         self.logger = logger or logging.getLogger(__name__)
+        self.workers = workers
+        self.use_cache = use_cache
+        self.cache_hits = 0
+        self.cache_misses = 0
         
     def find_extracted_qna_files(self) -> List[str]:
         """workbook_data 하위의 모든 extracted_qna.json 파일을 찾습니다."""
@@ -63,12 +79,10 @@ class QnAStatisticsAnalyzer:
         matches = re.findall(pattern, question_text)
         return matches[0] if matches else None
         
-    def analyze(self) -> Dict[str, Any]:
-        """QnA 파일들을 분석하여 통계를 생성합니다."""
-        files = self.find_extracted_qna_files()
-        self.logger.info(f"분석할 파일 수: {len(files)}")
-        
-        stats = {
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """analyze() 결과와 같은 구조의 빈 통계"""
+        return {
             'total_files': 0,
             'total_qna_items': 0,
             'valid_domain_items': 0,
@@ -81,99 +95,219 @@ class QnAStatisticsAnalyzer:
             'invalid_domain_details': defaultdict(list),
             'ss_pattern_details': defaultdict(list)
         }
+    
+    def cache_path(self, file_path: str) -> str:
+        """파일별 집계 캐시 경로 (원본 옆)"""
+        return file_path + self.CACHE_EXT
+    
+    def fingerprint(self, file_path: str) -> List[Any]:
+        """캐시 무효화 지문: 형식 버전, 원본 크기/mtime, 유효 도메인 목록 해시"""
+        st = os.stat(file_path)
+        domains = hashlib.sha1('|'.join(sorted(self.VALID_DOMAINS)).encode('utf-8')).hexdigest()[:12]
+        return [self.CACHE_VERSION, st.st_size, st.st_mtime_ns, domains]
+    
+    def analyze_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        파일 1개 집계 (map 단계)
         
-        for file_path in files:
-            self.logger.debug(f"Processing: {file_path}")
-            try:
-                data = JSONHandler.load(file_path)
-            except Exception as e:
-                self.logger.error(f"Error loading {file_path}: {e}")
+        Returns:
+            JSON으로 저장 가능한 파일별 집계 (로드 실패/빈 파일이면 None 값의 'items')
+        """
+        data = JSONHandler.load(file_path)
+        if data is None:
+            return {'items': None}
+        
+        file_id = os.path.basename(file_path).replace('_extracted_qna.json', '')
+        partial = {
+            'items': 0,
+            'valid': 0,
+            'invalid': 0,
+            'qna_domain_stats': {},
+            'qna_type_stats': {},
+            'domain_type_combination': {},
+            'domain_type_details': {},
+            'invalid_domain_details': {},
+            'ss_pattern_details': {}
+        }
+        
+        for item in data:
+            if not isinstance(item, dict):
                 continue
             
-            if data is None:
-                continue
-                
-            stats['total_files'] += 1
-            file_id = os.path.basename(file_path).replace('_extracted_qna.json', '')
-            file_qna_count = 0
-            file_valid_domain_count = 0
-            file_invalid_domain_count = 0
+            partial['items'] += 1
+            
+            qna_domain = item.get('qna_domain', '')
+            qna_type = item.get('qna_type', 'Unknown')
+            question_text = item.get('qna_data', {}).get('description', {}).get('question', '')
+            
+            # 빈 도메인을 ""로 명시
+            if not qna_domain or qna_domain.strip() == '':
+                qna_domain = ''
             
-            for item in data:
-                if not isinstance(item, dict):
-                    continue
-                    
-                stats['total_qna_items'] += 1
-                file_qna_count += 1
+            short_question = question_text[:100] + '...' if len(question_text) > 100 else question_text
+            
+            # 도메인 유효성 검사
+            if self.is_valid_domain(qna_domain):
+                partial['valid'] += 1
                 
-                qna_domain = item.get('qna_domain', '')
-                qna_type = item.get('qna_type', 'Unknown')
-                question_text = item.get('qna_data', {}).get('description', {}).get('question', '')
+                # 기본 통계
+                partial['qna_domain_stats'][qna_domain] = partial['qna_domain_stats'].get(qna_domain, 0) + 1
+                partial['qna_type_stats'][qna_type] = partial['qna_type_stats'].get(qna_type, 0) + 1
                 
-                # 빈 도메인을 ""로 명시
-                if not qna_domain or qna_domain.strip() == '':
-                    qna_domain = ''
+                # 도메인-타입 조합 통계
+                combination = partial['domain_type_combination'].setdefault(qna_domain, {})
+                combination[qna_type] = combination.get(qna_type, 0) + 1
                 
-                # 도메인 유효성 검사
-                if self.is_valid_domain(qna_domain):
-                    stats['valid_domain_items'] += 1
-                    file_valid_domain_count += 1
-                    
-                    # 기본 통계
-                    stats['qna_domain_stats'][qna_domain] += 1
-                    stats['qna_type_stats'][qna_type] += 1
-                    
-                    # 도메인-타입 조합 통계
-                    stats['domain_type_combination'][qna_domain][qna_type] += 1
-                    
-                    # 상세 정보 저장 (파일별)
-                    stats['domain_type_details'][qna_domain][qna_type].append({
-                        'file_id': file_id,
-                        'title': item.get('title', ''),
-                        'chapter': item.get('chapter', ''),
-                        'page': item.get('page', ''),
-                        'qna_reason': item.get('qna_reason', ''),
-                        'question': question_text[:100] + '...' if len(question_text) > 100 else question_text
-                    })
-                else:
-                    stats['invalid_domain_items'] += 1
-                    file_invalid_domain_count += 1
-                    
-                    # SS 패턴 추출
-                    ss_pattern = self.extract_ss_pattern_from_question(question_text)
-                    
-                    # 유효하지 않은 도메인 상세 정보 저장
-                    stats['invalid_domain_details'][qna_domain].append({
+                # 상세 정보 저장 (파일별)
+                partial['domain_type_details'].setdefault(qna_domain, {}).setdefault(qna_type, []).append({
+                    'file_id': file_id,
+                    'title': item.get('title', ''),
+                    'chapter': item.get('chapter', ''),
+                    'page': item.get('page', ''),
+                    'qna_reason': item.get('qna_reason', ''),
+                    'question': short_question
+                })
+            else:
+                partial['invalid'] += 1
+                
+                # SS 패턴 추출
+                ss_pattern = self.extract_ss_pattern_from_question(question_text)
+                
+                # 유효하지 않은 도메인 상세 정보 저장
+                partial['invalid_domain_details'].setdefault(qna_domain, []).append({
+                    'file_id': file_id,
+                    'title': item.get('title', ''),
+                    'chapter': item.get('chapter', ''),
+                    'page': item.get('page', ''),
+                    'qna_reason': item.get('qna_reason', ''),
+                    'question': short_question,
+                    'ss_pattern': ss_pattern,
+                    'original_domain': qna_domain,
+                    'qna_type': qna_type
+                })
+                
+                # SS 패턴별 그룹화
+                if ss_pattern:
+                    partial['ss_pattern_details'].setdefault(ss_pattern, []).append({
                         'file_id': file_id,
-                        'title': item.get('title', ''),
-                        'chapter': item.get('chapter', ''),
-                        'page': item.get('page', ''),
-                        'qna_reason': item.get('qna_reason', ''),
-                        'question': question_text[:100] + '...' if len(question_text) > 100 else question_text,
-                        'ss_pattern': ss_pattern,
-                        'original_domain': qna_domain,
-                        'qna_type': qna_type
+                        'domain': qna_domain,
+                        'type': qna_type,
+                        'question': short_question
                     })
-                    
-                    # SS 패턴별 그룹화
-                    if ss_pattern:
-                        stats['ss_pattern_details'][ss_pattern].append({
-                            'file_id': file_id,
-                            'domain': qna_domain,
-                            'type': qna_type,
-                            'question': question_text[:100] + '...' if len(question_text) > 100 else question_text
-                        })
-            
-            stats['file_stats'].append({
-                'file_id': file_id,
-                'file_path': file_path,
-                'qna_count': file_qna_count,
-                'valid_domain_count': file_valid_domain_count,
-                'invalid_domain_count': file_invalid_domain_count
-            })
+        
+        return partial
+    
+    def load_cached(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """지문이 일치하는 캐시된 파일별 집계 (없거나 오래되었으면 None)"""
+        cache_file = self.cache_path(file_path)
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('fingerprint') == self.fingerprint(file_path):
+                return cached['partial']
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+    
+    def save_cached(self, file_path: str, fingerprint: List[Any], partial: Dict[str, Any]) -> None:
+        """파일별 집계 캐시 저장 (임시 파일에 쓴 뒤 교체, 실패해도 분석은 계속)"""
+        cache_file = self.cache_path(file_path)
+        tmp_file = cache_file + '.tmp'
+        try:
+            # json.dump(파일)은 조각 단위로 write하므로 문자열로 만든 뒤 한 번에 씀
+            payload = json.dumps({'fingerprint': fingerprint, 'partial': partial}, ensure_ascii=False, separators=(',', ':'))
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.debug(f"캐시 저장 실패 {cache_file}: {e}")
+    
+    def _compute_partial(self, file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """파일별 집계 계산 + 캐시 저장 → (집계, 오류 메시지)"""
+        try:
+            # 읽기 전에 지문을 잡아 두어, 집계 중 파일이 바뀌면 다음 실행에서 다시 계산되게 함
+            fingerprint = self.fingerprint(file_path)
+            partial = self.analyze_file(file_path)
+        except Exception as e:
+            return None, str(e)
+        if self.use_cache:
+            self.save_cached(file_path, fingerprint, partial)
+        return partial, None
+    
+    def _merge_partial(self, stats: Dict[str, Any], file_path: str, partial: Dict[str, Any]) -> None:
+        """파일별 집계를 전체 통계에 합침 (reduce 단계, 파일 순서대로 호출)"""
+        stats['total_files'] += 1
+        stats['total_qna_items'] += partial['items']
+        stats['valid_domain_items'] += partial['valid']
+        stats['invalid_domain_items'] += partial['invalid']
+        
+        for domain, count in partial['qna_domain_stats'].items():
+            stats['qna_domain_stats'][domain] += count
+        for qna_type, count in partial['qna_type_stats'].items():
+            stats['qna_type_stats'][qna_type] += count
+        for domain, types in partial['domain_type_combination'].items():
+            for qna_type, count in types.items():
+                stats['domain_type_combination'][domain][qna_type] += count
+        for domain, types in partial['domain_type_details'].items():
+            for qna_type, details in types.items():
+                stats['domain_type_details'][domain][qna_type].extend(details)
+        for domain, details in partial['invalid_domain_details'].items():
+            stats['invalid_domain_details'][domain].extend(details)
+        for ss_pattern, details in partial['ss_pattern_details'].items():
+            stats['ss_pattern_details'][ss_pattern].extend(details)
+        
+        stats['file_stats'].append({
+            'file_id': os.path.basename(file_path).replace('_extracted_qna.json', ''),
+            'file_path': file_path,
+            'qna_count': partial['items'],
+            'valid_domain_count': partial['valid'],
+            'invalid_domain_count': partial['invalid']
+        })
+    
+    def analyze(self) -> Dict[str, Any]:
+        """QnA 파일들을 분석하여 통계를 생성합니다 (파일별 집계 캐시 + 병렬 map, 파일 순서대로 reduce)."""
+        files = self.find_extracted_qna_files()
+        self.logger.info(f"분석할 파일 수: {len(files)}")
+        
+        partials: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for file_path in files:
+            cached = self.load_cached(file_path) if self.use_cache else None
+            if cached is None:
+                pending.append(file_path)
+            else:
+                partials[file_path] = cached
+        self.cache_hits = len(files) - len(pending)
+        self.cache_misses = len(pending)
+        
+        if self.workers > 1 and len(pending) > 1:
+            tasks = [(self.base_path, self.use_cache, file_path) for file_path in pending]
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                outcomes = list(executor.map(_analyze_file_worker, tasks, chunksize=8))
+        else:
+            outcomes = [self._compute_partial(file_path) for file_path in pending]
+        
+        for file_path, (partial, error) in zip(pending, outcomes):
+            if error is not None:
+                self.logger.error(f"Error loading {file_path}: {error}")
+                continue
+            partials[file_path] = partial
+        
+        if self.use_cache:
+            self.logger.info(f"파일별 집계 캐시: 재사용 {self.cache_hits}개, 새로 계산 {self.cache_misses}개")
+        
+        stats = self._empty_stats()
+        for file_path in files:
+            partial = partials.get(file_path)
+            if partial is None or partial['items'] is None:
+                continue
+            self.logger.debug(f"Processing: {file_path}")
+            self._merge_partial(stats, file_path, partial)
         
         return stats
-
+    
     def save_report(self, stats: Dict[str, Any], output_file: str):
         """
         상세 보고서를 마크다운 파일로 저장합니다.
@@ -184,3 +318,29 @@ class QnAStatisticsAnalyzer:
         QnAReportGenerator.save_report(stats, output_file)
         self.logger.info(f"상세 마크다운 보고서가 저장되었습니다: {output_file}")
 
+
+
+def _analyze_file_worker(task: Tuple[str, bool, str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """프로세스 워커: 파일 1개 집계 (+ 캐시 저장)"""
+    base_path, use_cache, file_path = task
+    return QnAStatisticsAnalyzer(base_path, use_cache=use_cache)._compute_partial(file_path)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='QnA 통계 분석 (파일별 집계 캐시 + 병렬 처리)')
+    parser.add_argument('base_path', help='workbook_data 경로')
+    parser.add_argument('--output', type=str, default='qna_statistics.md', help='리포트 파일 경로 (기본값: qna_statistics.md)')
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                        help='캐시에 없는 파일을 집계할 프로세스 수 (기본값: CPU 수, 최대 8)')
+    parser.add_argument('--no_cache', action='store_true', help='파일별 집계 캐시를 쓰지 않고 모두 다시 파싱')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    analyzer = QnAStatisticsAnalyzer(args.base_path, workers=args.workers, use_cache=not args.no_cache)
+    stats = analyzer.analyze()
+    analyzer.save_report(stats, args.output)
+
+
+if __name__ == '__main__':
+    main()
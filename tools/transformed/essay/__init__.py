@@ -9,7 +9,9 @@ essay 패키지 - 서술형 문제 변환 기능
 - change_question_to_essay: 서술형 문제로 변환
 - extract_keywords: 키워드 추출
 - create_best_answers: 모범답안 생성
+- generate_essay_combined: 서술형 문제 + 키워드 + 모범답안 통합 생성 (문제당 1회 호출)
 - generate_essay_answers: 모델 답변 생성
+- get_answer_engine: 모델 답변 생성 엔진 (OpenRouter / 로컬 vLLM / OpenAI 호환 서버 / stub, 회차 간 재사용)
 
 사용 예시:
     # Step9에서 개별 함수 사용
@@ -39,21 +41,34 @@ from .filter_full_explanation import filter_full_explanation
 from .classify_by_exam import main as classify_by_exam
 
 # 1단계: 서술형 문제로 변환
-from .change_question_to_essay import change_question_to_essay
+from .change_question_to_essay import change_question_to_essay, convert_question
 
 # 2단계: 키워드 추출
-from .extract_keywords import extract_keywords
+from .extract_keywords import extract_keywords, extract_question_keywords
 
 # 3단계: 모범답안 생성
-from .create_best_answers import create_best_answers
+from .create_best_answers import create_best_answers, create_best_answer
+
+# 1~3단계 통합 생성
+from .generate_combined import generate_essay_combined, generate_combined_fields, compare_generation_cost
 
 # 모델 답변 생성
 try:
     from .create_model_answers import generate_essay_answers, process_essay_questions, get_api_key
+    from .answer_engines import (
+        AnswerEngine,
+        StubEngine,
+        get_answer_engine,
+        release_answer_engines,
+    )
 except ImportError:
     generate_essay_answers = None
     process_essay_questions = None
     get_api_key = None
+    AnswerEngine = None
+    StubEngine = None
+    get_answer_engine = None
+    release_answer_engines = None
 
 
 __all__ = [
@@ -71,9 +86,19 @@ __all__ = [
     'change_question_to_essay',
     'extract_keywords',
     'create_best_answers',
+    'convert_question',
+    'extract_question_keywords',
+    'create_best_answer',
+    'generate_essay_combined',
+    'generate_combined_fields',
+    'compare_generation_cost',
     # 모델 답변 생성
     'generate_essay_answers',
     'process_essay_questions',
     'get_api_key',
+    'AnswerEngine',
+    'StubEngine',
+    'get_answer_engine',
+    'release_answer_engines',
 ]
 
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서술형 모델 답변 생성 엔진
+
+process_essay_questions가 회차마다 LLMQuery를 새로 만들고 vLLM 모델을 다시 올린 뒤
+문제를 1개씩 생성하던 방식을 대체합니다. 엔진은 generate(system_prompt, user_prompts)로
+여러 답변을 한 번에 생성하며, get_answer_engine으로 만든 엔진은 (방식, 모델)별로 캐시되어
+여러 회차에서 같은 모델 핸들을 재사용합니다.
+
+엔진 종류:
+    - api: OpenRouter (LLMQuery.query_openrouter를 스레드 풀로 동시 호출)
+    - vllm: 로컬 vLLM 엔진 (LLMQuery.load_vllm_model 1회, query_vllm_batch로 배치 생성)
+    - server: OpenAI 호환 서버 (예: `vllm serve <model>`로 띄운 서버, 동시 요청)
+    - stub: 모델 없이 CPU에서 동작하는 결정적 엔진 (파이프라인 점검용)
+
+사용 예시:
+    engine = get_answer_engine('Qwen/Qwen3-8B', mode='vllm')
+    answers = engine.generate(system_prompt, user_prompts)
+    release_answer_engines()   # GPU 메모리 해제
+"""
+
+import abc
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from tools.core.llm_query import LLMQuery
+from tools.core.rate_budget import BudgetedLLM
+
+
+ENGINE_MODES = ('api', 'vllm', 'server', 'stub')
+
+
+def clean_generated_text(text: str) -> str:
+    """생성 결과 정리 (<think> 블록, gpt-oss assistantfinal 접두부 제거)"""
+    if not isinstance(text, str):
+        return text
+    text = re.sub(r"<think>.*?</think>\s*", "", text, flags=re.DOTALL)
+    match = re.search(r"assistantfinal(.*)$", text, flags=re.DOTALL)
+    return (match.group(1) if match else text).strip()
+
+
+class AnswerEngine(abc.ABC):
+    """답변 생성 엔진 기본 클래스"""
+
+    mode = ''
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @abc.abstractmethod
+    def generate(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        """user_prompts 순서대로 답변 생성"""
+
+    def close(self) -> None:
+        """엔진이 잡고 있는 자원 해제"""
+
+
+class OpenRouterEngine(AnswerEngine):
+    """OpenRouter API 엔진 (배치 내 요청을 동시에 전송)"""
+
+    mode = 'api'
+
+    def __init__(self, model: str, api_key: Optional[str] = None, max_workers: int = 8, rate_budget=None):
+        super().__init__(model)
+        llm = LLMQuery(api_key=api_key)
+        self.llm = BudgetedLLM(llm, rate_budget) if rate_budget is not None else llm
+        self.max_workers = max(1, max_workers)
+
+    def _query(self, system_prompt: str, user_prompt: str) -> str:
+        return self.llm.query_openrouter(system_prompt, user_prompt, model_name=self.model)
+
+    def generate(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        if self.max_workers == 1 or len(user_prompts) <= 1:
+            return [self._query(system_prompt, p) for p in user_prompts]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(user_prompts))) as executor:
+            return list(executor.map(lambda p: self._query(system_prompt, p), user_prompts))
+
+
+class VLLMEngine(AnswerEngine):
+    """로컬 vLLM 엔진 (모델은 생성 시 1회 로드, 배치 단위로 generate)"""
+
+    mode = 'vllm'
+
+    def __init__(self, model: str, config_path: Optional[str] = None):
+        super().__init__(model)
+        # vLLM 모드는 OpenRouter를 쓰지 않지만 LLMQuery 초기화에 설정 파일이 필요
+        self.llm = LLMQuery(config_path=config_path)
+        print(f"[VLLM] 모델 로드 중: {model}")
+        self.llm.load_vllm_model(model)
+        print(f"[VLLM] 모델 로드 완료: {model}")
+
+    def generate(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        return self.llm.query_vllm_batch(system_prompt, user_prompts)
+
+    def close(self) -> None:
+        self.llm.llm = None
+        self.llm.tokenizer = None
+        self.llm.sampling_params = None
+        try:
+            import gc
+            import torch
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+
+class OpenAIServerEngine(AnswerEngine):
+    """OpenAI 호환 서버 엔진 (vllm serve 등, 배치 내 요청을 동시에 전송)"""
+
+    mode = 'server'
+
+    def __init__(self, model: str, base_url: str, api_key: Optional[str] = None, max_workers: int = 16,
+                 temperature: Optional[float] = None, max_tokens: Optional[int] = None):
+        super().__init__(model)
+        from openai import OpenAI
+        self.client = OpenAI(api_key=api_key or 'EMPTY', base_url=base_url)
+        self.max_workers = max(1, max_workers)
+        self.params = {k: v for k, v in (('temperature', temperature), ('max_tokens', max_tokens))
+                       if v is not None}
+
+    def _query(self, system_prompt: str, user_prompt: str) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            **self.params
+        )
+        return clean_generated_text(response.choices[0].message.content)
+
+    def generate(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        if self.max_workers == 1 or len(user_prompts) <= 1:
+            return [self._query(system_prompt, p) for p in user_prompts]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(user_prompts))) as executor:
+            return list(executor.map(lambda p: self._query(system_prompt, p), user_prompts))
+
+
+class StubEngine(AnswerEngine):
+    """
+    모델 없이 동작하는 결정적 엔진
+
+    user_prompt의 '서술형 질문:'과 '키워드:' 줄로 키워드를 모두 포함한 답변을 만듭니다.
+    GPU/API 없이 답변 파일 형식, 회차 처리, 채점 파이프라인을 점검할 때 사용합니다.
+    """
+
+    mode = 'stub'
+
+    def __init__(self, model: str = 'stub'):
+        super().__init__(model)
+        self.calls = 0
+        self.batches: List[int] = []
+
+    @staticmethod
+    def _field(user_prompt: str, label: str) -> str:
+        match = re.search(rf"{label}:\s*(.*)", user_prompt)
+        return match.group(1).strip() if match else ''
+
+    def generate(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        self.calls += 1
+        self.batches.append(len(user_prompts))
+        answers = []
+        for user_prompt in user_prompts:
+            question = self._field(user_prompt, '서술형 질문')
+            keywords = self._field(user_prompt, '키워드')
+            answers.append(f"[{self.model}] {question} 핵심 개념은 {keywords}이다.")
+        return answers
+
+
+# (방식, 모델, 엔진 설정) → 엔진 (회차 간 재사용)
+_ENGINE_CACHE: Dict[Tuple, AnswerEngine] = {}
+_ENGINE_LOCK = threading.Lock()
+
+
+def _engine_key(mode: str, model: str, api_key: Optional[str], server_url: Optional[str],
+                max_workers: int, rate_budget, config_path: Optional[str]) -> Tuple:
+    """
+    엔진 캐시 키: 엔진 동작에 영향을 주는 설정이 다르면 다른 엔진
+
+    API 키는 원문 대신 해시로 보관하고, RateBudget은 객체 단위로 구분합니다.
+    (캐시된 엔진이 RateBudget을 참조하므로 id가 재사용되지 않음)
+    """
+    key_digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest() if api_key else None
+    if mode == 'vllm':
+        return (mode, model, config_path)
+    if mode == 'stub':
+        return (mode, model)
+    if mode == 'server':
+        return (mode, model, server_url, key_digest, max_workers)
+    return (mode, model, key_digest, max_workers, id(rate_budget) if rate_budget is not None else None)
+
+
+def get_answer_engine(model: str, mode: str = 'api', api_key: Optional[str] = None,
+                      server_url: Optional[str] = None, max_workers: int = 8,
+                      rate_budget=None, config_path: Optional[str] = None) -> AnswerEngine:
+    """
+    캐시된 답변 엔진 반환 (없으면 생성)
+
+    vllm 엔진은 GPU에 모델을 하나만 올리므로, 다른 모델의 vllm 엔진을 요청하면
+    기존 vllm 엔진을 먼저 해제합니다.
+
+    Args:
+        model: 모델 이름 (vllm은 로컬 모델 경로 가능)
+        mode: 'api' / 'vllm' / 'server' / 'stub'
+        api_key: OpenRouter API 키 (api) 또는 서버 키 (server)
+        server_url: OpenAI 호환 서버 주소 (server, 예: http://localhost:8000/v1)
+        max_workers: api/server 엔진의 배치 내 동시 요청 수
+        rate_budget: api 엔진이 다른 스레드와 공유할 RateBudget
+        config_path: llm_config.ini 경로 (vllm)
+    """
+    if mode not in ENGINE_MODES:
+        raise ValueError(f"지원하지 않는 엔진: {mode} (가능: {', '.join(ENGINE_MODES)})")
+    key = _engine_key(mode, model, api_key, server_url, max_workers, rate_budget, config_path)
+    with _ENGINE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is not None:
+            return engine
+
+        if mode == 'vllm':
+            for other in [k for k in _ENGINE_CACHE if k[0] == 'vllm']:
+                _ENGINE_CACHE.pop(other).close()
+            engine = VLLMEngine(model, config_path=config_path)
+        elif mode == 'server':
+            if not server_url:
+                raise ValueError("server 엔진에는 server_url이 필요합니다.")
+            engine = OpenAIServerEngine(model, server_url, api_key=api_key, max_workers=max_workers)
+        elif mode == 'stub':
+            engine = StubEngine(model)
+        else:
+            engine = OpenRouterEngine(model, api_key=api_key, max_workers=max_workers, rate_budget=rate_budget)
+        _ENGINE_CACHE[key] = engine
+        return engine
+
+
+def release_answer_engines(mode: Optional[str] = None) -> None:
+    """캐시된 엔진 해제 (mode를 주면 해당 방식만)"""
+    with _ENGINE_LOCK:
+        for key in [k for k in _ENGINE_CACHE if mode is None or k[0] == mode]:
+            _ENGINE_CACHE.pop(key).close()
@@ -36,6 +36,44 @@ def _get_module_logger():
     return _module_logger
 
 
+ESSAY_CONVERSION_SYSTEM_PROMPT = """당신은 25년 경력의 서술형 문제 전문가입니다. 아래 지시사항을 정확히 이해하고 수행하여 서술형 문제로 변환하시오.
+    
+    지시사항:
+    1. 주어진 question에서 주요 주제를 식별하라.
+    2. 주요 주제를 바탕으로 서술형 문제로 변환하라. 조사와 띄어쓰기 모두 반드시 유지해서 변환하라.
+    3. 수식이나 표는 모두 유지하라. 
+    예시:
+     - 수요의 가격탄력성에 관한 설명으로 옳지 않은 것은? (단, Q는 수량, P는 가격이다.) -> 다음 키워드를 활용하여 수요의 가격탄력성에 대해 서술하시오. (단, Q는 수량, P는 가격이다.)
+     - 소비자 행동 이론 중 '고관여 제품'의 특징으로 옳지 않은 것은? -> 다음 키워드를 활용하여 소비자 행동 이론 중 '고관여 제품'의 특징에 대해 서술하시오.
+     - 다음 중 금융투자회사의 투자설명서 이외에 추가로 핵심설명서 교부대상이 아닌 것은? -> 다음 키워드를 활용하여 금융투자회사의 투자설명서 이외에 추가로 핵심설명서 교부대상에 대해 서술하시오.
+     - 다음 중 IS곡선상의 이동이 아닌 IS곡선 자체의 이동과 관련이 없는 것은? -> 다음 키워드를 활용하여 IS곡선상의 이동이 아닌 IS곡선 자체의 이동에 대해 서술하시오.
+    
+    출력 형식:
+    - 서술형 문제: 다음 키워드를 활용하여 [주제]에 대해 서술하시오. (단서조항, 수식, 조건, 표 등 모두 유지)
+    """
+
+
+def convert_question(llm, q, model_name: str = 'google/gemini-2.5-flash') -> str:
+    """
+    문제 1개를 서술형 문제로 변환 (LLM 1회 호출)
+    
+    Args:
+        llm: LLMQuery 인스턴스
+        q: 문제 딕셔너리 (question 필요)
+        model_name: 사용할 모델명
+    
+    Returns:
+        str: 서술형 문제
+    """
+    user_prompt = f"""
+        입력:
+        - question: {q['question']}
+
+        """
+    response = llm.query_openrouter(ESSAY_CONVERSION_SYSTEM_PROMPT, user_prompt, model_name=model_name)
+    return response.replace('서술형 문제: ', '').replace("[", "").replace("]", "").replace("-", "").strip()
+
+
 def change_question_to_essay(llm=None, onedrive_path=None, log_func=None, round_number=None, input_file=None, output_file=None):
     """
     1단계: 서술형 문제로 변환
@@ -67,33 +105,11 @@ def change_question_to_essay(llm=None, onedrive_path=None, log_func=None, round_
     if questions is None:
         return 0
     
-    # 서술형 문제로 변환
-    system_prompt = """당신은 25년 경력의 서술형 문제 전문가입니다. 아래 지시사항을 정확히 이해하고 수행하여 서술형 문제로 변환하시오.
-    
-    지시사항:
-    1. 주어진 question에서 주요 주제를 식별하라.
-    2. 주요 주제를 바탕으로 서술형 문제로 변환하라. 조사와 띄어쓰기 모두 반드시 유지해서 변환하라.
-    3. 수식이나 표는 모두 유지하라. 
-    예시:
-     - 수요의 가격탄력성에 관한 설명으로 옳지 않은 것은? (단, Q는 수량, P는 가격이다.) -> 다음 키워드를 활용하여 수요의 가격탄력성에 대해 서술하시오. (단, Q는 수량, P는 가격이다.)
-     - 소비자 행동 이론 중 '고관여 제품'의 특징으로 옳지 않은 것은? -> 다음 키워드를 활용하여 소비자 행동 이론 중 '고관여 제품'의 특징에 대해 서술하시오.
-     - 다음 중 금융투자회사의 투자설명서 이외에 추가로 핵심설명서 교부대상이 아닌 것은? -> 다음 키워드를 활용하여 금융투자회사의 투자설명서 이외에 추가로 핵심설명서 교부대상에 대해 서술하시오.
-     - 다음 중 IS곡선상의 이동이 아닌 IS곡선 자체의 이동과 관련이 없는 것은? -> 다음 키워드를 활용하여 IS곡선상의 이동이 아닌 IS곡선 자체의 이동에 대해 서술하시오.
-    
-    출력 형식:
-    - 서술형 문제: 다음 키워드를 활용하여 [주제]에 대해 서술하시오. (단서조항, 수식, 조건, 표 등 모두 유지)
-    """
     log_func("서술형 문제 변환 중...")
     for q in tqdm(questions, desc="서술형 문제 변환"):
         clean_question_data(q)
         
-        user_prompt = f"""
-        입력:
-        - question: {q['question']}
-
-        """
-        response = llm.query_openrouter(system_prompt, user_prompt, model_name='google/gemini-2.5-flash')
-        q['essay_question'] = response.replace('서술형 문제: ', '').replace("[", "").replace("]", "").replace("-", "").strip()
+        q['essay_question'] = convert_question(llm, q)
     
     save_questions(questions, output_file, log_func, '1단계')
     return len(questions)
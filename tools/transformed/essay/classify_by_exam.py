@@ -3,6 +3,9 @@
 """
 9_multiple_to_essay/essay_w_keyword.json 파일의 문제들을 
 4_multiple_exam의 1st/2nd/3rd/4th/5th 세트에 매칭하여 5개의 JSON 파일로 분리
+
+입력(full_explanation, 시험지, 기존 분류 결과)은 같은 이름의 압축 아티팩트(.jsonl)가 더 최근이면 그것을 읽고,
+시험지 매칭에는 .jsonl 사이드카 인덱스의 (file_id, tag)만 사용합니다 (문제 본문 파싱 없음).
 """
 
 import os
@@ -11,11 +14,14 @@ import random
 from collections import defaultdict
 
 from tools import ONEDRIVE_PATH
+from tools.core.artifact_store import ArtifactReader, is_artifact, load_records, resolve_artifact, select_artifacts
 
 
-def load_exam_questions(exam_dir, exam_set_name):
+def load_exam_questions(exam_dir, exam_set_name, keys_only=False):
     """
     특정 exam 세트의 모든 문제를 로드하고 (file_id, tag)를 키로 하는 딕셔너리 생성
+    
+    keys_only=True이면 (file_id, tag) set만 반환합니다 (.jsonl은 인덱스만 읽음).
     """
     exam_path = os.path.join(exam_dir, exam_set_name)
     if not os.path.exists(exam_path):
@@ -24,29 +30,36 @@ def load_exam_questions(exam_dir, exam_set_name):
     
     exam_questions = {}
     
-    # exam_set_name 폴더의 모든 JSON 파일 읽기
-    for filename in os.listdir(exam_path):
-        if filename.endswith('.json'):
-            file_path = os.path.join(exam_path, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    questions = json.load(f)
-                    # 각 문제를 (file_id, tag) 튜플을 키로 저장
-                    for q in questions:
-                        if 'file_id' in q and 'tag' in q:
-                            key = (q['file_id'], q['tag'])
-                            exam_questions[key] = q
-            except Exception as e:
-                print(f"경고: {file_path} 파일을 읽는 중 오류 발생: {e}")
+    # exam_set_name 폴더의 모든 JSON/JSONL 파일 읽기 (같은 이름의 쌍은 최신 파일만)
+    file_paths = select_artifacts(
+        os.path.join(exam_path, filename) for filename in os.listdir(exam_path)
+        if filename.endswith(('.json', '.jsonl'))
+    )
+    for file_path in file_paths:
+        try:
+            if keys_only and is_artifact(file_path):
+                for key in ArtifactReader(file_path).keys():
+                    exam_questions[key] = None
+                continue
+            questions = load_records(file_path)
+            # 각 문제를 (file_id, tag) 튜플을 키로 저장
+            for q in questions:
+                if 'file_id' in q and 'tag' in q:
+                    key = (q['file_id'], q['tag'])
+                    exam_questions[key] = None if keys_only else q
+        except Exception as e:
+            print(f"경고: {file_path} 파일을 읽는 중 오류 발생: {e}")
     
     print(f"{exam_set_name} 세트: {len(exam_questions)}개 문제 로드 완료")
-    return exam_questions
+    return set(exam_questions) if keys_only else exam_questions
 
 
 def main():
     
     # essay_file = os.path.join(ONEDRIVE_PATH, 'evaluation', 'eval_data', '9_multiple_to_essay', 'best_ans.json')
-    essay_file = os.path.join(ONEDRIVE_PATH, 'evaluation', 'eval_data', '9_multiple_to_essay', 'full_explanation.json')
+    essay_file = resolve_artifact(
+        os.path.join(ONEDRIVE_PATH, 'evaluation', 'eval_data', '9_multiple_to_essay', 'full_explanation.json')
+    )
     exam_dir = os.path.join(ONEDRIVE_PATH, 'evaluation', 'eval_data', '4_multiple_exam')
     output_dir = os.path.join(ONEDRIVE_PATH, 'evaluation', 'eval_data', '9_multiple_to_essay', 'questions')
     
@@ -62,8 +75,7 @@ def main():
     
     try:
         print("JSON 파일 로딩 시작...")
-        with open(essay_file, 'r', encoding='utf-8') as f:
-            essay_questions = json.load(f)
+        essay_questions = load_records(essay_file)
         print(f"총 {len(essay_questions)}개의 서술형 문제 로드 완료")
     except Exception as e:
         print(f"파일 읽기 오류: {e}")
@@ -75,15 +87,16 @@ def main():
     exam_data = {}
     
     for exam_set in exam_sets:
-        exam_data[exam_set] = load_exam_questions(exam_dir, exam_set)
+        # 매칭에는 (file_id, tag)만 필요
+        exam_data[exam_set] = load_exam_questions(exam_dir, exam_set, keys_only=True)
     
     # 기존 파일들 로드 (있는 경우) - 샘플링 순서 보존을 위해
     existing_sampled = {}  # 기존 샘플링된 문제들 (순서 보존)
     existing_remaining = {}  # 기존 remaining 문제들
     existing_keys = {}  # 각 세트별로 이미 존재하는 (file_id, tag) 키 추적
     for exam_set in exam_sets:
-        existing_file = os.path.join(output_dir, f'essay_questions_{exam_set}.json')
-        remaining_file = os.path.join(output_dir, f'essay_questions_{exam_set}_remaining.json')
+        existing_file = resolve_artifact(os.path.join(output_dir, f'essay_questions_{exam_set}.json'))
+        remaining_file = resolve_artifact(os.path.join(output_dir, f'essay_questions_{exam_set}_remaining.json'))
         
         existing_sampled[exam_set] = []
         existing_remaining[exam_set] = []
@@ -92,21 +105,20 @@ def main():
         # 기존 샘플링된 파일 로드
         if os.path.exists(existing_file):
             try:
-                with open(existing_file, 'r', encoding='utf-8') as f:
-                    existing_sampled[exam_set] = json.load(f)
-                    # explanation이 있는 문제들만 유지하고 키 추적
-                    filtered_sampled = []
-                    for q in existing_sampled[exam_set]:
-                        file_id = q.get('file_id')
-                        tag = q.get('tag')
-                        explanation = q.get('explanation', '').strip() if q.get('explanation') else ''
-                        # explanation이 있는 문제만 유지
-                        if explanation and file_id and tag:
-                            key = (file_id, tag)
-                            existing_keys[exam_set].add(key)
-                            filtered_sampled.append(q)
-                    existing_sampled[exam_set] = filtered_sampled
-                    print(f"{exam_set} 기존 샘플링 파일 로드: {len(existing_sampled[exam_set])}개 문제 (explanation 있는 것만 유지)")
+                existing_sampled[exam_set] = load_records(existing_file)
+                # explanation이 있는 문제들만 유지하고 키 추적
+                filtered_sampled = []
+                for q in existing_sampled[exam_set]:
+                    file_id = q.get('file_id')
+                    tag = q.get('tag')
+                    explanation = q.get('explanation', '').strip() if q.get('explanation') else ''
+                    # explanation이 있는 문제만 유지
+                    if explanation and file_id and tag:
+                        key = (file_id, tag)
+                        existing_keys[exam_set].add(key)
+                        filtered_sampled.append(q)
+                existing_sampled[exam_set] = filtered_sampled
+                print(f"{exam_set} 기존 샘플링 파일 로드: {len(existing_sampled[exam_set])}개 문제 (explanation 있는 것만 유지)")
             except Exception as e:
                 print(f"경고: {existing_file} 파일 읽기 오류: {e}")
                 existing_sampled[exam_set] = []
@@ -114,21 +126,20 @@ def main():
         # 기존 remaining 파일 로드
         if os.path.exists(remaining_file):
             try:
-                with open(remaining_file, 'r', encoding='utf-8') as f:
-                    existing_remaining[exam_set] = json.load(f)
-                    # explanation이 있는 문제들만 유지하고 키 추적
-                    filtered_remaining = []
-                    for q in existing_remaining[exam_set]:
-                        file_id = q.get('file_id')
-                        tag = q.get('tag')
-                        explanation = q.get('explanation', '').strip() if q.get('explanation') else ''
-                        # explanation이 있는 문제만 유지
-                        if explanation and file_id and tag:
-                            key = (file_id, tag)
-                            existing_keys[exam_set].add(key)
-                            filtered_remaining.append(q)
-                    existing_remaining[exam_set] = filtered_remaining
-                    print(f"{exam_set} 기존 remaining 파일 로드: {len(existing_remaining[exam_set])}개 문제 (explanation 있는 것만 유지)")
+                existing_remaining[exam_set] = load_records(remaining_file)
+                # explanation이 있는 문제들만 유지하고 키 추적
+                filtered_remaining = []
+                for q in existing_remaining[exam_set]:
+                    file_id = q.get('file_id')
+                    tag = q.get('tag')
+                    explanation = q.get('explanation', '').strip() if q.get('explanation') else ''
+                    # explanation이 있는 문제만 유지
+                    if explanation and file_id and tag:
+                        key = (file_id, tag)
+                        existing_keys[exam_set].add(key)
+                        filtered_remaining.append(q)
+                existing_remaining[exam_set] = filtered_remaining
+                print(f"{exam_set} 기존 remaining 파일 로드: {len(existing_remaining[exam_set])}개 문제 (explanation 있는 것만 유지)")
             except Exception as e:
                 print(f"경고: {remaining_file} 파일 읽기 오류: {e}")
                 existing_remaining[exam_set] = []
@@ -225,13 +236,12 @@ def main():
         sampled_essays[exam_set] = sampled
         
         # 원본 파일에서 explanation 빈 문제가 제거된 수 계산
-        original_file = os.path.join(output_dir, f'essay_questions_{exam_set}.json')
+        original_file = resolve_artifact(os.path.join(output_dir, f'essay_questions_{exam_set}.json'))
         original_count = 0
         if os.path.exists(original_file):
             try:
-                with open(original_file, 'r', encoding='utf-8') as f:
-                    original_data = json.load(f)
-                    original_count = len(original_data)
+                original_data = load_records(original_file)
+                original_count = len(original_data)
             except:
                 pass
         
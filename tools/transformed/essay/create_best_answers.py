@@ -35,6 +35,52 @@ def _get_module_logger():
     return _module_logger
 
 
+BEST_ANSWER_SYSTEM_PROMPT = """
+당신은 주어진 여러 정보를 조합하여 서술형 문제에 대한 '모범답안'을 생성하는 AI입니다.
+
+**[역할]**
+- '서술형 질문'의 요구사항을 정확히 파악합니다.
+- '원래 질문/선지/정답/해설'에서 서술형 질문에 답변하는 데 필요한 핵심 정보를 추출합니다.
+- 추출한 정보와 '키워드'를 논리적으로 엮어 하나의 완성된 글로 재구성합니다.
+
+**[수행 절차]**
+1.  **주제 파악:** '서술형 질문'과 '키워드'를 통해 모범답안이 다루어야 할 핵심 주제와 포함해야 할 요소를 확인합니다.
+2.  **정보 추출:** '원래 선지'와 '선지별 해설'을 분석하여 각 '키워드'에 해당하는 구체적인 내용을 찾아냅니다.
+3.  **논리적 구성:** 추출한 정보들을 활용하여 '서술형 질문'에 대한 답변이 되도록 문장을 자연스럽게 연결하고 문단을 구성합니다. 이때, 모든 '키워드'가 '그대로' 포함되어야 합니다.
+4.  **답안 생성:** 위의 과정을 거쳐 최종 '모범답안'을 작성합니다.
+
+**[규칙]**
+- **절대 외부 지식을 사용하지 마세요.** 반드시 '원래 질문/선지/정답/해설'에 명시된 정보만을 근거로 답안을 작성해야 합니다.
+- 제시된 모든 '키워드'를 반드시 답안에 '그대로' 포함해야 합니다.
+- 최종 결과물은 "모범답안:"으로 시작하는 완성된 형태의 글이어야 합니다.
+"""
+
+
+def create_best_answer(llm, q, model_name: str = 'google/gemini-3-pro-preview') -> str:
+    """
+    문제 1개의 모범답안 생성 (LLM 1회 호출)
+    
+    Args:
+        llm: LLMQuery 인스턴스
+        q: 문제 딕셔너리 (essay_question, essay_keyword, question, options, answer, explanation 필요)
+        model_name: 사용할 모델명
+    
+    Returns:
+        str: 모범답안
+    """
+    user_prompt = f"""
+========= 문제 ========
+- 서술형 질문: {q['essay_question']}
+- 키워드: {q['essay_keyword']}
+- 원래 질문: {q['question']}
+- 원래 선지: {q['options']}
+- 원래 정답: {q['answer']}
+- 선지별 해설: {q['explanation']}
+"""
+    response = llm.query_openrouter(BEST_ANSWER_SYSTEM_PROMPT, user_prompt, model_name=model_name)
+    return response.replace('모범답안:', '').strip()
+
+
 def create_best_answers(llm=None, onedrive_path=None, log_func=None, round_number=None):
     """
     3단계: 모범답안 생성만 수행
@@ -63,40 +109,9 @@ def create_best_answers(llm=None, onedrive_path=None, log_func=None, round_numbe
     if questions is None:
         return 0
     
-    # 모범답안 생성
-    system_prompt = """
-당신은 주어진 여러 정보를 조합하여 서술형 문제에 대한 '모범답안'을 생성하는 AI입니다.
-
-**[역할]**
-- '서술형 질문'의 요구사항을 정확히 파악합니다.
-- '원래 질문/선지/정답/해설'에서 서술형 질문에 답변하는 데 필요한 핵심 정보를 추출합니다.
-- 추출한 정보와 '키워드'를 논리적으로 엮어 하나의 완성된 글로 재구성합니다.
-
-**[수행 절차]**
-1.  **주제 파악:** '서술형 질문'과 '키워드'를 통해 모범답안이 다루어야 할 핵심 주제와 포함해야 할 요소를 확인합니다.
-2.  **정보 추출:** '원래 선지'와 '선지별 해설'을 분석하여 각 '키워드'에 해당하는 구체적인 내용을 찾아냅니다.
-3.  **논리적 구성:** 추출한 정보들을 활용하여 '서술형 질문'에 대한 답변이 되도록 문장을 자연스럽게 연결하고 문단을 구성합니다. 이때, 모든 '키워드'가 '그대로' 포함되어야 합니다.
-4.  **답안 생성:** 위의 과정을 거쳐 최종 '모범답안'을 작성합니다.
-
-**[규칙]**
-- **절대 외부 지식을 사용하지 마세요.** 반드시 '원래 질문/선지/정답/해설'에 명시된 정보만을 근거로 답안을 작성해야 합니다.
-- 제시된 모든 '키워드'를 반드시 답안에 '그대로' 포함해야 합니다.
-- 최종 결과물은 "모범답안:"으로 시작하는 완성된 형태의 글이어야 합니다.
-"""
-    
     log_func("모범답안 생성 중...")
     for q in tqdm(questions, desc="모범답안 생성"):
-        user_prompt = f"""
-========= 문제 ========
-- 서술형 질문: {q['essay_question']}
-- 키워드: {q['essay_keyword']}
-- 원래 질문: {q['question']}
-- 원래 선지: {q['options']}
-- 원래 정답: {q['answer']}
-- 선지별 해설: {q['explanation']}
-"""
-        response = llm.query_openrouter(system_prompt, user_prompt, model_name='google/gemini-3-pro-preview')
-        q['essay_answer'] = response.replace('모범답안:', '').strip()
+        q['essay_answer'] = create_best_answer(llm, q)
     
     save_questions(questions, output_file, log_func, '3단계')
     return len(questions)
@@ -12,7 +12,7 @@ import configparser
 from tqdm import tqdm
 
 from tools import ONEDRIVE_PATH, PROJECT_ROOT_PATH
-from tools.core.llm_query import LLMQuery
+from .answer_engines import ENGINE_MODES, get_answer_engine, release_answer_engines
 
 
 def get_api_key():
@@ -33,7 +33,19 @@ def get_api_key():
     return None
 
 
-def process_essay_questions(model, round_number, round_folder, selected_questions, api_key=None, use_server_mode=False):
+ANSWER_SYSTEM_PROMPT = "주어진 키워드를 모두 사용하여 서술형 문제에 대한 답변을 작성해주세요."
+
+
+def build_answer_prompt(q):
+    """모델 답변 생성용 사용자 프롬프트"""
+    return f"""
+서술형 질문: {q['essay_question']}
+키워드: {q['essay_keyword']}
+"""
+
+
+def process_essay_questions(model, round_number, round_folder, selected_questions, api_key=None, use_server_mode=False,
+                            rate_budget=None, engine=None, batch_size=16, engine_mode=None, server_url=None):
     """특정 모델과 회차에 대해 서술형 문제를 처리하는 함수
     
     Args:
@@ -42,40 +54,37 @@ def process_essay_questions(model, round_number, round_folder, selected_question
         round_folder: 회차 폴더명 (예: '1st', '2nd', '3rd', '4th', '5th') - 파일명에 사용
         selected_questions: 선택된 문제 리스트
         api_key: API 키
-        use_server_mode: 서버 모드 사용 여부
+        use_server_mode: 서버 모드 사용 여부 (engine_mode가 없을 때 'vllm' 엔진 사용)
+        rate_budget: 다른 스레드와 공유할 RateBudget (API 모드에서만 적용, None이면 제한 없음)
+        engine: 사용할 AnswerEngine (None이면 get_answer_engine으로 캐시된 엔진 사용 → 회차 간 모델 재사용)
+        batch_size: 엔진에 한 번에 넘길 문제 수
+        engine_mode: 'api' / 'vllm' / 'server' / 'stub' (None이면 use_server_mode로 결정)
+        server_url: OpenAI 호환 서버 주소 (engine_mode='server')
     """
-    llm = LLMQuery(api_key=api_key)
-    
-    # 서버 모드일 때 모델 로드
-    if use_server_mode:
-        print(f"[VLLM] 모델 로드 중: {model}")
-        llm.load_vllm_model(model)
-        print(f"[VLLM] 모델 로드 완료: {model}")
+    if engine is None:
+        engine_mode = engine_mode or ('vllm' if use_server_mode else 'api')
+        engine = get_answer_engine(model, mode=engine_mode, api_key=api_key, server_url=server_url,
+                                   rate_budget=rate_budget)
     
     eval_model_answer = []
-    mode_str = "[VLLM]" if use_server_mode else "[API]"
+    mode_str = f"[{engine.mode.upper()}]"
     print(f"\n{mode_str} 답변 모델: {model}, 회차: {round_number}, 선택된 문제 수: {len(selected_questions)}")
     
-    for q in tqdm(selected_questions, desc=f"{model} - {round_number}"):
-        user_prompt = f"""
-서술형 질문: {q['essay_question']}
-키워드: {q['essay_keyword']}
-"""
-        system_prompt = "주어진 키워드를 모두 사용하여 서술형 문제에 대한 답변을 작성해주세요."
-        
-        if use_server_mode:
-            answer = llm.query_vllm(system_prompt, user_prompt)
-        else:
-            answer = llm.query_openrouter(system_prompt, user_prompt, model_name=model)
-        
-        answers = {
-            'file_id': q['file_id'],
-            'tag': q['tag'],
-            'question': q['essay_question'],
-            'keyword': q['essay_keyword'],
-            'answer': answer
-        }
-        eval_model_answer.append(answers)
+    batch_size = max(1, batch_size)
+    with tqdm(total=len(selected_questions), desc=f"{model} - {round_number}") as progress:
+        for start in range(0, len(selected_questions), batch_size):
+            batch = selected_questions[start:start + batch_size]
+            batch_answers = engine.generate(ANSWER_SYSTEM_PROMPT, [build_answer_prompt(q) for q in batch])
+            
+            for q, answer in zip(batch, batch_answers):
+                eval_model_answer.append({
+                    'file_id': q['file_id'],
+                    'tag': q['tag'],
+                    'question': q['essay_question'],
+                    'keyword': q['essay_keyword'],
+                    'answer': answer
+                })
+            progress.update(len(batch))
     
     # 모델 이름에서 슬래시를 언더스코어로 변경하여 파일명에 사용
     model_name_for_file = model.replace('/', '_')
@@ -104,19 +113,25 @@ def main():
     parser.add_argument('--models', type=str, required=True, help='모델 이름 (예: google/gemini-2.5-pro 또는 로컬 모델 경로)')
     parser.add_argument('--sets', type=str, nargs='+', help='회차 리스트 (예: 1 2 3 또는 생략 시 전체 회차)')
     parser.add_argument('--servermode', action='store_true', help='vLLM 서버 모드 사용 (로컬 모델 로드)')
+    parser.add_argument('--engine', choices=ENGINE_MODES, default=None,
+                        help='답변 생성 엔진 (api: OpenRouter, vllm: 로컬 vLLM, server: OpenAI 호환 서버, stub: CPU 점검용). '
+                             '생략 시 --servermode면 vllm, 아니면 api')
+    parser.add_argument('--server_url', type=str, default=None, help='OpenAI 호환 서버 주소 (--engine server, 예: http://localhost:8000/v1)')
+    parser.add_argument('--batch_size', type=int, default=16, help='엔진에 한 번에 넘길 문제 수')
     
     args = parser.parse_args()
     
     use_server_mode = args.servermode
+    engine_mode = args.engine or ('vllm' if use_server_mode else 'api')
     
-    # API 키 읽기 (서버 모드가 아닐 때만 필요)
+    # API 키 읽기 (OpenRouter 엔진일 때만 필요)
     api_key = None
-    if not use_server_mode:
+    if engine_mode == 'api':
         api_key = get_api_key()
         if api_key is None:
             print("경고: llm_config.ini에서 API 키를 찾을 수 없습니다. API 키 없이 진행합니다.")
     else:
-        print("[VLLM] 서버 모드: API 키가 필요하지 않습니다.")
+        print(f"[{engine_mode.upper()}] API 키가 필요하지 않습니다.")
     
     model = args.models
     
@@ -134,7 +149,7 @@ def main():
                 print(f"오류: 회차 {s}는 유효하지 않습니다. 회차는 1, 2, 3, 4, 5 중 하나여야 합니다.")
                 return
     
-    # 각 회차별로 순차적으로 처리
+    # 각 회차별로 순차적으로 처리 (엔진은 캐시되어 회차 간 모델 재사용)
     for round_number in sets_to_process:
         round_folder = round_folders[round_number]
         
@@ -158,7 +173,10 @@ def main():
         print(f"[{round_folder}] 선택된 문제 수: {len(selected_questions)}")
         
         # 해당 회차 처리 및 저장
-        process_essay_questions(model, round_number, round_folder, selected_questions, api_key, use_server_mode)
+        process_essay_questions(model, round_number, round_folder, selected_questions, api_key, use_server_mode,
+                                batch_size=args.batch_size, engine_mode=engine_mode, server_url=args.server_url)
+    
+    release_answer_engines()
 
 
 if __name__ == '__main__':
@@ -36,6 +36,42 @@ def _get_module_logger():
     return _module_logger
 
 
+KEYWORD_EXTRACTION_SYSTEM_PROMPT = """당신은 25년 경력의 서술형 문제 전문가입니다. 아래 지시사항을 정확히 이해하고 수행하여 키워드를 추출하시오.
+    
+지시사항:
+1. 주어진 essay_question에서 주요 주제를 식별하라. 
+2. 주어진 options, answer, explanation을 참고하여 완벽한 서술형 답변을 작성하기에 핵심적이라고 판단되는 단어 또는 종결어미를 뺀 어절 1개씩 추출하라. 이때 어절은 최대 2개의 단어까지 허용한다.
+3. 키워드는 essay_question의 주제와 겹치지 않도록 추출하라. 중복된 키워드는 제거하고, 총 5개 이내로 추출하라.
+4. 단, 단어,표현 추출은 원문이 가진 텍스트 원본을 그대로 유지하라. 조사와 띄어쓰기 모두 반드시 유지해서 추출하라
+
+출력 형식:
+- 키워드: [키워드1], [키워드2], [키워드3], [키워드4], [키워드5]
+    """
+
+
+def extract_question_keywords(llm, q, model_name: str = 'google/gemini-2.5-flash') -> str:
+    """
+    문제 1개의 키워드 추출 (LLM 1회 호출)
+    
+    Args:
+        llm: LLMQuery 인스턴스
+        q: 문제 딕셔너리 (essay_question, options, answer, explanation 필요)
+        model_name: 사용할 모델명
+    
+    Returns:
+        str: "키워드1, 키워드2, ..." 형식 문자열 (응답 형식이 맞지 않으면 예외 발생)
+    """
+    user_prompt = f"""
+입력:
+    - essay_question: {q['essay_question']}
+    - options: {q['options']}
+    - answer: {q['answer']}
+    - explanation: {q['explanation']}
+"""
+    response = llm.query_openrouter(KEYWORD_EXTRACTION_SYSTEM_PROMPT, user_prompt, model_name=model_name)
+    return response.strip().split('키워드: ')[1].replace("[", "").replace("]", "").replace("-", "").strip()
+
+
 def extract_keywords(llm=None, onedrive_path=None, log_func=None, round_number=None):
     """
     2단계: 키워드 추출만 수행
@@ -64,33 +100,12 @@ def extract_keywords(llm=None, onedrive_path=None, log_func=None, round_number=N
     if questions is None:
         return 0
     
-    # 키워드 추출
-    system_prompt = """당신은 25년 경력의 서술형 문제 전문가입니다. 아래 지시사항을 정확히 이해하고 수행하여 키워드를 추출하시오.
-    
-지시사항:
-1. 주어진 essay_question에서 주요 주제를 식별하라. 
-2. 주어진 options, answer, explanation을 참고하여 완벽한 서술형 답변을 작성하기에 핵심적이라고 판단되는 단어 또는 종결어미를 뺀 어절 1개씩 추출하라. 이때 어절은 최대 2개의 단어까지 허용한다.
-3. 키워드는 essay_question의 주제와 겹치지 않도록 추출하라. 중복된 키워드는 제거하고, 총 5개 이내로 추출하라.
-4. 단, 단어,표현 추출은 원문이 가진 텍스트 원본을 그대로 유지하라. 조사와 띄어쓰기 모두 반드시 유지해서 추출하라
-
-출력 형식:
-- 키워드: [키워드1], [키워드2], [키워드3], [키워드4], [키워드5]
-    """
-    
     log_func("키워드 추출 중...")
     for q in tqdm(questions, desc="키워드 추출"):
         clean_question_data(q)
         
-        user_prompt = f"""
-입력:
-    - essay_question: {q['essay_question']}
-    - options: {q['options']}
-    - answer: {q['answer']}
-    - explanation: {q['explanation']}
-"""
-        response = llm.query_openrouter(system_prompt, user_prompt, model_name='google/gemini-2.5-flash')
         try:
-            q['essay_keyword'] = response.strip().split('키워드: ')[1].replace("[", "").replace("]", "").replace("-", "").strip()
+            q['essay_keyword'] = extract_question_keywords(llm, q)
         except Exception as e:
             log_func(f"오류: 키워드 추출 실패 - {e}")
             q['essay_keyword'] = ''
@@ -2,14 +2,23 @@
 # -*- coding: utf-8 -*-
 """
 0단계: 옳지 않은 문제 중 해설이 많은 문제 선별
+
+배치 모드(batch_size > 1):
+    여러 문제를 ID([Q1], [Q2], ...)를 붙여 한 요청으로 보내고
+    {"results": [{"id": "Q1", "verdict": "full"}, ...]} 형식의 응답을 엄격하게 검증합니다.
+    판정을 파싱하지 못한 문제만 더 작은 배치로 다시 요청하고,
+    재시도 후에도 남은 문제는 문제별 단건 요청으로 확인합니다.
 """
 
 import os
 import json
+from typing import Any, Dict, List, Optional, Tuple
 from tqdm import tqdm
 
 from tools.core.llm_query import LLMQuery
 from tools.core.logger import setup_logger
+from tools.core.utils import JSONHandler
+from tools.core.token_packer import TokenBudgetPacker
 from .common import init_common
 
 # 모듈 레벨 로거 (독립 실행 시 사용)
@@ -29,6 +38,34 @@ def _get_module_logger():
     return _module_logger
 
 
+FILTER_MODEL = 'google/gemini-2.5-flash'
+
+VALID_VERDICTS = ('full', 'notfull')
+
+BATCH_FILTER_SYSTEM_PROMPT = """다음은 [Q1], [Q2], ... 형식의 ID가 붙은 여러 문제의 문제, 정답, 선지, 해설입니다.
+    각 문제마다 해설에 모든 선지에 대한 설명이 포함되어 있으면 'full', 아니라면 'notfull'로 판정해주세요.
+    
+    출력 형식 (JSON만 출력, 모든 ID를 한 번씩 포함):
+    {"results": [{"id": "Q1", "verdict": "full"}, {"id": "Q2", "verdict": "notfull"}]}
+    """
+
+# 배치 응답에서 문제 1개당 예상 출력 토큰 수
+OUTPUT_TOKENS_PER_ITEM = 20
+
+
+def parse_verdict(response: str) -> Optional[str]:
+    """단건 응답에서 판정 추출 ('full' / 'notfull', 판단 불가 시 None)"""
+    text = str(response or '').strip().strip('\'"`.').lower().replace(' ', '')
+    if text in VALID_VERDICTS:
+        return text
+    # 설명이 덧붙은 응답: notfull이 full을 포함하므로 notfull부터 확인
+    if 'notfull' in text:
+        return 'notfull'
+    if 'full' in text:
+        return 'full'
+    return None
+
+
 def is_full_explanation(llm, question, answer, options, explanation):
     """해설이 문제의 모든 선지에 대한 설명을 포함하는지 확인"""
     system_prompt = """다음은 문제, 정답, 해설입니다.
@@ -40,11 +77,119 @@ def is_full_explanation(llm, question, answer, options, explanation):
     선지: {options}
     해설: {explanation}
     """
-    response = llm.query_openrouter(system_prompt, user_prompt, model_name='google/gemini-2.5-flash')
+    response = llm.query_openrouter(system_prompt, user_prompt, model_name=FILTER_MODEL)
     return response.strip()
 
 
-def filter_full_explanation(llm=None, onedrive_path=None, log_func=None):
+def render_batch_item(item_id: str, wd: Dict[str, Any]) -> str:
+    """배치 프롬프트의 문제 1개 블록"""
+    return f"""[{item_id}]
+    문제: {wd['question']}
+    정답: {wd['answer']}
+    선지: {wd['options']}
+    해설: {wd['explanation']}
+    """
+
+
+def parse_batch_verdicts(response: str, expected_ids: List[str]) -> Dict[str, str]:
+    """
+    배치 응답 검증 및 판정 추출
+    
+    - results 리스트의 각 항목은 요청한 ID와 'full'/'notfull' 판정을 가져야 함
+    - 요청하지 않은 ID, 잘못된 판정값은 무시
+    - 같은 ID에 서로 다른 판정이 있으면 해당 ID는 파싱 실패로 처리
+    
+    Returns:
+        ID → 판정 (파싱에 성공한 ID만 포함)
+    """
+    data = JSONHandler.extract_object(str(response or ''))
+    if not isinstance(data, dict) or not isinstance(data.get('results'), list):
+        return {}
+    
+    expected = set(expected_ids)
+    verdicts: Dict[str, str] = {}
+    conflicted = set()
+    for entry in data['results']:
+        if not isinstance(entry, dict):
+            continue
+        item_id = str(entry.get('id', '')).strip().strip('[]')
+        verdict = str(entry.get('verdict', '')).strip().lower()
+        if item_id not in expected or verdict not in VALID_VERDICTS:
+            continue
+        if item_id in verdicts and verdicts[item_id] != verdict:
+            conflicted.add(item_id)
+        verdicts[item_id] = verdict
+    for item_id in conflicted:
+        verdicts.pop(item_id, None)
+    return verdicts
+
+
+def classify_explanations_batched(llm, items: List[Dict[str, Any]], batch_size: int = 20,
+                                  max_retries: int = 2, model_name: str = FILTER_MODEL,
+                                  log_func=print) -> Tuple[List[Optional[str]], Dict[str, int]]:
+    """
+    여러 문제를 배치로 판정
+    
+    Args:
+        llm: LLMQuery 인스턴스
+        items: 판정할 문제 리스트 (question, answer, options, explanation 필요)
+        batch_size: 배치당 최대 문제 수 (토큰 예산을 넘으면 더 작게 묶음)
+        max_retries: 파싱 실패 문제만 모아 다시 배치 요청하는 횟수 (재시도마다 배치 크기 절반)
+        model_name: 판정 모델
+        log_func: 로그 함수
+    
+    Returns:
+        (items 순서의 판정 리스트('full'/'notfull'/None), 통계 dict: batch_calls, single_calls, requeried)
+    """
+    verdicts: List[Optional[str]] = [None] * len(items)
+    stats = {'batch_calls': 0, 'single_calls': 0, 'requeried': 0}
+    pending = list(range(len(items)))
+    size = max(1, batch_size)
+    
+    for attempt in range(max_retries + 1):
+        if not pending or size <= 1:
+            break
+        packer = TokenBudgetPacker.for_model(model_name, output_tokens_per_item=OUTPUT_TOKENS_PER_ITEM,
+                                             max_items=size)
+        batches = packer.pack(pending, lambda i: render_batch_item('Q0', items[i]),
+                              fixed_text=BATCH_FILTER_SYSTEM_PROMPT)
+        unparsed = []
+        desc = "해설 검증 (배치)" if attempt == 0 else f"해설 재검증 ({attempt}회차)"
+        for batch in tqdm(batches, desc=desc):
+            ids = [f"Q{n}" for n in range(1, len(batch) + 1)]
+            user_prompt = '\n'.join(render_batch_item(item_id, items[i]) for item_id, i in zip(ids, batch))
+            stats['batch_calls'] += 1
+            try:
+                response = llm.query_openrouter(BATCH_FILTER_SYSTEM_PROMPT, user_prompt, model_name=model_name)
+                parsed = parse_batch_verdicts(response, ids)
+            except Exception as e:
+                log_func(f"배치 판정 오류 ({len(batch)}개 문제): {e}")
+                parsed = {}
+            for item_id, i in zip(ids, batch):
+                if item_id in parsed:
+                    verdicts[i] = parsed[item_id]
+                else:
+                    unparsed.append(i)
+        if unparsed:
+            log_func(f"판정 파싱 실패 {len(unparsed)}개 → 재요청")
+            stats['requeried'] += len(unparsed)
+        pending = unparsed
+        size = size // 2
+    
+    # 배치 재시도 후에도 남은 문제는 단건 요청
+    for i in pending:
+        wd = items[i]
+        stats['single_calls'] += 1
+        try:
+            verdicts[i] = parse_verdict(is_full_explanation(
+                llm, wd['question'], wd['answer'], wd['options'], wd['explanation']
+            ))
+        except Exception as e:
+            log_func(f"단건 판정 오류 ({wd.get('file_id')}/{wd.get('tag')}): {e}")
+    return verdicts, stats
+
+
+def filter_full_explanation(llm=None, onedrive_path=None, log_func=None, batch_size=20, max_retries=2):
     """
     0단계: 옳지 않은 문제 중 해설이 많은 문제 선별
     
@@ -52,6 +197,8 @@ def filter_full_explanation(llm=None, onedrive_path=None, log_func=None):
         llm: LLMQuery 인스턴스 (None이면 새로 생성)
         onedrive_path: OneDrive 경로 (None이면 ONEDRIVE_PATH 사용)
         log_func: 로깅 함수 (None이면 logger.info 또는 print 사용)
+        batch_size: 한 요청에 넣을 최대 문제 수 (1이면 문제별 단건 요청)
+        max_retries: 배치 판정 파싱 실패 문제의 배치 재요청 횟수
     
     Returns:
         int: 선별된 문제 개수
@@ -87,24 +234,33 @@ def filter_full_explanation(llm=None, onedrive_path=None, log_func=None):
     fail = []
     
     log_func("해설이 많은 문제 선별 중...")
-    for wd in tqdm(wrong_questions, desc="해설 검증"):
+    # 해설이 없는 문제는 요청 없이 notfull
+    targets = []
+    for wd in wrong_questions:
         if wd['explanation'] == '':
             notfull_explanation.append(wd)
-            continue
         else:
-            response = is_full_explanation(
-                llm, 
-                wd['question'], 
-                wd['answer'], 
-                wd['options'], 
-                wd['explanation']
-            )
-            if 'full' in response.lower():
-                full_explanation.append(wd)
-            elif 'notfull' in response.lower():
-                notfull_explanation.append(wd)
-            else:
-                fail.append(wd)
+            targets.append(wd)
+    
+    if batch_size > 1:
+        verdicts, stats = classify_explanations_batched(
+            llm, targets, batch_size=batch_size, max_retries=max_retries, log_func=log_func
+        )
+        log_func(f"배치 요청 {stats['batch_calls']}회, 재요청 문제 {stats['requeried']}개, "
+                 f"단건 요청 {stats['single_calls']}회 (단건 방식 대비 {len(targets) - stats['batch_calls'] - stats['single_calls']}회 절감)")
+    else:
+        verdicts = [
+            parse_verdict(is_full_explanation(llm, wd['question'], wd['answer'], wd['options'], wd['explanation']))
+            for wd in tqdm(targets, desc="해설 검증")
+        ]
+    
+    for wd, verdict in zip(targets, verdicts):
+        if verdict == 'full':
+            full_explanation.append(wd)
+        elif verdict == 'notfull':
+            notfull_explanation.append(wd)
+        else:
+            fail.append(wd)
     
     log_func(f"\n선별 결과:")
     log_func(f"  - full (해설 완전): {len(full_explanation)}개")
@@ -123,11 +279,15 @@ def filter_full_explanation(llm=None, onedrive_path=None, log_func=None):
     return len(questions)
 
 
-def main():
+def main(batch_size=20):
     """메인 함수"""
-    filter_full_explanation()
+    filter_full_explanation(batch_size=batch_size)
 
 
 if __name__ == '__main__':
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description='해설이 많은 문제 선별')
+    parser.add_argument('--batch_size', type=int, default=20, help='한 요청에 넣을 최대 문제 수 (1이면 단건 요청)')
+    args = parser.parse_args()
+    main(batch_size=args.batch_size)
 
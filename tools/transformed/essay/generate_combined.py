@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1~3단계 통합: 서술형 문제 + 키워드 + 모범답안을 문제당 1회 호출로 생성
+
+기존 흐름(change_question_to_essay → extract_keywords → create_best_answers)은 문제마다 LLM을 3번 호출하고
+회차 파일을 세 번 읽고 씁니다. 통합 모드는 구조화된 JSON 한 번으로 세 필드를 받고,
+검증에 실패한 필드만 기존 단계 함수로 다시 생성합니다.
+
+필드별 검증 / 대체 규칙:
+    - essay_question: 비어 있지 않은 문자열 → 실패 시 convert_question
+    - essay_keyword: 1~5개의 비어 있지 않은 키워드 (각 최대 2어절) → 실패 시 extract_question_keywords
+    - essay_answer: 비어 있지 않고 모든 키워드를 그대로 포함 → 실패 시 create_best_answer
+    - 앞 필드를 다시 생성했다면 그 필드에 의존하는 뒤 필드도 다시 생성 (키워드 → 모범답안)
+
+일부 단계만 지정하면(steps) 그 단계의 필드만 생성하고 나머지 필드는 기존 단계별 출력 값을 유지합니다.
+
+출력 파일은 기존 3단계 경로와 같으므로 이후 단계(모델 답변 생성, 평가)는 그대로 동작합니다.
+
+비용/지연 비교:
+    python -m tools.transformed.essay.generate_combined --round 1 --compare 20
+"""
+
+import os
+import time
+import random
+import argparse
+from typing import Any, Dict, List, Optional
+
+from tqdm import tqdm
+
+from tools.core.logger import setup_logger
+from tools.core.utils import JSONHandler
+from .common import (
+    init_common,
+    validate_round_number,
+    get_essay_dir,
+    load_questions,
+    save_questions,
+    clean_question_data
+)
+from .change_question_to_essay import ESSAY_CONVERSION_SYSTEM_PROMPT, convert_question
+from .extract_keywords import KEYWORD_EXTRACTION_SYSTEM_PROMPT, extract_question_keywords
+from .create_best_answers import BEST_ANSWER_SYSTEM_PROMPT, create_best_answer
+
+try:
+    from tools.core.token_packer import TokenEstimator
+except ImportError:
+    TokenEstimator = None
+
+# 모듈 레벨 로거 (독립 실행 시 사용)
+_module_logger = None
+
+
+def _get_module_logger():
+    """모듈 레벨 로거 생성"""
+    global _module_logger
+    if _module_logger is None:
+        _module_logger = setup_logger(
+            name=__name__,
+            log_file='essay_generate_combined.log',
+            use_console=True,
+            use_file=True
+        )
+    return _module_logger
+
+
+COMBINED_SYSTEM_PROMPT = f"""당신은 25년 경력의 서술형 문제 전문가입니다. 주어진 객관식 문제 하나로 아래 세 가지를 순서대로 작성하시오.
+
+[1] 서술형 문제 (essay_question)
+{ESSAY_CONVERSION_SYSTEM_PROMPT.strip()}
+
+[2] 키워드 (essay_keyword)
+{KEYWORD_EXTRACTION_SYSTEM_PROMPT.strip()}
+
+[3] 모범답안 (essay_answer)
+{BEST_ANSWER_SYSTEM_PROMPT.strip()}
+
+[최종 출력 형식]
+위 각 항목의 개별 출력 형식 대신, 반드시 아래 JSON 객체 하나만 출력하시오. (다른 텍스트 금지)
+{{"essay_question": "다음 키워드를 활용하여 ...에 대해 서술하시오.", "essay_keyword": ["키워드1", "키워드2"], "essay_answer": "모범답안 본문 (모든 키워드를 그대로 포함)"}}
+"""
+
+DEFAULT_COMBINED_MODEL = 'google/gemini-3-pro-preview'
+
+
+def _parse_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """응답에서 JSON 객체 추출 (코드블록/앞뒤 텍스트 허용)"""
+    data = JSONHandler.extract_object(text or '')
+    return data if isinstance(data, dict) else None
+
+
+def _valid_question(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _normalize_keywords(value: Any) -> Optional[List[str]]:
+    """키워드 검증: 1~5개, 비어 있지 않음, 각 최대 2어절. 통과하면 리스트, 아니면 None"""
+    if isinstance(value, str):
+        value = [v for v in value.split(',')]
+    if not isinstance(value, list):
+        return None
+    keywords = []
+    for v in value:
+        if not isinstance(v, str):
+            return None
+        v = v.replace('[', '').replace(']', '').strip()
+        if v and v not in keywords:
+            keywords.append(v)
+    if not 1 <= len(keywords) <= 5 or any(len(k.split()) > 2 for k in keywords):
+        return None
+    return keywords
+
+
+def _valid_answer(value: Any, keywords: List[str]) -> bool:
+    if not isinstance(value, str) or not value.strip():
+        return False
+    compact = value.replace(' ', '')
+    return all(k.replace(' ', '') in compact for k in keywords)
+
+
+# 단계 번호 → (생성 필드, 단계별 출력 폴더, 출력 파일명 형식, 로그용 단계명)
+STEP_FIELDS = {
+    3: ('essay_question', 'questions', 'essay_questions_{round}_서술형문제로변환.json', '1단계'),
+    4: ('essay_keyword', 'questions', 'essay_questions_w_keyword_{round}_서술형답변에서키워드추출.json', '2단계'),
+    5: ('essay_answer', 'answers', 'best_ans_{round}.json', '3단계'),
+}
+ALL_FIELDS = tuple(field for field, _, _, _ in STEP_FIELDS.values())
+
+
+def _regenerate_field(llm, q: Dict[str, Any], field: str) -> None:
+    """기존 단계 함수로 필드 1개 생성"""
+    if field == 'essay_question':
+        q['essay_question'] = convert_question(llm, q)
+    elif field == 'essay_keyword':
+        try:
+            q['essay_keyword'] = extract_question_keywords(llm, q)
+        except Exception:
+            q['essay_keyword'] = ''
+    else:
+        q['essay_answer'] = create_best_answer(llm, q)
+
+
+def generate_combined_fields(llm, q: Dict[str, Any], model_name: str = DEFAULT_COMBINED_MODEL,
+                             fallback: bool = True, fields=None) -> Dict[str, Any]:
+    """
+    문제 1개의 essay_question / essay_keyword / essay_answer를 1회 호출로 생성 (in-place 갱신)
+
+    Args:
+        llm: LLMQuery 인스턴스
+        q: 문제 딕셔너리 (question, options, answer, explanation 필요)
+        model_name: 통합 생성에 사용할 모델명
+        fallback: 검증 실패 필드를 기존 단계 함수로 다시 생성할지 여부
+        fields: 생성할 필드 (None이면 세 필드 모두). 나머지 필드는 q의 기존 값을 유지하며,
+            1개만 지정하면 통합 호출 없이 해당 단계 함수로 바로 생성
+
+    Returns:
+        dict: {'calls': int, 'fallback_fields': [필드명...], 'prompt_chars': int, 'response_chars': int}
+    """
+    fields = set(fields or ALL_FIELDS)
+    info = {'calls': 0, 'fallback_fields': [], 'prompt_chars': 0, 'response_chars': 0}
+    if len(fields) == 1:
+        field = next(iter(fields))
+        _regenerate_field(llm, q, field)
+        info['calls'] = 1
+        return info
+
+    user_prompt = f"""
+입력:
+    - question: {q['question']}
+    - options: {q['options']}
+    - answer: {q['answer']}
+    - explanation: {q['explanation']}
+"""
+    info.update({'calls': 1, 'prompt_chars': len(COMBINED_SYSTEM_PROMPT) + len(user_prompt)})
+    try:
+        response = llm.query_openrouter(COMBINED_SYSTEM_PROMPT, user_prompt, model_name=model_name)
+    except Exception:
+        response = ''
+    info['response_chars'] = len(response or '')
+    data = _parse_json_object(response) or {}
+
+    def fall_back(field: str) -> None:
+        if fallback:
+            _regenerate_field(llm, q, field)
+            info['calls'] += 1
+            info['fallback_fields'].append(field)
+        else:
+            q[field] = ''
+
+    # essay_question
+    regenerated = False
+    if 'essay_question' in fields:
+        if _valid_question(data.get('essay_question')):
+            q['essay_question'] = data['essay_question'].strip()
+        else:
+            fall_back('essay_question')
+            regenerated = fallback
+
+    # essay_keyword (서술형 문제를 다시 만들었다면 키워드도 다시 추출)
+    if 'essay_keyword' in fields:
+        keywords = None if regenerated else _normalize_keywords(data.get('essay_keyword'))
+        if keywords is not None:
+            q['essay_keyword'] = ', '.join(keywords)
+        else:
+            fall_back('essay_keyword')
+            regenerated = fallback
+    keywords = [k.strip() for k in str(q.get('essay_keyword') or '').split(',') if k.strip()]
+
+    # essay_answer (키워드를 다시 만들었다면 모범답안도 다시 생성, 유지한 키워드로도 검증)
+    if 'essay_answer' in fields:
+        if not regenerated and _valid_answer(data.get('essay_answer'), keywords):
+            q['essay_answer'] = data['essay_answer'].replace('모범답안:', '').strip()
+        else:
+            fall_back('essay_answer')
+
+    return info
+
+
+def _overlay_existing_fields(questions: List[Dict[str, Any]], essay_dir: str, round_folder: str,
+                             keep_steps: List[int], log_func) -> None:
+    """
+    생성하지 않는 단계의 필드를 그 단계의 기존 출력 파일에서 (file_id, tag) 기준으로 가져옴
+
+    기존 출력에 없는 문제는 해당 필드가 비어 있는 채로 남습니다.
+    """
+    for step in keep_steps:
+        field, folder, name, step_name = STEP_FIELDS[step]
+        path = os.path.join(essay_dir, folder, name.format(round=round_folder))
+        existing = load_questions(path, log_func, step_name) if os.path.exists(path) else None
+        if not existing:
+            log_func(f"{step_name} 기존 출력이 없어 {field}를 유지할 수 없습니다: {path}")
+            continue
+        values = {(e.get('file_id'), e.get('tag')): e.get(field) for e in existing if field in e}
+        for q in questions:
+            value = values.get((q.get('file_id'), q.get('tag')))
+            if value is not None:
+                q[field] = value
+
+
+def generate_essay_combined(llm=None, onedrive_path=None, log_func=None, round_number=None,
+                            model_name: str = DEFAULT_COMBINED_MODEL, fallback: bool = True,
+                            steps: Optional[List[int]] = None) -> int:
+    """
+    1~3단계 통합 수행: 회차 파일을 한 번 읽고 문제당 1회 호출로 세 필드 생성
+
+    steps로 일부 단계(3: 서술형 문제, 4: 키워드, 5: 모범답안)만 지정하면 그 단계의 필드만 새로 만들고,
+    나머지 필드는 각 단계의 기존 출력 파일 값을 유지합니다. 출력 파일도 지정한 단계의 것만 기록합니다.
+
+    Args:
+        llm: LLMQuery 인스턴스 (None이면 새로 생성)
+        onedrive_path: OneDrive 경로 (None이면 ONEDRIVE_PATH 사용)
+        log_func: 로깅 함수 (None이면 logger.info 또는 print 사용)
+        round_number: 회차 번호 (예: '1', '2', '3', '4', '5')
+        model_name: 통합 생성에 사용할 모델명
+        fallback: 검증 실패 필드를 기존 단계 함수로 다시 생성할지 여부
+        steps: 생성할 단계 목록 (None이면 [3, 4, 5])
+
+    Returns:
+        int: 처리된 문제 개수
+    """
+    logger = _get_module_logger() if log_func is None else None
+    llm, onedrive_path, log_func = init_common(llm, onedrive_path, log_func, logger)
+
+    round_folder = validate_round_number(round_number, log_func)
+    if round_folder is None:
+        return 0
+
+    steps = sorted(set(steps or STEP_FIELDS) & set(STEP_FIELDS))
+    fields = [STEP_FIELDS[step][0] for step in steps]
+    essay_dir = get_essay_dir(onedrive_path)
+    input_file = os.path.join(essay_dir, 'questions', f'essay_questions_{round_folder}.json')
+    questions = load_questions(input_file, log_func, '통합 생성')
+    if questions is None:
+        return 0
+    keep_steps = [step for step in STEP_FIELDS if step not in steps]
+    if keep_steps:
+        _overlay_existing_fields(questions, essay_dir, round_folder, keep_steps, log_func)
+
+    log_func(f"{', '.join(fields)} 통합 생성 중...")
+    total_calls = 0
+    fallback_counts = {field: 0 for field in fields}
+    start = time.perf_counter()
+    for q in tqdm(questions, desc="통합 생성"):
+        clean_question_data(q)
+        info = generate_combined_fields(llm, q, model_name, fallback, fields)
+        total_calls += info['calls']
+        for name in info['fallback_fields']:
+            fallback_counts[name] += 1
+    elapsed = time.perf_counter() - start
+
+    log_func(
+        f"통합 생성 완료: {len(questions)}개 문제, 호출 {total_calls}회 "
+        f"(기존 단계별: {len(questions) * len(fields)}회), {elapsed:.1f}초, 필드별 대체 생성 {fallback_counts}"
+    )
+
+    # 기존 단계별 출력 경로에 저장 (이후 단계 호환, 지정한 단계만)
+    for step in steps:
+        _, folder, name, step_name = STEP_FIELDS[step]
+        save_questions(questions, os.path.join(essay_dir, folder, name.format(round=round_folder)),
+                       log_func, step_name)
+    return len(questions)
+
+
+class _MeteredLLM:
+    """호출 수 / 지연 / 입출력 문자 수를 기록하는 LLM 래퍼 (비교용)"""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.calls = 0
+        self.elapsed = 0.0
+        self.input_texts: List[str] = []
+        self.output_texts: List[str] = []
+
+    def query_openrouter(self, system_prompt: str, user_prompt: str, model_name: str = None) -> str:
+        start = time.perf_counter()
+        response = self.llm.query_openrouter(system_prompt, user_prompt, model_name=model_name)
+        self.elapsed += time.perf_counter() - start
+        self.calls += 1
+        self.input_texts.append(system_prompt + user_prompt)
+        self.output_texts.append(response or '')
+        return response
+
+    def summary(self) -> Dict[str, Any]:
+        if TokenEstimator:
+            estimator = TokenEstimator()
+            input_tokens = sum(estimator.count(t) for t in self.input_texts)
+            output_tokens = sum(estimator.count(t) for t in self.output_texts)
+        else:
+            input_tokens = sum(len(t) for t in self.input_texts)
+            output_tokens = sum(len(t) for t in self.output_texts)
+        return {'calls': self.calls, 'elapsed': self.elapsed,
+                'input_tokens': input_tokens, 'output_tokens': output_tokens}
+
+
+def compare_generation_cost(llm, questions: List[Dict[str, Any]], sample_size: int = 20,
+                            seed: int = 42, model_name: str = DEFAULT_COMBINED_MODEL) -> Dict[str, Dict[str, Any]]:
+    """
+    같은 표본에서 기존 3단계 경로와 통합 경로의 호출 수 / 지연 / 예상 토큰 비교
+
+    Returns:
+        {'three_pass': {...}, 'combined': {...}} (calls, elapsed, input_tokens, output_tokens, [fallback_fields])
+    """
+    sample = random.Random(seed).sample(questions, min(sample_size, len(questions)))
+
+    three_pass = _MeteredLLM(llm)
+    for original in sample:
+        q = dict(original)
+        clean_question_data(q)
+        q['essay_question'] = convert_question(three_pass, q)
+        try:
+            q['essay_keyword'] = extract_question_keywords(three_pass, q)
+        except Exception:
+            q['essay_keyword'] = ''
+        q['essay_answer'] = create_best_answer(three_pass, q)
+
+    combined = _MeteredLLM(llm)
+    fallback_counts: Dict[str, int] = {}
+    for original in sample:
+        q = dict(original)
+        clean_question_data(q)
+        info = generate_combined_fields(combined, q, model_name)
+        for name in info['fallback_fields']:
+            fallback_counts[name] = fallback_counts.get(name, 0) + 1
+
+    result = {'three_pass': three_pass.summary(), 'combined': combined.summary()}
+    result['combined']['fallback_fields'] = fallback_counts
+    result['sample_size'] = len(sample)
+    return result
+
+
+def main(round_number='1', compare: int = 0):
+    """메인 함수"""
+    if not compare:
+        generate_essay_combined(round_number=round_number)
+        return
+
+    llm, onedrive_path, log_func = init_common(None, None, None, _get_module_logger())
+    round_folder = validate_round_number(round_number, log_func)
+    input_file = os.path.join(get_essay_dir(onedrive_path), 'questions', f'essay_questions_{round_folder}.json')
+    questions = load_questions(input_file, log_func, '비교')
+    if not questions:
+        return
+    result = compare_generation_cost(llm, questions, sample_size=compare)
+    print(f"표본 {result['sample_size']}개 문제")
+    for name, label in (('three_pass', '기존 3단계'), ('combined', '통합 1회')):
+        r = result[name]
+        print(f"  {label}: 호출 {r['calls']}회, {r['elapsed']:.1f}초, "
+              f"예상 입력 토큰 {r['input_tokens']:.0f}, 출력 토큰 {r['output_tokens']:.0f}")
+    print(f"  통합 모드 필드별 대체 생성: {result['combined']['fallback_fields']}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='서술형 문제 + 키워드 + 모범답안 통합 생성')
+    parser.add_argument('--round', type=str, default='1', help='회차 번호 (1-5)')
+    parser.add_argument('--compare', type=int, default=0,
+                        help='0보다 크면 해당 개수 표본으로 기존 3단계 vs 통합 호출 수/지연/토큰 비교만 수행')
+    args = parser.parse_args()
+    main(round_number=args.round, compare=args.compare)
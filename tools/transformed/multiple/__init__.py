@@ -7,6 +7,7 @@ multiple 패키지 - 객관식 문제 변형 기능
 - QuestionTransformerOrchestrator: 변형 프로세스 전체 관리 (Step3 진입점)
 - AnswerTypeClassifier: 답변 유형 분류 (right/wrong/abcd)
 - MultipleChoiceTransformer: 객관식 문제 변형 (right↔wrong, ABCD)
+- AnswerCountSampler: 정답 개수별 층화 샘플러 (선형 시간)
 - load_transformed_questions: 변형된 문제 로드
 - create_transformed_exam: 변형 시험지 생성
 
@@ -27,9 +28,11 @@ from .question_transformer import QuestionTransformerOrchestrator
 
 # 답변 유형 분류
 from .answer_type_classifier import AnswerTypeClassifier
+from .answer_type_rules import AnswerTypeRules
 
 # 객관식 문제 변형
 from .change_question_and_options import MultipleChoiceTransformer
+from .stratified_sampler import AnswerCountSampler
 
 # 변형 문제 로드 유틸리티
 from .load_transformed_questions import load_transformed_questions
@@ -43,8 +46,10 @@ __all__ = [
     'QuestionTransformerOrchestrator',
     # 답변 유형 분류
     'AnswerTypeClassifier',
+    'AnswerTypeRules',
     # 객관식 변형
     'MultipleChoiceTransformer',
+    'AnswerCountSampler',
     'load_transformed_questions',
     'create_transformed_exam',
 ]
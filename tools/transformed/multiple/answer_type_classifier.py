@@ -12,6 +12,7 @@ Q&A Answer Type 분류기
 - 10문제 단위로 LLM API 호출 (배치 처리)
 - answer_type 키를 추가하여 원본 데이터 업데이트
 - 중간 결과 저장 (재시작 가능)
+- rule_fast_path=True: 지시문이 명확한 문제는 AnswerTypeRules로 즉시 판정하고 나머지만 LLM 분류
 
 출력 경로:
     - 분류 결과: {onedrive_path}/evaluation/eval_data/7_multiple_rw/answer_type_classified.json
@@ -35,6 +36,8 @@ from tqdm import tqdm
 
 from tools.core.logger import setup_logger
 from tools.core.llm_query import LLMQuery
+from tools.core.token_packer import TokenBudgetPacker
+from .answer_type_rules import AnswerTypeRules
 
 
 # 모듈 레벨 로거 설정 (독립 실행 시에만 사용)
@@ -54,6 +57,9 @@ _module_logger = _get_module_logger()
 class AnswerTypeClassifier:
     """Q&A Answer Type 분류기 (right/wrong/abcd)"""
     
+    # 토큰 예산 배치 시 문제당 예상 출력 토큰 (한 줄에 right/wrong/abcd 한 단어)
+    OUTPUT_TOKENS_PER_ITEM = 5
+    
     def __init__(self, config_path: str = None, onedrive_path: str = None, logger=None):
         """Answer Type 분류기 초기화
         
@@ -219,9 +225,22 @@ class AnswerTypeClassifier:
         
         return updated_questions, failed_questions
     
+    def _make_batches(self, questions: List[Dict[str, Any]], batch_size: int,
+                      model: str, token_budget: bool) -> List[List[Dict[str, Any]]]:
+        """문제를 배치로 나누기 (고정 개수 또는 토큰 예산 기준)"""
+        if not token_budget:
+            return [questions[i:i + batch_size] for i in range(0, len(questions), batch_size)]
+        
+        packer = TokenBudgetPacker.for_model(model, output_tokens_per_item=self.OUTPUT_TOKENS_PER_ITEM)
+        batches = packer.pack(questions, lambda q: self.create_user_prompt([q]), fixed_text=self.system_prompt)
+        fixed_calls = (len(questions) + batch_size - 1) // batch_size
+        self.logger.info(f"토큰 예산 배치: {len(batches)}회 호출 (고정 {batch_size}개 배치 대비 {fixed_calls - len(batches)}회 절감)")
+        return batches
+    
     def process_questions(self, questions: List[Dict[str, Any]], 
-                         batch_size: int = 10, model: str = "x-ai/grok-4-fast") -> Tuple[List[Dict[str, Any]], List, List[Dict[str, Any]]]:
-        """문제들을 배치 단위로 처리"""
+                         batch_size: int = 10, model: str = "x-ai/grok-4-fast",
+                         token_budget: bool = False) -> Tuple[List[Dict[str, Any]], List, List[Dict[str, Any]]]:
+        """문제들을 배치 단위로 처리 (token_budget=True면 예상 토큰 수 기준으로 배치 구성)"""
         self.logger.info(f"처리 시작 - 총 {len(questions)}개 문제")
         
         all_updated_questions = []
@@ -229,9 +248,8 @@ class AnswerTypeClassifier:
         fail_question = []
         
         # 배치 단위로 처리
-        for i in tqdm(range(0, len(questions), batch_size), desc="처리 중"):
-            batch = questions[i:i + batch_size]
-            batch_num = i // batch_size + 1
+        batches = self._make_batches(questions, batch_size, model, token_budget)
+        for batch_num, batch in enumerate(tqdm(batches, desc="처리 중"), 1):
             
             self.logger.info(f"배치 {batch_num} 처리 중... ({len(batch)}개 문제)")
             
@@ -367,8 +385,9 @@ class AnswerTypeClassifier:
                 self.logger.warning(f"fail_q 파일 삭제 실패: {e}")
     
     def process_all_questions(self, data_path: str = None, questions: List[Dict[str, Any]] = None,
-                              model: str = "x-ai/grok-4-fast", batch_size: int = 10) -> List[Dict[str, Any]]:
-        """모든 문제 처리 (answer_type 분류)"""
+                              model: str = "x-ai/grok-4-fast", batch_size: int = 10,
+                              token_budget: bool = False, rule_fast_path: bool = False) -> List[Dict[str, Any]]:
+        """모든 문제 처리 (answer_type 분류, rule_fast_path=True면 규칙으로 판정되지 않은 문제만 LLM 분류)"""
         # 데이터 로드
         if questions is None:
             if data_path is None:
@@ -377,8 +396,24 @@ class AnswerTypeClassifier:
         
         self.logger.info(f"총 문제 수: {len(questions)}")
         
+        # 규칙 기반 빠른 경로: 명확한 문제는 바로 판정
+        llm_questions = questions
+        if rule_fast_path:
+            labels, llm_questions = AnswerTypeRules().split(questions)
+            for qna, label in zip(questions, labels):
+                if label is not None:
+                    qna['answer_type'] = label
+            rule_count = len(questions) - len(llm_questions)
+            calls_before = (len(questions) + batch_size - 1) // batch_size
+            calls_after = (len(llm_questions) + batch_size - 1) // batch_size
+            self.logger.info(f"규칙 판정: {rule_count}개, LLM 분류 대상: {len(llm_questions)}개 "
+                             f"(배치 호출 {calls_before}회 → {calls_after}회)")
+        
         # 문제 처리
-        updated_questions, fail_response, fail_question = self.process_questions(questions, batch_size, model)
+        updated_questions, fail_response, fail_question = self.process_questions(llm_questions, batch_size, model, token_budget)
+        if rule_fast_path:
+            # 규칙 판정 문제와 LLM 분류 문제를 원래 순서로 합침 (process_questions는 문제 dict를 직접 갱신)
+            updated_questions = questions
         
         # 최종 결과 저장
         self._save_results(updated_questions, fail_response, fail_question)
@@ -413,8 +448,12 @@ def main():
                        help='배치 크기 (기본값: 10)')
     parser.add_argument('--config', type=str, default=None,
                        help='설정 파일 경로')
+    parser.add_argument('--token_budget', action='store_true',
+                       help='토큰 예산 기준 배치 구성')
     parser.add_argument('--onedrive_path', type=str, default=None,
                        help='OneDrive 경로')
+    parser.add_argument('--rule_fast_path', action='store_true',
+                       help='지시문이 명확한 문제는 규칙으로 판정하고 나머지만 LLM 분류')
     
     args = parser.parse_args()
     
@@ -430,7 +469,9 @@ def main():
         results = classifier.process_all_questions(
             data_path=args.data_path,
             model=str(args.model).strip(),
-            batch_size=args.batch_size
+            batch_size=args.batch_size,
+            token_budget=args.token_budget,
+            rule_fast_path=args.rule_fast_path
         )
         _module_logger.info("처리 완료!")
         
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Answer Type 규칙 기반 분류 (LLM 분류 전 빠른 경로)
+
+문제의 지시문(마지막 물음 문장)이 "옳은 것은?", "옳지 않은 것은?", "모두 고른 것은?"처럼
+명확한 경우만 로컬에서 right/wrong/abcd로 판정하고, 애매한 문제는 None을 반환해
+AnswerTypeClassifier의 LLM 분류로 넘깁니다. 판정 우선순위는 LLM 시스템 프롬프트와 같습니다.
+
+    1) abcd: 지시문에 '모두 고르기'/'것만을' 표현이 있거나, 선택지 대부분이 "ㄱ, ㄴ" 같은 항목 조합
+    2) wrong: 지시문이 부정 표현(옳지 않은/틀린/아닌 ...) + 것은? 으로 끝남
+    3) right: 지시문이 긍정 표현(옳은/적절한/바르게 설명한 ...) + 것은? 으로 끝나고 부정 표현이 없음
+    그 외 (<보기>가 있는데 조합 선택지가 아님, 개수/값을 묻는 문제, 부정어가 중간에 섞인 지시문 등) → None
+
+정밀도 리포트 (기존 LLM 분류 결과와 비교, LLM 호출 없음):
+    python -m tools.transformed.multiple.answer_type_rules --data_path answer_type_classified.json --batch_size 10
+"""
+
+import re
+import json
+import math
+import argparse
+from typing import Any, Dict, List, Optional
+
+
+ANSWER_TYPES = ('right', 'wrong', 'abcd')
+
+# 지시문에서 '모두 고르기' 유형을 나타내는 표현
+_ABCD_STEM_RE = re.compile(
+    r"모두\s*(?:고른|고르|골라|선택|찾|묶)|있는\s*대로\s*(?:고른|고르|골라)|것만을|것들로만|"
+    r"(?:옳은|옳지\s*않은|바른|적절한)\s*것(?:을|끼리)\s*(?:모두\s*)?(?:묶은|짝지은|조합한)"
+)
+
+# 선택지 1개가 항목 조합인지 (예: "ㄱ, ㄴ", "가, 다, 라", "Ⅰ, Ⅲ", "A, C")
+_COMBO_ITEM = r"(?:[ㄱ-ㅎ]|[가나다라마바사]|[ⅠⅡⅢⅣⅤ]|I{1,3}|IV|V|[A-E])"
+_COMBO_OPTION_RE = re.compile(
+    rf"^\s*(?:[①-⑩]|\(?\d{{1,2}}[.)])?\s*{_COMBO_ITEM}(?:\s*[,·및]\s*{_COMBO_ITEM}|\s+{_COMBO_ITEM})+\s*$"
+)
+
+# <보기> 또는 ㄱ. ㄴ. 항목 표기 (조합 선택지 없이 나오면 애매하므로 LLM으로)
+_BOGI_RE = re.compile(r"<\s*보\s*기\s*>|〈\s*보\s*기\s*〉|\[\s*보\s*기\s*\]|(?:^|\s)[ㄱㄴㄷㄹ]\s*[.)]")
+
+# 지시문 끝의 명사 + 조사 + 물음 (예: "것은?", "설명으로 옳지 않은 것은 무엇인가?")
+_TAIL_NOUN = (r"(?:것|설명|내용|진술|항목|사항|기술|예시?|경우|사례|지문|문장|주장|요소|조건|의견|견해|사람|행위|방법)")
+_TAIL_END = (rf"\s*{_TAIL_NOUN}(?:을|를)?\s*(?:은|는)?\s*"
+             r"(?:무엇인가|어느\s*것인가|어느\s*것입니까|고르(?:시오|면|세요)|골라라|고른\s*것은)?\s*\??\s*$")
+
+_NEGATIVE = (r"(?:옳지\s*(?:않은|못한|않게\s*\S+한)|틀린|틀리게\s*\S+한|잘못\s*(?:된|\S+한)|잘못된|부적절한|"
+             r"(?:적절|타당|적합|올바르|바르|알맞|맞|부합|일치|해당|관련|관계)(?:하|되)?지\s*(?:않은|않는|못한)|"
+             r"적절치\s*않은|관계\s*없는|관련\s*없는|관계가\s*없는|관련이\s*없는|거리가\s*먼|아닌|"
+             r"볼\s*수\s*없는|어긋나는|해당\s*없는)")
+_POSITIVE = (r"(?:옳은|맞는|바른|올바른|적절한|타당한|알맞은|적합한|"
+             r"(?:옳게|바르게|올바르게|적절하게|적절히)\s*\S*(?:한|된)|해당하는|해당되는|일치하는|부합하는)")
+
+_WRONG_TAIL_RE = re.compile(rf"{_NEGATIVE}{_TAIL_END}")
+_RIGHT_TAIL_RE = re.compile(rf"{_POSITIVE}{_TAIL_END}")
+_NEGATIVE_RE = re.compile(_NEGATIVE)
+
+
+def instruction_sentence(question: str) -> str:
+    """
+    문제에서 지시문(마지막 물음 문장) 추출
+
+    마지막 '?'까지를 지시문 끝으로 보고, 그 앞의 줄바꿈/마침표 이후부터 잘라냅니다.
+    '?'가 없으면 마지막 줄을 사용합니다. 뒤에 붙은 "(단, ...)" 조건은 제외됩니다.
+    """
+    text = str(question or '').strip()
+    end = text.rfind('?')
+    if end == -1:
+        lines = [line for line in text.split('\n') if line.strip()]
+        return lines[-1].strip() if lines else ''
+    head = text[:end + 1]
+    start = max(head.rfind('\n'), head.rfind('. '), head.rfind('다.'))
+    return head[start + 1:].strip() if start >= 0 else head.strip()
+
+
+class AnswerTypeRules:
+    """지시문 패턴 기반 answer_type 판정기 (명확한 문제만 판정, 나머지는 None)"""
+
+    def __init__(self, combo_option_ratio: float = 0.5):
+        """
+        Args:
+            combo_option_ratio: 선택지 중 항목 조합 형태의 비율이 이 값 이상이면 abcd
+        """
+        self.combo_option_ratio = combo_option_ratio
+
+    def _has_combo_options(self, options) -> bool:
+        if not isinstance(options, list) or not options:
+            return False
+        combos = sum(1 for opt in options if _COMBO_OPTION_RE.match(str(opt)))
+        return combos / len(options) >= self.combo_option_ratio
+
+    def classify(self, qna: Dict[str, Any]) -> Optional[str]:
+        """문제 1개 판정 ('right' / 'wrong' / 'abcd', 애매하면 None)"""
+        question = str(qna.get('question', '') or '')
+        sentence = instruction_sentence(question)
+        if not sentence:
+            return None
+
+        # 1) abcd (최우선)
+        if _ABCD_STEM_RE.search(sentence) or self._has_combo_options(qna.get('options')):
+            return 'abcd'
+        # <보기> 항목이 있는데 조합 선택지가 아니면 유형 판단이 애매함
+        if _BOGI_RE.search(question):
+            return None
+
+        # 2) wrong
+        if _WRONG_TAIL_RE.search(sentence):
+            return 'wrong'
+
+        # 3) right (지시문 어디에도 부정 표현이 없을 때만)
+        if _RIGHT_TAIL_RE.search(sentence) and not _NEGATIVE_RE.search(sentence):
+            return 'right'
+        return None
+
+    def split(self, questions: List[Dict[str, Any]]):
+        """
+        규칙으로 판정되는 문제와 LLM이 필요한 문제로 분리
+
+        Returns:
+            (판정 리스트(questions 순서, None은 LLM 필요), LLM으로 보낼 문제 리스트)
+        """
+        labels = [self.classify(q) for q in questions]
+        residue = [q for q, label in zip(questions, labels) if label is None]
+        return labels, residue
+
+    def report(self, questions: List[Dict[str, Any]], label_key: str = 'answer_type',
+               batch_size: int = 10, max_mismatches: int = 20) -> Dict[str, Any]:
+        """
+        기존 LLM 분류 결과와 비교한 정밀도 / LLM 호출 절감 리포트
+
+        Args:
+            questions: label_key에 LLM 분류 결과가 있는 문제 리스트 (빈 값은 제외)
+            label_key: 기존 분류 결과 키
+            batch_size: LLM 분류 배치 크기 (호출 수 계산용)
+            max_mismatches: 리포트에 담을 불일치 사례 수
+
+        Returns:
+            dict: total, rule_labeled, coverage, precision, per_label, llm_calls_before,
+                  llm_calls_after, calls_avoided, mismatches
+        """
+        labeled = [q for q in questions if q.get(label_key) in ANSWER_TYPES]
+        per_label = {t: {'predicted': 0, 'correct': 0} for t in ANSWER_TYPES}
+        mismatches = []
+        residue = 0
+        for q in labeled:
+            label = self.classify(q)
+            if label is None:
+                residue += 1
+                continue
+            per_label[label]['predicted'] += 1
+            if label == q[label_key]:
+                per_label[label]['correct'] += 1
+            elif len(mismatches) < max_mismatches:
+                mismatches.append({
+                    'file_id': q.get('file_id'),
+                    'tag': q.get('tag'),
+                    'rule': label,
+                    'llm': q[label_key],
+                    'instruction': instruction_sentence(q.get('question', '')),
+                })
+
+        rule_labeled = len(labeled) - residue
+        correct = sum(v['correct'] for v in per_label.values())
+        for stats in per_label.values():
+            stats['precision'] = stats['correct'] / stats['predicted'] if stats['predicted'] else None
+        batch_size = max(1, batch_size)
+        calls_before = math.ceil(len(labeled) / batch_size)
+        calls_after = math.ceil(residue / batch_size)
+        return {
+            'total': len(labeled),
+            'rule_labeled': rule_labeled,
+            'coverage': rule_labeled / len(labeled) if labeled else 0.0,
+            'precision': correct / rule_labeled if rule_labeled else None,
+            'per_label': per_label,
+            'llm_calls_before': calls_before,
+            'llm_calls_after': calls_after,
+            'calls_avoided': calls_before - calls_after,
+            'mismatches': mismatches,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Answer Type 규칙 분류 정밀도 리포트 (기존 LLM 분류 결과 기준)')
+    parser.add_argument('--data_path', type=str, required=True,
+                        help='answer_type이 있는 분류 결과 파일 (예: answer_type_classified.json)')
+    parser.add_argument('--batch_size', type=int, default=10, help='LLM 분류 배치 크기 (호출 수 계산용)')
+    parser.add_argument('--show_mismatches', type=int, default=20, help='출력할 불일치 사례 수')
+    args = parser.parse_args()
+
+    with open(args.data_path, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+
+    report = AnswerTypeRules().report(questions, batch_size=args.batch_size,
+                                      max_mismatches=args.show_mismatches)
+    print(f"비교 대상: {report['total']}개 (LLM 분류 결과 보유)")
+    print(f"규칙 판정: {report['rule_labeled']}개 (커버리지 {report['coverage']:.1%})")
+    if report['precision'] is not None:
+        print(f"규칙 판정 정밀도: {report['precision']:.2%}")
+    for label, stats in report['per_label'].items():
+        precision = f"{stats['precision']:.2%}" if stats['precision'] is not None else '-'
+        print(f"  {label}: {stats['correct']}/{stats['predicted']} ({precision})")
+    print(f"LLM 호출: {report['llm_calls_before']}회 → {report['llm_calls_after']}회 "
+          f"({report['calls_avoided']}회 절감, 배치 크기 {args.batch_size})")
+    for m in report['mismatches']:
+        print(f"  [불일치] {m['file_id']}/{m['tag']} rule={m['rule']} llm={m['llm']} | {m['instruction']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,24 +10,26 @@
 import os
 import json
 import time
-import random
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from tools.core.llm_query import LLMQuery
+from tools.transformed.multiple.stratified_sampler import AnswerCountSampler
 
 
 class MultipleChoiceTransformer:
     """객관식 문제 변형 클래스"""
     
-    def __init__(self, llm_query: LLMQuery, onedrive_path: str, logger):
+    def __init__(self, llm_query: LLMQuery, onedrive_path: str, logger, sample_by_domain: bool = False):
         """
         Args:
             llm_query: LLMQuery 인스턴스
             onedrive_path: OneDrive 경로
             logger: 로거 인스턴스
+            sample_by_domain: 정답 개수 그룹을 나눌 때 domain별로도 층화할지 여부
         """
         self.llm_query = llm_query
         self.onedrive_path = onedrive_path
         self.logger = logger
+        self.sample_by_domain = sample_by_domain
     
     def transform_wrong_to_right(self, questions: List[Dict[str, Any]], 
                                  model: str, seed: int) -> Dict[str, Any]:
@@ -175,81 +177,30 @@ class MultipleChoiceTransformer:
     
     def _sample_questions_by_answer_count(self, questions: List[Dict[str, Any]], 
                                          seed: int) -> Dict[int, List[Dict[str, Any]]]:
-        """정답 개수별로 문제 샘플링 (옵션 개수에 따라 4지선다/5지선다로 분류 후 공평하게 배치)"""
-        random.seed(seed)
-        
-        # 옵션 개수에 따라 분류
-        options_4 = []
-        options_5 = []
-        option_others = []
-        
-        for q in questions:
-            options_count = len(q.get('options', []))
-            if options_count == 4:
-                options_4.append(q)
-            elif options_count == 5:
-                options_5.append(q)
-            else:
-                option_others.append(q)
-        
-        self.logger.info(f"4지선다 문제 수: {len(options_4)}")
-        self.logger.info(f"5지선다 문제 수: {len(options_5)}")
-        if option_others:
-            self.logger.warning(f"기타 옵션 개수 문제 수: {len(option_others)} (제외됨)")
-        
-        # 4지선다: 정답 개수 2, 3, 4로 3개 그룹으로 나눔
-        ans_num_4 = {
-            2: len(options_4) // 3,
-            3: len(options_4) // 3,
-            4: len(options_4) // 3
-        }
-        # 5지선다: 정답 개수 2, 3, 4, 5로 4개 그룹으로 나눔
-        ans_num_5 = {
-            2: len(options_5) // 4,
-            3: len(options_5) // 4,
-            4: len(options_5) // 4,
-            5: len(options_5) // 4
-        }
-        
-        # 나머지 문제를 공평하게 분배
-        if len(options_4) % 3 != 0:
-            remainder_4 = len(options_4) % 3
-            for i in range(remainder_4):
-                ans_num_4[3] += 1
-        
-        if len(options_5) % 4 != 0:
-            remainder_5 = len(options_5) % 4
-            for i in range(remainder_5):
-                ans_num_5[4] += 1
-        
-        self.logger.info(f"4지선다 배치 계획: {ans_num_4}")
-        self.logger.info(f"5지선다 배치 계획: {ans_num_5}")
-        
-        # 4지선다와 5지선다를 독립적으로 랜덤 샘플링
-        remaining_4 = options_4.copy()
-        remaining_5 = options_5.copy()
-        sampling_result = {}
-        
-        for answer_count in range(2, 6):
-            sampling_result[answer_count] = []
-            
-            # 4지선다에서 샘플링 (answer_count가 2, 3, 4일 때만)
-            if answer_count in ans_num_4 and ans_num_4[answer_count] > 0:
-                random.shuffle(remaining_4)
-                sampled_4 = random.sample(remaining_4, ans_num_4[answer_count])
-                sampling_result[answer_count].extend(sampled_4)
-                remaining_4 = [x for x in remaining_4 if x not in sampled_4]
-            
-            # 5지선다에서 샘플링 (answer_count가 2, 3, 4, 5일 때)
-            if answer_count in ans_num_5 and ans_num_5[answer_count] > 0:
-                random.shuffle(remaining_5)
-                sampled_5 = random.sample(remaining_5, ans_num_5[answer_count])
-                sampling_result[answer_count].extend(sampled_5)
-                remaining_5 = [x for x in remaining_5 if x not in sampled_5]
+        """
+        정답 개수별로 문제 샘플링 (옵션 개수에 따라 4지선다/5지선다로 분류 후 공평하게 배치)
+
+        AnswerCountSampler가 선형 시간에 나눕니다. 전역 random 상태는 건드리지 않으며,
+        sample_by_domain=False면 같은 seed에서 기존 구현과 같은 결과입니다.
+        """
+        sampler = AnswerCountSampler(seed, by_domain=self.sample_by_domain)
+        groups, excluded = sampler.strata(questions)
+        options_4 = sum(len(qs) for key, qs in groups.items() if key[0] == 4)
+        options_5 = sum(len(qs) for key, qs in groups.items() if key[0] == 5)
+        self.logger.info(f"4지선다 문제 수: {options_4}")
+        self.logger.info(f"5지선다 문제 수: {options_5}")
+        if excluded:
+            self.logger.warning(f"기타 옵션 개수 문제 수: {excluded} (제외됨)")
+        self.logger.info(f"4지선다 배치 계획: {AnswerCountSampler.plan(options_4, 4)}")
+        self.logger.info(f"5지선다 배치 계획: {AnswerCountSampler.plan(options_5, 5)}")
+        if self.sample_by_domain:
+            self.logger.info(f"domain 층화 샘플링: {len(groups)}개 층")
+
+        sampling_result = sampler.sample(questions)
         
         # 검증: 모든 문제가 포함되었는지 확인
         total_sampled = sum(len(questions_list) for questions_list in sampling_result.values())
-        total_valid = len(options_4) + len(options_5)
+        total_valid = options_4 + options_5
         
         if total_sampled != total_valid:
             self.logger.warning(
@@ -3,11 +3,13 @@
 """
 변형된 문제 로드 유틸리티
 - pick_right, pick_wrong, pick_abcd의 result.json 파일들을 로드
+- 같은 위치에 압축 아티팩트(result.jsonl)가 더 최근이면 그것을 사용
 """
 
 import os
 from typing import Dict, Any
 from tools.core.utils import JSONHandler
+from tools.core.artifact_store import is_artifact, iter_records, resolve_artifact
 
 
 def load_transformed_questions(onedrive_path: str, json_handler: JSONHandler, logger) -> Dict[str, Dict[str, Any]]:
@@ -34,13 +36,19 @@ def load_transformed_questions(onedrive_path: str, json_handler: JSONHandler, lo
         """question_id 생성 (file_id_tag 형식)"""
         return f"{file_id}_{tag}"
     
+    def load_result(path: str) -> Any:
+        """result.json / result.jsonl 로드"""
+        if is_artifact(path):
+            return list(iter_records(path))
+        return json_handler.load(path)
+    
     # pick_abcd는 루트에 result.json이 있음
-    abcd_path = os.path.join(
+    abcd_path = resolve_artifact(os.path.join(
         onedrive_path,
         'evaluation', 'eval_data', '7_multiple_rw', 'pick_abcd', 'result.json'
-    )
+    ))
     if os.path.exists(abcd_path):
-        abcd_data = json_handler.load(abcd_path)
+        abcd_data = load_result(abcd_path)
         if not isinstance(abcd_data, list):
             abcd_data = []
         logger.info(f"pick_abcd: {len(abcd_data)}개 문제 로드")
@@ -67,9 +75,9 @@ def load_transformed_questions(onedrive_path: str, json_handler: JSONHandler, lo
         
         # 각 세트 폴더 확인 (2, 3, 4, 5)
         for set_num in [2, 3, 4, 5]:
-            result_path = os.path.join(transform_dir, str(set_num), 'result.json')
+            result_path = resolve_artifact(os.path.join(transform_dir, str(set_num), 'result.json'))
             if os.path.exists(result_path):
-                data = json_handler.load(result_path)
+                data = load_result(result_path)
                 if not isinstance(data, list):
                     data = []
                 logger.info(f"{transform_type}/{set_num}: {len(data)}개 문제 로드")
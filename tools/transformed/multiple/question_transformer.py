@@ -74,11 +74,13 @@ class QuestionTransformerOrchestrator:
                           input_data_path: str = None, questions: List[Dict[str, Any]] = None,
                           run_classify: bool = False,
                           classify_model: str = 'openai/gpt-5', classify_batch_size: int = 10,
+                          classify_rule_fast_path: bool = False,
                           transform_model: str = 'openai/o3', 
                           transform_wrong_to_right: bool = True,
                           transform_right_to_wrong: bool = True,
                           transform_abcd: bool = True,
-                          seed: int = 42) -> Dict[str, Any]:
+                          seed: int = 42,
+                          sample_by_domain: bool = False) -> Dict[str, Any]:
         """
         객관식 문제 변형 실행
         
@@ -89,11 +91,13 @@ class QuestionTransformerOrchestrator:
             run_classify: 분류 단계 실행 여부
             classify_model: 분류에 사용할 LLM 모델
             classify_batch_size: 분류 배치 크기
+            classify_rule_fast_path: 지시문이 명확한 문제는 규칙으로 판정하고 나머지만 LLM 분류
             transform_model: 변형에 사용할 LLM 모델
             transform_wrong_to_right: wrong → right 변형 수행 여부
             transform_right_to_wrong: right → wrong 변형 수행 여부
             transform_abcd: abcd 변형 수행 여부
             seed: 랜덤 시드
+            sample_by_domain: 정답 개수 그룹 샘플링 시 domain별로도 층화
             
         Returns:
             Dict[str, Any]: 변형 결과
@@ -115,7 +119,8 @@ class QuestionTransformerOrchestrator:
                 return {'success': False, 'error': '문제 데이터 없음'}
             
             self.logger.info(f"총 {len(questions)}개 문제 로드")
-            classified_questions = self._classify_questions(questions, classify_model, classify_batch_size)
+            classified_questions = self._classify_questions(questions, classify_model, classify_batch_size,
+                                                            classify_rule_fast_path)
             if not classified_questions:
                 return {'success': False, 'error': '분류 실패'}
         else:
@@ -142,7 +147,8 @@ class QuestionTransformerOrchestrator:
         transformer = MultipleChoiceTransformer(
             llm_query=self.llm_query,
             onedrive_path=self.onedrive_path,
-            logger=self.logger
+            logger=self.logger,
+            sample_by_domain=sample_by_domain
         )
         
         results = {
@@ -272,7 +278,8 @@ class QuestionTransformerOrchestrator:
             self.logger.error(f"분류된 데이터 파일 로드 실패 ({classified_data_path}): {e}")
             return []
 
-    def _classify_questions(self, questions: List[Dict[str, Any]], model: str, batch_size: int) -> List[Dict[str, Any]]:
+    def _classify_questions(self, questions: List[Dict[str, Any]], model: str, batch_size: int,
+                            rule_fast_path: bool = False) -> List[Dict[str, Any]]:
         self.logger.info("문제 분류 중...")
         classifier = AnswerTypeClassifier(
             config_path=os.path.join(self.project_root_path, 'llm_config.ini') if self.llm_query else None,
@@ -283,7 +290,8 @@ class QuestionTransformerOrchestrator:
         classified_questions = classifier.process_all_questions(
             questions=questions,
             model=model,
-            batch_size=batch_size
+            batch_size=batch_size,
+            rule_fast_path=rule_fast_path
         )
         
         answer_type_counts = {}
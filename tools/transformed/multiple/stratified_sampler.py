@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정답 개수별 층화 샘플러 (객관식 변형용)
+
+MultipleChoiceTransformer가 wrong→right / right→wrong 변형 전에 문제를 정답 개수 그룹(2~5개)으로
+나누는 샘플링을 선형 시간으로 수행합니다.
+
+- 층(stratum): 선택지 개수(4지선다/5지선다), by_domain=True면 (선택지 개수, domain)
+- 층마다 문제 수를 정답 개수 그룹에 균등 배분하고 나머지는 가운데 그룹(4지: 3개, 5지: 4개)에 몰아줌
+- 난수 호출 순서(그룹별 shuffle → sample)는 기존 구현과 같으므로, by_domain=False면 같은 seed에서
+  기존 _sample_questions_by_answer_count와 동일한 결과가 나옵니다.
+- 뽑힌 문제 제거는 풀 안의 위치(인덱스) 집합으로 판정해 O(n)입니다.
+  (기존 구현은 dict 전체 비교 `x not in sampled`로 O(n²)) ID가 중복되거나 file_id/tag가 없는 문제도
+  뽑힌 항목만 정확히 빠집니다.
+
+벤치마크:
+    python -m tools.benchmarks.stratified_sampler --pool_size 50000 --legacy_max 5000
+"""
+
+import random
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+# 선택지 개수 → 배정 가능한 정답 개수
+ANSWER_COUNTS_BY_OPTIONS = {4: (2, 3, 4), 5: (2, 3, 4, 5)}
+# 나머지를 몰아줄 정답 개수 그룹
+REMAINDER_TARGET = {4: 3, 5: 4}
+
+
+class AnswerCountSampler:
+    """정답 개수별 층화 샘플러 (풀 인덱스 기준, 선형 시간)"""
+
+    def __init__(self, seed: int = 42, by_domain: bool = False, domain_key: str = 'domain'):
+        """
+        Args:
+            seed: 랜덤 시드 (같은 seed와 입력 순서면 항상 같은 결과)
+            by_domain: 선택지 개수 층을 domain별로 다시 나눠 각 정답 개수 그룹의 domain 비율을 맞춤
+            domain_key: domain 필드명
+        """
+        self.seed = seed
+        self.by_domain = by_domain
+        self.domain_key = domain_key
+
+    @staticmethod
+    def plan(size: int, options_count: int) -> Dict[int, int]:
+        """층 1개의 정답 개수별 배정 수 (균등 배분, 나머지는 REMAINDER_TARGET 그룹)"""
+        answer_counts = ANSWER_COUNTS_BY_OPTIONS[options_count]
+        quota = {ac: size // len(answer_counts) for ac in answer_counts}
+        quota[REMAINDER_TARGET[options_count]] += size % len(answer_counts)
+        return quota
+
+    def strata(self, questions: List[Dict[str, Any]]) -> Tuple[Dict[Hashable, List[Dict[str, Any]]], int]:
+        """
+        문제를 층으로 분류 (입력 순서 유지)
+
+        Returns:
+            (층 키 → 문제 리스트, 제외된(4/5지선다가 아닌) 문제 수)
+        """
+        groups: Dict[Hashable, List[Dict[str, Any]]] = {}
+        excluded = 0
+        for q in questions:
+            options_count = len(q.get('options', []))
+            if options_count not in ANSWER_COUNTS_BY_OPTIONS:
+                excluded += 1
+                continue
+            key = (options_count, q.get(self.domain_key, '')) if self.by_domain else (options_count,)
+            groups.setdefault(key, []).append(q)
+        return groups, excluded
+
+    def sample(self, questions: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        정답 개수(2~5)별 문제 리스트 반환
+
+        모든 유효 문제(4/5지선다)가 정확히 한 그룹에 들어갑니다.
+        """
+        rng = random.Random(self.seed)
+        groups, _ = self.strata(questions)
+        # 층 순서: 선택지 개수 오름차순 (기존 구현의 4지 → 5지 순서), domain은 이름순
+        ordered_keys = sorted(groups.keys(), key=lambda k: (k[0], str(k[1:])))
+        remaining = {key: list(groups[key]) for key in ordered_keys}
+        quotas = {key: self.plan(len(groups[key]), key[0]) for key in ordered_keys}
+
+        result: Dict[int, List[Dict[str, Any]]] = {}
+        for answer_count in range(2, 6):
+            result[answer_count] = []
+            for key in ordered_keys:
+                k = quotas[key].get(answer_count, 0)
+                if k <= 0:
+                    continue
+                pool = remaining[key]
+                rng.shuffle(pool)
+                # rng.sample(pool, k)와 같은 난수 소비로 인덱스를 뽑아, 뽑힌 위치만 제거
+                picked = rng.sample(range(len(pool)), k)
+                result[answer_count].extend(pool[i] for i in picked)
+                picked_set = set(picked)
+                remaining[key] = [q for i, q in enumerate(pool) if i not in picked_set]
+
+        return result